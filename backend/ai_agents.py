@@ -14,11 +14,15 @@ from openai import OpenAI
 from supabase import Client
 import logging
 import uuid
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OPTIMIZATION_MODEL_CACHE_SIZE = 16  # Compiled resource optimization models kept (one per organization)
+
 class AIAgentBase:
     """Base class for all AI agents with common functionality"""
     
@@ -695,6 +699,12 @@ class ResourceOptimizerAgent(AIAgentBase):
         self.skill_match_threshold = 0.6
         self.utilization_target_min = 60.0
         self.utilization_target_max = 85.0
+        
+        # Compiled LP per organization, re-solved when only capacities/requirements change
+        self._compiled_models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Per-organization solve locks, dropped once no request holds or awaits them
+        self._model_locks: Dict[str, asyncio.Lock] = {}
+        self._model_lock_users: Dict[str, int] = defaultdict(int)
     
     async def optimize_resources(
         self,
@@ -744,19 +754,29 @@ class ResourceOptimizerAgent(AIAgentBase):
                     "constraints_satisfied": False
                 }
             
-            # Build PuLP linear programming model
-            model, allocation_vars = self._build_optimization_model(resources, projects, constraints or {})
-            
-            # Solve the model
+            # Build (or re-use) and solve the PuLP model; one solve per organization at a time
             import pulp
-            model.solve(pulp.PULP_CBC_CMD(msg=0))  # Silent solver
-            
-            # Check solution status
-            status = pulp.LpStatus[model.status]
+            async with self._organization_model_lock(organization_id):
+                model, allocation_vars, warm_start = self._get_optimization_model(
+                    organization_id, resources, projects, constraints or {}
+                )
+                
+                # Solve off the event loop; a cached model starts from its previous solution
+                solver = pulp.PULP_CBC_CMD(msg=0, warmStart=warm_start)  # Silent solver
+                await asyncio.to_thread(model.solve, solver)
+                
+                # Read the solution while the cached model belongs to this solve
+                status = pulp.LpStatus[model.status]
+                
+                if status == "Optimal":
+                    recommendations = self._extract_recommendations(model, allocation_vars, resources, projects)
+                    # Calculate confidence scores based on solution quality
+                    confidence_score = self._calculate_confidence(model, recommendations)
+                else:
+                    error_msg = self._get_infeasibility_message(model, status, constraints)
             
             if status != "Optimal":
                 # Handle infeasible solutions
-                error_msg = self._get_infeasibility_message(model, status, constraints)
                 await self._log_audit(user_id, organization_id, "optimize_resources", False, error_msg)
                 return {
                     "error": error_msg,
@@ -767,12 +787,6 @@ class ResourceOptimizerAgent(AIAgentBase):
                     "solver_status": status
                 }
             
-            # Extract recommendations from solved model
-            recommendations = self._extract_recommendations(model, allocation_vars, resources, projects)
-            
-            # Calculate confidence scores based on solution quality
-            confidence_score = self._calculate_confidence(model, recommendations)
-            
             # Calculate total cost savings
             total_cost_savings = self._calculate_cost_savings(recommendations, resources, projects)
             
@@ -843,6 +857,129 @@ class ResourceOptimizerAgent(AIAgentBase):
             logger.error(f"Resource optimization failed: {e}")
             raise
     
+    def _get_optimization_model(
+        self,
+        organization_id: str,
+        resources: List[Dict],
+        projects: List[Dict],
+        constraints: Dict
+    ):
+        """
+        Return the organization's compiled model, rebuilding it only when its structure changed.
+        
+        The structure is the set of resources and projects, their skills and
+        rates, and the allocation cap. When only available or required hours
+        change, the cached model's constraint right-hand sides are updated in
+        place and the previous solution is used as a warm start.
+        
+        Args:
+            organization_id: Organization ID (cache key)
+            resources: List of resource dictionaries
+            projects: List of project dictionaries
+            constraints: Additional constraints
+            
+        Returns:
+            Tuple of (model, allocation_vars, warm_start)
+        """
+        signature = self._model_signature(resources, projects, constraints)
+        compiled = self._compiled_models.get(organization_id)
+        
+        if compiled is not None and compiled["signature"] == signature:
+            self._compiled_models.move_to_end(organization_id)
+            model = compiled["model"]
+            for i, resource in enumerate(resources):
+                model.constraints[f"Resource_Availability_{i}"].changeRHS(self._available_hours(resource))
+            for j, project in enumerate(projects):
+                model.constraints[f"Project_Requirements_{j}"].changeRHS(self._required_hours(project))
+            return model, compiled["allocation_vars"], True
+        
+        model, allocation_vars = self._build_optimization_model(resources, projects, constraints)
+        self._compiled_models[organization_id] = {
+            "signature": signature,
+            "model": model,
+            "allocation_vars": allocation_vars
+        }
+        self._compiled_models.move_to_end(organization_id)
+        while len(self._compiled_models) > OPTIMIZATION_MODEL_CACHE_SIZE:
+            self._compiled_models.popitem(last=False)
+        
+        return model, allocation_vars, False
+    
+    @asynccontextmanager
+    async def _organization_model_lock(self, organization_id: str):
+        """Hold the organization's solve lock, pruning it when no longer in use."""
+        lock = self._model_locks.get(organization_id)
+        if lock is None:
+            lock = self._model_locks[organization_id] = asyncio.Lock()
+        self._model_lock_users[organization_id] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._model_lock_users[organization_id] -= 1
+            if not self._model_lock_users[organization_id]:
+                del self._model_lock_users[organization_id]
+                del self._model_locks[organization_id]
+    
+    def _model_signature(self, resources: List[Dict], projects: List[Dict], constraints: Dict) -> tuple:
+        """Everything that shapes the model other than available and required hours."""
+        return (
+            tuple(
+                (resource['id'], frozenset(resource.get('skills') or []), self._hourly_rate(resource),
+                 self._available_hours(resource) > 0)
+                for resource in resources
+            ),
+            tuple(
+                (project['id'], frozenset(project.get('required_skills') or []),
+                 self._required_hours(project) > 0)
+                for project in projects
+            ),
+            constraints.get('max_allocation_per_resource')
+        )
+    
+    @staticmethod
+    def _hourly_rate(resource: Dict) -> float:
+        return resource.get('hourly_rate', resource.get('cost_per_hour', 100))
+    
+    @staticmethod
+    def _available_hours(resource: Dict) -> float:
+        return resource.get('available_hours', resource.get('capacity', 160))
+    
+    @staticmethod
+    def _required_hours(project: Dict) -> float:
+        return project.get('required_hours', project.get('estimated_effort', 160))
+    
+    def _feasible_pairs(self, resources: List[Dict], projects: List[Dict]) -> List[Tuple[int, int]]:
+        """
+        (resource index, project index) pairs that may receive hours.
+        
+        A pair is feasible when the resource has every skill the project
+        requires, the resource has available hours and the project needs
+        hours. Resources and projects are grouped by skill set so each
+        distinct (required, offered) combination is checked once.
+        """
+        resource_groups: Dict[frozenset, List[int]] = defaultdict(list)
+        for i, resource in enumerate(resources):
+            if self._available_hours(resource) > 0:
+                resource_groups[frozenset(resource.get('skills') or [])].append(i)
+        
+        project_groups: Dict[frozenset, List[int]] = defaultdict(list)
+        for j, project in enumerate(projects):
+            if self._required_hours(project) > 0:
+                project_groups[frozenset(project.get('required_skills') or [])].append(j)
+        
+        pairs = []
+        for required_skills, project_indices in project_groups.items():
+            candidates = [
+                i
+                for skills, resource_indices in resource_groups.items()
+                if required_skills <= skills
+                for i in resource_indices
+            ]
+            pairs.extend((i, j) for j in project_indices for i in candidates)
+        
+        return sorted(pairs)
+    
     def _build_optimization_model(
         self,
         resources: List[Dict],
@@ -859,6 +996,12 @@ class ResourceOptimizerAgent(AIAgentBase):
         - Project requirements: Σ(allocations per project) ≥ required_hours
         - Skill matching: resource_skills ⊇ project_required_skills
         
+        Only skill-compatible pairs get a variable, so skill matching needs no
+        constraints; the row expressions are assembled from the sparse pair
+        list, and the allocation cap is a variable bound rather than a row.
+        Rows are named by position (Resource_Availability_<i>,
+        Project_Requirements_<j>) so a cached model can update their bounds.
+        
         Args:
             resources: List of resource dictionaries
             projects: List of project dictionaries
@@ -872,82 +1015,42 @@ class ResourceOptimizerAgent(AIAgentBase):
         # Create the model
         model = pulp.LpProblem("Resource_Optimization", pulp.LpMinimize)
         
+        max_alloc = constraints.get('max_allocation_per_resource')
+        
         # Define decision variables: allocation[resource_id, project_id] = hours allocated
         allocation_vars = {}
-        for resource in resources:
-            for project in projects:
-                var_name = f"alloc_{resource['id']}_{project['id']}"
-                allocation_vars[(resource['id'], project['id'])] = pulp.LpVariable(
-                    var_name,
-                    lowBound=0,
-                    cat='Continuous'
-                )
+        resource_terms: List[List[tuple]] = [[] for _ in resources]
+        project_terms: List[List[tuple]] = [[] for _ in projects]
+        cost_terms = []
+        for i, j in self._feasible_pairs(resources, projects):
+            var = pulp.LpVariable(f"alloc_{i}_{j}", lowBound=0, upBound=max_alloc or None, cat='Continuous')
+            allocation_vars[(resources[i]['id'], projects[j]['id'])] = var
+            resource_terms[i].append((var, 1))
+            project_terms[j].append((var, 1))
+            cost_terms.append((var, self._hourly_rate(resources[i])))
         
         # Set objective: minimize Σ(resource_cost × allocation_hours)
-        cost_expr = []
-        for resource in resources:
-            resource_cost = resource.get('hourly_rate', resource.get('cost_per_hour', 100))
-            for project in projects:
-                var = allocation_vars[(resource['id'], project['id'])]
-                cost_expr.append(resource_cost * var)
-        
-        model += pulp.lpSum(cost_expr), "Total_Cost"
+        model.setObjective(pulp.LpAffineExpression(cost_terms, name="Total_Cost"))
         
         # Add constraints: resource availability
-        for resource in resources:
-            available_hours = resource.get('available_hours', resource.get('capacity', 160))
-            resource_allocations = [
-                allocation_vars[(resource['id'], project['id'])]
-                for project in projects
-            ]
-            model += (
-                pulp.lpSum(resource_allocations) <= available_hours,
-                f"Resource_Availability_{resource['id']}"
-            )
-        
-        # Add constraints: project requirements
-        for project in projects:
-            required_hours = project.get('required_hours', project.get('estimated_effort', 160))
-            project_allocations = [
-                allocation_vars[(resource['id'], project['id'])]
-                for resource in resources
-            ]
-            model += (
-                pulp.lpSum(project_allocations) >= required_hours,
-                f"Project_Requirements_{project['id']}"
-            )
-        
-        # Add constraints: skill matching
-        for resource in resources:
-            resource_skills = set(resource.get('skills', []))
-            for project in projects:
-                required_skills = set(project.get('required_skills', []))
-                
-                # If project requires skills that resource doesn't have, set allocation to 0
-                if required_skills and not required_skills.issubset(resource_skills):
-                    model += (
-                        allocation_vars[(resource['id'], project['id'])] == 0,
-                        f"Skill_Match_{resource['id']}_{project['id']}"
-                    )
-        
-        # Add custom constraints if provided
-        if constraints.get('max_allocation_per_resource'):
-            max_alloc = constraints['max_allocation_per_resource']
-            for resource in resources:
-                for project in projects:
-                    model += (
-                        allocation_vars[(resource['id'], project['id'])] <= max_alloc,
-                        f"Max_Allocation_{resource['id']}_{project['id']}"
-                    )
-        
-        if constraints.get('min_allocation_per_project'):
-            min_alloc = constraints['min_allocation_per_project']
-            for project in projects:
-                for resource in resources:
-                    var = allocation_vars[(resource['id'], project['id'])]
-                    # If allocated, must be at least min_alloc
-                    # This is a simplified version; proper implementation would use binary variables
-                    pass  # Skip for now as it requires binary variables
+        for i, resource in enumerate(resources):
+            model.addConstraint(pulp.LpConstraint(
+                pulp.LpAffineExpression(resource_terms[i]),
+                pulp.LpConstraintLE,
+                f"Resource_Availability_{i}",
+                self._available_hours(resource)
+            ))
+        
+        # Add constraints: project requirements (a project without candidates stays infeasible)
+        for j, project in enumerate(projects):
+            model.addConstraint(pulp.LpConstraint(
+                pulp.LpAffineExpression(project_terms[j]),
+                pulp.LpConstraintGE,
+                f"Project_Requirements_{j}",
+                self._required_hours(project)
+            ))
+        
+        # min_allocation_per_project would need binary variables and is not modelled
         
         return model, allocation_vars
     
@@ -972,29 +1075,32 @@ class ResourceOptimizerAgent(AIAgentBase):
         """
         recommendations = []
         
-        for resource in resources:
-            for project in projects:
-                var = allocation_vars[(resource['id'], project['id'])]
-                allocated_hours = var.varValue
-                
-                if allocated_hours and allocated_hours > 0:
-                    resource_cost = resource.get('hourly_rate', resource.get('cost_per_hour', 100))
-                    total_cost = allocated_hours * resource_cost
-                    
-                    # Calculate cost savings compared to average cost
-                    avg_cost = sum(r.get('hourly_rate', r.get('cost_per_hour', 100)) for r in resources) / len(resources)
-                    cost_savings = (avg_cost - resource_cost) * allocated_hours
-                    
-                    recommendations.append({
-                        "resource_id": resource['id'],
-                        "resource_name": resource.get('name', 'Unknown'),
-                        "project_id": project['id'],
-                        "project_name": project.get('name', 'Unknown'),
-                        "allocated_hours": round(allocated_hours, 2),
-                        "cost_savings": round(cost_savings, 2),
-                        "total_cost": round(total_cost, 2),
-                        "confidence": 0.0  # Will be calculated separately
-                    })
+        resources_by_id = {resource['id']: resource for resource in resources}
+        projects_by_id = {project['id']: project for project in projects}
+        avg_cost = sum(self._hourly_rate(r) for r in resources) / len(resources)
+        
+        for (resource_id, project_id), var in allocation_vars.items():
+            allocated_hours = var.varValue
+            
+            if allocated_hours and allocated_hours > 0:
+                resource = resources_by_id[resource_id]
+                project = projects_by_id[project_id]
+                resource_cost = self._hourly_rate(resource)
+                total_cost = allocated_hours * resource_cost
+                
+                # Calculate cost savings compared to average cost
+                cost_savings = (avg_cost - resource_cost) * allocated_hours
+                
+                recommendations.append({
+                    "resource_id": resource['id'],
+                    "resource_name": resource.get('name', 'Unknown'),
+                    "project_id": project['id'],
+                    "project_name": project.get('name', 'Unknown'),
+                    "allocated_hours": round(allocated_hours, 2),
+                    "cost_savings": round(cost_savings, 2),
+                    "total_cost": round(total_cost, 2),
+                    "confidence": 0.0  # Will be calculated separately
+                })
         
         return recommendations
     
@@ -7,12 +7,14 @@ This module provides the EnhancedPermissionChecker class that supports:
 - Permission aggregation across multiple roles
 - Caching for performance optimization
 - Portfolio-to-project permission inheritance
+- Compiled per-user permission index with bulk checks for list endpoints
 
 Requirements: 1.1, 1.2, 2.5, 7.1
 """
 
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Set, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID
 import logging
 
@@ -25,9 +27,59 @@ from .enhanced_rbac_models import (
     UserPermissionsResponse,
 )
 from .permission_cache import PermissionCache, get_permission_cache
+from .permission_index import (
+    PERMISSION_BITS,
+    IndexedRole,
+    UserPermissionIndex,
+    compile_permission_index,
+    get_permission_index_versions,
+)
 
 logger = logging.getLogger(__name__)
 
+# Maximum IDs per .in_() filter when resolving project/portfolio parents
+PARENT_LOOKUP_CHUNK = 200
+
+# Compiled permission indexes kept per checker (least recently used evicted)
+PERMISSION_INDEX_CACHE_SIZE = 10000
+
+
+class _UserKeyedCache(dict):
+    """
+    Legacy result cache that indexes its keys by the user ID they embed.
+    
+    Keys follow "<prefix>:<user_id>:...", so a user's entries can be dropped
+    directly instead of scanning every cached key.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._keys_by_owner: Dict[str, Set[str]] = defaultdict(set)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._keys_by_owner[self._owner(key)].add(key)
+    
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._keys_by_owner[self._owner(key)].discard(key)
+    
+    def clear(self) -> None:
+        super().clear()
+        self._keys_by_owner.clear()
+    
+    def pop_owner(self, owner: str) -> Set[str]:
+        """Remove and return every key belonging to owner."""
+        keys = self._keys_by_owner.pop(owner, set())
+        for key in keys:
+            super().pop(key, None)
+        return keys
+    
+    @staticmethod
+    def _owner(key: str) -> str:
+        parts = key.split(":", 2)
+        return parts[1] if len(parts) > 1 else ""
+
 
 class EnhancedPermissionChecker:
     """
@@ -66,10 +118,14 @@ class EnhancedPermissionChecker:
         self.cache = permission_cache or get_permission_cache()
         
         # Legacy cache for backward compatibility (deprecated)
-        self._permission_cache: Dict[str, Any] = {}
+        self._permission_cache: Dict[str, Any] = _UserKeyedCache()
         self._cache_timestamps: Dict[str, float] = {}
         self._cache_ttl = cache_ttl
         
+        # Compiled per-user permission indexes, invalidated by version
+        self._permission_indexes: "OrderedDict[str, UserPermissionIndex]" = OrderedDict()
+        self._index_versions = get_permission_index_versions()
+        
         # Development mode user IDs that get admin permissions
         self._dev_user_ids = {
             "00000000-0000-0000-0000-000000000001",
@@ -287,74 +343,23 @@ class EnhancedPermissionChecker:
                     )
                 ]
             
-            effective_roles: List[EffectiveRole] = []
+            # All assignments come from the compiled index (one query per user)
+            index = await self.get_permission_index(user_id)
             
-            # Get global role assignments
-            global_roles = await self._get_role_assignments(user_id_str, None, None)
-            for assignment, role_data in global_roles:
-                effective_roles.append(
-                    EffectiveRole(
-                        role_id=UUID(assignment["role_id"]),
-                        role_name=role_data.get("name", "unknown"),
-                        permissions=role_data.get("permissions", []),
-                        source_type=ScopeType.GLOBAL,
-                        source_id=None,
-                        is_inherited=False
-                    )
-                )
-            
-            # Get scoped role assignments if context is provided
+            scopes: List[Tuple[ScopeType, Optional[UUID]]] = [(ScopeType.GLOBAL, None)]
             if context:
-                # Organization-scoped roles
                 if context.organization_id:
-                    org_roles = await self._get_role_assignments(
-                        user_id_str, ScopeType.ORGANIZATION, str(context.organization_id)
-                    )
-                    for assignment, role_data in org_roles:
-                        effective_roles.append(
-                            EffectiveRole(
-                                role_id=UUID(assignment["role_id"]),
-                                role_name=role_data.get("name", "unknown"),
-                                permissions=role_data.get("permissions", []),
-                                source_type=ScopeType.ORGANIZATION,
-                                source_id=context.organization_id,
-                                is_inherited=False
-                            )
-                        )
-                
-                # Portfolio-scoped roles
+                    scopes.append((ScopeType.ORGANIZATION, context.organization_id))
                 if context.portfolio_id:
-                    portfolio_roles = await self._get_role_assignments(
-                        user_id_str, ScopeType.PORTFOLIO, str(context.portfolio_id)
-                    )
-                    for assignment, role_data in portfolio_roles:
-                        effective_roles.append(
-                            EffectiveRole(
-                                role_id=UUID(assignment["role_id"]),
-                                role_name=role_data.get("name", "unknown"),
-                                permissions=role_data.get("permissions", []),
-                                source_type=ScopeType.PORTFOLIO,
-                                source_id=context.portfolio_id,
-                                is_inherited=False
-                            )
-                        )
-                
-                # Project-scoped roles
+                    scopes.append((ScopeType.PORTFOLIO, context.portfolio_id))
                 if context.project_id:
-                    project_roles = await self._get_role_assignments(
-                        user_id_str, ScopeType.PROJECT, str(context.project_id)
-                    )
-                    for assignment, role_data in project_roles:
-                        effective_roles.append(
-                            EffectiveRole(
-                                role_id=UUID(assignment["role_id"]),
-                                role_name=role_data.get("name", "unknown"),
-                                permissions=role_data.get("permissions", []),
-                                source_type=ScopeType.PROJECT,
-                                source_id=context.project_id,
-                                is_inherited=False
-                            )
-                        )
+                    scopes.append((ScopeType.PROJECT, context.project_id))
+            
+            effective_roles: List[EffectiveRole] = []
+            for scope_type, scope_id in scopes:
+                effective_roles.extend(
+                    self._to_effective_roles(index, scope_type, scope_id)
+                )
             
             # If no roles found, return default viewer role
             if not effective_roles:
@@ -411,33 +416,8 @@ class EnhancedPermissionChecker:
         Requirements: 1.2, 7.1 - Global permission checking
         """
         try:
-            user_id_str = str(user_id)
-            
-            # Check cache first
-            cache_key = f"global_perm:{user_id_str}:{permission.value}"
-            cached_result = self._get_cached_permission(cache_key)
-            if cached_result is not None:
-                return cached_result
-            
-            # Development mode: dev users have all admin permissions
-            if user_id_str in self._dev_user_ids:
-                admin_permissions = DEFAULT_ROLE_PERMISSIONS[UserRole.admin]
-                result = permission in admin_permissions
-                self._cache_permission(cache_key, result)
-                return result
-            
-            # Get global roles only (no context)
-            global_roles = await self.get_effective_roles(user_id, None)
-            
-            # Check if any global role has the permission
-            for role in global_roles:
-                if role.source_type == ScopeType.GLOBAL:
-                    if permission.value in role.permissions:
-                        self._cache_permission(cache_key, True)
-                        return True
-            
-            self._cache_permission(cache_key, False)
-            return False
+            index = await self.get_permission_index(user_id)
+            return bool(index.global_mask & PERMISSION_BITS[permission])
             
         except Exception as e:
             logger.error(f"Error checking global permission for user {user_id}: {e}")
@@ -468,34 +448,21 @@ class EnhancedPermissionChecker:
         Requirements: 1.2, 2.5, 7.1 - Context-aware project permission checking
         """
         try:
-            user_id_str = str(user_id)
+            bit = PERMISSION_BITS[permission]
+            index = await self.get_permission_index(user_id)
             
-            # Check cache first
-            cache_key = f"proj_perm:{user_id_str}:{permission.value}:{project_id}"
-            cached_result = self._get_cached_permission(cache_key)
-            if cached_result is not None:
-                return cached_result
-            
-            # 1. Check global permissions first
-            if await self.has_global_permission(user_id, permission):
-                self._cache_permission(cache_key, True)
+            # 1-2. Global and project-specific grants
+            if index.project_mask(str(project_id)) & bit:
                 return True
             
-            # 2. Check project-specific role assignments
-            project_roles = await self.get_project_roles(user_id, project_id)
-            for role in project_roles:
-                if permission.value in role.permissions:
-                    self._cache_permission(cache_key, True)
-                    return True
-            
-            # 3. Check portfolio-level permissions if project belongs to a portfolio
+            # 3. Portfolio-level grants (inherited to projects); the parent
+            # lookup is skipped when the user holds no portfolio/org roles
+            if not self._has_inherited_grants(index, ScopeType.PORTFOLIO):
+                return False
             portfolio_id = await self.get_project_portfolio(project_id)
             if portfolio_id:
-                result = await self.check_portfolio_permission(user_id, permission, portfolio_id)
-                self._cache_permission(cache_key, result)
-                return result
+                return await self.check_portfolio_permission(user_id, permission, portfolio_id)
             
-            self._cache_permission(cache_key, False)
             return False
             
         except Exception as e:
@@ -527,34 +494,20 @@ class EnhancedPermissionChecker:
         Requirements: 1.2, 2.5, 7.1 - Context-aware portfolio permission checking
         """
         try:
-            user_id_str = str(user_id)
+            bit = PERMISSION_BITS[permission]
+            index = await self.get_permission_index(user_id)
             
-            # Check cache first
-            cache_key = f"port_perm:{user_id_str}:{permission.value}:{portfolio_id}"
-            cached_result = self._get_cached_permission(cache_key)
-            if cached_result is not None:
-                return cached_result
-            
-            # 1. Check global permissions first
-            if await self.has_global_permission(user_id, permission):
-                self._cache_permission(cache_key, True)
+            # 1-2. Global and portfolio-specific grants
+            if index.portfolio_mask(str(portfolio_id)) & bit:
                 return True
             
-            # 2. Check portfolio-specific role assignments
-            portfolio_roles = await self.get_portfolio_roles(user_id, portfolio_id)
-            for role in portfolio_roles:
-                if permission.value in role.permissions:
-                    self._cache_permission(cache_key, True)
-                    return True
-            
-            # 3. Check organization-level permissions (if portfolio has organization)
+            # 3. Organization-level grants (if portfolio has organization)
+            if not index.has_scope_grants(ScopeType.ORGANIZATION):
+                return False
             organization_id = await self.get_portfolio_organization(portfolio_id)
             if organization_id:
-                result = await self.check_organization_permission(user_id, permission, organization_id)
-                self._cache_permission(cache_key, result)
-                return result
+                return bool(index.organization_mask(str(organization_id)) & bit)
             
-            self._cache_permission(cache_key, False)
             return False
             
         except Exception as e:
@@ -581,31 +534,8 @@ class EnhancedPermissionChecker:
         Requirements: 1.2, 7.1 - Context-aware organization permission checking
         """
         try:
-            user_id_str = str(user_id)
-            
-            # Check cache first
-            cache_key = f"org_perm:{user_id_str}:{permission.value}:{organization_id}"
-            cached_result = self._get_cached_permission(cache_key)
-            if cached_result is not None:
-                return cached_result
-            
-            # 1. Check global permissions first
-            if await self.has_global_permission(user_id, permission):
-                self._cache_permission(cache_key, True)
-                return True
-            
-            # 2. Check organization-specific role assignments
-            context = PermissionContext(organization_id=organization_id)
-            org_roles = await self.get_effective_roles(user_id, context)
-            
-            for role in org_roles:
-                if role.source_type == ScopeType.ORGANIZATION and role.source_id == organization_id:
-                    if permission.value in role.permissions:
-                        self._cache_permission(cache_key, True)
-                        return True
-            
-            self._cache_permission(cache_key, False)
-            return False
+            index = await self.get_permission_index(user_id)
+            return bool(index.organization_mask(str(organization_id)) & PERMISSION_BITS[permission])
             
         except Exception as e:
             logger.error(f"Error checking organization permission for user {user_id}, org {organization_id}: {e}")
@@ -650,25 +580,8 @@ class EnhancedPermissionChecker:
             if not self.supabase:
                 return []
             
-            # Get project-scoped role assignments
-            project_roles = await self._get_role_assignments(
-                user_id_str, ScopeType.PROJECT, str(project_id)
-            )
-            
-            effective_roles: List[EffectiveRole] = []
-            for assignment, role_data in project_roles:
-                effective_roles.append(
-                    EffectiveRole(
-                        role_id=UUID(assignment["role_id"]),
-                        role_name=role_data.get("name", "unknown"),
-                        permissions=role_data.get("permissions", []),
-                        source_type=ScopeType.PROJECT,
-                        source_id=project_id,
-                        is_inherited=False
-                    )
-                )
-            
-            return effective_roles
+            index = await self.get_permission_index(user_id)
+            return self._to_effective_roles(index, ScopeType.PROJECT, project_id)
             
         except Exception as e:
             logger.error(f"Error getting project roles for user {user_id}, project {project_id}: {e}")
@@ -713,25 +626,8 @@ class EnhancedPermissionChecker:
             if not self.supabase:
                 return []
             
-            # Get portfolio-scoped role assignments
-            portfolio_roles = await self._get_role_assignments(
-                user_id_str, ScopeType.PORTFOLIO, str(portfolio_id)
-            )
-            
-            effective_roles: List[EffectiveRole] = []
-            for assignment, role_data in portfolio_roles:
-                effective_roles.append(
-                    EffectiveRole(
-                        role_id=UUID(assignment["role_id"]),
-                        role_name=role_data.get("name", "unknown"),
-                        permissions=role_data.get("permissions", []),
-                        source_type=ScopeType.PORTFOLIO,
-                        source_id=portfolio_id,
-                        is_inherited=False
-                    )
-                )
-            
-            return effective_roles
+            index = await self.get_permission_index(user_id)
+            return self._to_effective_roles(index, ScopeType.PORTFOLIO, portfolio_id)
             
         except Exception as e:
             logger.error(f"Error getting portfolio roles for user {user_id}, portfolio {portfolio_id}: {e}")
@@ -918,11 +814,294 @@ class EnhancedPermissionChecker:
             logger.error(f"Error getting all context permissions for user {user_id}: {e}")
             return set()
     
+    # =========================================================================
+    # Compiled Permission Index
+    # Requirements: 1.2, 7.1, 8.1, 8.2
+    # =========================================================================
+    
+    async def get_permission_index(self, user_id: UUID) -> UserPermissionIndex:
+        """
+        Get the compiled permission index for a user, building it on a miss.
+        
+        The index holds every active role assignment of the user as scope
+        bitsets, loaded with a single query. It is rebuilt when the user's or
+        the global version changes (see clear_user_cache / clear_role_cache),
+        after cache_ttl seconds, or when an assignment expires.
+        
+        Args:
+            user_id: The user's UUID
+            
+        Returns:
+            The user's UserPermissionIndex
+        """
+        user_id_str = str(user_id)
+        version = self._index_versions.current(user_id_str)
+        
+        index = self._permission_indexes.get(user_id_str)
+        if index is not None and index.is_valid(version):
+            self._permission_indexes.move_to_end(user_id_str)
+            return index
+        
+        index = await self._build_permission_index(user_id_str, version)
+        self._permission_indexes[user_id_str] = index
+        self._permission_indexes.move_to_end(user_id_str)
+        while len(self._permission_indexes) > PERMISSION_INDEX_CACHE_SIZE:
+            self._permission_indexes.popitem(last=False)
+        return index
+    
+    async def _build_permission_index(
+        self,
+        user_id_str: str,
+        version: Tuple[int, int]
+    ) -> UserPermissionIndex:
+        """Load all of a user's role assignments and compile them."""
+        admin_role = IndexedRole(
+            role_id="00000000-0000-0000-0000-000000000000",
+            role_name="admin",
+            permissions=[p.value for p in DEFAULT_ROLE_PERMISSIONS[UserRole.admin]]
+        )
+        
+        # Development mode: dev users hold the admin role globally
+        if user_id_str in self._dev_user_ids:
+            assignments = [(ScopeType.GLOBAL, None, admin_role)]
+            return compile_permission_index(
+                user_id_str, version, assignments, [], self._cache_ttl
+            )
+        
+        assignments = []
+        valid_until = None
+        
+        if self.supabase:
+            for assignment, role_data in await self._get_role_assignments(user_id_str, None, None, all_scopes=True):
+                scope_type = assignment.get("scope_type")
+                try:
+                    scope_type = ScopeType(scope_type) if scope_type else ScopeType.GLOBAL
+                except ValueError:
+                    logger.warning(
+                        f"Skipping role assignment {assignment.get('id')} for user {user_id_str}: "
+                        f"unknown scope_type {scope_type!r}"
+                    )
+                    continue
+                scope_id = assignment.get("scope_id") if scope_type != ScopeType.GLOBAL else None
+                assignments.append((
+                    scope_type,
+                    str(scope_id) if scope_id else None,
+                    IndexedRole(
+                        role_id=assignment["role_id"],
+                        role_name=role_data.get("name", "unknown"),
+                        permissions=role_data.get("permissions", [])
+                    )
+                ))
+                
+                expiry = self._parse_expiry(assignment.get("expires_at"))
+                if expiry is not None:
+                    valid_until = min(valid_until or expiry.timestamp(), expiry.timestamp())
+        
+        return compile_permission_index(
+            user_id_str,
+            version,
+            assignments,
+            DEFAULT_ROLE_PERMISSIONS[UserRole.viewer],
+            self._cache_ttl,
+            valid_until
+        )
+    
+    def _to_effective_roles(
+        self,
+        index: UserPermissionIndex,
+        scope_type: ScopeType,
+        scope_id: Optional[UUID]
+    ) -> List[EffectiveRole]:
+        """Convert the index's roles at one scope into EffectiveRole objects."""
+        return [
+            EffectiveRole(
+                role_id=UUID(role.role_id),
+                role_name=role.role_name,
+                permissions=role.permissions,
+                source_type=scope_type,
+                source_id=scope_id,
+                is_inherited=False
+            )
+            for role in index.roles_for(scope_type, str(scope_id) if scope_id else None)
+        ]
+    
+    @staticmethod
+    def _has_inherited_grants(index: UserPermissionIndex, scope_type: ScopeType) -> bool:
+        """Whether a parent scope of scope_type could add permissions."""
+        if scope_type == ScopeType.PORTFOLIO:
+            return (
+                index.has_scope_grants(ScopeType.PORTFOLIO) or
+                index.has_scope_grants(ScopeType.ORGANIZATION)
+            )
+        return index.has_scope_grants(ScopeType.ORGANIZATION)
+    
+    # =========================================================================
+    # Bulk Permission Checks
+    # Requirements: 1.2, 7.1, 8.1
+    # =========================================================================
+    
+    async def filter_projects_by_permission(
+        self,
+        user_id: UUID,
+        permission: Permission,
+        project_ids: Iterable[Any],
+        project_portfolios: Optional[Dict[Any, Any]] = None
+    ) -> Set[str]:
+        """
+        Return the projects on which a user holds a permission.
+        
+        Equivalent to calling check_project_permission per project, but the
+        parent portfolios and organizations are resolved with one query per
+        chunk of IDs and each project is then decided with a bitmask test.
+        
+        Args:
+            user_id: The user's UUID
+            permission: The permission to check
+            project_ids: Project IDs (UUIDs or strings)
+            project_portfolios: Optional project -> portfolio mapping already known
+                to the caller (e.g. the portfolio_id column of listed rows)
+            
+        Returns:
+            Set of permitted project IDs as strings
+            
+        Requirements: 1.2, 7.1 - Row-level permission filtering
+        """
+        ids = [str(project_id) for project_id in project_ids]
+        try:
+            bit = PERMISSION_BITS[permission]
+            index = await self.get_permission_index(user_id)
+            
+            if index.global_mask & bit:
+                return set(ids)
+            
+            permitted = {project_id for project_id in ids if index.project_mask(project_id) & bit}
+            if not self._has_inherited_grants(index, ScopeType.PORTFOLIO):
+                return permitted
+            
+            remaining = [project_id for project_id in ids if project_id not in permitted]
+            portfolios = await self._resolve_parents(
+                "projects", "portfolio_id", "proj_portfolio", remaining, project_portfolios
+            )
+            organizations = {}
+            if index.has_scope_grants(ScopeType.ORGANIZATION):
+                organizations = await self._resolve_parents(
+                    "portfolios", "organization_id", "port_org", set(filter(None, portfolios.values()))
+                )
+            
+            for project_id in remaining:
+                portfolio_id = portfolios.get(project_id)
+                if portfolio_id and index.portfolio_mask(portfolio_id, organizations.get(portfolio_id)) & bit:
+                    permitted.add(project_id)
+            
+            return permitted
+            
+        except Exception as e:
+            logger.error(f"Error filtering projects by permission for user {user_id}: {e}")
+            return set()
+    
+    async def filter_portfolios_by_permission(
+        self,
+        user_id: UUID,
+        permission: Permission,
+        portfolio_ids: Iterable[Any],
+        portfolio_organizations: Optional[Dict[Any, Any]] = None
+    ) -> Set[str]:
+        """
+        Return the portfolios on which a user holds a permission.
+        
+        Equivalent to calling check_portfolio_permission per portfolio, with
+        parent organizations resolved in bulk.
+        
+        Args:
+            user_id: The user's UUID
+            permission: The permission to check
+            portfolio_ids: Portfolio IDs (UUIDs or strings)
+            portfolio_organizations: Optional portfolio -> organization mapping
+                already known to the caller
+            
+        Returns:
+            Set of permitted portfolio IDs as strings
+            
+        Requirements: 1.2, 7.1 - Row-level permission filtering
+        """
+        ids = [str(portfolio_id) for portfolio_id in portfolio_ids]
+        try:
+            bit = PERMISSION_BITS[permission]
+            index = await self.get_permission_index(user_id)
+            
+            if index.global_mask & bit:
+                return set(ids)
+            
+            permitted = {portfolio_id for portfolio_id in ids if index.portfolio_mask(portfolio_id) & bit}
+            if not index.has_scope_grants(ScopeType.ORGANIZATION):
+                return permitted
+            
+            remaining = [portfolio_id for portfolio_id in ids if portfolio_id not in permitted]
+            organizations = await self._resolve_parents(
+                "portfolios", "organization_id", "port_org", remaining, portfolio_organizations
+            )
+            for portfolio_id in remaining:
+                organization_id = organizations.get(portfolio_id)
+                if organization_id and index.organization_mask(organization_id) & bit:
+                    permitted.add(portfolio_id)
+            
+            return permitted
+            
+        except Exception as e:
+            logger.error(f"Error filtering portfolios by permission for user {user_id}: {e}")
+            return set()
+    
+    async def _resolve_parents(
+        self,
+        table: str,
+        parent_column: str,
+        cache_prefix: str,
+        ids: Iterable[str],
+        known_parents: Optional[Dict[Any, Any]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Map child IDs to their parent ID (project -> portfolio, portfolio -> organization).
+        
+        Uses the caller's known_parents first, then the cache entries shared with
+        get_project_portfolio / get_portfolio_organization, and fetches the
+        remaining misses with chunked .in_() queries.
+        """
+        known = {str(child_id): parent_id for child_id, parent_id in (known_parents or {}).items()}
+        parents: Dict[str, Optional[str]] = {}
+        missing = []
+        for child_id in dict.fromkeys(ids):
+            if child_id in known:
+                parents[child_id] = str(known[child_id]) if known[child_id] else None
+                continue
+            cached = self._get_cached_permission(f"{cache_prefix}:{child_id}")
+            if cached is None:
+                missing.append(child_id)
+            else:
+                parents[child_id] = str(cached) if cached != "none" else None
+        
+        if missing and self.supabase:
+            for i in range(0, len(missing), PARENT_LOOKUP_CHUNK):
+                chunk = missing[i:i + PARENT_LOOKUP_CHUNK]
+                response = self.supabase.table(table).select(
+                    f"id, {parent_column}"
+                ).in_("id", chunk).execute()
+                found = {row["id"]: row.get(parent_column) for row in response.data or []}
+                
+                for child_id in chunk:
+                    parent_id = found.get(child_id)
+                    parents[child_id] = str(parent_id) if parent_id else None
+                    self._cache_permission(
+                        f"{cache_prefix}:{child_id}", UUID(str(parent_id)) if parent_id else "none"
+                    )
+        
+        return parents
+    
     async def _get_role_assignments(
         self,
         user_id: str,
         scope_type: Optional[ScopeType],
-        scope_id: Optional[str]
+        scope_id: Optional[str],
+        all_scopes: bool = False
     ) -> List[tuple]:
         """
         Get role assignments from the database.
@@ -931,6 +1110,7 @@ class EnhancedPermissionChecker:
             user_id: The user's ID string
             scope_type: Optional scope type filter
             scope_id: Optional scope ID filter
+            all_scopes: Return assignments of every scope, ignoring the filters
             
         Returns:
             List of tuples (assignment_data, role_data)
@@ -942,7 +1122,9 @@ class EnhancedPermissionChecker:
             ).eq("user_id", user_id)
             
             # Filter by scope if provided
-            if scope_type is None:
+            if all_scopes:
+                pass
+            elif scope_type is None:
                 # Global assignments have NULL scope_type
                 query = query.is_("scope_type", "null")
             else:
@@ -964,14 +1146,9 @@ class EnhancedPermissionChecker:
             
             for assignment in response.data:
                 # Check expiration
-                expires_at = assignment.get("expires_at")
-                if expires_at:
-                    try:
-                        expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-                        if expiry < now:
-                            continue
-                    except (ValueError, TypeError):
-                        pass
+                expiry = self._parse_expiry(assignment.get("expires_at"))
+                if expiry is not None and expiry < now:
+                    continue
                 
                 # Check role is active
                 role_data = assignment.get("roles", {})
@@ -986,6 +1163,16 @@ class EnhancedPermissionChecker:
             logger.error(f"Error getting role assignments: {e}")
             return []
     
+    @staticmethod
+    def _parse_expiry(expires_at: Any) -> Optional[datetime]:
+        """Parse an assignment's expires_at, ignoring missing or malformed values."""
+        if not expires_at:
+            return None
+        try:
+            return datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+        except (ValueError, TypeError, AttributeError):
+            return None
+    
     def _build_cache_key(
         self,
         user_id: str,
@@ -1038,16 +1225,23 @@ class EnhancedPermissionChecker:
         except Exception as e:
             logger.warning(f"Error clearing cache for user {user_id}: {e}")
         
-        # Also clear legacy cache for backward compatibility
+        # Invalidate the compiled index and the legacy entries keyed by this user
         user_id_str = str(user_id)
-        keys_to_remove = [
-            key for key in self._permission_cache.keys()
-            if user_id_str in key
-        ]
-        for key in keys_to_remove:
-            del self._permission_cache[key]
-            if key in self._cache_timestamps:
-                del self._cache_timestamps[key]
+        self._index_versions.bump_user(user_id_str)
+        self._permission_indexes.pop(user_id_str, None)
+        for key in self._permission_cache.pop_owner(user_id_str):
+            self._cache_timestamps.pop(key, None)
+    
+    def clear_role_cache(self, role_id: UUID) -> None:
+        """
+        Invalidate every compiled index after a role's permissions change.
+        
+        Args:
+            role_id: The role's UUID
+        """
+        logger.info(f"Role {role_id} changed - invalidating compiled permission indexes")
+        self._index_versions.bump_all()
+        self._permission_indexes.clear()
     
     def clear_all_cache(self) -> None:
         """Clear all cached permissions."""
@@ -1062,9 +1256,11 @@ class EnhancedPermissionChecker:
         except Exception as e:
             logger.warning(f"Error clearing all cache: {e}")
         
-        # Also clear legacy cache
+        # Also clear legacy cache and compiled indexes
         self._permission_cache.clear()
         self._cache_timestamps.clear()
+        self._index_versions.bump_all()
+        self._permission_indexes.clear()
     
     # =========================================================================
     # Permission Combination Logic Methods
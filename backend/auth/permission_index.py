@@ -0,0 +1,206 @@
+"""
+Compiled Per-User Permission Index
+
+This module compiles a user's complete set of role assignments into permission
+bitsets keyed by scope, so that permission checks become integer AND operations
+instead of repeated role queries and list scans:
+- One bit per Permission, one mask per (scope type, scope id)
+- Scope-chain resolution (organization -> portfolio -> project) by OR-ing masks
+- Versioned invalidation per user and globally (role definition changes)
+
+Requirements: 1.2, 2.5, 7.1, 8.1, 8.2
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+import time
+
+from .rbac import Permission
+from .enhanced_rbac_models import ScopeType
+
+# Bit assigned to each permission
+PERMISSION_BITS: Dict[Permission, int] = {
+    permission: 1 << position for position, permission in enumerate(Permission)
+}
+
+# Scope key for global assignments
+GLOBAL_SCOPE: Tuple[ScopeType, Optional[str]] = (ScopeType.GLOBAL, None)
+
+
+def permission_mask(permissions: Iterable) -> int:
+    """
+    Compile permissions into a bitset.
+
+    Args:
+        permissions: Permission enums or their string values; unknown values are ignored
+
+    Returns:
+        Integer bitset with one bit per granted permission
+    """
+    mask = 0
+    for permission in permissions:
+        if not isinstance(permission, Permission):
+            try:
+                permission = Permission(permission)
+            except ValueError:
+                continue
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
+def permissions_from_mask(mask: int) -> List[Permission]:
+    """Expand a bitset back into the list of Permission enums it grants."""
+    return [permission for permission, bit in PERMISSION_BITS.items() if mask & bit]
+
+
+@dataclass
+class IndexedRole:
+    """A role assignment as stored in the index."""
+    role_id: str
+    role_name: str
+    permissions: List[str]
+
+
+@dataclass
+class UserPermissionIndex:
+    """
+    All of a user's active role assignments, compiled into scope bitsets.
+
+    Scoped masks hold only the permissions granted directly at that scope; the
+    *_mask methods OR in the global mask and the parent scopes, mirroring how
+    portfolio permissions inherit to projects and organization permissions to
+    portfolios.
+    """
+    user_id: str
+    version: Tuple[int, int]
+    expires_at: float
+    global_mask: int = 0
+    scope_masks: Dict[Tuple[ScopeType, str], int] = field(default_factory=dict)
+    roles: Dict[Tuple[ScopeType, Optional[str]], List[IndexedRole]] = field(default_factory=dict)
+    scope_types: FrozenSet[ScopeType] = frozenset()
+
+    def is_valid(self, version: Tuple[int, int]) -> bool:
+        """Whether the index is current for the given version and not expired."""
+        return self.version == version and time.time() < self.expires_at
+
+    def has_scope_grants(self, scope_type: ScopeType) -> bool:
+        """Whether any role is assigned at the given scope type."""
+        return scope_type in self.scope_types
+
+    def organization_mask(self, organization_id: Optional[str]) -> int:
+        """Permissions effective within an organization."""
+        mask = self.global_mask
+        if organization_id:
+            mask |= self.scope_masks.get((ScopeType.ORGANIZATION, organization_id), 0)
+        return mask
+
+    def portfolio_mask(self, portfolio_id: str, organization_id: Optional[str] = None) -> int:
+        """Permissions effective within a portfolio, including its organization."""
+        return (
+            self.organization_mask(organization_id) |
+            self.scope_masks.get((ScopeType.PORTFOLIO, portfolio_id), 0)
+        )
+
+    def project_mask(
+        self,
+        project_id: str,
+        portfolio_id: Optional[str] = None,
+        organization_id: Optional[str] = None
+    ) -> int:
+        """Permissions effective within a project, including its portfolio chain."""
+        mask = self.scope_masks.get((ScopeType.PROJECT, project_id), 0)
+        if portfolio_id:
+            return mask | self.portfolio_mask(portfolio_id, organization_id)
+        return mask | self.global_mask
+
+    def roles_for(self, scope_type: ScopeType, scope_id: Optional[str] = None) -> List[IndexedRole]:
+        """Roles assigned directly at a scope."""
+        return self.roles.get((scope_type, scope_id), [])
+
+
+def compile_permission_index(
+    user_id: str,
+    version: Tuple[int, int],
+    assignments: Iterable[Tuple[ScopeType, Optional[str], IndexedRole]],
+    default_global_permissions: Iterable,
+    ttl: float,
+    valid_until: Optional[float] = None
+) -> UserPermissionIndex:
+    """
+    Build a UserPermissionIndex from a user's valid role assignments.
+
+    Args:
+        user_id: The user's ID string
+        version: Version the index is built for (see PermissionIndexVersions)
+        assignments: (scope_type, scope_id, role) for every active assignment
+        default_global_permissions: Global permissions when no global role is assigned
+        ttl: Seconds the index may be served before it is rebuilt
+        valid_until: Optional earlier expiry, e.g. the first assignment expiration
+
+    Returns:
+        The compiled index
+    """
+    roles: Dict[Tuple[ScopeType, Optional[str]], List[IndexedRole]] = defaultdict(list)
+    scope_masks: Dict[Tuple[ScopeType, str], int] = defaultdict(int)
+    global_mask = 0
+
+    for scope_type, scope_id, role in assignments:
+        mask = permission_mask(role.permissions)
+        roles[(scope_type, scope_id)].append(role)
+        if scope_type == ScopeType.GLOBAL:
+            global_mask |= mask
+        elif scope_id:
+            scope_masks[(scope_type, scope_id)] |= mask
+
+    if GLOBAL_SCOPE not in roles:
+        global_mask = permission_mask(default_global_permissions)
+
+    expires_at = time.time() + ttl
+    if valid_until is not None:
+        expires_at = min(expires_at, valid_until)
+
+    return UserPermissionIndex(
+        user_id=user_id,
+        version=version,
+        expires_at=expires_at,
+        global_mask=global_mask,
+        scope_masks=dict(scope_masks),
+        roles=dict(roles),
+        scope_types=frozenset(scope_type for scope_type, _ in scope_masks)
+    )
+
+
+class PermissionIndexVersions:
+    """
+    Version counters that invalidate compiled indexes without scanning caches.
+
+    Bumping a user's version invalidates that user's index; bumping the global
+    version (role definitions changed) invalidates every index. Indexes compare
+    versions on read and are rebuilt lazily.
+    """
+
+    def __init__(self):
+        self._global_version = 0
+        self._user_versions: Dict[str, int] = {}
+
+    def current(self, user_id: str) -> Tuple[int, int]:
+        """Current (global, user) version for a user."""
+        return self._global_version, self._user_versions.get(user_id, 0)
+
+    def bump_user(self, user_id: str) -> None:
+        """Invalidate one user's index (role assignments changed)."""
+        self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+
+    def bump_all(self) -> None:
+        """Invalidate every index (role permissions changed)."""
+        self._global_version += 1
+
+
+# Shared by all checker instances so invalidation reaches every cached index
+_index_versions = PermissionIndexVersions()
+
+
+def get_permission_index_versions() -> PermissionIndexVersions:
+    """Get the process-wide PermissionIndexVersions instance."""
+    return _index_versions
@@ -4,9 +4,13 @@ Database configuration and client setup
 
 import os
 import jwt
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from supabase import create_client, Client
-from typing import Optional
+from typing import Optional, Any, Callable, Dict
 
 from .settings import settings
 
@@ -118,4 +122,132 @@ DATABASE_POOL_CONFIG = {
     "max_inactive_connection_lifetime": 300.0,  # Close connections idle for 5 minutes
     "timeout": 60.0,  # Connection timeout in seconds
     "command_timeout": 60.0,  # Query timeout in seconds
-}
\ No newline at end of file
+}
+
+# Async query execution
+# The Supabase client is synchronous; calling .execute() inside an async def
+# blocks the event loop for the whole round trip. These helpers run queries on
+# a bounded thread pool so concurrent requests overlap their database I/O.
+
+logger = logging.getLogger(__name__)
+
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    """Lazily create the shared executor, sized like the connection pool."""
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=DATABASE_POOL_CONFIG["max_size"],
+            thread_name_prefix="db-query"
+        )
+    return _db_executor
+
+
+class QueryMetrics:
+    """Per-label counters and timings for queries run through run_db."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+    
+    def started(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    
+    def finished(self, label: str, elapsed: float, outcome: str) -> None:
+        self.in_flight -= 1
+        entry = self.stats.setdefault(label, {
+            "count": 0, "errors": 0, "timeouts": 0, "total_seconds": 0.0, "max_seconds": 0.0
+        })
+        entry["count"] += 1
+        entry["total_seconds"] += elapsed
+        entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+        if outcome == "error":
+            entry["errors"] += 1
+        elif outcome == "timeout":
+            entry["timeouts"] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queries": {
+                label: {**entry, "avg_seconds": entry["total_seconds"] / entry["count"]}
+                for label, entry in self.stats.items()
+            }
+        }
+
+
+query_metrics = QueryMetrics()
+
+
+async def run_db(
+    func: Callable[..., Any],
+    *args: Any,
+    timeout: Optional[float] = None,
+    label: str = "query"
+) -> Any:
+    """
+    Run a blocking database call on the shared executor.
+    
+    Args:
+        func: Blocking callable, e.g. a query builder's execute
+        *args: Positional arguments for func
+        timeout: Seconds to wait before raising TimeoutError
+                 (default: DATABASE_POOL_CONFIG["command_timeout"])
+        label: Name the call is recorded under in query_metrics
+        
+    Returns:
+        Whatever func returns
+        
+    Raises:
+        TimeoutError: If the call does not finish within timeout. The worker
+                      thread still runs the request to completion.
+    """
+    if timeout is None:
+        timeout = DATABASE_POOL_CONFIG["command_timeout"]
+    
+    loop = asyncio.get_running_loop()
+    query_metrics.started()
+    started_at = time.perf_counter()
+    outcome = "ok"
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(_get_db_executor(), func, *args),
+            timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        logger.warning(f"Database call '{label}' timed out after {timeout}s")
+        raise
+    except Exception:
+        outcome = "error"
+        raise
+    finally:
+        query_metrics.finished(label, time.perf_counter() - started_at, outcome)
+
+
+async def execute_async(query: Any, timeout: Optional[float] = None, label: str = "query") -> Any:
+    """
+    Await a Supabase query builder's execute() without blocking the event loop.
+    
+    Args:
+        query: Query or RPC builder, e.g. db.table("tasks").select("*")
+        timeout: Seconds before TimeoutError (see run_db)
+        label: Name the query is recorded under in query_metrics
+        
+    Returns:
+        The query response
+    """
+    return await run_db(query.execute, timeout=timeout, label=label)
+
+
+def get_query_metrics() -> Dict[str, Any]:
+    """Snapshot of async query counts, timings, timeouts and concurrency."""
+    return query_metrics.snapshot()
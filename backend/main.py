@@ -2,6 +2,7 @@
 FastAPI application entry point - Refactored modular architecture
 """
 
+import asyncio
 import logging
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,6 +15,7 @@ logger = logging.getLogger(__name__)
 # Import configuration
 from config.settings import settings
 from config.database import supabase
+from services.feature_flag_service import get_feature_flag_service
 
 # Import authentication
 from auth.dependencies import get_current_user
@@ -597,6 +599,9 @@ async def startup_event():
                 logger.info("Next rundown profile generation scheduled for: %s", next_run)
         except Exception as e:
             logger.warning("Failed to start rundown scheduler: %s", e)
+    if supabase:
+        # Connect the flag invalidation listener off the event loop (Redis ping can block)
+        await asyncio.to_thread(get_feature_flag_service(supabase).start_invalidation_listener)
 
 # Shutdown event for scheduler
 @app.on_event("shutdown")
@@ -607,6 +612,8 @@ async def shutdown_event():
             await rundown_scheduler.stop()
         except Exception as e:
             logger.warning("Error stopping rundown scheduler: %s", e)
+    if supabase:
+        get_feature_flag_service(supabase).close()
 
 # #region agent log
 try:
@@ -10,12 +10,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from services.rate_limiter import rate_limiter, RateLimitExceeded
+from services.rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
-RATE_LIMIT_WINDOW = 3600
-
 
 def _user_id_from_request(request: Request) -> str:
     """Extract user id from JWT or fallback to client IP."""
@@ -42,25 +40,22 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         user_id = getattr(request.state, "user_id", None) or _user_id_from_request(request)
         role = getattr(request.state, "role", "user") or "user"
 
-        limit = rate_limiter.get_limit_for_user(user_id, role)
-        try:
-            remaining = await rate_limiter.get_remaining_requests(user_id, role)
-            await rate_limiter.check_rate_limit(user_id, role)
-        except RateLimitExceeded:
+        # One atomic check-and-count (shared across workers when Redis is configured)
+        decision = await rate_limiter.acquire(user_id, role)
+        if not decision.allowed:
             response = Response(
                 content='{"detail":"Rate limit exceeded. Please retry later."}',
                 status_code=429,
                 media_type="application/json",
             )
-            response.headers["X-RateLimit-Limit"] = str(limit)
+            response.headers["X-RateLimit-Limit"] = str(decision.limit)
             response.headers["X-RateLimit-Remaining"] = "0"
-            response.headers["X-RateLimit-Reset"] = str(int(time.time()) + RATE_LIMIT_WINDOW)
-            response.headers["Retry-After"] = str(min(60, RATE_LIMIT_WINDOW))
+            response.headers["X-RateLimit-Reset"] = str(decision.reset_at)
+            response.headers["Retry-After"] = str(max(1, min(60, decision.reset_at - int(time.time()))))
             return response
 
         response = await call_next(request)
-        remaining_after = await rate_limiter.get_remaining_requests(user_id, role)
-        response.headers["X-RateLimit-Limit"] = str(limit)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining_after - 1))
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + RATE_LIMIT_WINDOW)
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        response.headers["X-RateLimit-Reset"] = str(decision.reset_at)
         return response
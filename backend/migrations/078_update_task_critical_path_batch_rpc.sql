@@ -0,0 +1,39 @@
+-- RPC to write critical path results for many tasks in one call.
+-- Used by TaskDependencyEngine after full or incremental CPM recalculation.
+-- Accepts records shaped like {id, is_critical, total_float_days, free_float_days,
+-- early_start_date, early_finish_date, late_start_date, late_finish_date, updated_at}.
+-- Caller sends batches (e.g. up to 1000 rows per call).
+--
+-- Run as postgres. EXECUTE is granted to service_role only: the function is
+-- SECURITY DEFINER and writes CPM fields on any task.
+
+CREATE OR REPLACE FUNCTION public.update_task_critical_path_batch(records jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  updated int;
+BEGIN
+  UPDATE public.tasks AS t
+  SET
+    is_critical = (e->>'is_critical')::boolean,
+    total_float_days = (e->>'total_float_days')::int,
+    free_float_days = (e->>'free_float_days')::int,
+    early_start_date = (e->>'early_start_date')::date,
+    early_finish_date = (e->>'early_finish_date')::date,
+    late_start_date = (e->>'late_start_date')::date,
+    late_finish_date = (e->>'late_finish_date')::date,
+    updated_at = COALESCE((e->>'updated_at')::timestamptz, NOW())
+  FROM jsonb_array_elements(records) AS e
+  WHERE t.id = (e->>'id')::uuid;
+  GET DIAGNOSTICS updated = ROW_COUNT;
+  RETURN updated;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.update_task_critical_path_batch(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.update_task_critical_path_batch(jsonb) TO service_role;
+
+COMMENT ON FUNCTION public.update_task_critical_path_batch(jsonb) IS 'Bulk update task CPM dates, float and critical flags. Used by schedule recalculation.';
@@ -0,0 +1,88 @@
+-- Revision counter for a schedule's critical path inputs.
+-- TaskDependencyEngine caches each schedule's CPM graph in process memory and
+-- compares the cached revision with this column before applying an
+-- incremental update, falling back to a full recalculation when another
+-- writer (another worker, WBSManager, ScheduleManager, direct SQL) changed
+-- task durations, planned starts, task membership or dependencies.
+--
+-- Writes of CPM results (dates, float, is_critical) do not bump the revision.
+--
+-- Run as postgres.
+
+ALTER TABLE public.schedules ADD COLUMN IF NOT EXISTS cpm_revision BIGINT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION public.bump_schedule_cpm_revision(target_schedule_id uuid)
+RETURNS void
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE public.schedules SET cpm_revision = cpm_revision + 1 WHERE id = target_schedule_id;
+$$;
+
+-- Only the triggers below (which run as the function owner) and the backend bump revisions
+REVOKE EXECUTE ON FUNCTION public.bump_schedule_cpm_revision(uuid) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.bump_schedule_cpm_revision(uuid) TO service_role;
+
+CREATE OR REPLACE FUNCTION public.tasks_bump_cpm_revision()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    PERFORM public.bump_schedule_cpm_revision(NEW.schedule_id);
+  ELSIF TG_OP = 'DELETE' THEN
+    PERFORM public.bump_schedule_cpm_revision(OLD.schedule_id);
+  ELSIF NEW.schedule_id IS DISTINCT FROM OLD.schedule_id THEN
+    PERFORM public.bump_schedule_cpm_revision(OLD.schedule_id);
+    PERFORM public.bump_schedule_cpm_revision(NEW.schedule_id);
+  ELSIF NEW.duration_days IS DISTINCT FROM OLD.duration_days
+     OR NEW.planned_start_date IS DISTINCT FROM OLD.planned_start_date THEN
+    PERFORM public.bump_schedule_cpm_revision(NEW.schedule_id);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+-- Dependencies belong to their successor task's schedule, matching how
+-- TaskDependencyEngine loads them
+CREATE OR REPLACE FUNCTION public.task_dependencies_bump_cpm_revision()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  old_schedule uuid;
+  new_schedule uuid;
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    SELECT schedule_id INTO old_schedule FROM public.tasks WHERE id = OLD.successor_task_id;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    SELECT schedule_id INTO new_schedule FROM public.tasks WHERE id = NEW.successor_task_id;
+  END IF;
+
+  IF old_schedule IS NOT NULL THEN
+    PERFORM public.bump_schedule_cpm_revision(old_schedule);
+  END IF;
+  IF new_schedule IS NOT NULL AND new_schedule IS DISTINCT FROM old_schedule THEN
+    PERFORM public.bump_schedule_cpm_revision(new_schedule);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS tasks_bump_cpm_revision ON public.tasks;
+CREATE TRIGGER tasks_bump_cpm_revision
+  AFTER INSERT OR DELETE OR UPDATE OF schedule_id, duration_days, planned_start_date ON public.tasks
+  FOR EACH ROW EXECUTE FUNCTION public.tasks_bump_cpm_revision();
+
+DROP TRIGGER IF EXISTS task_dependencies_bump_cpm_revision ON public.task_dependencies;
+CREATE TRIGGER task_dependencies_bump_cpm_revision
+  AFTER INSERT OR UPDATE OR DELETE ON public.task_dependencies
+  FOR EACH ROW EXECUTE FUNCTION public.task_dependencies_bump_cpm_revision();
+
+COMMENT ON COLUMN public.schedules.cpm_revision IS 'Bumped when task durations, planned starts, task membership or dependencies change. Used to validate cached critical path state.';
@@ -71,6 +71,12 @@ class FeatureFlagCheck(BaseModel):
     user_roles: Optional[List[str]] = None
 
 
+class FeatureFlagBulkCheck(BaseModel):
+    """Evaluate all feature flags for a user"""
+    user_id: Optional[UUID] = None
+    user_roles: Optional[List[str]] = None
+
+
 class FeatureFlagCheckResponse(BaseModel):
     """Feature flag check response"""
     feature_name: str
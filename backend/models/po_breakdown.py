@@ -249,6 +249,14 @@ class ImportConfig(BaseModel):
     )
     validate_amounts: bool = Field(default=True, description="Validate amount fields")
     create_missing_parents: bool = Field(default=True, description="Auto-create missing parent items")
+    bulk_insert: bool = Field(
+        default=True,
+        description="Materialize hierarchies in memory and write them with chunked multi-row upserts"
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Stream the upload in chunks and process rows in bounded batches"
+    )
     max_hierarchy_depth: int = Field(default=10, ge=1, le=10, description="Maximum hierarchy depth")
     delimiter: str = Field(default=',', description="CSV delimiter character")
     encoding: str = Field(default='utf-8', description="File encoding")
@@ -5,14 +5,15 @@ This module contains the main Monte Carlo simulation engine
 that coordinates between risk modeling, correlation analysis, and results processing.
 """
 
+import os
 import time
 import uuid
 import hashlib
 import json
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import threading
 
 from .models import (
@@ -25,6 +26,7 @@ from .model_validator import ModelValidator
 from .change_detector import ModelChangeDetector, ChangeDetectionReport, ChangeSeverity
 from .cost_escalation import CostEscalationModeler, EscalationFactor, EscalationFactorType
 from .distribution_outputs import DistributionOutputGenerator, BudgetComplianceResult, ScheduleComplianceResult
+from .results_storage import SimulationResultsCache, compact_simulation_results
 
 
 class MonteCarloEngine:
@@ -43,14 +45,23 @@ class MonteCarloEngine:
             config: Optional SimulationConfig. If None, uses default configuration.
         """
         self._active_simulations: Dict[str, ProgressStatus] = {}
-        self._simulation_cache: Dict[str, SimulationResults] = {}
         self._parameter_cache: Dict[str, str] = {}  # simulation_id -> parameter_hash
+        # simulation_id -> (hash of non-risk parameters, per-risk parameter hashes)
+        self._risk_fingerprint_cache: Dict[str, Tuple[str, Dict[str, str]]] = {}
         self._lock = threading.Lock()
         
         # Initialize configuration management
         self._config_manager = ConfigurationManager()
         self._config = config or self._config_manager.get_default_config()
         
+        # Bounded LRU cache of results; evicted runs spill to disk when configured,
+        # otherwise their change-detection hashes are dropped with them
+        self._simulation_cache = SimulationResultsCache(
+            max_entries=self._config.cache_size_limit,
+            spill_directory=self._config.results_spill_directory,
+            on_discard=self._forget_simulation_hashes
+        )
+        
         # Initialize model validator
         self._model_validator = ModelValidator()
         
@@ -72,7 +83,8 @@ class MonteCarloEngine:
         correlations: Optional[CorrelationMatrix] = None,
         random_seed: Optional[int] = None,
         baseline_costs: Optional[Dict[str, float]] = None,
-        schedule_data: Optional[ScheduleData] = None
+        schedule_data: Optional[ScheduleData] = None,
+        execution_options: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate a hash of simulation parameters for caching and change detection.
@@ -84,6 +96,8 @@ class MonteCarloEngine:
             random_seed: Optional random seed
             baseline_costs: Optional baseline cost data
             schedule_data: Optional schedule data
+            execution_options: Execution settings that change the sampled outcomes
+                (vectorized, num_shards, adaptive_iterations, ...)
             
         Returns:
             SHA-256 hash of parameters
@@ -96,6 +110,12 @@ class MonteCarloEngine:
             'risks': []
         }
         
+        # Execution modes consume the random stream differently, so a seeded
+        # result from one mode must not be served for another
+        active_options = {k: v for k, v in (execution_options or {}).items() if v}
+        if active_options:
+            param_dict['execution_options'] = active_options
+        
         # Add schedule data if present
         if schedule_data:
             param_dict['schedule_data'] = {
@@ -134,28 +154,7 @@ class MonteCarloEngine:
         
         # Serialize risks
         for risk in risks:
-            risk_dict = {
-                'id': risk.id,
-                'name': risk.name,
-                'category': risk.category.value,
-                'impact_type': risk.impact_type.value,
-                'baseline_impact': risk.baseline_impact,
-                'distribution': {
-                    'type': risk.probability_distribution.distribution_type.value,
-                    'parameters': risk.probability_distribution.parameters,
-                    'bounds': risk.probability_distribution.bounds
-                },
-                'correlation_dependencies': sorted(risk.correlation_dependencies),
-                'mitigation_strategies': [
-                    {
-                        'id': ms.id,
-                        'cost': ms.cost,
-                        'effectiveness': ms.effectiveness,
-                        'implementation_time': ms.implementation_time
-                    } for ms in risk.mitigation_strategies
-                ]
-            }
-            param_dict['risks'].append(risk_dict)
+            param_dict['risks'].append(self._serialize_risk(risk))
         
         # Sort risks by ID for consistent hashing
         param_dict['risks'].sort(key=lambda x: x['id'])
@@ -173,6 +172,53 @@ class MonteCarloEngine:
         param_json = json.dumps(param_dict, sort_keys=True)
         return hashlib.sha256(param_json.encode()).hexdigest()
     
+    def _serialize_risk(self, risk: Risk) -> Dict[str, Any]:
+        """
+        Build the JSON-serializable representation of a risk used for hashing.
+        
+        Args:
+            risk: Risk to serialize
+            
+        Returns:
+            Dictionary of all risk parameters that influence simulation outcomes
+        """
+        return {
+            'id': risk.id,
+            'name': risk.name,
+            'category': risk.category.value,
+            'impact_type': risk.impact_type.value,
+            'baseline_impact': risk.baseline_impact,
+            'distribution': {
+                'type': risk.probability_distribution.distribution_type.value,
+                'parameters': risk.probability_distribution.parameters,
+                'bounds': risk.probability_distribution.bounds
+            },
+            'correlation_dependencies': sorted(risk.correlation_dependencies),
+            'mitigation_strategies': [
+                {
+                    'id': ms.id,
+                    'cost': ms.cost,
+                    'effectiveness': ms.effectiveness,
+                    'implementation_time': ms.implementation_time
+                } for ms in risk.mitigation_strategies
+            ]
+        }
+    
+    def _generate_risk_fingerprints(self, risks: List[Risk]) -> Dict[str, str]:
+        """
+        Hash each risk's parameters individually, preserving risk order.
+        
+        Args:
+            risks: List of Risk objects
+            
+        Returns:
+            Ordered mapping of risk ID to SHA-256 hash of that risk's parameters
+        """
+        return {
+            risk.id: hashlib.sha256(json.dumps(self._serialize_risk(risk), sort_keys=True).encode()).hexdigest()
+            for risk in risks
+        }
+    
     def _detect_parameter_changes(
         self, 
         current_hash: str, 
@@ -197,6 +243,61 @@ class MonteCarloEngine:
                 return True  # No cached hash found
             return previous_hash != current_hash
     
+    def _detect_changed_risks(
+        self,
+        risks: List[Risk],
+        iterations: int,
+        correlations: Optional[CorrelationMatrix],
+        random_seed: Optional[int],
+        baseline_costs: Optional[Dict[str, float]],
+        schedule_data: Optional[ScheduleData],
+        previous_simulation_id: Optional[str]
+    ) -> Optional[List[str]]:
+        """
+        Identify which risks changed since a previous simulation, if it can be reused.
+        
+        A previous simulation can be updated incrementally when it was run with the same
+        iterations, seed, correlations and baseline costs over the same risks in the same
+        order, without schedule data (whose impact draws depend on all risks jointly).
+        
+        Args:
+            risks: Current list of risks
+            iterations: Current iteration count
+            correlations: Current correlation matrix
+            random_seed: Current random seed
+            baseline_costs: Current baseline cost data
+            schedule_data: Current schedule data
+            previous_simulation_id: ID of the simulation to update
+            
+        Returns:
+            IDs of the changed risks, or None if the previous simulation cannot be
+            updated incrementally or nothing risk-specific changed
+        """
+        if previous_simulation_id is None or schedule_data is not None:
+            return None
+        
+        with self._lock:
+            previous_state = self._risk_fingerprint_cache.get(previous_simulation_id)
+        if previous_state is None:
+            return None
+        
+        previous_context_hash, previous_fingerprints = previous_state
+        context_hash = self._generate_parameter_hash(
+            [], iterations, correlations, random_seed, baseline_costs, schedule_data
+        )
+        if context_hash != previous_context_hash:
+            return None
+        
+        current_fingerprints = self._generate_risk_fingerprints(risks)
+        if list(current_fingerprints) != list(previous_fingerprints):
+            return None
+        
+        changed_risk_ids = [
+            risk_id for risk_id, fingerprint in current_fingerprints.items()
+            if previous_fingerprints[risk_id] != fingerprint
+        ]
+        return changed_risk_ids or None
+    
     def run_simulation_with_caching(
         self,
         risks: List[Risk],
@@ -207,7 +308,12 @@ class MonteCarloEngine:
         previous_simulation_id: Optional[str] = None,
         force_rerun: bool = False,
         baseline_costs: Optional[Dict[str, float]] = None,
-        schedule_data: Optional[ScheduleData] = None
+        schedule_data: Optional[ScheduleData] = None,
+        vectorized: bool = False,
+        num_shards: Optional[int] = None,
+        adaptive_iterations: bool = False,
+        convergence_tolerance: float = 0.01,
+        incremental: bool = False
     ) -> SimulationResults:
         """
         Execute Monte Carlo simulation with parameter change detection and caching.
@@ -222,12 +328,26 @@ class MonteCarloEngine:
             force_rerun: Force re-execution even if parameters haven't changed
             baseline_costs: Optional baseline cost data for integration
             schedule_data: Optional schedule data for timeline and milestone integration
+            vectorized: Use the vectorized batch sampling mode
+            num_shards: Run sharded across a process pool with this many shards
+            adaptive_iterations: Stop early once P50/P80/P95 estimates are stable
+            convergence_tolerance: Relative percentile tolerance for adaptive stopping
+            incremental: When only some risks changed since previous_simulation_id, reuse
+                the cached contribution columns of the unchanged risks and resample only
+                the changed risks (or their correlated blocks)
             
         Returns:
             SimulationResults containing all simulation outcomes and metrics
         """
         # Generate parameter hash for change detection
-        current_hash = self._generate_parameter_hash(risks, iterations, correlations, random_seed, baseline_costs, schedule_data)
+        current_hash = self._generate_parameter_hash(
+            risks, iterations, correlations, random_seed, baseline_costs, schedule_data,
+            {
+                'vectorized': vectorized,
+                'num_shards': num_shards,
+                'adaptive_iterations': convergence_tolerance if adaptive_iterations else None
+            }
+        )
         
         # Check if parameters have changed
         parameters_changed = self._detect_parameter_changes(current_hash, previous_simulation_id)
@@ -239,8 +359,31 @@ class MonteCarloEngine:
                 # Return the cached results with the same simulation ID
                 return cached_results
         
+        # Resample only the edited risks when the previous run can be reused
+        changed_risk_ids = None
+        if incremental and not force_rerun and not adaptive_iterations:
+            changed_risk_ids = self._detect_changed_risks(
+                risks, iterations, correlations, random_seed, baseline_costs, schedule_data,
+                previous_simulation_id
+            )
+        previous_results = self.get_cached_results(previous_simulation_id) if changed_risk_ids else None
+        
         # Run new simulation
-        results = self.run_simulation(risks, iterations, correlations, random_seed, progress_callback, baseline_costs, schedule_data)
+        if previous_results is not None and previous_results.iteration_count == iterations:
+            results = self._run_incremental_simulation(
+                previous_results, risks, changed_risk_ids, correlations, random_seed,
+                progress_callback, baseline_costs
+            )
+        elif num_shards:
+            results = self.run_simulation_sharded(
+                risks, iterations, correlations, random_seed, progress_callback, baseline_costs, schedule_data,
+                num_shards=num_shards
+            )
+        else:
+            results = self.run_simulation(
+                risks, iterations, correlations, random_seed, progress_callback, baseline_costs, schedule_data,
+                vectorized, adaptive_iterations, convergence_tolerance
+            )
         
         # Cache parameter hash
         with self._lock:
@@ -256,12 +399,8 @@ class MonteCarloEngine:
             risk_id: ID of the risk that has been modified
         """
         with self._lock:
-            # Find simulations that need to be invalidated
-            simulations_to_remove = []
-            
-            for simulation_id, results in self._simulation_cache.items():
-                if risk_id in results.risk_contributions:
-                    simulations_to_remove.append(simulation_id)
+            # Look simulations up in the cache's risk index so spilled runs are not reloaded
+            simulations_to_remove = self._simulation_cache.simulation_ids_for_risk(risk_id)
             
             # Remove invalidated simulations
             for simulation_id in simulations_to_remove:
@@ -269,6 +408,12 @@ class MonteCarloEngine:
                     del self._simulation_cache[simulation_id]
                 if simulation_id in self._parameter_cache:
                     del self._parameter_cache[simulation_id]
+                self._risk_fingerprint_cache.pop(simulation_id, None)
+    
+    def _forget_simulation_hashes(self, simulation_id: str) -> None:
+        """Drop the parameter hashes of a run whose results left the cache."""
+        self._parameter_cache.pop(simulation_id, None)
+        self._risk_fingerprint_cache.pop(simulation_id, None)
     
     def get_parameter_change_summary(
         self,
@@ -347,7 +492,10 @@ class MonteCarloEngine:
         random_seed: Optional[int] = None,
         progress_callback: Optional[callable] = None,
         baseline_costs: Optional[Dict[str, float]] = None,
-        schedule_data: Optional[ScheduleData] = None
+        schedule_data: Optional[ScheduleData] = None,
+        vectorized: bool = False,
+        adaptive_iterations: bool = False,
+        convergence_tolerance: float = 0.01
     ) -> SimulationResults:
         """
         Execute Monte Carlo simulation with configurable iterations.
@@ -360,6 +508,14 @@ class MonteCarloEngine:
             progress_callback: Optional callback for progress updates
             baseline_costs: Optional baseline cost data for integration
             schedule_data: Optional schedule data for timeline and milestone integration
+            vectorized: Draw all iterations as (iterations x risks) NumPy matrices instead
+                of looping per iteration. Results are statistically equivalent to the
+                iterative mode but not bit-identical for the same seed.
+            adaptive_iterations: Treat iterations as an upper bound and stop early once the
+                P50/P80/P95 cost estimates are stable. The iterations actually used are
+                reported as iteration_count and convergence_metrics.iterations_to_convergence.
+            convergence_tolerance: Maximum relative change of the tracked percentiles between
+                consecutive convergence checkpoints for adaptive stopping
             
         Returns:
             SimulationResults containing all simulation outcomes and metrics
@@ -394,148 +550,207 @@ class MonteCarloEngine:
             self._active_simulations[simulation_id] = progress_status
         
         try:
-            # Initialize result arrays
-            cost_outcomes = np.zeros(iterations)
-            schedule_outcomes = np.zeros(iterations)
-            risk_contributions = {risk.id: np.zeros(iterations) for risk in risks}
-            
             # Prepare baseline costs integration
             baseline_cost_total = 0.0
             if baseline_costs:
                 baseline_cost_total = sum(baseline_costs.values())
             
             # Prepare correlation handling
-            correlated_sampling = correlations is not None
-            if correlated_sampling:
-                # Validate that all risks in correlation matrix exist
-                risk_ids = [risk.id for risk in risks]
-                for risk_id in correlations.risk_ids:
-                    if risk_id not in risk_ids:
-                        raise ValueError(f"Correlation matrix references unknown risk: {risk_id}")
-                
-                # Create correlation-aware sampling
-                correlated_risk_indices = {risk_id: i for i, risk_id in enumerate(correlations.risk_ids)}
-                correlation_matrix = self._build_numpy_correlation_matrix(correlations)
-                
-                # Use Cholesky decomposition for correlated sampling
-                try:
-                    cholesky_matrix = np.linalg.cholesky(correlation_matrix)
-                except np.linalg.LinAlgError:
-                    # Fallback to uncorrelated sampling if matrix is not positive definite
-                    correlated_sampling = False
-                    cholesky_matrix = None
-            else:
-                cholesky_matrix = None
-                correlated_risk_indices = {}
+            correlated_sampling, cholesky_matrix, correlated_risk_indices = self._prepare_correlated_sampling(
+                risks, correlations
+            )
             
             # Track convergence metrics
-            convergence_tracker = ConvergenceTracker()
+            if adaptive_iterations:
+                convergence_tracker = ConvergenceTracker(percentiles=(10, 50, 80, 90, 95))
+            else:
+                convergence_tracker = ConvergenceTracker()
+            iterations_used = iterations
             
             # Track risk interactions to prevent double-counting
             risk_interaction_tracker = RiskInteractionTracker(risks, correlations)
             
-            # Run simulation iterations
-            for i in range(iterations):
-                iteration_start = time.time()
-                
-                # Generate correlated or independent samples
-                if correlated_sampling and cholesky_matrix is not None:
-                    # Generate correlated samples
-                    independent_samples = random_state.standard_normal(len(correlations.risk_ids))
-                    correlated_samples = cholesky_matrix @ independent_samples
-                    
-                    # Map correlated samples to risks
-                    risk_samples = {}
-                    for risk in risks:
-                        if risk.id in correlated_risk_indices:
-                            # Use correlated sample
-                            corr_idx = correlated_risk_indices[risk.id]
-                            # Transform standard normal to risk distribution
-                            risk_samples[risk.id] = self._transform_sample_to_distribution(
-                                correlated_samples[corr_idx], risk.probability_distribution, random_state
-                            )
-                        else:
-                            # Use independent sample
-                            risk_samples[risk.id] = risk.probability_distribution.sample(1, random_state)[0]
-                else:
-                    # Generate independent samples
-                    risk_samples = {}
-                    for risk in risks:
-                        risk_samples[risk.id] = risk.probability_distribution.sample(1, random_state)[0]
-                
-                # Calculate risk impacts with correlation adjustments
-                total_cost_impact = 0.0
-                total_schedule_impact = 0.0
-                iteration_risk_impacts = {}
+            if vectorized and adaptive_iterations:
+                # Draw one checkpoint interval per batch until the percentiles are stable
+                cost_blocks, schedule_blocks, contribution_blocks = [], [], []
+                iterations_used = 0
+                schedule_model = ScheduleImpactModel(schedule_data) if schedule_data else None
                 
-                for risk in risks:
-                    # Get base sample for this risk
-                    sample = risk_samples[risk.id]
+                while iterations_used < iterations:
+                    block_size = min(convergence_tracker.check_interval, iterations - iterations_used)
+                    block_cost, block_schedule, block_contributions = self._run_vectorized_iterations(
+                        risks, block_size, correlations, correlated_sampling, cholesky_matrix,
+                        correlated_risk_indices, risk_interaction_tracker, baseline_cost_total,
+                        schedule_data, random_state, schedule_model
+                    )
+                    cost_blocks.append(block_cost)
+                    schedule_blocks.append(block_schedule)
+                    contribution_blocks.append(block_contributions)
+                    iterations_used += block_size
                     
-                    # Apply baseline impact
-                    base_impact = sample * risk.baseline_impact
+                    convergence_tracker.observe(block_cost, block_schedule)
+                    convergence_tracker.record_checkpoint()
                     
-                    # Apply correlation adjustments to prevent double-counting
-                    adjusted_impact = risk_interaction_tracker.adjust_for_correlations(
-                        risk.id, base_impact, iteration_risk_impacts, correlations
-                    )
+                    with self._lock:
+                        progress_status.current_iteration = iterations_used
+                        progress_status.elapsed_time = time.time() - start_time
                     
-                    iteration_risk_impacts[risk.id] = adjusted_impact
-                    risk_contributions[risk.id][i] = adjusted_impact
+                    if progress_callback:
+                        progress_callback(progress_status)
                     
-                    # Add to appropriate outcome type
-                    if risk.impact_type in [ImpactType.COST, ImpactType.BOTH]:
-                        total_cost_impact += adjusted_impact
-                    if risk.impact_type in [ImpactType.SCHEDULE, ImpactType.BOTH]:
-                        total_schedule_impact += adjusted_impact
-                
-                # Apply schedule simulation logic if schedule data is provided
-                if schedule_data:
-                    total_schedule_impact = self._simulate_schedule_impact(
-                        total_schedule_impact, iteration_risk_impacts, schedule_data, random_state
-                    )
+                    if convergence_tracker.is_stable(tolerance=convergence_tolerance):
+                        break
                 
-                # Integrate with baseline costs (bidirectional impacts)
-                final_cost_outcome = baseline_cost_total + total_cost_impact
-                
-                # Handle negative cost impacts (cost savings) properly
-                if total_cost_impact < 0:
-                    # Cost savings - ensure we don't go below reasonable minimum
-                    min_cost = baseline_cost_total * 0.1  # Minimum 10% of baseline
-                    final_cost_outcome = max(final_cost_outcome, min_cost)
-                
-                # Store iteration results
-                cost_outcomes[i] = final_cost_outcome
-                schedule_outcomes[i] = total_schedule_impact
+                cost_outcomes = np.concatenate(cost_blocks)
+                schedule_outcomes = np.concatenate(schedule_blocks)
+                risk_contributions = {
+                    risk.id: np.concatenate([block[risk.id] for block in contribution_blocks])
+                    for risk in risks
+                }
+            elif vectorized:
+                # Draw every iteration at once as (iterations x risks) matrices
+                cost_outcomes, schedule_outcomes, risk_contributions = self._run_vectorized_iterations(
+                    risks, iterations, correlations, correlated_sampling, cholesky_matrix,
+                    correlated_risk_indices, risk_interaction_tracker, baseline_cost_total,
+                    schedule_data, random_state
+                )
                 
-                # Update convergence tracking
-                if i > 0 and i % 1000 == 0:  # Check convergence every 1000 iterations
+                # Replay the per-iteration convergence checkpoints on the finished arrays
+                for i in range(1000, iterations, 1000):
                     convergence_tracker.update(cost_outcomes[:i+1], schedule_outcomes[:i+1])
                 
-                # Update progress
-                current_time = time.time()
-                elapsed = current_time - start_time
-                
                 with self._lock:
-                    progress_status.current_iteration = i + 1
-                    progress_status.elapsed_time = elapsed
-                    if i > 0:
-                        avg_time_per_iteration = elapsed / (i + 1)
-                        remaining_iterations = iterations - (i + 1)
-                        progress_status.estimated_remaining_time = avg_time_per_iteration * remaining_iterations
+                    progress_status.current_iteration = iterations
+                    progress_status.elapsed_time = time.time() - start_time
+                    progress_status.estimated_remaining_time = 0.0
                 
-                # Call progress callback if provided
-                if progress_callback and (i + 1) % 1000 == 0:
+                if progress_callback:
                     progress_callback(progress_status)
+            else:
+                # Initialize result arrays
+                cost_outcomes = np.zeros(iterations)
+                schedule_outcomes = np.zeros(iterations)
+                risk_contributions = {risk.id: np.zeros(iterations) for risk in risks}
+                
+                # Run simulation iterations
+                for i in range(iterations):
+                    iteration_start = time.time()
+                    
+                    # Generate correlated or independent samples
+                    if correlated_sampling and cholesky_matrix is not None:
+                        # Generate correlated samples
+                        independent_samples = random_state.standard_normal(len(correlations.risk_ids))
+                        correlated_samples = cholesky_matrix @ independent_samples
+                    
+                        # Map correlated samples to risks
+                        risk_samples = {}
+                        for risk in risks:
+                            if risk.id in correlated_risk_indices:
+                                # Use correlated sample
+                                corr_idx = correlated_risk_indices[risk.id]
+                                # Transform standard normal to risk distribution
+                                risk_samples[risk.id] = self._transform_sample_to_distribution(
+                                    correlated_samples[corr_idx], risk.probability_distribution, random_state
+                                )
+                            else:
+                                # Use independent sample
+                                risk_samples[risk.id] = risk.probability_distribution.sample(1, random_state)[0]
+                    else:
+                        # Generate independent samples
+                        risk_samples = {}
+                        for risk in risks:
+                            risk_samples[risk.id] = risk.probability_distribution.sample(1, random_state)[0]
+                    
+                    # Calculate risk impacts with correlation adjustments
+                    total_cost_impact = 0.0
+                    total_schedule_impact = 0.0
+                    iteration_risk_impacts = {}
+                    
+                    for risk in risks:
+                        # Get base sample for this risk
+                        sample = risk_samples[risk.id]
+                    
+                        # Apply baseline impact
+                        base_impact = sample * risk.baseline_impact
+                    
+                        # Apply correlation adjustments to prevent double-counting
+                        adjusted_impact = risk_interaction_tracker.adjust_for_correlations(
+                            risk.id, base_impact, iteration_risk_impacts, correlations
+                        )
+                    
+                        iteration_risk_impacts[risk.id] = adjusted_impact
+                        risk_contributions[risk.id][i] = adjusted_impact
+                    
+                        # Add to appropriate outcome type
+                        if risk.impact_type in [ImpactType.COST, ImpactType.BOTH]:
+                            total_cost_impact += adjusted_impact
+                        if risk.impact_type in [ImpactType.SCHEDULE, ImpactType.BOTH]:
+                            total_schedule_impact += adjusted_impact
+                    
+                    # Apply schedule simulation logic if schedule data is provided
+                    if schedule_data:
+                        total_schedule_impact = self._simulate_schedule_impact(
+                            total_schedule_impact, iteration_risk_impacts, schedule_data, random_state
+                        )
+                    
+                    # Integrate with baseline costs (bidirectional impacts)
+                    final_cost_outcome = baseline_cost_total + total_cost_impact
+                    
+                    # Handle negative cost impacts (cost savings) properly
+                    if total_cost_impact < 0:
+                        # Cost savings - ensure we don't go below reasonable minimum
+                        min_cost = baseline_cost_total * 0.1  # Minimum 10% of baseline
+                        final_cost_outcome = max(final_cost_outcome, min_cost)
+                    
+                    # Store iteration results
+                    cost_outcomes[i] = final_cost_outcome
+                    schedule_outcomes[i] = total_schedule_impact
+                    
+                    # Update convergence tracking
+                    if i > 0 and i % 1000 == 0:  # Check convergence every 1000 iterations
+                        convergence_tracker.update(cost_outcomes[:i+1], schedule_outcomes[:i+1])
+                        
+                        if adaptive_iterations and convergence_tracker.is_stable(tolerance=convergence_tolerance):
+                            iterations_used = i + 1
+                            break
+                    
+                    # Update progress
+                    current_time = time.time()
+                    elapsed = current_time - start_time
+                    
+                    with self._lock:
+                        progress_status.current_iteration = i + 1
+                        progress_status.elapsed_time = elapsed
+                        if i > 0:
+                            avg_time_per_iteration = elapsed / (i + 1)
+                            remaining_iterations = iterations - (i + 1)
+                            progress_status.estimated_remaining_time = avg_time_per_iteration * remaining_iterations
+                    
+                    # Call progress callback if provided
+                    if progress_callback and (i + 1) % 1000 == 0:
+                        progress_callback(progress_status)
+            
+            # Drop the unused tail of the result arrays after an early stop
+            if iterations_used < iterations:
+                cost_outcomes = cost_outcomes[:iterations_used]
+                schedule_outcomes = schedule_outcomes[:iterations_used]
+                risk_contributions = {
+                    risk_id: contributions[:iterations_used]
+                    for risk_id, contributions in risk_contributions.items()
+                }
             
             # Finalize convergence metrics
-            final_convergence = convergence_tracker.finalize(cost_outcomes, schedule_outcomes, iterations)
+            final_convergence = convergence_tracker.finalize(cost_outcomes, schedule_outcomes, iterations_used)
+            if adaptive_iterations and convergence_tracker.is_stable(tolerance=convergence_tolerance):
+                final_convergence.converged = True
+                final_convergence.iterations_to_convergence = iterations_used
             
             # Calculate execution time
             execution_time = time.time() - start_time
             
             # Update final progress status
             with self._lock:
+                progress_status.current_iteration = iterations_used
                 progress_status.status = "completed"
                 progress_status.elapsed_time = execution_time
                 progress_status.estimated_remaining_time = 0.0
@@ -544,7 +759,7 @@ class MonteCarloEngine:
             results = SimulationResults(
                 simulation_id=simulation_id,
                 timestamp=datetime.now(),
-                iteration_count=iterations,
+                iteration_count=iterations_used,
                 cost_outcomes=cost_outcomes,
                 schedule_outcomes=schedule_outcomes,
                 risk_contributions=risk_contributions,
@@ -552,12 +767,24 @@ class MonteCarloEngine:
                 execution_time=execution_time
             )
             
+            if self._config.compact_results_storage:
+                results = compact_simulation_results(results)
+            
             # Cache results
             with self._lock:
                 self._simulation_cache[simulation_id] = results
                 # Also cache the parameter hash for change detection
-                param_hash = self._generate_parameter_hash(risks, iterations, correlations, random_seed, baseline_costs, schedule_data)
+                param_hash = self._generate_parameter_hash(
+                    risks, iterations, correlations, random_seed, baseline_costs, schedule_data,
+                    {
+                        'vectorized': vectorized,
+                        'adaptive_iterations': convergence_tolerance if adaptive_iterations else None
+                    }
+                )
                 self._parameter_cache[simulation_id] = param_hash
+                self._record_risk_fingerprints(
+                    simulation_id, risks, iterations, correlations, random_seed, baseline_costs, schedule_data
+                )
             
             return results
             
@@ -573,6 +800,454 @@ class MonteCarloEngine:
                 if simulation_id in self._active_simulations:
                     del self._active_simulations[simulation_id]
     
+    def run_simulation_sharded(
+        self,
+        risks: List[Risk],
+        iterations: int = 10000,
+        correlations: Optional[CorrelationMatrix] = None,
+        random_seed: Optional[int] = None,
+        progress_callback: Optional[callable] = None,
+        baseline_costs: Optional[Dict[str, float]] = None,
+        schedule_data: Optional[ScheduleData] = None,
+        num_shards: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> SimulationResults:
+        """
+        Execute Monte Carlo simulation with iterations split across a worker pool.
+        
+        Each shard runs the vectorized sampling mode on its own np.random.SeedSequence
+        child stream, so results are reproducible for a given random_seed and shard
+        count regardless of how many workers execute them. Shard outcomes are
+        concatenated in shard order and their convergence statistics merged.
+        
+        Args:
+            risks: List of Risk objects to simulate
+            iterations: Total number of simulation iterations (minimum 10,000)
+            correlations: Optional correlation matrix for dependent risks
+            random_seed: Optional random seed for reproducibility
+            progress_callback: Optional callback, invoked as each shard completes
+            baseline_costs: Optional baseline cost data for integration
+            schedule_data: Optional schedule data for timeline and milestone integration
+            num_shards: Number of shards to split iterations into. Defaults to max_workers,
+                or the CPU count if neither is given
+            max_workers: Maximum number of worker processes or threads
+            use_processes: Use a ProcessPoolExecutor; set False to run shards on threads
+            
+        Returns:
+            SimulationResults containing all simulation outcomes and metrics
+            
+        Raises:
+            ValueError: If iterations < 10000 or risks list is empty
+            RuntimeError: If simulation fails to complete
+        """
+        # Validate inputs
+        validation_result = self.validate_simulation_parameters(risks, iterations, schedule_data)
+        if not validation_result.is_valid:
+            raise ValueError(f"Invalid simulation parameters: {validation_result.errors}")
+        
+        shard_count = max(1, min(num_shards or max_workers or os.cpu_count() or 1, iterations))
+        shard_iterations = [len(chunk) for chunk in np.array_split(np.arange(iterations), shard_count)]
+        seed_sequences = np.random.SeedSequence(random_seed).spawn(shard_count)
+        
+        # Initialize simulation
+        simulation_id = str(uuid.uuid4())
+        start_time = time.time()
+        
+        progress_status = ProgressStatus(
+            simulation_id=simulation_id,
+            current_iteration=0,
+            total_iterations=iterations,
+            elapsed_time=0.0,
+            estimated_remaining_time=0.0,
+            status="running"
+        )
+        
+        with self._lock:
+            self._active_simulations[simulation_id] = progress_status
+        
+        try:
+            # Fail fast on invalid correlation input before dispatching shards
+            self._prepare_correlated_sampling(risks, correlations)
+            
+            baseline_cost_total = sum(baseline_costs.values()) if baseline_costs else 0.0
+            
+            executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            shard_results = [None] * shard_count
+            
+            with executor_class(max_workers=max_workers or shard_count) as executor:
+                futures = {
+                    executor.submit(
+                        _run_simulation_shard, risks, shard_iterations[k], correlations,
+                        seed_sequences[k], baseline_cost_total, schedule_data
+                    ): k
+                    for k in range(shard_count)
+                }
+                
+                for future in as_completed(futures):
+                    k = futures[future]
+                    shard_results[k] = future.result()
+                    
+                    with self._lock:
+                        progress_status.current_iteration += shard_iterations[k]
+                        elapsed = time.time() - start_time
+                        progress_status.elapsed_time = elapsed
+                        remaining_iterations = iterations - progress_status.current_iteration
+                        progress_status.estimated_remaining_time = (
+                            elapsed / progress_status.current_iteration * remaining_iterations
+                        )
+                    
+                    if progress_callback:
+                        progress_callback(progress_status)
+            
+            # Merge shard outputs in shard order
+            cost_outcomes = np.concatenate([result[0] for result in shard_results])
+            schedule_outcomes = np.concatenate([result[1] for result in shard_results])
+            risk_contributions = {
+                risk.id: np.concatenate([result[2][risk.id] for result in shard_results])
+                for risk in risks
+            }
+            
+            convergence_tracker = shard_results[0][3]
+            for result in shard_results[1:]:
+                convergence_tracker = convergence_tracker.merge(result[3])
+            final_convergence = convergence_tracker.finalize(cost_outcomes, schedule_outcomes, iterations)
+            
+            execution_time = time.time() - start_time
+            
+            with self._lock:
+                progress_status.status = "completed"
+                progress_status.elapsed_time = execution_time
+                progress_status.estimated_remaining_time = 0.0
+            
+            results = SimulationResults(
+                simulation_id=simulation_id,
+                timestamp=datetime.now(),
+                iteration_count=iterations,
+                cost_outcomes=cost_outcomes,
+                schedule_outcomes=schedule_outcomes,
+                risk_contributions=risk_contributions,
+                convergence_metrics=final_convergence,
+                execution_time=execution_time
+            )
+            
+            if self._config.compact_results_storage:
+                results = compact_simulation_results(results)
+            
+            # Cache results
+            with self._lock:
+                self._simulation_cache[simulation_id] = results
+                param_hash = self._generate_parameter_hash(
+                    risks, iterations, correlations, random_seed, baseline_costs, schedule_data,
+                    {'num_shards': shard_count}
+                )
+                self._parameter_cache[simulation_id] = param_hash
+                self._record_risk_fingerprints(
+                    simulation_id, risks, iterations, correlations, random_seed, baseline_costs, schedule_data
+                )
+            
+            return results
+            
+        except Exception as e:
+            with self._lock:
+                progress_status.status = "failed"
+            raise RuntimeError(f"Simulation failed: {str(e)}") from e
+        
+        finally:
+            with self._lock:
+                if simulation_id in self._active_simulations:
+                    del self._active_simulations[simulation_id]
+    
+    def _record_risk_fingerprints(
+        self,
+        simulation_id: str,
+        risks: List[Risk],
+        iterations: int,
+        correlations: Optional[CorrelationMatrix],
+        random_seed: Optional[int],
+        baseline_costs: Optional[Dict[str, float]],
+        schedule_data: Optional[ScheduleData]
+    ):
+        """
+        Remember per-risk parameter hashes so later edits can be simulated incrementally.
+        
+        Must be called while holding self._lock.
+        
+        Args:
+            simulation_id: ID of the cached simulation
+            risks: Risks that were simulated
+            iterations: Number of iterations requested
+            correlations: Correlation matrix used
+            random_seed: Random seed used
+            baseline_costs: Baseline cost data used
+            schedule_data: Schedule data used
+        """
+        context_hash = self._generate_parameter_hash(
+            [], iterations, correlations, random_seed, baseline_costs, schedule_data
+        )
+        self._risk_fingerprint_cache[simulation_id] = (context_hash, self._generate_risk_fingerprints(risks))
+    
+    def _run_incremental_simulation(
+        self,
+        previous_results: SimulationResults,
+        risks: List[Risk],
+        changed_risk_ids: List[str],
+        correlations: Optional[CorrelationMatrix] = None,
+        random_seed: Optional[int] = None,
+        progress_callback: Optional[callable] = None,
+        baseline_costs: Optional[Dict[str, float]] = None
+    ) -> SimulationResults:
+        """
+        Update a previous simulation after some risks changed.
+        
+        Contribution columns of unchanged risks are reused as-is, so the comparison with
+        the previous run uses common random numbers. Changed independent risks are
+        resampled on their own; a changed correlated risk resamples every risk in its
+        correlated block (connected component of non-zero correlations). Cost and
+        schedule totals are then rebuilt from the contribution columns.
+        
+        Args:
+            previous_results: Cached results of the previous simulation
+            risks: Current list of risks, in the same order as the previous simulation
+            changed_risk_ids: IDs of risks whose parameters changed
+            correlations: Optional correlation matrix for dependent risks
+            random_seed: Random seed of the previous simulation
+            progress_callback: Optional callback for progress updates
+            baseline_costs: Optional baseline cost data for integration
+            
+        Returns:
+            SimulationResults for the updated risks
+        """
+        start_time = time.time()
+        simulation_id = str(uuid.uuid4())
+        iterations = previous_results.iteration_count
+        
+        # Derive the resampling stream from the seed and the new risk parameters so
+        # that repeating the same edit reproduces the same result
+        if random_seed is not None:
+            fingerprints = self._generate_risk_fingerprints(
+                [risk for risk in risks if risk.id in changed_risk_ids]
+            )
+            digest = hashlib.sha256(json.dumps(fingerprints, sort_keys=True).encode()).hexdigest()
+            seed_sequence = np.random.SeedSequence([random_seed, int(digest[:16], 16)])
+        else:
+            seed_sequence = np.random.SeedSequence()
+        random_state = np.random.RandomState(np.random.MT19937(seed_sequence))
+        
+        correlated_sampling, cholesky_matrix, correlated_risk_indices = self._prepare_correlated_sampling(
+            risks, correlations
+        )
+        
+        # Expand changed correlated risks to their whole correlated block
+        resampled_ids = set(changed_risk_ids)
+        correlated_blocks: List[List[str]] = []
+        if correlated_sampling and cholesky_matrix is not None:
+            correlation_matrix = self._build_numpy_correlation_matrix(correlations)
+            unvisited = set(risk_id for risk_id in changed_risk_ids if risk_id in correlated_risk_indices)
+            while unvisited:
+                block = [unvisited.pop()]
+                seen = set(block)
+                for risk_id in block:
+                    row = correlation_matrix[correlated_risk_indices[risk_id]]
+                    for other_index in np.nonzero(row)[0]:
+                        other_id = correlations.risk_ids[other_index]
+                        if other_id not in seen:
+                            seen.add(other_id)
+                            block.append(other_id)
+                unvisited -= seen
+                resampled_ids.update(block)
+                correlated_blocks.append(block)
+        
+        risks_by_id = {risk.id: risk for risk in risks}
+        new_samples: Dict[str, np.ndarray] = {}
+        
+        independent_risks = [
+            risk for risk in risks
+            if risk.id in resampled_ids and not any(risk.id in block for block in correlated_blocks)
+        ]
+        if independent_risks:
+            samples = self._sample_risk_matrix(independent_risks, iterations, random_state)
+            for j, risk in enumerate(independent_risks):
+                new_samples[risk.id] = samples[:, j]
+        
+        for block in correlated_blocks:
+            # Correlated blocks are diagonal blocks of the full matrix, so the Cholesky
+            # factor of the sub-matrix equals the matching block of the full factor
+            indices = [correlated_risk_indices[risk_id] for risk_id in block]
+            block_cholesky = np.linalg.cholesky(correlation_matrix[np.ix_(indices, indices)])
+            correlated_normals = random_state.standard_normal((iterations, len(block))) @ block_cholesky.T
+            for column, risk_id in enumerate(block):
+                new_samples[risk_id] = self._transform_samples_to_distribution(
+                    correlated_normals[:, column], risks_by_id[risk_id].probability_distribution, random_state
+                )
+        
+        # Assemble contributions: reused columns for unchanged risks, new columns otherwise
+        adjustment_factors = RiskInteractionTracker(risks, correlations).get_adjustment_factors(
+            [risk.id for risk in risks], correlations
+        )
+        contributions = np.empty((iterations, len(risks)), order='F')
+        for j, risk in enumerate(risks):
+            if risk.id in new_samples:
+                contributions[:, j] = new_samples[risk.id] * (risk.baseline_impact * adjustment_factors[j])
+            else:
+                contributions[:, j] = previous_results.risk_contributions[risk.id]
+        
+        cost_mask = np.array([risk.impact_type in [ImpactType.COST, ImpactType.BOTH] for risk in risks])
+        schedule_mask = np.array([risk.impact_type in [ImpactType.SCHEDULE, ImpactType.BOTH] for risk in risks])
+        total_cost_impact = contributions[:, cost_mask].sum(axis=1)
+        schedule_outcomes = contributions[:, schedule_mask].sum(axis=1)
+        
+        baseline_cost_total = sum(baseline_costs.values()) if baseline_costs else 0.0
+        cost_outcomes = baseline_cost_total + total_cost_impact
+        savings = total_cost_impact < 0
+        cost_outcomes[savings] = np.maximum(cost_outcomes[savings], baseline_cost_total * 0.1)
+        
+        convergence_tracker = ConvergenceTracker()
+        for i in range(1000, iterations, 1000):
+            convergence_tracker.update(cost_outcomes[:i+1], schedule_outcomes[:i+1])
+        final_convergence = convergence_tracker.finalize(cost_outcomes, schedule_outcomes, iterations)
+        
+        execution_time = time.time() - start_time
+        
+        if progress_callback:
+            progress_callback(ProgressStatus(
+                simulation_id=simulation_id,
+                current_iteration=iterations,
+                total_iterations=iterations,
+                elapsed_time=execution_time,
+                estimated_remaining_time=0.0,
+                status="completed"
+            ))
+        
+        results = SimulationResults(
+            simulation_id=simulation_id,
+            timestamp=datetime.now(),
+            iteration_count=iterations,
+            cost_outcomes=cost_outcomes,
+            schedule_outcomes=schedule_outcomes,
+            risk_contributions={risk.id: contributions[:, j] for j, risk in enumerate(risks)},
+            convergence_metrics=final_convergence,
+            execution_time=execution_time
+        )
+        
+        if self._config.compact_results_storage:
+            results = compact_simulation_results(results)
+        
+        with self._lock:
+            self._simulation_cache[simulation_id] = results
+            self._record_risk_fingerprints(
+                simulation_id, risks, iterations, correlations, random_seed, baseline_costs, None
+            )
+        
+        return results
+    
+    def run_impact_sweep(
+        self,
+        risks: List[Risk],
+        impact_variants: List[Dict[str, float]],
+        iterations: int = 10000,
+        correlations: Optional[CorrelationMatrix] = None,
+        random_seed: Optional[int] = None,
+        baseline_costs: Optional[Dict[str, float]] = None,
+        percentiles: Tuple[float, ...] = (10, 50, 80, 90, 95),
+        return_outcomes: bool = False,
+        variant_batch_size: int = 64
+    ) -> List[Dict[str, Any]]:
+        """
+        Simulate many baseline-impact variants of the same risks with common random numbers.
+        
+        All variants share one sampled (iterations x risks) matrix of correlation-adjusted
+        samples per unit of impact. Since contributions are linear in baseline impact, the
+        outcomes of a batch of variants are a single matrix product of that matrix with the
+        (risks x variants) impact matrix, so a sweep costs about one simulation plus one
+        matmul per batch instead of one full simulation per variant.
+        
+        Args:
+            risks: List of Risk objects to simulate
+            impact_variants: One dict per variant mapping risk ID -> baseline impact;
+                risks not listed keep their own baseline impact
+            iterations: Number of simulation iterations (minimum 10,000)
+            correlations: Optional correlation matrix for dependent risks
+            random_seed: Optional random seed for reproducibility
+            baseline_costs: Optional baseline cost data for integration
+            percentiles: Percentiles to report for each variant
+            return_outcomes: Include each variant's cost and schedule outcome arrays
+            variant_batch_size: Number of variants evaluated per matrix product
+            
+        Returns:
+            One dict per variant with 'cost' and 'schedule' statistics (mean, std and
+            percentiles) and, if requested, 'cost_outcomes' and 'schedule_outcomes'
+            
+        Raises:
+            ValueError: If the simulation parameters are invalid or a variant references
+                an unknown risk
+        """
+        validation_result = self.validate_simulation_parameters(risks, iterations)
+        if not validation_result.is_valid:
+            raise ValueError(f"Invalid simulation parameters: {validation_result.errors}")
+        
+        risk_index = {risk.id: j for j, risk in enumerate(risks)}
+        impact_matrix = np.tile(
+            np.array([risk.baseline_impact for risk in risks], dtype=float), (len(impact_variants), 1)
+        )
+        for v, variant in enumerate(impact_variants):
+            for risk_id, impact in variant.items():
+                if risk_id not in risk_index:
+                    raise ValueError(f"Impact variant references unknown risk: {risk_id}")
+                impact_matrix[v, risk_index[risk_id]] = impact
+        
+        random_state = np.random.RandomState(random_seed)
+        correlated_sampling, cholesky_matrix, correlated_risk_indices = self._prepare_correlated_sampling(
+            risks, correlations
+        )
+        unit_contributions = self._sample_unit_contributions(
+            risks, iterations, correlations, correlated_sampling, cholesky_matrix,
+            correlated_risk_indices, RiskInteractionTracker(risks, correlations), random_state
+        )
+        
+        cost_mask = np.array([risk.impact_type in [ImpactType.COST, ImpactType.BOTH] for risk in risks])
+        schedule_mask = np.array([risk.impact_type in [ImpactType.SCHEDULE, ImpactType.BOTH] for risk in risks])
+        cost_units = unit_contributions[:, cost_mask]
+        schedule_units = unit_contributions[:, schedule_mask]
+        baseline_cost_total = sum(baseline_costs.values()) if baseline_costs else 0.0
+        
+        def summarize(outcomes: np.ndarray) -> List[Dict[str, Any]]:
+            # Column-wise statistics for an (iterations x variants) outcome batch
+            means = outcomes.mean(axis=0)
+            stds = outcomes.std(axis=0)
+            percentile_values = np.percentile(outcomes, percentiles, axis=0)
+            return [
+                {
+                    'mean': float(means[k]),
+                    'std': float(stds[k]),
+                    'percentiles': {p: float(percentile_values[i, k]) for i, p in enumerate(percentiles)}
+                }
+                for k in range(outcomes.shape[1])
+            ]
+        
+        sweep_results = []
+        for start in range(0, len(impact_variants), max(1, variant_batch_size)):
+            batch_impacts = impact_matrix[start:start + max(1, variant_batch_size)]
+            
+            total_cost_impact = cost_units @ batch_impacts[:, cost_mask].T
+            schedule_outcomes = schedule_units @ batch_impacts[:, schedule_mask].T
+            
+            # Integrate with baseline costs, flooring cost savings at 10% of baseline
+            cost_outcomes = baseline_cost_total + total_cost_impact
+            savings = total_cost_impact < 0
+            cost_outcomes[savings] = np.maximum(cost_outcomes[savings], baseline_cost_total * 0.1)
+            
+            for k, (cost_stats, schedule_stats) in enumerate(
+                zip(summarize(cost_outcomes), summarize(schedule_outcomes))
+            ):
+                variant_result = {'cost': cost_stats, 'schedule': schedule_stats}
+                if return_outcomes:
+                    variant_result['cost_outcomes'] = cost_outcomes[:, k].copy()
+                    variant_result['schedule_outcomes'] = schedule_outcomes[:, k].copy()
+                sweep_results.append(variant_result)
+        
+        return sweep_results
+    
     def validate_simulation_parameters(self, risks: List[Risk], iterations: int = 10000, schedule_data: Optional[ScheduleData] = None) -> ValidationResult:
         """
         Validate simulation parameters before execution.
@@ -664,6 +1339,46 @@ class MonteCarloEngine:
         with self._lock:
             return self._simulation_cache.get(simulation_id)
     
+    def _prepare_correlated_sampling(
+        self,
+        risks: List[Risk],
+        correlations: Optional[CorrelationMatrix]
+    ) -> Tuple[bool, Optional[np.ndarray], Dict[str, int]]:
+        """
+        Prepare the Cholesky factor used for correlated sampling.
+        
+        Args:
+            risks: List of Risk objects to simulate
+            correlations: Optional correlation matrix for dependent risks
+            
+        Returns:
+            Tuple of (correlated_sampling, cholesky_matrix, correlated_risk_indices)
+            
+        Raises:
+            ValueError: If the correlation matrix references an unknown risk
+        """
+        if correlations is None:
+            return False, None, {}
+        
+        # Validate that all risks in correlation matrix exist
+        risk_ids = [risk.id for risk in risks]
+        for risk_id in correlations.risk_ids:
+            if risk_id not in risk_ids:
+                raise ValueError(f"Correlation matrix references unknown risk: {risk_id}")
+        
+        # Create correlation-aware sampling
+        correlated_risk_indices = {risk_id: i for i, risk_id in enumerate(correlations.risk_ids)}
+        correlation_matrix = self._build_numpy_correlation_matrix(correlations)
+        
+        # Use Cholesky decomposition for correlated sampling
+        try:
+            cholesky_matrix = np.linalg.cholesky(correlation_matrix)
+        except np.linalg.LinAlgError:
+            # Fallback to uncorrelated sampling if matrix is not positive definite
+            return False, None, correlated_risk_indices
+        
+        return True, cholesky_matrix, correlated_risk_indices
+    
     def _build_numpy_correlation_matrix(self, correlations: CorrelationMatrix) -> np.ndarray:
         """
         Build a NumPy correlation matrix from the CorrelationMatrix object.
@@ -727,6 +1442,211 @@ class MonteCarloEngine:
             # This is a simplification - full implementation would use proper inverse CDF
             return distribution.sample(1, random_state)[0]
     
+    def _run_vectorized_iterations(
+        self,
+        risks: List[Risk],
+        iterations: int,
+        correlations: Optional[CorrelationMatrix],
+        correlated_sampling: bool,
+        cholesky_matrix: Optional[np.ndarray],
+        correlated_risk_indices: Dict[str, int],
+        risk_interaction_tracker: 'RiskInteractionTracker',
+        baseline_cost_total: float,
+        schedule_data: Optional[ScheduleData],
+        random_state: np.random.RandomState,
+        schedule_model: Optional['ScheduleImpactModel'] = None
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Execute all simulation iterations as column-wise array operations.
+        
+        Mirrors the per-iteration loop in run_simulation: samples are drawn as an
+        (iterations x risks) matrix, the Cholesky factor is applied in a single matmul,
+        and correlation adjustments, which only depend on risk order, are applied as
+        one factor per risk column. Schedule adjustments are sampled for all iterations
+        at once from the precompiled ScheduleImpactModel.
+        
+        Args:
+            risks: List of Risk objects to simulate
+            iterations: Number of simulation iterations
+            correlations: Optional correlation matrix for dependent risks
+            correlated_sampling: Whether correlated sampling is active
+            cholesky_matrix: Cholesky factor of the correlation matrix, if any
+            correlated_risk_indices: Risk ID -> column index in the correlation matrix
+            risk_interaction_tracker: Tracker providing correlation adjustments
+            baseline_cost_total: Sum of baseline costs
+            schedule_data: Optional schedule data for timeline integration
+            random_state: Random state for sampling
+            schedule_model: schedule_data precompiled by the caller; compiled here if None
+            
+        Returns:
+            Tuple of (cost_outcomes, schedule_outcomes, risk_contributions)
+        """
+        unit_contributions = self._sample_unit_contributions(
+            risks, iterations, correlations, correlated_sampling, cholesky_matrix,
+            correlated_risk_indices, risk_interaction_tracker, random_state
+        )
+        baseline_impacts = np.array([risk.baseline_impact for risk in risks], dtype=float)
+        contributions = unit_contributions * baseline_impacts
+        
+        cost_mask = np.array([risk.impact_type in [ImpactType.COST, ImpactType.BOTH] for risk in risks])
+        schedule_mask = np.array([risk.impact_type in [ImpactType.SCHEDULE, ImpactType.BOTH] for risk in risks])
+        total_cost_impact = contributions[:, cost_mask].sum(axis=1)
+        schedule_outcomes = contributions[:, schedule_mask].sum(axis=1)
+        
+        # Apply schedule simulation logic if schedule data is provided
+        if schedule_data:
+            if schedule_model is None:
+                schedule_model = ScheduleImpactModel(schedule_data)
+            schedule_outcomes = schedule_model.sample(schedule_outcomes, random_state)
+        
+        # Integrate with baseline costs, flooring cost savings at 10% of baseline
+        cost_outcomes = baseline_cost_total + total_cost_impact
+        savings = total_cost_impact < 0
+        cost_outcomes[savings] = np.maximum(cost_outcomes[savings], baseline_cost_total * 0.1)
+        
+        risk_contributions = {risk.id: contributions[:, j] for j, risk in enumerate(risks)}
+        
+        return cost_outcomes, schedule_outcomes, risk_contributions
+    
+    def _sample_unit_contributions(
+        self,
+        risks: List[Risk],
+        iterations: int,
+        correlations: Optional[CorrelationMatrix],
+        correlated_sampling: bool,
+        cholesky_matrix: Optional[np.ndarray],
+        correlated_risk_indices: Dict[str, int],
+        risk_interaction_tracker: 'RiskInteractionTracker',
+        random_state: np.random.RandomState
+    ) -> np.ndarray:
+        """
+        Draw correlation-adjusted risk samples per unit of baseline impact.
+        
+        Sampling does not depend on baseline impacts, so multiplying the returned
+        (iterations x risks) matrix by each risk's baseline impact yields its contributions.
+        
+        Args:
+            risks: List of Risk objects to simulate
+            iterations: Number of simulation iterations
+            correlations: Optional correlation matrix for dependent risks
+            correlated_sampling: Whether correlated sampling is active
+            cholesky_matrix: Cholesky factor of the correlation matrix, if any
+            correlated_risk_indices: Risk ID -> column index in the correlation matrix
+            risk_interaction_tracker: Tracker providing correlation adjustments
+            random_state: Random state for sampling
+            
+        Returns:
+            Matrix of adjusted samples, one column per risk
+        """
+        samples = self._sample_risk_matrix(risks, iterations, random_state)
+        
+        if correlated_sampling and cholesky_matrix is not None:
+            # Rows are iterations, so L @ z per row becomes Z @ L^T for the whole batch
+            independent_normals = random_state.standard_normal((iterations, len(correlations.risk_ids)))
+            correlated_normals = independent_normals @ cholesky_matrix.T
+            
+            for j, risk in enumerate(risks):
+                if risk.id in correlated_risk_indices:
+                    samples[:, j] = self._transform_samples_to_distribution(
+                        correlated_normals[:, correlated_risk_indices[risk.id]],
+                        risk.probability_distribution,
+                        random_state
+                    )
+        
+        adjustment_factors = risk_interaction_tracker.get_adjustment_factors(
+            [risk.id for risk in risks], correlations
+        )
+        samples *= adjustment_factors
+        return samples
+    
+    def _sample_risk_matrix(
+        self,
+        risks: List[Risk],
+        iterations: int,
+        random_state: np.random.RandomState
+    ) -> np.ndarray:
+        """
+        Draw independent samples for all risks as an (iterations x risks) matrix.
+        
+        Risks sharing a distribution type are sampled in a single call with
+        broadcast per-column parameters and bounds.
+        
+        Args:
+            risks: List of Risk objects to sample
+            iterations: Number of rows to draw
+            random_state: Random state for sampling
+            
+        Returns:
+            Matrix of raw distribution samples, one column per risk
+        """
+        samples = np.empty((iterations, len(risks)))
+        
+        columns_by_type: Dict[DistributionType, List[int]] = {}
+        for j, risk in enumerate(risks):
+            columns_by_type.setdefault(risk.probability_distribution.distribution_type, []).append(j)
+        
+        for distribution_type, columns in columns_by_type.items():
+            distributions = [risks[j].probability_distribution for j in columns]
+            size = (iterations, len(columns))
+            
+            def param(name: str) -> np.ndarray:
+                return np.array([d.parameters[name] for d in distributions], dtype=float)
+            
+            if distribution_type == DistributionType.NORMAL:
+                block = random_state.normal(param('mean'), param('std'), size)
+            elif distribution_type == DistributionType.TRIANGULAR:
+                block = random_state.triangular(param('min'), param('mode'), param('max'), size)
+            elif distribution_type == DistributionType.UNIFORM:
+                block = random_state.uniform(param('min'), param('max'), size)
+            elif distribution_type == DistributionType.BETA:
+                block = random_state.beta(param('alpha'), param('beta'), size)
+            elif distribution_type == DistributionType.LOGNORMAL:
+                block = random_state.lognormal(param('mu'), param('sigma'), size)
+            else:
+                raise ValueError(f"Unsupported distribution type: {distribution_type}")
+            
+            # Apply bounds where specified
+            if any(d.bounds is not None for d in distributions):
+                lower = np.array([d.bounds[0] if d.bounds is not None else -np.inf for d in distributions])
+                upper = np.array([d.bounds[1] if d.bounds is not None else np.inf for d in distributions])
+                block = np.clip(block, lower, upper)
+            
+            samples[:, columns] = block
+        
+        return samples
+    
+    def _transform_samples_to_distribution(
+        self,
+        standard_normal_samples: np.ndarray,
+        distribution: ProbabilityDistribution,
+        random_state: np.random.RandomState
+    ) -> np.ndarray:
+        """
+        Vectorized counterpart of _transform_sample_to_distribution.
+        
+        Args:
+            standard_normal_samples: Column of correlated standard normal samples
+            distribution: Target probability distribution
+            random_state: Random state for additional sampling if needed
+            
+        Returns:
+            Transformed samples matching the target distribution
+        """
+        size = len(standard_normal_samples)
+        
+        if distribution.distribution_type == DistributionType.NORMAL:
+            mean = distribution.parameters['mean']
+            std = distribution.parameters['std']
+            return mean + std * standard_normal_samples
+        
+        elif distribution.distribution_type == DistributionType.TRIANGULAR:
+            base_samples = distribution.sample(size, random_state)
+            correlation_influence = 0.3 * standard_normal_samples * (distribution.parameters['max'] - distribution.parameters['min']) / 6
+            return base_samples + correlation_influence
+        
+        else:
+            return distribution.sample(size, random_state)
+    
     def _simulate_schedule_impact(
         self,
         base_schedule_impact: float,
@@ -1052,60 +1972,28 @@ class MonteCarloEngine:
         if len(demand_periods) <= 1:
             return 0.0  # No scheduling conflicts with single or no activities
         
-        # Sort demand periods by start time
-        sorted_periods = sorted(demand_periods, key=lambda x: x['start'])
-        
-        total_scheduling_impact = 0.0
         available_capacity = resource.total_availability * resource.utilization_limit
         
-        # Simulate resource scheduling conflicts
-        for i in range(len(sorted_periods)):
-            current_period = sorted_periods[i]
+        # Overlaps are found for all periods at once instead of a nested loop per period
+        conflict_impacts, conflict_critical = ScheduleImpactModel.find_scheduling_conflicts(
+            np.array([p['start'] for p in demand_periods], dtype=float),
+            np.array([p['end'] for p in demand_periods], dtype=float),
+            np.array([p['demand'] for p in demand_periods], dtype=float),
+            np.array([p['critical_path'] for p in demand_periods], dtype=bool),
+            available_capacity
+        )
+        
+        total_scheduling_impact = 0.0
+        for base_impact, critical_path in zip(conflict_impacts, conflict_critical):
+            # Random variation in scheduling efficiency
+            scheduling_efficiency = random_state.uniform(0.7, 1.0)  # 70-100% efficiency
+            scheduling_impact = base_impact / scheduling_efficiency
             
-            # Check for overlapping resource demands
-            overlapping_periods = []
-            for j in range(len(sorted_periods)):
-                if i != j:
-                    other_period = sorted_periods[j]
-                    # Check if periods overlap
-                    if (current_period['start'] < other_period['end'] and 
-                        current_period['end'] > other_period['start']):
-                        overlapping_periods.append(other_period)
-            
-            if overlapping_periods:
-                # Calculate total demand during overlap
-                total_concurrent_demand = current_period['demand']
-                for overlap in overlapping_periods:
-                    total_concurrent_demand += overlap['demand']
-                
-                # Check if demand exceeds available capacity
-                if total_concurrent_demand > available_capacity:
-                    # Calculate resource conflict impact
-                    excess_demand = total_concurrent_demand - available_capacity
-                    conflict_ratio = excess_demand / max(available_capacity, 0.001)
-                    
-                    # Duration of the conflict
-                    conflict_start = current_period['start']
-                    conflict_end = current_period['end']
-                    for overlap in overlapping_periods:
-                        conflict_start = max(conflict_start, overlap['start'])
-                        conflict_end = min(conflict_end, overlap['end'])
-                    
-                    conflict_duration = max(0, conflict_end - conflict_start)
-                    
-                    # Impact is proportional to conflict severity and duration
-                    base_impact = conflict_ratio * conflict_duration * 0.1
-                    
-                    # Random variation in scheduling efficiency
-                    scheduling_efficiency = random_state.uniform(0.7, 1.0)  # 70-100% efficiency
-                    scheduling_impact = base_impact / scheduling_efficiency
-                    
-                    # Critical path conflicts have higher impact
-                    if (current_period['critical_path'] or 
-                        any(overlap['critical_path'] for overlap in overlapping_periods)):
-                        scheduling_impact *= 2.0
-                    
-                    total_scheduling_impact += scheduling_impact
+            # Critical path conflicts have higher impact
+            if critical_path:
+                scheduling_impact *= 2.0
+            
+            total_scheduling_impact += scheduling_impact
         
         return total_scheduling_impact
     
@@ -1207,12 +2095,14 @@ class MonteCarloEngine:
             if simulation_ids is None:
                 self._simulation_cache.clear()
                 self._parameter_cache.clear()
+                self._risk_fingerprint_cache.clear()
             else:
                 for sim_id in simulation_ids:
                     if sim_id in self._simulation_cache:
                         del self._simulation_cache[sim_id]
                     if sim_id in self._parameter_cache:
                         del self._parameter_cache[sim_id]
+                    self._risk_fingerprint_cache.pop(sim_id, None)
     
     def get_configuration(self) -> SimulationConfig:
         """
@@ -1239,6 +2129,12 @@ class MonteCarloEngine:
         
         self._config = config
         
+        with self._lock:
+            self._simulation_cache.configure(
+                max_entries=config.cache_size_limit,
+                spill_directory=config.results_spill_directory
+            )
+        
         # Clear cache if caching is disabled in new config
         if not config.enable_caching:
             self.clear_cache()
@@ -1302,6 +2198,9 @@ class MonteCarloEngine:
         random_state = effective_config.get_random_state()
         random_seed = effective_config.random_seed
         
+        # Parallel execution shards iterations across worker processes
+        num_shards = (effective_config.num_threads or os.cpu_count() or 1) if effective_config.parallel_execution else None
+        
         # Use caching if enabled
         if effective_config.enable_caching:
             return self.run_simulation_with_caching(
@@ -1313,7 +2212,20 @@ class MonteCarloEngine:
                 previous_simulation_id=previous_simulation_id,
                 force_rerun=force_rerun,
                 baseline_costs=baseline_costs,
-                schedule_data=schedule_data
+                schedule_data=schedule_data,
+                vectorized=effective_config.vectorized_execution,
+                num_shards=num_shards
+            )
+        elif num_shards:
+            return self.run_simulation_sharded(
+                risks=risks,
+                iterations=effective_iterations,
+                correlations=correlations,
+                random_seed=random_seed,
+                progress_callback=progress_callback if effective_config.enable_progress_tracking else None,
+                baseline_costs=baseline_costs,
+                schedule_data=schedule_data,
+                num_shards=num_shards
             )
         else:
             return self.run_simulation(
@@ -1323,7 +2235,8 @@ class MonteCarloEngine:
                 random_seed=random_seed,
                 progress_callback=progress_callback if effective_config.enable_progress_tracking else None,
                 baseline_costs=baseline_costs,
-                schedule_data=schedule_data
+                schedule_data=schedule_data,
+                vectorized=effective_config.vectorized_execution
             )
     
     def validate_model(
@@ -1877,36 +2790,307 @@ class RiskInteractionTracker:
         adjustment_factor = max(0.5, 1.0 - min(total_correlation_effect, 0.5))
         
         return base_impact * adjustment_factor
+    
+    def get_adjustment_factors(
+        self,
+        risk_order: List[str],
+        correlations: Optional[CorrelationMatrix] = None
+    ) -> np.ndarray:
+        """
+        Compute the adjust_for_correlations factor for every risk at once.
+        
+        Within an iteration each risk is only adjusted against the risks processed
+        before it, so the factor depends on risk order alone and is the same for
+        every iteration.
+        
+        Args:
+            risk_order: Risk IDs in the order they are processed
+            correlations: Optional correlation matrix
+            
+        Returns:
+            Array of multiplicative adjustment factors aligned with risk_order
+        """
+        factors = np.ones(len(risk_order))
+        if not correlations:
+            return factors
+        
+        for j in range(1, len(risk_order)):
+            total_correlation_effect = 0.0
+            for other_risk_id in risk_order[:j]:
+                correlation = correlations.get_correlation(risk_order[j], other_risk_id)
+                if abs(correlation) > 0.1:
+                    total_correlation_effect += abs(correlation) * 0.1
+            factors[j] = max(0.5, 1.0 - min(total_correlation_effect, 0.5))
+        
+        return factors
+
+
+class QuantileSketch:
+    """
+    Mergeable, fixed-size summary for streaming quantile estimates.
+    
+    Keeps at most max_centroids weighted centroids over the sorted observations.
+    Each batch is merged in with a single sort and compressed back by cumulative
+    weight, so the rank error of quantile estimates is bounded by roughly
+    1 / max_centroids while memory stays constant.
+    """
+    
+    def __init__(self, max_centroids: int = 1000):
+        """
+        Initialize an empty sketch.
+        
+        Args:
+            max_centroids: Maximum number of centroids retained after compression
+        """
+        self.max_centroids = max_centroids
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+    
+    @property
+    def count(self) -> float:
+        """Total weight (number of observations) summarized by the sketch."""
+        return float(self.weights.sum())
+    
+    def add(self, samples: np.ndarray):
+        """Add a batch of observations to the sketch."""
+        samples = np.asarray(samples, dtype=float)
+        if samples.size == 0:
+            return
+        self._compress(
+            np.concatenate([self.values, samples]),
+            np.concatenate([self.weights, np.ones(samples.size)])
+        )
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Return a new sketch summarizing the observations of both sketches."""
+        merged = QuantileSketch(max(self.max_centroids, other.max_centroids))
+        merged._compress(
+            np.concatenate([self.values, other.values]),
+            np.concatenate([self.weights, other.weights])
+        )
+        return merged
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile of the observations.
+        
+        Args:
+            q: Quantile in [0, 1]
+            
+        Returns:
+            Estimated quantile value, or NaN for an empty sketch
+        """
+        if self.values.size == 0:
+            return float('nan')
+        midpoints = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * self.weights.sum(), midpoints, self.values))
+    
+    def _compress(self, values: np.ndarray, weights: np.ndarray):
+        """Sort centroids and merge neighbours into at most max_centroids buckets."""
+        order = np.argsort(values, kind='stable')
+        values, weights = values[order], weights[order]
+        
+        if values.size > self.max_centroids:
+            cumulative = np.cumsum(weights)
+            buckets = np.minimum(
+                ((cumulative - weights / 2) / cumulative[-1] * self.max_centroids).astype(int),
+                self.max_centroids - 1
+            )
+            bucket_weights = np.bincount(buckets, weights=weights, minlength=self.max_centroids)
+            bucket_sums = np.bincount(buckets, weights=values * weights, minlength=self.max_centroids)
+            occupied = bucket_weights > 0
+            values = bucket_sums[occupied] / bucket_weights[occupied]
+            weights = bucket_weights[occupied]
+        
+        self.values, self.weights = values, weights
 
 
 class ConvergenceTracker:
-    """Helper class to track simulation convergence."""
+    """
+    Helper class to track simulation convergence.
+    
+    Mean and variance are maintained online (Welford/Chan batch updates) and
+    percentiles through a QuantileSketch, so recording a checkpoint only costs
+    the outcomes produced since the previous one.
+    """
     
-    def __init__(self):
-        """Initialize convergence tracker."""
+    def __init__(self, check_interval: int = 1000, percentiles: Tuple[int, ...] = (10, 50, 90)):
+        """
+        Initialize convergence tracker.
+        
+        Args:
+            check_interval: Number of iterations between two recorded checkpoints
+            percentiles: Cost percentiles whose history is tracked per checkpoint
+        """
+        self.check_interval = check_interval
+        self.checkpoint_counts = []
         self.cost_means = []
         self.cost_variances = []
         self.schedule_means = []
         self.schedule_variances = []
-        self.percentile_history = {p: [] for p in [10, 50, 90]}
+        self.percentile_history = {p: [] for p in percentiles}
+        
+        # Online statistics over every outcome observed so far
+        self.count = 0
+        self.cost_mean = 0.0
+        self.cost_variance = 0.0
+        self.schedule_mean = 0.0
+        self.schedule_variance = 0.0
+        self.cost_sketch = QuantileSketch()
+    
+    def observe(self, cost_batch: np.ndarray, schedule_batch: np.ndarray):
+        """
+        Fold a batch of new outcomes into the online statistics.
+        
+        Args:
+            cost_batch: Cost outcomes not yet observed
+            schedule_batch: Schedule outcomes aligned with cost_batch
+        """
+        batch_size = len(cost_batch)
+        if batch_size == 0:
+            return
+        
+        if self.count == 0:
+            self.cost_mean, self.cost_variance = float(np.mean(cost_batch)), float(np.var(cost_batch))
+            self.schedule_mean, self.schedule_variance = float(np.mean(schedule_batch)), float(np.var(schedule_batch))
+        else:
+            self.cost_mean, self.cost_variance = self._pool_moments(
+                self.count, self.cost_mean, self.cost_variance,
+                batch_size, float(np.mean(cost_batch)), float(np.var(cost_batch))
+            )
+            self.schedule_mean, self.schedule_variance = self._pool_moments(
+                self.count, self.schedule_mean, self.schedule_variance,
+                batch_size, float(np.mean(schedule_batch)), float(np.var(schedule_batch))
+            )
+        
+        self.count += batch_size
+        self.cost_sketch.add(cost_batch)
     
     def update(self, cost_outcomes: np.ndarray, schedule_outcomes: np.ndarray):
-        """Update convergence metrics with current outcomes."""
-        # Calculate running statistics
-        cost_mean = np.mean(cost_outcomes)
-        cost_var = np.var(cost_outcomes)
-        schedule_mean = np.mean(schedule_outcomes)
-        schedule_var = np.var(schedule_outcomes)
-        
-        self.cost_means.append(cost_mean)
-        self.cost_variances.append(cost_var)
-        self.schedule_means.append(schedule_mean)
-        self.schedule_variances.append(schedule_var)
+        """
+        Record a convergence checkpoint for the outcomes produced so far.
+        
+        Successive calls receive growing prefixes of the same outcome arrays; only
+        the outcomes beyond those already observed are consumed.
+        """
+        self.observe(cost_outcomes[self.count:], schedule_outcomes[self.count:])
+        self.record_checkpoint()
+    
+    def record_checkpoint(self):
+        """Append the current online statistics to the checkpoint history."""
+        self.checkpoint_counts.append(self.count)
+        self.cost_means.append(self.cost_mean)
+        self.cost_variances.append(self.cost_variance)
+        self.schedule_means.append(self.schedule_mean)
+        self.schedule_variances.append(self.schedule_variance)
         
         # Track key percentiles
         for p in self.percentile_history.keys():
-            cost_percentile = np.percentile(cost_outcomes, p)
-            self.percentile_history[p].append(cost_percentile)
+            self.percentile_history[p].append(self.cost_sketch.quantile(p / 100.0))
+    
+    def is_stable(
+        self,
+        percentiles: Tuple[int, ...] = (50, 80, 95),
+        tolerance: float = 0.01,
+        window: int = 3
+    ) -> bool:
+        """
+        Check whether percentile estimates have stopped moving.
+        
+        Args:
+            percentiles: Tracked cost percentiles that must be stable
+            tolerance: Maximum relative change allowed between consecutive checkpoints
+            window: Number of consecutive checkpoint-to-checkpoint changes to inspect
+            
+        Returns:
+            True if every percentile changed by at most tolerance over the window
+        """
+        for p in percentiles:
+            history = self.percentile_history[p]
+            if len(history) < window + 1:
+                return False
+            
+            recent = np.asarray(history[-(window + 1):])
+            scale = np.maximum(np.abs(recent[1:]), 1e-12)
+            if np.any(np.abs(np.diff(recent)) / scale > tolerance):
+                return False
+        
+        return True
+    
+    def merge(self, other: 'ConvergenceTracker') -> 'ConvergenceTracker':
+        """
+        Merge the statistics of another tracker into a new tracker.
+        
+        Used to combine the partial statistics of independent simulation shards.
+        Online moments and quantile sketches are pooled over all observed outcomes.
+        The k-th checkpoint of the merged tracker pools the k-th checkpoint of both
+        trackers: means and variances are combined exactly from their sample counts,
+        percentiles are approximated by a count-weighted average. Checkpoints that
+        only one tracker reached are dropped.
+        
+        Args:
+            other: Tracker holding the statistics of another shard
+            
+        Returns:
+            New ConvergenceTracker with pooled checkpoint statistics
+        """
+        merged = ConvergenceTracker(
+            check_interval=self.check_interval + other.check_interval,
+            percentiles=tuple(self.percentile_history.keys())
+        )
+        
+        # Pool the online statistics over all observed outcomes
+        merged.count = self.count + other.count
+        if self.count and other.count:
+            merged.cost_mean, merged.cost_variance = self._pool_moments(
+                self.count, self.cost_mean, self.cost_variance,
+                other.count, other.cost_mean, other.cost_variance
+            )
+            merged.schedule_mean, merged.schedule_variance = self._pool_moments(
+                self.count, self.schedule_mean, self.schedule_variance,
+                other.count, other.schedule_mean, other.schedule_variance
+            )
+        else:
+            source = self if self.count else other
+            merged.cost_mean, merged.cost_variance = source.cost_mean, source.cost_variance
+            merged.schedule_mean, merged.schedule_variance = source.schedule_mean, source.schedule_variance
+        merged.cost_sketch = self.cost_sketch.merge(other.cost_sketch)
+        
+        for k in range(min(len(self.checkpoint_counts), len(other.checkpoint_counts))):
+            n1, n2 = self.checkpoint_counts[k], other.checkpoint_counts[k]
+            total = n1 + n2
+            
+            cost_mean, cost_var = self._pool_moments(
+                n1, self.cost_means[k], self.cost_variances[k],
+                n2, other.cost_means[k], other.cost_variances[k]
+            )
+            schedule_mean, schedule_var = self._pool_moments(
+                n1, self.schedule_means[k], self.schedule_variances[k],
+                n2, other.schedule_means[k], other.schedule_variances[k]
+            )
+            
+            merged.checkpoint_counts.append(total)
+            merged.cost_means.append(cost_mean)
+            merged.cost_variances.append(cost_var)
+            merged.schedule_means.append(schedule_mean)
+            merged.schedule_variances.append(schedule_var)
+            for p in merged.percentile_history.keys():
+                merged.percentile_history[p].append(
+                    (n1 * self.percentile_history[p][k] + n2 * other.percentile_history[p][k]) / total
+                )
+        
+        return merged
+    
+    @staticmethod
+    def _pool_moments(
+        n1: int, mean1: float, var1: float,
+        n2: int, mean2: float, var2: float
+    ) -> Tuple[float, float]:
+        """Combine the mean and population variance of two disjoint samples."""
+        total = n1 + n2
+        mean = (n1 * mean1 + n2 * mean2) / total
+        var = (n1 * (var1 + (mean1 - mean) ** 2) + n2 * (var2 + (mean2 - mean) ** 2)) / total
+        return mean, var
     
     def finalize(self, cost_outcomes: np.ndarray, schedule_outcomes: np.ndarray, iterations: int) -> ConvergenceMetrics:
         """Calculate final convergence metrics."""
@@ -1945,7 +3129,7 @@ class ConvergenceTracker:
                 self._calculate_running_stability(self.cost_variances)
             )):
                 if m_stab > 0.95 and v_stab > 0.95:
-                    iterations_to_convergence = (i + 1) * 1000  # Since we check every 1000 iterations
+                    iterations_to_convergence = (i + 1) * self.check_interval
                     break
         
         return ConvergenceMetrics(
@@ -1969,4 +3153,242 @@ class ConvergenceTracker:
                     stability.append(1.0 - min(cv, 1.0))
                 else:
                     stability.append(0.0)
-        return stability
\ No newline at end of file
+        return stability
+
+
+class ScheduleImpactModel:
+    """
+    Schedule data precompiled into arrays for vectorized schedule impact sampling.
+    
+    Everything in the per-iteration schedule model that does not depend on random
+    draws (critical path ratios, milestone and activity weights, resource demand
+    periods, availability overlaps and scheduling conflicts) is computed once per run.
+    ``sample`` then draws the remaining random terms for all iterations at once and
+    matches the distribution of MonteCarloEngine._simulate_schedule_impact.
+    """
+    
+    def __init__(self, schedule_data: ScheduleData):
+        """
+        Compile schedule data.
+        
+        Args:
+            schedule_data: Schedule data with milestones, activities and resources
+        """
+        milestones = schedule_data.milestones
+        activities = schedule_data.activities
+        project_duration = max(schedule_data.project_baseline_duration, 1.0)
+        
+        self.has_schedule_items = bool(milestones or activities)
+        
+        # Critical path multiplier: 1.5 to 2.5 depending on the share of critical items
+        total_items = len(milestones) + len(activities)
+        critical_items = sum(1 for m in milestones if m.critical_path) + sum(1 for a in activities if a.critical_path)
+        self.critical_multiplier = 1.5 + (critical_items / total_items if total_items else 0.0)
+        
+        # Milestone adjustments: normal(0, sd) scaled by dependency and critical path weights
+        self.milestone_std = np.array(
+            [m.baseline_duration / project_duration * 0.5 for m in milestones], dtype=float
+        )
+        self.milestone_weight = np.array(
+            [(1.0 + len(m.dependencies) * 0.1) * (1.5 if m.critical_path else 1.0) for m in milestones],
+            dtype=float
+        )
+        
+        # Activity adjustments: float time absorbs risk except on the critical path
+        self.activity_std = np.array(
+            [a.baseline_duration / project_duration * 0.3 for a in activities], dtype=float
+        )
+        self.activity_weight = np.array(
+            [
+                1.2 if a.critical_path else 1.0 - min(0.8, a.float_time / max(a.baseline_duration, 1.0))
+                for a in activities
+            ],
+            dtype=float
+        )
+        self.project_wide_scale = len(activities) * 0.1
+        
+        self.has_resource_constraints = bool(schedule_data.resource_constraints)
+        self.resources = []
+        if activities:
+            for resource in schedule_data.resource_constraints:
+                self.resources.append(self._compile_resource(resource, activities))
+    
+    @staticmethod
+    def _compile_resource(resource: ResourceConstraint, activities: List[Activity]) -> Dict[str, Any]:
+        """Precompute the deterministic parts of one resource's schedule impact."""
+        requiring = [a for a in activities if resource.resource_id in a.resource_requirements]
+        starts = np.array([a.earliest_start for a in requiring], dtype=float)
+        ends = np.array([a.earliest_start + a.baseline_duration for a in requiring], dtype=float)
+        demands = np.array([a.resource_requirements[resource.resource_id] for a in requiring], dtype=float)
+        critical = np.array([a.critical_path for a in requiring], dtype=bool)
+        
+        available_capacity = resource.total_availability * resource.utilization_limit
+        utilization_ratio = demands.sum() / max(available_capacity, 0.001)
+        
+        # Reduced availability periods: impact = coefficient * normal(1.0, 0.2)
+        availability_coefficients = []
+        for start_day, end_day, availability_factor in resource.availability_periods:
+            overlap = np.maximum(0, np.minimum(ends, end_day) - np.maximum(starts, start_day))
+            overlapping = (starts < end_day) & (ends > start_day) & (overlap > 0)
+            if not overlapping.any():
+                continue
+            overlap_demand = np.sum(
+                demands[overlapping] * (overlap[overlapping] / (ends[overlapping] - starts[overlapping]))
+            )
+            if overlap_demand > 0:
+                shortage = resource.total_availability * (1.0 - availability_factor) / max(resource.total_availability, 0.001)
+                coefficient = shortage * overlap_demand / 10.0
+                if critical[overlapping].any():
+                    coefficient *= 1.5
+                availability_coefficients.append(coefficient)
+        
+        # Scheduling conflicts: impact = base / uniform(0.7, 1.0)
+        conflict_impacts, conflict_critical = ScheduleImpactModel.find_scheduling_conflicts(
+            starts, ends, demands, critical, available_capacity
+        )
+        
+        return {
+            'availability_coefficients': np.array(availability_coefficients, dtype=float),
+            'conflict_impacts': np.where(conflict_critical, 2.0, 1.0) * conflict_impacts,
+            'utilization_pressure': (utilization_ratio - 0.8) * 2.0 if utilization_ratio > 0.8 else None,
+            'critical_path_multiplier': (
+                1.0 + (critical.sum() / len(requiring)) * 0.5 if critical.any() else 1.0
+            )
+        }
+    
+    @staticmethod
+    def find_scheduling_conflicts(
+        starts: np.ndarray,
+        ends: np.ndarray,
+        demands: np.ndarray,
+        critical: np.ndarray,
+        available_capacity: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find demand periods whose concurrent demand exceeds a resource's capacity.
+        
+        Periods are taken in order of start time (ties keep their input order). For each
+        period, all other periods overlapping it contribute their demand; when the total
+        exceeds capacity, the conflict impact is the excess ratio times the duration of
+        the common overlap times 0.1.
+        
+        Args:
+            starts: Period start days
+            ends: Period end days
+            demands: Resource demand per period
+            critical: Critical path flag per period
+            available_capacity: Usable resource capacity
+            
+        Returns:
+            Tuple of (base impact per conflict, critical path flag per conflict), in
+            order of period start
+        """
+        if len(starts) <= 1:
+            return np.empty(0), np.empty(0, dtype=bool)
+        
+        order = np.argsort(starts, kind='stable')
+        starts, ends, demands, critical = starts[order], ends[order], demands[order], critical[order]
+        
+        overlaps = (starts[:, None] < ends[None, :]) & (ends[:, None] > starts[None, :])
+        np.fill_diagonal(overlaps, False)
+        
+        concurrent_demand = demands + overlaps @ demands
+        in_conflict = overlaps.any(axis=1) & (concurrent_demand > available_capacity)
+        if not in_conflict.any():
+            return np.empty(0), np.empty(0, dtype=bool)
+        
+        overlaps = overlaps[in_conflict]
+        conflict_start = np.maximum(starts[in_conflict], np.where(overlaps, starts, -np.inf).max(axis=1))
+        conflict_end = np.minimum(ends[in_conflict], np.where(overlaps, ends, np.inf).min(axis=1))
+        conflict_duration = np.maximum(0, conflict_end - conflict_start)
+        
+        conflict_ratio = (concurrent_demand[in_conflict] - available_capacity) / max(available_capacity, 0.001)
+        conflict_critical = critical[in_conflict] | (overlaps & critical).any(axis=1)
+        
+        return conflict_ratio * conflict_duration * 0.1, conflict_critical
+    
+    def sample(self, base_schedule_impacts: np.ndarray, random_state: np.random.RandomState) -> np.ndarray:
+        """
+        Apply schedule adjustments to the base schedule impact of every iteration.
+        
+        Args:
+            base_schedule_impacts: Base schedule impact per iteration
+            random_state: Random state for the schedule-specific random terms
+            
+        Returns:
+            Adjusted, non-negative schedule impact per iteration
+        """
+        if not self.has_schedule_items:
+            return base_schedule_impacts
+        
+        iterations = len(base_schedule_impacts)
+        
+        critical_path_multiplier = np.maximum(
+            1.0, self.critical_multiplier + random_state.normal(0, 0.1, iterations)
+        )
+        adjusted = base_schedule_impacts * critical_path_multiplier
+        
+        if len(self.milestone_std):
+            adjusted += random_state.normal(0, self.milestone_std, (iterations, len(self.milestone_std))) @ self.milestone_weight
+        
+        if len(self.activity_std):
+            adjusted += random_state.normal(0, self.activity_std, (iterations, len(self.activity_std))) @ self.activity_weight
+            adjusted += random_state.normal(0, 0.1, iterations) * self.project_wide_scale
+        
+        if self.has_resource_constraints:
+            resource_adjustment = np.zeros(iterations)
+            for resource in self.resources:
+                resource_impact = np.zeros(iterations)
+                
+                coefficients = resource['availability_coefficients']
+                if len(coefficients):
+                    resource_impact += random_state.normal(1.0, 0.2, (iterations, len(coefficients))) @ coefficients
+                
+                conflict_impacts = resource['conflict_impacts']
+                if len(conflict_impacts):
+                    efficiency = random_state.uniform(0.7, 1.0, (iterations, len(conflict_impacts)))
+                    resource_impact += (conflict_impacts / efficiency).sum(axis=1)
+                
+                if resource['utilization_pressure'] is not None:
+                    variation = random_state.normal(0, 0.1, iterations)
+                    resource_impact += (resource['utilization_pressure'] + variation) * np.abs(adjusted) * 0.1
+                
+                resource_adjustment += resource_impact * resource['critical_path_multiplier']
+            adjusted += resource_adjustment
+        
+        return np.maximum(0.0, adjusted)
+
+
+def _run_simulation_shard(
+    risks: List[Risk],
+    iterations: int,
+    correlations: Optional[CorrelationMatrix],
+    seed_sequence: np.random.SeedSequence,
+    baseline_cost_total: float,
+    schedule_data: Optional[ScheduleData]
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray], ConvergenceTracker]:
+    """
+    Run one shard of a sharded simulation.
+    
+    Defined at module level so it can be pickled into worker processes.
+    
+    Returns:
+        Tuple of (cost_outcomes, schedule_outcomes, risk_contributions, convergence_tracker)
+    """
+    engine = MonteCarloEngine()
+    random_state = np.random.RandomState(np.random.MT19937(seed_sequence))
+    
+    correlated_sampling, cholesky_matrix, correlated_risk_indices = engine._prepare_correlated_sampling(
+        risks, correlations
+    )
+    cost_outcomes, schedule_outcomes, risk_contributions = engine._run_vectorized_iterations(
+        risks, iterations, correlations, correlated_sampling, cholesky_matrix,
+        correlated_risk_indices, RiskInteractionTracker(risks, correlations), baseline_cost_total,
+        schedule_data, random_state
+    )
+    
+    convergence_tracker = ConvergenceTracker()
+    for i in range(1000, iterations, 1000):
+        convergence_tracker.update(cost_outcomes[:i+1], schedule_outcomes[:i+1])
+    
+    return cost_outcomes, schedule_outcomes, risk_contributions, convergence_tracker
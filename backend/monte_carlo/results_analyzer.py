@@ -13,6 +13,7 @@ from .models import (
     SimulationResults, PercentileAnalysis, ConfidenceIntervals, 
     RiskContribution, ScenarioComparison
 )
+from .results_storage import contribution_covariance
 
 
 class SimulationResultsAnalyzer:
@@ -183,9 +184,16 @@ class SimulationResultsAnalyzer:
         total_variance = np.var(results.cost_outcomes, ddof=1)
         risk_contributions = []
         
-        for risk_id, contributions in results.risk_contributions.items():
-            # Calculate variance contribution of this risk
-            risk_variance = np.var(contributions, ddof=1)
+        # One blocked pass over the contribution matrix yields all variances and
+        # pairwise correlations instead of a corrcoef call per risk pair
+        risk_ids, covariance = contribution_covariance(results.risk_contributions)
+        risk_variances = np.diag(covariance)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std_devs = np.sqrt(risk_variances)
+            correlations = np.clip(covariance / np.outer(std_devs, std_devs), -1.0, 1.0)
+        
+        for index, risk_id in enumerate(risk_ids):
+            risk_variance = risk_variances[index]
             
             # Calculate percentage contribution to total variance
             if total_variance > 0:
@@ -195,10 +203,9 @@ class SimulationResultsAnalyzer:
             
             # Calculate correlation effects with other risks
             correlation_effects = {}
-            for other_risk_id, other_contributions in results.risk_contributions.items():
-                if other_risk_id != risk_id:
-                    # Calculate correlation coefficient
-                    correlation = np.corrcoef(contributions, other_contributions)[0, 1]
+            for other_index, other_risk_id in enumerate(risk_ids):
+                if other_index != index:
+                    correlation = correlations[index, other_index]
                     if not np.isnan(correlation):
                         correlation_effects[other_risk_id] = correlation
             
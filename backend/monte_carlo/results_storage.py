@@ -0,0 +1,426 @@
+"""
+Compact storage for Monte Carlo simulation results.
+
+This module keeps per-risk contribution samples in a single contiguous column-major
+matrix instead of one array per risk, persists results as memory-mappable ``.npy``
+files and provides a bounded LRU cache that spills evicted runs to disk. Consumers
+such as the results analyzer and chart generator can then read individual columns or
+row slices of a run without materialising the whole result set in memory.
+"""
+
+import json
+import shutil
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from dataclasses import asdict, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from .models import ConvergenceMetrics, SimulationResults
+
+
+_METADATA_FILE = "metadata.json"
+_COST_FILE = "cost_outcomes.npy"
+_SCHEDULE_FILE = "schedule_outcomes.npy"
+_CONTRIBUTIONS_FILE = "risk_contributions.npy"
+
+
+class ColumnarRiskContributions(Mapping):
+    """
+    Read-only mapping of risk ID to contribution samples backed by one matrix.
+
+    The matrix has shape ``(iterations, risks)`` and is stored in Fortran order so
+    that every risk column is contiguous; ``contributions[risk_id]`` returns a view
+    of that column without copying, even when the matrix is memory-mapped.
+    """
+
+    def __init__(self, risk_ids: List[str], matrix: np.ndarray):
+        """
+        Initialize the mapping.
+
+        Args:
+            risk_ids: Risk IDs in column order
+            matrix: Contribution samples with one column per risk
+
+        Raises:
+            ValueError: If the matrix shape does not match the risk IDs
+        """
+        if matrix.ndim != 2 or matrix.shape[1] != len(risk_ids):
+            raise ValueError(
+                f"Contribution matrix shape {matrix.shape} does not match {len(risk_ids)} risks"
+            )
+        self._risk_ids = list(risk_ids)
+        self._index = {risk_id: column for column, risk_id in enumerate(self._risk_ids)}
+        self._matrix = matrix
+
+    @classmethod
+    def from_dict(
+        cls,
+        risk_contributions: Mapping,
+        dtype: Optional[np.dtype] = None
+    ) -> 'ColumnarRiskContributions':
+        """
+        Pack a mapping of per-risk arrays into a single column-major matrix.
+
+        Args:
+            risk_contributions: Mapping of risk ID to equally sized sample arrays
+            dtype: Optional storage dtype (defaults to the dtype of the first column)
+
+        Returns:
+            ColumnarRiskContributions holding a copy of the samples
+        """
+        if isinstance(risk_contributions, cls) and (
+            dtype is None or risk_contributions.matrix.dtype == np.dtype(dtype)
+        ):
+            return risk_contributions
+
+        risk_ids = list(risk_contributions.keys())
+        if not risk_ids:
+            return cls([], np.empty((0, 0), dtype=dtype or np.float64, order='F'))
+
+        first = np.asarray(risk_contributions[risk_ids[0]])
+        matrix = np.empty(
+            (first.shape[0], len(risk_ids)),
+            dtype=dtype or first.dtype,
+            order='F'
+        )
+        for column, risk_id in enumerate(risk_ids):
+            matrix[:, column] = risk_contributions[risk_id]
+
+        return cls(risk_ids, matrix)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Underlying ``(iterations, risks)`` contribution matrix."""
+        return self._matrix
+
+    @property
+    def risk_ids(self) -> List[str]:
+        """Risk IDs in column order."""
+        return list(self._risk_ids)
+
+    def row_slice(self, start: int, stop: int) -> np.ndarray:
+        """
+        Return contribution samples for a contiguous range of iterations.
+
+        Args:
+            start: First iteration (inclusive)
+            stop: Last iteration (exclusive)
+
+        Returns:
+            View of shape ``(stop - start, risks)``
+        """
+        return self._matrix[start:stop]
+
+    def __getitem__(self, risk_id: str) -> np.ndarray:
+        return self._matrix[:, self._index[risk_id]]
+
+    def __contains__(self, risk_id) -> bool:
+        return risk_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._risk_ids)
+
+    def __len__(self) -> int:
+        return len(self._risk_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the contribution samples in bytes."""
+        return int(self._matrix.nbytes)
+
+
+def contribution_matrix(risk_contributions: Mapping) -> Tuple[List[str], np.ndarray]:
+    """
+    Get risk IDs and an ``(iterations, risks)`` matrix for a contributions mapping.
+
+    Columnar contributions are returned without copying; plain dictionaries are packed
+    into a new matrix.
+
+    Args:
+        risk_contributions: Mapping of risk ID to sample arrays
+
+    Returns:
+        Tuple of (risk IDs in column order, contribution matrix)
+    """
+    columnar = ColumnarRiskContributions.from_dict(risk_contributions)
+    return columnar.risk_ids, columnar.matrix
+
+
+def contribution_covariance(
+    risk_contributions: Mapping,
+    block_size: int = 65536
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Compute the sample covariance matrix of per-risk contributions.
+
+    Rows are processed in blocks so only ``block_size`` iterations are converted to
+    float64 at a time, which keeps memory bounded for large or memory-mapped runs.
+
+    Args:
+        risk_contributions: Mapping of risk ID to sample arrays
+        block_size: Number of iterations processed per block
+
+    Returns:
+        Tuple of (risk IDs in column order, covariance matrix with ddof=1)
+    """
+    risk_ids, matrix = contribution_matrix(risk_contributions)
+    iterations, risk_count = matrix.shape
+
+    if iterations < 2:
+        return risk_ids, np.full((risk_count, risk_count), np.nan)
+
+    means = matrix.mean(axis=0, dtype=np.float64)
+    gram = np.zeros((risk_count, risk_count), dtype=np.float64)
+    for start in range(0, iterations, block_size):
+        block = matrix[start:start + block_size].astype(np.float64) - means
+        gram += block.T @ block
+
+    return risk_ids, gram / (iterations - 1)
+
+
+def compact_simulation_results(
+    results: SimulationResults,
+    dtype: np.dtype = np.float32
+) -> SimulationResults:
+    """
+    Return a copy of simulation results with columnar contribution storage.
+
+    Cost and schedule outcomes keep their precision; per-risk contributions, which
+    dominate memory for large risk registers, are packed into one matrix of ``dtype``.
+
+    Args:
+        results: Simulation results to compact
+        dtype: Storage dtype for contribution samples
+
+    Returns:
+        SimulationResults sharing outcomes with ``results``
+    """
+    return replace(
+        results,
+        risk_contributions=ColumnarRiskContributions.from_dict(results.risk_contributions, dtype)
+    )
+
+
+def save_simulation_results(results: SimulationResults, directory: Union[str, Path]) -> Path:
+    """
+    Persist simulation results as ``.npy`` arrays plus a JSON metadata file.
+
+    Args:
+        results: Simulation results to persist
+        directory: Directory to write into (created if missing)
+
+    Returns:
+        Path of the directory containing the persisted results
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+
+    risk_ids, matrix = contribution_matrix(results.risk_contributions)
+    np.save(path / _COST_FILE, np.asarray(results.cost_outcomes))
+    np.save(path / _SCHEDULE_FILE, np.asarray(results.schedule_outcomes))
+    np.save(path / _CONTRIBUTIONS_FILE, np.asfortranarray(matrix))
+
+    convergence = asdict(results.convergence_metrics)
+    convergence['percentile_stability'] = {
+        str(percentile): value
+        for percentile, value in results.convergence_metrics.percentile_stability.items()
+    }
+    metadata = {
+        'simulation_id': results.simulation_id,
+        'timestamp': results.timestamp.isoformat(),
+        'iteration_count': results.iteration_count,
+        'execution_time': results.execution_time,
+        'risk_ids': risk_ids,
+        'convergence_metrics': convergence
+    }
+    with open(path / _METADATA_FILE, 'w') as f:
+        json.dump(metadata, f)
+
+    return path
+
+
+def load_simulation_results(directory: Union[str, Path], mmap: bool = True) -> SimulationResults:
+    """
+    Load simulation results written by ``save_simulation_results``.
+
+    Args:
+        directory: Directory containing the persisted results
+        mmap: If True, arrays are memory-mapped read-only instead of read into memory
+
+    Returns:
+        SimulationResults with columnar risk contributions
+    """
+    path = Path(directory)
+    mmap_mode = 'r' if mmap else None
+
+    with open(path / _METADATA_FILE) as f:
+        metadata = json.load(f)
+
+    convergence = metadata['convergence_metrics']
+    convergence['percentile_stability'] = {
+        float(percentile): value
+        for percentile, value in convergence['percentile_stability'].items()
+    }
+
+    return SimulationResults(
+        simulation_id=metadata['simulation_id'],
+        timestamp=datetime.fromisoformat(metadata['timestamp']),
+        iteration_count=metadata['iteration_count'],
+        cost_outcomes=np.load(path / _COST_FILE, mmap_mode=mmap_mode),
+        schedule_outcomes=np.load(path / _SCHEDULE_FILE, mmap_mode=mmap_mode),
+        risk_contributions=ColumnarRiskContributions(
+            metadata['risk_ids'],
+            np.load(path / _CONTRIBUTIONS_FILE, mmap_mode=mmap_mode)
+        ),
+        convergence_metrics=ConvergenceMetrics(**convergence),
+        execution_time=metadata['execution_time']
+    )
+
+
+class SimulationResultsCache(MutableMapping):
+    """
+    Bounded LRU cache of simulation results keyed by simulation ID.
+
+    At most ``max_entries`` results are held in memory. When a spill directory is
+    configured, evicted results are written to disk and transparently reloaded as
+    memory-mapped arrays on the next access; otherwise they are discarded and
+    ``on_discard`` is called with their ID. Each entry's risk IDs are indexed so
+    runs involving a risk can be found without reloading spilled results.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100,
+        spill_directory: Optional[Union[str, Path]] = None,
+        on_discard: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results held in memory (at least 1)
+            spill_directory: Optional directory for results evicted from memory
+            on_discard: Optional callback for IDs evicted without being spilled
+        """
+        self._entries: 'OrderedDict[str, SimulationResults]' = OrderedDict()
+        self._spilled: Dict[str, Path] = {}
+        self._risk_ids: Dict[str, FrozenSet[str]] = {}
+        self._risk_index: Dict[str, Set[str]] = {}
+        self._max_entries = max(1, max_entries)
+        self._spill_directory = Path(spill_directory) if spill_directory else None
+        self._on_discard = on_discard
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of results held in memory."""
+        return self._max_entries
+
+    @property
+    def spill_directory(self) -> Optional[Path]:
+        """Directory evicted results are written to, if any."""
+        return self._spill_directory
+
+    def configure(self, max_entries: int, spill_directory: Optional[Union[str, Path]] = None):
+        """
+        Change the capacity and spill directory, evicting entries as needed.
+
+        Args:
+            max_entries: Maximum number of results held in memory (at least 1)
+            spill_directory: Optional directory for results evicted from memory
+        """
+        self._max_entries = max(1, max_entries)
+        self._spill_directory = Path(spill_directory) if spill_directory else None
+        self._evict()
+
+    def is_in_memory(self, simulation_id: str) -> bool:
+        """Check whether results are currently held in memory (not spilled)."""
+        return simulation_id in self._entries
+
+    def simulation_ids_for_risk(self, risk_id: str) -> List[str]:
+        """Get the IDs of cached runs whose results include a risk."""
+        return list(self._risk_index.get(risk_id, ()))
+
+    def __getitem__(self, simulation_id: str) -> SimulationResults:
+        if simulation_id in self._entries:
+            self._entries.move_to_end(simulation_id)
+            return self._entries[simulation_id]
+
+        path = self._spilled[simulation_id]
+        results = load_simulation_results(path, mmap=True)
+        self._entries[simulation_id] = results
+        self._evict()
+        return results
+
+    def __setitem__(self, simulation_id: str, results: SimulationResults):
+        self._discard_spilled(simulation_id)
+        self._unindex(simulation_id)
+        self._entries[simulation_id] = results
+        self._entries.move_to_end(simulation_id)
+        self._index(simulation_id, results)
+        self._evict()
+
+    def __delitem__(self, simulation_id: str):
+        if simulation_id not in self:
+            raise KeyError(simulation_id)
+        self._entries.pop(simulation_id, None)
+        self._discard_spilled(simulation_id)
+        self._unindex(simulation_id)
+
+    def __contains__(self, simulation_id) -> bool:
+        return simulation_id in self._entries or simulation_id in self._spilled
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate over a snapshot since lookups reorder and reload entries
+        keys = list(self._spilled)
+        keys.extend(key for key in self._entries if key not in self._spilled)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries) + sum(1 for key in self._spilled if key not in self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        for simulation_id in list(self._spilled):
+            self._discard_spilled(simulation_id)
+        self._risk_ids.clear()
+        self._risk_index.clear()
+
+    def _evict(self):
+        """Evict least recently used entries until the capacity is respected."""
+        while len(self._entries) > self._max_entries:
+            simulation_id, results = self._entries.popitem(last=False)
+            if simulation_id in self._spilled:
+                continue
+            if self._spill_directory is None:
+                self._unindex(simulation_id)
+                if self._on_discard is not None:
+                    self._on_discard(simulation_id)
+                continue
+            self._spilled[simulation_id] = save_simulation_results(
+                results, self._spill_directory / simulation_id
+            )
+
+    def _index(self, simulation_id: str, results: SimulationResults):
+        """Record which risks an entry's results include."""
+        risk_ids = frozenset(results.risk_contributions)
+        self._risk_ids[simulation_id] = risk_ids
+        for risk_id in risk_ids:
+            self._risk_index.setdefault(risk_id, set()).add(simulation_id)
+
+    def _unindex(self, simulation_id: str):
+        """Drop an entry from the risk index."""
+        for risk_id in self._risk_ids.pop(simulation_id, ()):
+            simulation_ids = self._risk_index[risk_id]
+            simulation_ids.discard(simulation_id)
+            if not simulation_ids:
+                del self._risk_index[risk_id]
+
+    def _discard_spilled(self, simulation_id: str):
+        """Remove the on-disk copy of a spilled entry, if any."""
+        path = self._spilled.pop(simulation_id, None)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
@@ -9,16 +9,19 @@ This module provides functionality for:
 """
 
 import copy
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 import uuid
 from datetime import datetime
 
 from .models import (
     Risk, Scenario, RiskModification, MitigationStrategy, MitigationAnalysis,
     ProbabilityDistribution, DistributionType, ScenarioComparison,
-    SimulationResults, ValidationResult
+    SimulationResults, ValidationResult, CorrelationMatrix
 )
 
+if TYPE_CHECKING:
+    from .engine import MonteCarloEngine
+
 
 class ScenarioGenerator:
     """
@@ -468,7 +471,12 @@ class ScenarioGenerator:
     def perform_sensitivity_analysis(self, 
                                     base_scenario: Scenario,
                                     target_variables: List[str],
-                                    variation_range: float = 0.2) -> Dict[str, Any]:
+                                    variation_range: float = 0.2,
+                                    engine: Optional['MonteCarloEngine'] = None,
+                                    iterations: int = 10000,
+                                    random_seed: Optional[int] = None,
+                                    correlations: Optional[CorrelationMatrix] = None,
+                                    baseline_costs: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Perform sensitivity analysis on key variables to assess their impact.
         
@@ -476,6 +484,12 @@ class ScenarioGenerator:
             base_scenario: Base scenario to analyze
             target_variables: List of variable names to analyze (risk IDs or parameter names)
             variation_range: Percentage variation to apply (e.g., 0.2 for ±20%)
+            engine: Optional engine; if given, all low/high variants are simulated in one
+                batched sweep and their outcome statistics are added to the results
+            iterations: Number of simulation iterations for the sweep
+            random_seed: Optional random seed for the sweep
+            correlations: Optional correlation matrix for the sweep
+            baseline_costs: Optional baseline cost data for the sweep
             
         Returns:
             Dict containing sensitivity analysis results
@@ -527,8 +541,70 @@ class ScenarioGenerator:
                 'high_scenario': high_scenario
             }
         
+        if engine is not None and sensitivity_results:
+            variants = {}
+            for variable in sensitivity_results:
+                variants[f"{variable}_low"] = {variable: 1.0 - variation_range}
+                variants[f"{variable}_high"] = {variable: 1.0 + variation_range}
+            sweep = self.run_impact_sweep(
+                base_scenario, variants, engine, iterations, random_seed, correlations, baseline_costs
+            )
+            
+            for variable, results in sensitivity_results.items():
+                low_outcome = sweep[f"{variable}_low"]
+                high_outcome = sweep[f"{variable}_high"]
+                results['low_outcome'] = low_outcome
+                results['high_outcome'] = high_outcome
+                results['cost_swing'] = high_outcome['cost']['mean'] - low_outcome['cost']['mean']
+        
         return sensitivity_results
     
+    def run_impact_sweep(self,
+                         base_scenario: Scenario,
+                         variants: Dict[str, Dict[str, float]],
+                         engine: 'MonteCarloEngine',
+                         iterations: int = 10000,
+                         random_seed: Optional[int] = None,
+                         correlations: Optional[CorrelationMatrix] = None,
+                         baseline_costs: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Simulate many impact-multiplier variants of a scenario in one batched sweep.
+        
+        All variants use common random numbers: the engine samples the scenario's risks
+        once and evaluates every variant as a matrix product, so a tornado with many
+        parameters and steps costs about as much as a single simulation.
+        
+        Args:
+            base_scenario: Scenario whose risks are varied
+            variants: Mapping of variant name -> {risk_id: baseline impact multiplier}
+            engine: Monte Carlo engine used for sampling
+            iterations: Number of simulation iterations
+            random_seed: Optional random seed for reproducibility
+            correlations: Optional correlation matrix for dependent risks
+            baseline_costs: Optional baseline cost data
+            
+        Returns:
+            Dict mapping variant name -> cost and schedule outcome statistics
+            
+        Raises:
+            ValueError: If a variant references a risk that is not in the scenario
+        """
+        base_impacts = {risk.id: risk.baseline_impact for risk in base_scenario.risks}
+        
+        impact_variants = []
+        for name, multipliers in variants.items():
+            unknown = set(multipliers) - set(base_impacts)
+            if unknown:
+                raise ValueError(f"Variant {name} references unknown risks: {sorted(unknown)}")
+            impact_variants.append({
+                risk_id: base_impacts[risk_id] * multiplier for risk_id, multiplier in multipliers.items()
+            })
+        
+        sweep_results = engine.run_impact_sweep(
+            base_scenario.risks, impact_variants, iterations, correlations, random_seed, baseline_costs
+        )
+        return dict(zip(variants.keys(), sweep_results))
+    
     def _create_impact_modified_scenario(self, 
                                        base_scenario: Scenario,
                                        risk_id: str,
@@ -684,10 +760,20 @@ class ScenarioGenerator:
             'baseline_values': []
         }
         
+        # Simulated sweeps rank by the swing in expected cost, otherwise by sensitivity ratio
+        simulated = bool(sensitivity_results) and all(
+            'cost_swing' in results for results in sensitivity_results.values()
+        )
+        sort_key = 'cost_swing' if simulated else 'sensitivity_ratio'
+        if simulated:
+            tornado_data['low_cost_means'] = []
+            tornado_data['high_cost_means'] = []
+            tornado_data['cost_swings'] = []
+        
         # Sort variables by sensitivity (absolute value)
         sorted_variables = sorted(
             sensitivity_results.items(),
-            key=lambda x: abs(x[1].get('sensitivity_ratio', 0)),
+            key=lambda x: abs(x[1].get(sort_key, 0)),
             reverse=True
         )
         
@@ -697,13 +783,22 @@ class ScenarioGenerator:
             tornado_data['high_impacts'].append(results.get('high_value', 0))
             tornado_data['ranges'].append(results.get('absolute_change', 0))
             tornado_data['baseline_values'].append(results.get('baseline_value', 0))
+            if simulated:
+                tornado_data['low_cost_means'].append(results['low_outcome']['cost']['mean'])
+                tornado_data['high_cost_means'].append(results['high_outcome']['cost']['mean'])
+                tornado_data['cost_swings'].append(results['cost_swing'])
         
         return tornado_data
     
     def perform_multi_variable_sensitivity(self, 
                                          base_scenario: Scenario,
                                          variable_combinations: List[Dict[str, float]],
-                                         scenario_name_prefix: str = "MultiVar") -> Dict[str, Any]:
+                                         scenario_name_prefix: str = "MultiVar",
+                                         engine: Optional['MonteCarloEngine'] = None,
+                                         iterations: int = 10000,
+                                         random_seed: Optional[int] = None,
+                                         correlations: Optional[CorrelationMatrix] = None,
+                                         baseline_costs: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Perform sensitivity analysis on multiple variables simultaneously.
         
@@ -711,6 +806,12 @@ class ScenarioGenerator:
             base_scenario: Base scenario
             variable_combinations: List of dicts mapping risk_id -> impact_multiplier
             scenario_name_prefix: Prefix for generated scenario names
+            engine: Optional engine; if given, all combinations are simulated in one
+                batched sweep and their outcome statistics are added to the results
+            iterations: Number of simulation iterations for the sweep
+            random_seed: Optional random seed for the sweep
+            correlations: Optional correlation matrix for the sweep
+            baseline_costs: Optional baseline cost data for the sweep
             
         Returns:
             Dict containing multi-variable sensitivity results
@@ -761,4 +862,19 @@ class ScenarioGenerator:
                                   if total_baseline_impact != 0 else 0)
             }
         
+        if engine is not None and multi_var_results:
+            known_risk_ids = {risk.id for risk in base_scenario.risks}
+            variants = {
+                f"{scenario_name_prefix}_{i}": {
+                    risk_id: multiplier for risk_id, multiplier in combination.items()
+                    if risk_id in known_risk_ids
+                }
+                for i, combination in enumerate(variable_combinations)
+            }
+            sweep = self.run_impact_sweep(
+                base_scenario, variants, engine, iterations, random_seed, correlations, baseline_costs
+            )
+            for scenario_name, outcome in sweep.items():
+                multi_var_results[scenario_name]['outcome'] = outcome
+        
         return multi_var_results
\ No newline at end of file
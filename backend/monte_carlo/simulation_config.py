@@ -46,6 +46,7 @@ class SimulationConfig:
     max_execution_time: Optional[float] = None  # seconds
     parallel_execution: bool = False
     num_threads: Optional[int] = None
+    vectorized_execution: bool = False  # Batch-sample all iterations as NumPy matrices
     
     # Statistical parameters
     confidence_levels: List[float] = field(default_factory=lambda: [0.80, 0.90, 0.95])
@@ -54,6 +55,8 @@ class SimulationConfig:
     # Caching and optimization
     enable_caching: bool = True
     cache_size_limit: int = 100  # Maximum number of cached simulations
+    compact_results_storage: bool = False  # Store risk contributions as one float32 matrix
+    results_spill_directory: Optional[str] = None  # Persist evicted results for memory-mapped reloads
     parameter_change_sensitivity: float = 1e-6  # Threshold for detecting parameter changes
     
     # Advanced options
@@ -247,10 +250,13 @@ class SimulationConfig:
             'max_execution_time': self.max_execution_time,
             'parallel_execution': self.parallel_execution,
             'num_threads': self.num_threads,
+            'vectorized_execution': self.vectorized_execution,
             'confidence_levels': self.confidence_levels.copy(),
             'percentiles': self.percentiles.copy(),
             'enable_caching': self.enable_caching,
             'cache_size_limit': self.cache_size_limit,
+            'compact_results_storage': self.compact_results_storage,
+            'results_spill_directory': self.results_spill_directory,
             'parameter_change_sensitivity': self.parameter_change_sensitivity,
             'enable_progress_tracking': self.enable_progress_tracking,
             'progress_callback_interval': self.progress_callback_interval,
@@ -280,10 +286,13 @@ class SimulationConfig:
             'max_execution_time': self.max_execution_time,
             'parallel_execution': self.parallel_execution,
             'num_threads': self.num_threads,
+            'vectorized_execution': self.vectorized_execution,
             'confidence_levels': self.confidence_levels,
             'percentiles': self.percentiles,
             'enable_caching': self.enable_caching,
             'cache_size_limit': self.cache_size_limit,
+            'compact_results_storage': self.compact_results_storage,
+            'results_spill_directory': self.results_spill_directory,
             'parameter_change_sensitivity': self.parameter_change_sensitivity,
             'enable_progress_tracking': self.enable_progress_tracking,
             'progress_callback_interval': self.progress_callback_interval,
@@ -55,6 +55,7 @@ class ChartConfig:
     show_grid: bool = True
     show_legend: bool = True
     color_palette: Optional[List[str]] = None
+    kde_max_samples: int = 20000  # Evenly strided samples used to fit density curves
     
     def __post_init__(self):
         """Set default color palette based on theme."""
@@ -135,6 +136,26 @@ class ChartGenerator:
             plt.rcParams['axes.facecolor'] = '#f8f9fa'
             plt.rcParams['figure.facecolor'] = 'white'
     
+    def _density_sample(self, data: np.ndarray) -> np.ndarray:
+        """
+        Select an evenly strided subset of outcomes for kernel density estimation.
+        
+        KDE evaluation cost grows with the number of samples, so large (possibly
+        memory-mapped) outcome arrays are thinned to at most ``kde_max_samples``
+        points; histograms and percentiles still use every outcome.
+        
+        Args:
+            data: Simulation outcomes
+            
+        Returns:
+            Strided view of the outcomes
+        """
+        max_samples = self.config.kde_max_samples
+        if max_samples <= 0 or len(data) <= max_samples:
+            return data
+        step = int(np.ceil(len(data) / max_samples))
+        return data[::step]
+    
     def generate_probability_distribution_chart(
         self,
         simulation_results: SimulationResults,
@@ -187,7 +208,7 @@ class ChartGenerator:
         # Add kernel density estimation (handle singular data)
         try:
             kde_x = np.linspace(data.min(), data.max(), 200)
-            kde = stats.gaussian_kde(data)
+            kde = stats.gaussian_kde(self._density_sample(data))
             kde_y = kde(kde_x)
             ax1.plot(kde_x, kde_y, color=self.config.color_palette[1], linewidth=2, label='Probability Density')
         except np.linalg.LinAlgError:
@@ -639,7 +660,7 @@ class ChartGenerator:
         
         # Prepare data
         scenario_data = {}
-        all_data = []
+        x_min, x_max = np.inf, -np.inf
         
         # Ensure unique scenario names
         name_counts = {}
@@ -660,10 +681,10 @@ class ChartGenerator:
                 name_counts[scenario_name] = 0
             
             scenario_data[scenario_name] = data
-            all_data.extend(data)
+            x_min = min(x_min, float(np.min(data)))
+            x_max = max(x_max, float(np.max(data)))
         
         # Set common x-axis range
-        x_min, x_max = min(all_data), max(all_data)
         x_range = np.linspace(x_min, x_max, 200)
         
         # Generate colors for scenarios
@@ -677,7 +698,7 @@ class ChartGenerator:
                        label=f'{scenario_name} (histogram)', edgecolor='white', linewidth=0.5)
                 
                 # KDE curve
-                kde = stats.gaussian_kde(data)
+                kde = stats.gaussian_kde(self._density_sample(data))
                 kde_y = kde(x_range)
                 ax.plot(x_range, kde_y, color=colors[i], linewidth=2.5, 
                        label=f'{scenario_name} (density)', linestyle='-')
@@ -10,7 +10,8 @@ from uuid import UUID
 
 from auth.rbac import require_admin, require_super_admin, require_org_admin_or_super, UserRole, Permission, DEFAULT_ROLE_PERMISSIONS
 from auth.dependencies import get_current_user
-from config.database import supabase, service_supabase
+from auth.enhanced_permission_checker import get_enhanced_permission_checker
+from config.database import supabase, service_supabase, get_query_metrics
 from services.rbac_audit_service import RBACAuditService
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -87,6 +88,14 @@ async def get_system_health(current_user = Depends(require_admin())):
         print(f"Get system health error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get system health: {str(e)}")
 
+@router.get("/database/query-stats")
+async def get_database_query_stats(current_user=Depends(require_admin())):
+    """Get counts, timings, timeouts and concurrency of queries run through the async database layer"""
+    return {
+        **get_query_metrics(),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @router.get("/cache/stats")
 async def get_cache_stats(request: Request, current_user=Depends(require_admin())):
     """Get cache performance statistics. Shape matches admin dashboard CacheStatsCard (type, entries, hit_rate, etc.)."""
@@ -508,6 +517,7 @@ async def assign_role_to_user(
                     detail="Role assignment requires SUPABASE_SERVICE_ROLE_KEY. Set it in backend .env and restart."
                 )
             raise HTTPException(status_code=500, detail=f"Failed to assign role: {err_str}")
+        get_enhanced_permission_checker().clear_user_cache(user_id)
         
         # Invalidate admin users cache so list shows updated roles
         cache = getattr(request.app.state, "cache_manager", None)
@@ -623,6 +633,7 @@ async def remove_role_from_user(
                     detail="Role removal requires SUPABASE_SERVICE_ROLE_KEY. Set it in backend .env and restart."
                 )
             raise HTTPException(status_code=500, detail=f"Failed to remove role: {err_str}")
+        get_enhanced_permission_checker().clear_user_cache(user_id)
         
         # Log role removal to audit_logs (no top-level "success" - audit_logs has no such column)
         admin_user_id = current_user.get("user_id")
@@ -893,6 +904,9 @@ async def update_custom_role(
         
         updated_role = update_response.data[0]
         
+        # Every compiled permission index may include this role
+        get_enhanced_permission_checker().clear_role_cache(role_id)
+        
         # Count assigned users
         user_count_response = supabase.table("user_roles").select(
             "id", count="exact"
@@ -979,6 +993,7 @@ async def delete_custom_role(
         
         # Delete the role
         supabase.table("roles").delete().eq("id", str(role_id)).execute()
+        get_enhanced_permission_checker().clear_role_cache(role_id)
         
         # Log to audit trail using audit service
         admin_user_id = current_user.get("user_id")
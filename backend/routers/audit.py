@@ -229,6 +229,13 @@ class ExportRequest(BaseModel):
     include_summary: bool = Field(True, description="Include AI-generated summary")
 
 
+class StreamingExportRequest(BaseModel):
+    """Request for a streaming export."""
+    filters: AuditEventFilters
+    format: str = Field("csv", pattern="^(csv|ndjson)$", description="Output format: csv or ndjson")
+    compress: bool = Field(False, description="Gzip-compress the stream")
+
+
 class AddTagRequest(BaseModel):
     """Request for adding a tag to an audit log."""
     tag: str = Field(..., min_length=1, max_length=50, description="Tag to add to the audit log")
@@ -1126,6 +1133,75 @@ async def export_csv(
 
 
 
+@router.post("/export/stream")
+@limiter.limit("10/minute")
+async def export_stream(
+    request: Request,
+    export_request: StreamingExportRequest,
+    current_user: Dict[str, Any] = Depends(require_permission(Permission.AUDIT_EXPORT)),
+    export_service: AuditExportService = Depends(get_export_service)
+):
+    """
+    Stream filtered audit events as CSV or NDJSON, optionally gzip-compressed.
+    
+    Intended for large exports: events are paged with a (timestamp, id)
+    cursor and written to the response as they are read, so memory use
+    stays flat regardless of the number of events.
+    
+    Requirements: 5.2, 5.4, 7.1, 7.6
+    """
+    try:
+        # Get tenant_id from current user
+        tenant_id = current_user.get("tenant_id")
+        if not tenant_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User must have a tenant_id"
+            )
+        
+        filters = export_request.filters.dict()
+        
+        # Log the export access (audit-of-audit)
+        await log_audit_access(
+            user_id=current_user.get("id"),
+            tenant_id=tenant_id,
+            action=f"export_{export_request.format}_stream",
+            filters={
+                **filters,
+                "ip_address": request.client.host if request.client else None,
+                "user_agent": request.headers.get("user-agent")
+            }
+        )
+        
+        media_type = "text/csv" if export_request.format == "csv" else "application/x-ndjson"
+        filename = f"audit_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_request.format}"
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+        if export_request.compress:
+            media_type = "application/gzip"
+            headers["Content-Disposition"] += ".gz"
+        
+        return StreamingResponse(
+            export_service.export_events_streaming(
+                filters,
+                tenant_id=tenant_id,
+                output_format=export_request.format,
+                compress=export_request.compress
+            ),
+            media_type=media_type,
+            headers=headers
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error starting streaming export: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start streaming export: {str(e)}"
+        )
+
+
+
 def _empty_dashboard_stats(start_time: Optional[datetime] = None) -> Dict[str, Any]:
     """Build empty dashboard stats so the audit page can load even when DB is unavailable."""
     end_time = datetime.now()
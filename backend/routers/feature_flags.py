@@ -15,17 +15,18 @@ from models.feature_flags import (
     FeatureFlagUpdate,
     FeatureFlagResponse,
     FeatureFlagCheck,
+    FeatureFlagBulkCheck,
     FeatureFlagCheckResponse,
     FeatureFlagStatus
 )
-from services.feature_flag_service import FeatureFlagService
+from services.feature_flag_service import get_feature_flag_service
 
 router = APIRouter(prefix="/api/admin/feature-flags", tags=["feature-flags"])
 
-# Initialize service
+# Initialize service (shared with the feature toggles router)
 feature_flag_service = None
 if supabase:
-    feature_flag_service = FeatureFlagService(supabase)
+    feature_flag_service = get_feature_flag_service(supabase)
 
 
 @router.post("", response_model=FeatureFlagResponse, status_code=201)
@@ -256,3 +257,44 @@ async def check_feature_enabled(
             status_code=500,
             detail=f"Failed to check feature flag: {str(e)}"
         )
+
+
+@router.post("/check-all", response_model=List[FeatureFlagCheckResponse])
+async def check_all_features(
+    check_data: FeatureFlagBulkCheck,
+    current_user = Depends(get_current_user)
+):
+    """
+    Evaluate every feature flag for the current user in one call.
+    
+    Flags are evaluated against the in-memory flag snapshot, so clients can
+    fetch their full flag set once instead of checking features one by one.
+    
+    **Requirements**: 10.6
+    """
+    try:
+        if not feature_flag_service:
+            raise HTTPException(
+                status_code=503,
+                detail="Feature flag service unavailable"
+            )
+        
+        # Use current user's ID and roles if not provided
+        user_id = check_data.user_id or UUID(current_user.get("user_id"))
+        user_roles = check_data.user_roles or current_user.get("roles", [])
+        
+        results = await asyncio.to_thread(
+            feature_flag_service.evaluate_all_flags,
+            user_id,
+            user_roles
+        )
+        
+        return list(results.values())
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to check feature flags: {str(e)}"
+        )
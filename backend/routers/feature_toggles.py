@@ -16,6 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from auth.dependencies import get_current_user
 from auth.rbac import require_admin
 from config.database import supabase, service_supabase
+from services.feature_flag_service import get_feature_flag_service
 from schemas.feature_toggles import (
     FeatureToggleCreate,
     FeatureToggleUpdate,
@@ -48,6 +49,32 @@ def _row_to_response(row: Dict[str, Any]) -> FeatureToggleResponse:
     )
 
 
+def _is_table_missing(error: Exception) -> bool:
+    """True if the error says the feature_toggles table does not exist."""
+    err_msg = str(error)
+    return (
+        getattr(error, "code", None) == "PGRST205"
+        or ("Could not find the table" in err_msg and "feature_toggles" in err_msg)
+        or "PGRST205" in err_msg
+    )
+
+
+def _merged_toggle_rows(db_client, org_id: Optional[str]) -> List[Dict[str, Any]]:
+    """Global toggles plus the organization's; org rows override global rows of the same name."""
+    if org_id:
+        response = db_client.table("feature_toggles").select("*").or_(f"organization_id.is.null,organization_id.eq.{org_id}").execute()
+    else:
+        response = db_client.table("feature_toggles").select("*").is_("organization_id", "null").execute()
+    rows = response.data or []
+    # Merge: for each name, prefer org-specific over global
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        name = r["name"]
+        if name not in by_name or r.get("organization_id") is not None:
+            by_name[name] = r
+    return list(by_name.values())
+
+
 async def _broadcast_flag_change(action: str, flag: Dict[str, Any]) -> None:
     """Broadcast flag change via Supabase Realtime. Log errors, do not fail main operation."""
     try:
@@ -79,37 +106,52 @@ async def get_features(
             response = db_client.table("feature_toggles").select("*").execute()
             rows = response.data or []
             return {"flags": [_row_to_response(r) for r in rows]}
-        elif org_id:
-            response = db_client.table("feature_toggles").select("*").or_(f"organization_id.is.null,organization_id.eq.{org_id}").execute()
-        else:
-            response = db_client.table("feature_toggles").select("*").is_("organization_id", "null").execute()
-        rows = response.data or []
-        # Merge: for each name, prefer org-specific over global
-        by_name: Dict[str, Dict[str, Any]] = {}
-        for r in rows:
-            name = r["name"]
-            if name not in by_name or r.get("organization_id") is not None:
-                by_name[name] = r
-        merged = list(by_name.values())
-        return {"flags": [_row_to_response(r) for r in merged]}
-        merged = list(by_name.values())
+        merged = _merged_toggle_rows(db_client, org_id)
         return {"flags": [_row_to_response(r) for r in merged]}
     except Exception as e:
-        err_msg = str(e)
-        err_code = getattr(e, "code", None)
         # Graceful fallback when feature_toggles table does not exist (migration 039 not applied)
-        table_missing = (
-            err_code == "PGRST205"
-            or ("Could not find the table" in err_msg and "feature_toggles" in err_msg)
-            or "PGRST205" in err_msg
-        )
-        if table_missing:
+        if _is_table_missing(e):
             logger.warning("feature_toggles table missing (migration 039 not applied?), returning empty flags")
             return {"flags": []}
         logger.exception("Failed to fetch feature toggles")
         raise HTTPException(status_code=503, detail="Failed to fetch feature flags") from e
 
 
+@router.get("/evaluate", response_model=Dict[str, Dict[str, bool]])
+async def evaluate_features(
+    user: Dict[str, Any] = Depends(get_current_user),
+):
+    """
+    Evaluate all feature flags for the current user in one call.
+    Returns {name: enabled} for the organization's merged toggles plus the
+    rollout flags (percentage, user list, role based) from the feature flag
+    service; a toggle takes precedence over a rollout flag of the same name.
+    """
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Service unavailable")
+    org_id = _organization_id_from_user(user)
+    user_id = user.get("user_id")
+    try:
+        evaluations = await asyncio.to_thread(
+            get_feature_flag_service(supabase).evaluate_all_flags,
+            user_id,
+            user.get("roles", []),
+        )
+        flags = {name: result.is_enabled for name, result in evaluations.items()}
+    except Exception as e:
+        logger.warning("Rollout flag evaluation failed, returning toggles only: %s", e)
+        flags = {}
+    try:
+        rows = await asyncio.to_thread(_merged_toggle_rows, supabase, org_id)
+    except Exception as e:
+        if not _is_table_missing(e):
+            logger.exception("Failed to fetch feature toggles")
+            raise HTTPException(status_code=503, detail="Failed to fetch feature flags") from e
+        rows = []
+    flags.update({r["name"]: bool(r["enabled"]) for r in rows})
+    return {"flags": flags}
+
+
 @router.post("", response_model=FeatureToggleResponse, status_code=status.HTTP_201_CREATED)
 async def create_feature(
     body: FeatureToggleCreate,
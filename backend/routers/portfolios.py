@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from uuid import UUID
 
 from auth.rbac import require_permission, Permission
+from auth.enhanced_permission_checker import get_enhanced_permission_checker
 from auth.dependencies import get_current_user
 from config.database import supabase, service_supabase
 from models.projects import PortfolioCreate, PortfolioUpdate, PortfolioResponse
@@ -39,7 +40,17 @@ async def list_portfolios(current_user = Depends(require_permission(Permission.p
         if not db:
             raise HTTPException(status_code=503, detail="Database service unavailable")
         response = db.table("portfolios").select("*").execute()
-        return convert_uuids(response.data)
+        portfolios = response.data or []
+        if not portfolios:
+            return []
+        # Row-level visibility for all listed portfolios in one bulk check
+        permitted = await get_enhanced_permission_checker().filter_portfolios_by_permission(
+            current_user.get("user_id"),
+            Permission.portfolio_read,
+            [row["id"] for row in portfolios],
+            {row["id"]: row.get("organization_id") for row in portfolios if "organization_id" in row},
+        )
+        return convert_uuids([row for row in portfolios if str(row["id"]) in permitted])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
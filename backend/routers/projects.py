@@ -8,6 +8,7 @@ from uuid import UUID
 from typing import Optional
 
 from auth.rbac import require_permission, Permission
+from auth.enhanced_permission_checker import get_enhanced_permission_checker
 
 logger = logging.getLogger(__name__)
 from auth.dependencies import get_current_user
@@ -24,6 +25,23 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 
 PROJECTS_CACHE_KEY_PREFIX = "projects:list"
 PROJECTS_CACHE_TTL = 120  # seconds
+PROJECT_ID_SCAN_PAGE = 1000  # PostgREST max rows per request
+
+# Full column set (requires migrations 066+); fallback to minimal set if DB lacks columns
+PROJECT_LIST_COLUMNS_FULL = (
+    "id", "name", "status", "portfolio_id", "program_id", "health", "budget", "actual_cost",
+    "start_date", "end_date", "created_at", "updated_at", "description",
+    "external_id", "parent_project_external_ids", "archived", "live_date", "date_last_updated",
+    "percentage_complete", "project_type_id", "project_type_description", "project_status_id",
+    "project_status_description", "project_phase_id", "project_phase_description",
+    "ppm_project_home_url", "legal_entity_id", "legal_entity_description", "order_ids",
+    "pm_technique", "pm_technique_description", "freeze_period", "freeze_period_description",
+    "forecast_display_setting", "cost_centre", "country_id", "currency",
+)
+PROJECT_LIST_COLUMNS_MINIMAL = (
+    "id", "name", "status", "portfolio_id", "health", "budget", "actual_cost",
+    "start_date", "end_date", "created_at", "updated_at", "description",
+)
 
 def _projects_cache_key(org_id: str, offset: int, limit: int) -> str:
     """Build cache key for projects list (idempotent for same inputs)."""
@@ -41,6 +59,51 @@ def _invalidate_projects_cache(request: Request) -> None:
             pass
 
 
+async def _list_permitted_projects(db, current_user, portfolio_id, status, offset: int, limit: int):
+    """
+    Page through only the projects the user may read (organization, portfolio or project roles).
+
+    IDs matching the filters are scanned in list order and checked in one bulk permission check
+    before paginating, so pages are full and total counts only permitted projects. Returns
+    (items, total).
+    """
+    rows = []
+    start = 0
+    while True:
+        query = db.table("projects").select("id", "portfolio_id")
+        if portfolio_id is not None:
+            query = query.eq("portfolio_id", str(portfolio_id))
+        if status is not None:
+            query = query.eq("status", status.value)
+        batch = query.order("updated_at", desc=True).range(start, start + PROJECT_ID_SCAN_PAGE - 1).execute().data or []
+        rows.extend(batch)
+        if len(batch) < PROJECT_ID_SCAN_PAGE:
+            break
+        start += PROJECT_ID_SCAN_PAGE
+
+    permitted = await get_enhanced_permission_checker().filter_projects_by_permission(
+        current_user.get("user_id"),
+        Permission.project_read,
+        [row["id"] for row in rows],
+        {row["id"]: row.get("portfolio_id") for row in rows},
+    )
+    permitted_ids = [str(row["id"]) for row in rows if str(row["id"]) in permitted]
+    page_ids = permitted_ids[offset:offset + limit]
+    if not page_ids:
+        return [], len(permitted_ids)
+
+    for select_cols in (PROJECT_LIST_COLUMNS_FULL, PROJECT_LIST_COLUMNS_MINIMAL):
+        try:
+            response = db.table("projects").select(*select_cols).in_("id", page_ids).execute()
+            break
+        except Exception as select_err:
+            if select_cols == PROJECT_LIST_COLUMNS_MINIMAL:
+                raise
+            logger.warning("Projects list full select failed (%s), retrying with minimal columns", select_err)
+    rows_by_id = {str(row["id"]): row for row in convert_uuids(response.data or [])}
+    return [rows_by_id[project_id] for project_id in page_ids if project_id in rows_by_id], len(permitted_ids)
+
+
 @router.post("/", response_model=ProjectResponse, status_code=201)
 async def create_project(
     request: Request,
@@ -82,6 +145,12 @@ async def list_projects(
         db = _db()
         if not db:
             raise HTTPException(status_code=503, detail="Database service unavailable")
+        # Pages are cached per organization, so only users who may read every project share them
+        if not await get_enhanced_permission_checker().has_global_permission(
+            current_user.get("user_id"), Permission.project_read
+        ):
+            items, total = await _list_permitted_projects(db, current_user, portfolio_id, status, offset, limit)
+            return {"items": items, "total": total, "limit": limit, "offset": offset}
         org_id = (current_user.get("organization_id") or current_user.get("tenant_id") or "default")
         if isinstance(org_id, UUID):
             org_id = str(org_id)
@@ -93,22 +162,7 @@ async def list_projects(
         if cache:
             data = await cache.get(cache_key)
         if data is None:
-            # Full column set (requires migrations 066+); fallback to minimal set if DB lacks columns
-            select_cols_full = (
-                "id", "name", "status", "portfolio_id", "program_id", "health", "budget", "actual_cost",
-                "start_date", "end_date", "created_at", "updated_at", "description",
-                "external_id", "parent_project_external_ids", "archived", "live_date", "date_last_updated",
-                "percentage_complete", "project_type_id", "project_type_description", "project_status_id",
-                "project_status_description", "project_phase_id", "project_phase_description",
-                "ppm_project_home_url", "legal_entity_id", "legal_entity_description", "order_ids",
-                "pm_technique", "pm_technique_description", "freeze_period", "freeze_period_description",
-                "forecast_display_setting", "cost_centre", "country_id", "currency",
-            )
-            select_cols_minimal = (
-                "id", "name", "status", "portfolio_id", "health", "budget", "actual_cost",
-                "start_date", "end_date", "created_at", "updated_at", "description",
-            )
-            for select_cols in (select_cols_full, select_cols_minimal):
+            for select_cols in (PROJECT_LIST_COLUMNS_FULL, PROJECT_LIST_COLUMNS_MINIMAL):
                 try:
                     if count_exact:
                         query = db.table("projects").select(*select_cols, count="exact")
@@ -129,7 +183,7 @@ async def list_projects(
                     data = {"items": items, "total": total}
                     break
                 except Exception as select_err:
-                    if select_cols == select_cols_minimal:
+                    if select_cols == PROJECT_LIST_COLUMNS_MINIMAL:
                         raise
                     logger.warning("Projects list full select failed (%s), retrying with minimal columns", select_err)
                     continue
@@ -19,7 +19,7 @@ from pydantic import BaseModel
 
 from auth.dependencies import get_current_user
 from auth.rbac import require_admin
-from auth.enhanced_permission_checker import EnhancedPermissionChecker
+from auth.enhanced_permission_checker import EnhancedPermissionChecker, get_enhanced_permission_checker
 from auth.enhanced_rbac_models import (
     PermissionContext,
     RoleAssignment,
@@ -233,6 +233,9 @@ async def create_role_assignment(
         
         assignment = insert_response.data[0]
         
+        # Rebuild the user's compiled permissions on their next check
+        get_enhanced_permission_checker().clear_user_cache(request.user_id)
+        
         # Log to audit trail using audit service
         org_id = current_user.get("organization_id")
         org_uuid = UUID(org_id) if org_id else None
@@ -302,6 +305,7 @@ async def delete_role_assignment(
         supabase.table("user_roles").update({
             "is_active": False
         }).eq("id", str(role_id)).execute()
+        get_enhanced_permission_checker().clear_user_cache(user_id)
         
         # Log to audit trail using audit service
         admin_user_id = current_user.get("user_id")
@@ -237,6 +237,7 @@ async def create_task(
         task = await schedule_manager.create_task(
             schedule_id, task_data, UUID(current_user.get("user_id") or current_user.get("id"))
         )
+        dependency_engine.invalidate_cpm_state(schedule_id)
         return task
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -250,11 +251,22 @@ async def update_task(
     updates: TaskUpdate,
     current_user: dict = Depends(get_current_user)
 ):
-    """Update an existing task."""
+    """Update an existing task. Date and duration edits incrementally refresh the critical path."""
     try:
         task = await schedule_manager.update_task(
             task_id, updates, UUID(current_user.get("user_id") or current_user.get("id"))
         )
+        change_type = None
+        if updates.duration_days is not None:
+            change_type = "duration_change"
+        elif updates.planned_start_date is not None or updates.planned_end_date is not None:
+            change_type = "date_change"
+        if change_type:
+            try:
+                await dependency_engine.auto_recalculate_on_task_change(task_id, change_type)
+            except Exception as e:
+                logger.warning(f"Critical path refresh failed after task update: {e}")
+            invalidate_schedule(task.schedule_id)
         return task
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -303,10 +315,16 @@ async def delete_task(
 ):
     """Delete a task and all its children."""
     try:
+        task = await schedule_manager.get_task(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
         success = await schedule_manager.delete_task(task_id)
         if not success:
             raise HTTPException(status_code=404, detail="Task not found")
+        dependency_engine.invalidate_cpm_state(task.schedule_id)
         return {"message": "Task deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error deleting task: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete task")
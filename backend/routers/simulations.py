@@ -20,6 +20,7 @@ import logging
 
 from auth.rbac import require_permission, Permission
 from auth.dependencies import get_current_user
+from auth.enhanced_permission_checker import get_enhanced_permission_checker
 from config.database import supabase
 
 # Import Monte Carlo components
@@ -90,6 +91,7 @@ class SimulationRequest(BaseModel):
     random_seed: Optional[int] = None
     baseline_costs: Optional[Dict[str, float]] = None
     schedule_data: Optional[Dict[str, Any]] = None
+    previous_simulation_id: Optional[str] = None  # Resample only risks edited since this run
 
 class ScenarioCreateRequest(BaseModel):
     """Request model for creating a scenario."""
@@ -117,6 +119,8 @@ def handle_monte_carlo_exceptions(func):
     async def wrapper(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
+        except HTTPException:
+            raise
         except ValidationError as e:
             logger.warning(f"Validation error in {func.__name__}: {e.message}")
             status_code, error_response = handle_api_exception(e)
@@ -146,6 +150,32 @@ def handle_monte_carlo_exceptions(func):
     
     return wrapper
 
+async def _get_reusable_simulation(simulation_id: str, current_user) -> Optional[Dict[str, Any]]:
+    """
+    Load a stored simulation whose samples the caller may reuse.
+    
+    The caller must own the run or be able to read simulations of its project.
+    Returns None when the database is unavailable and ownership cannot be checked.
+    """
+    if not supabase:
+        logger.warning("Database unavailable - not reusing samples of simulation %s", simulation_id)
+        return None
+    
+    response = supabase.table("monte_carlo_simulations").select(
+        "id, user_id, project_id, timestamp, iteration_count, execution_time, status, results_summary"
+    ).eq("id", simulation_id).execute()
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Previous simulation not found")
+    
+    record = response.data[0]
+    if str(record.get("user_id")) == str(current_user["user_id"]):
+        return record
+    if record.get("project_id") and await get_enhanced_permission_checker().check_project_permission(
+        current_user["user_id"], Permission.simulation_read, record["project_id"]
+    ):
+        return record
+    raise HTTPException(status_code=403, detail="Not allowed to reuse this simulation")
+
 # Simulation Execution Endpoints
 
 @router.post("/simulations/run", response_model=Dict[str, Any])
@@ -248,19 +278,51 @@ async def run_simulation(
                 resource_constraints=[]  # Would convert resource constraint data
             )
         
+        # Only reuse samples of a run the caller may read
+        previous_record = None
+        if request.previous_simulation_id:
+            previous_record = await _get_reusable_simulation(request.previous_simulation_id, current_user)
+        
         # Run simulation with error handling
         try:
-            results = monte_carlo_engine.run_simulation(
-                risks=risks,
-                iterations=validated_data["iterations"],
-                correlations=correlations,
-                random_seed=validated_data.get("random_seed"),
-                baseline_costs=validated_data.get("baseline_costs"),
-                schedule_data=schedule_data
-            )
+            if previous_record:
+                # Interactive what-if edits: reuse the unchanged risks' samples
+                results = monte_carlo_engine.run_simulation_with_caching(
+                    risks=risks,
+                    iterations=validated_data["iterations"],
+                    correlations=correlations,
+                    random_seed=validated_data.get("random_seed"),
+                    previous_simulation_id=request.previous_simulation_id,
+                    baseline_costs=validated_data.get("baseline_costs"),
+                    schedule_data=schedule_data,
+                    incremental=True
+                )
+            else:
+                results = monte_carlo_engine.run_simulation(
+                    risks=risks,
+                    iterations=validated_data["iterations"],
+                    correlations=correlations,
+                    random_seed=validated_data.get("random_seed"),
+                    baseline_costs=validated_data.get("baseline_costs"),
+                    schedule_data=schedule_data
+                )
         except Exception as e:
             raise BusinessLogicError(f"Simulation execution failed: {str(e)}")
         
+        # Unchanged parameters return the previous run itself, which is already stored
+        if previous_record and results.simulation_id == previous_record["id"]:
+            return {
+                "simulation_id": previous_record["id"],
+                "status": previous_record["status"],
+                "timestamp": previous_record["timestamp"],
+                "iteration_count": previous_record["iteration_count"],
+                "execution_time": previous_record["execution_time"],
+                "results_summary": previous_record.get("results_summary") or {},
+                "storage_status": "success",
+                "performance_info": performance_info,
+                "reused_previous_simulation": True
+            }
+        
         # Cache results if enabled
         if use_cache and cache_service.cache_enabled:
             try:
@@ -349,6 +411,8 @@ async def run_simulation(
         
         return response
         
+    except HTTPException:
+        raise
     except ValidationError:
         raise  # Re-raise validation errors
     except BusinessLogicError:
@@ -13,6 +13,7 @@ from datetime import datetime
 _rpc_get_users_available: Optional[bool] = None
 
 from auth.rbac import require_permission, Permission, require_admin
+from auth.enhanced_permission_checker import get_enhanced_permission_checker
 from config.database import supabase, service_supabase
 from services.user_management_audit import log_user_management_to_audit_trail
 from models.users import (
@@ -531,6 +532,7 @@ async def delete_user(
                 service_supabase.table("user_roles").delete().eq("user_id", str(user_id)).execute()
             except Exception:
                 pass
+            get_enhanced_permission_checker().clear_user_cache(user_id)
 
         # Delete from auth so user disappears from admin list (list is built from auth.admin.list_users())
         if service_supabase:
@@ -784,6 +786,7 @@ async def assign_role_to_user(
             raise HTTPException(status_code=400, detail="Failed to assign role")
         
         assignment = response.data[0]
+        get_enhanced_permission_checker().clear_user_cache(user_id)
         
         return UserRoleResponse(
             id=assignment["id"],
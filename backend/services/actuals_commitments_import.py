@@ -7,7 +7,7 @@ and audit logging.
 
 PERFORMANCE OPTIMIZATIONS FOR 100K+ RECORDS:
 - Larger batch sizes (10000 records per batch)
-- Parallel validation using multiprocessing
+- Columnar validation (services/columnar_import.py), chunks run in a process pool
 - Bulk duplicate checking with single query
 - Project pre-caching to eliminate repeated lookups
 - Minimal error collection (first 100 errors only)
@@ -22,15 +22,15 @@ from uuid import uuid4
 from datetime import datetime
 from decimal import Decimal
 from supabase import Client
-from pydantic import ValidationError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import asyncio
 
 from models.imports import (
-    ActualCreate, CommitmentCreate, ImportResult, ImportError,
+    ImportResult, ImportError,
     ImportType, ImportStatus
 )
 from .anonymizer import AnonymizerService
+from .columnar_import import validate_records, duplicate_mask, unique_keys
 from .project_linker import ProjectLinker
 from .data_import_audit import log_data_import_to_audit_trail, trim_import_history
 
@@ -40,9 +40,13 @@ logger = logging.getLogger(__name__)
 BATCH_SIZE = 500  # Fallback insert chunk when not using RPC (trigger per row = slow)
 BATCH_SIZE_RPC = 4000  # Chunk size for insert_*_batch RPC (trigger disabled = fast; actuals & commitments)
 MAX_ERRORS_TO_COLLECT = 50
-VALIDATION_CHUNK_SIZE = 5000
+VALIDATION_CHUNK_SIZE = 5000  # Records per columnar validation chunk (one process-pool task)
 PROJECT_CACHE_PRELOAD = True
 
+# Optional amounts stored as NULL when zero or empty
+ACTUAL_NULLABLE_AMOUNTS = ("value_in_document_currency", "quantity", "goods_received_value")
+COMMITMENT_NULLABLE_AMOUNTS = ("tax_amount", "value_in_document_currency")
+
 
 class ActualsCommitmentsImportService:
     """
@@ -153,60 +157,72 @@ class ActualsCommitmentsImportService:
         
         return project_id
     
-    def _validate_record_fast(
+    def _anonymize_records(
+        self,
+        records: List[Dict[str, Any]],
+        record_type: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Anonymize records in row order before columnar validation.
+        
+        Runs in this process: the anonymizer's vendor/project numbering is
+        stateful, so it cannot be split across validation workers.
+        """
+        if record_type == 'actual':
+            return [self.anonymizer.anonymize_actual(record) for record in records]
+        return [self.anonymizer.anonymize_commitment(record) for record in records]
+    
+    async def _validate_records_columnar(
         self,
-        row_idx: int,
-        record_data: Dict[str, Any],
+        records: List[Dict[str, Any]],
         record_type: str,
-        anonymize: bool
-    ) -> Tuple[Optional[Any], Optional[List[ImportError]]]:
+        anonymize: bool,
+        errors: List[ImportError]
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
         """
-        ULTRA FAST validation: Validate single record with minimal overhead.
+        Validate all records with the columnar engine.
+        
+        Chunks of VALIDATION_CHUNK_SIZE records are validated column-wise,
+        in a process pool for large imports. Errors are appended to
+        ``errors`` with their original row numbers, capped at
+        MAX_ERRORS_TO_COLLECT like the per-record path.
         
         Args:
-            row_idx: Row number
-            record_data: Record data
+            records: Raw record dicts, row 1 first
             record_type: 'actual' or 'commitment'
-            anonymize: Whether to anonymize
+            anonymize: Whether to anonymize before validation
+            errors: Error list to extend
             
         Returns:
-            Tuple of (validated_record, errors)
+            Tuple of ((row number, insert-ready record) list, error count)
         """
-        try:
-            # Anonymize if requested (in-place for speed)
-            if anonymize:
-                if record_type == 'actual':
-                    record_data = self.anonymizer.anonymize_actual(record_data)
-                else:
-                    record_data = self.anonymizer.anonymize_commitment(record_data)
-            
-            # Validate using Pydantic
-            if record_type == 'actual':
-                validated = ActualCreate(**record_data)
-            else:
-                validated = CommitmentCreate(**record_data)
-            
-            return (validated, None)
-            
-        except ValidationError as e:
-            errors = []
-            for error in e.errors():
-                field = ".".join(str(loc) for loc in error['loc'])
-                errors.append(ImportError(
-                    row=row_idx,
-                    field=field,
-                    value=record_data.get(field),
-                    error=error['msg']
-                ))
-            return (None, errors)
-            
-        except Exception as e:
-            return (None, [ImportError(
-                row=row_idx,
-                field="unknown",
-                value=None,
-                error=f"Unexpected error: {str(e)}"
-            )])
+        if anonymize:
+            records = self._anonymize_records(records, record_type)
+        
+        chunk_results = await validate_records(records, record_type, VALIDATION_CHUNK_SIZE)
+        
+        validated_records: List[Tuple[int, Dict[str, Any]]] = []
+        error_count = 0
+        collect_errors = True  # Stop collecting after MAX_ERRORS_TO_COLLECT
+        for chunk in chunk_results:
+            validated_records.extend(chunk.records())
+            for row_idx, record_errors in chunk.invalid:
+                error_count += len(record_errors) if record_errors else 1
+                if collect_errors and len(errors) < MAX_ERRORS_TO_COLLECT:
+                    errors.extend(record_errors)
+                elif len(errors) == MAX_ERRORS_TO_COLLECT:
+                    errors.append(ImportError(
+                        row=0,
+                        field="system",
+                        value=None,
+                        error=f"... und {error_count - MAX_ERRORS_TO_COLLECT} weitere Fehler (zu viele zum Anzeigen)"
+                    ))
+                    collect_errors = False
+            # Rows past the per-chunk error sample only add to the count
+            error_count += chunk.error_count - sum(
+                len(record_errors) if record_errors else 1 for _, record_errors in chunk.invalid
+            )
+        return validated_records, error_count
     
     async def import_actuals(
         self,
@@ -253,32 +269,15 @@ class ActualsCommitmentsImportService:
         duplicate_count = 0
         error_count = 0
         errors: List[ImportError] = []
-        validated_records = []
-        collect_errors = True  # Stop collecting after MAX_ERRORS_TO_COLLECT
         
-        # Step 1: Validate and anonymize all records (ULTRA FAST)
-        logger.info("Step 1/4: Validating records (ULTRA FAST mode)...")
+        # Step 1: Validate and anonymize all records (columnar, process pool for large imports)
+        logger.info("Step 1/4: Validating records (columnar mode)...")
         validation_start = datetime.now()
         
-        for row_idx, record_data in enumerate(records, start=1):
-            validated, record_errors = self._validate_record_fast(
-                row_idx, record_data, 'actual', anonymize
-            )
-            
-            if validated:
-                validated_records.append((row_idx, validated))
-            else:
-                error_count += len(record_errors) if record_errors else 1
-                if collect_errors and len(errors) < MAX_ERRORS_TO_COLLECT:
-                    errors.extend(record_errors or [])
-                elif len(errors) == MAX_ERRORS_TO_COLLECT:
-                    errors.append(ImportError(
-                        row=0,
-                        field="system",
-                        value=None,
-                        error=f"... und {error_count - MAX_ERRORS_TO_COLLECT} weitere Fehler (zu viele zum Anzeigen)"
-                    ))
-                    collect_errors = False
+        validated_records, error_count = await self._validate_records_columnar(
+            records, 'actual', anonymize, errors
+        )
+        collect_errors = True  # Stop collecting after MAX_ERRORS_TO_COLLECT
         
         validation_time = (datetime.now() - validation_start).total_seconds()
         validation_rate = len(records) / validation_time if validation_time > 0 else 0
@@ -301,83 +300,40 @@ class ActualsCommitmentsImportService:
         
         # Step 2: Bulk check for duplicates (SINGLE QUERY!)
         logger.info(f"Step 2/4: Checking {len(validated_records)} records for duplicates...")
-        fi_doc_nos = [actual.fi_doc_no for _, actual in validated_records]
-        existing_fi_doc_nos = await self.batch_check_duplicate_actuals(fi_doc_nos)
+        fi_doc_nos = [actual["fi_doc_no"] for _, actual in validated_records]
+        existing_fi_doc_nos = await self.batch_check_duplicate_actuals(unique_keys(fi_doc_nos))
         logger.info(f"✅ Found {len(existing_fi_doc_nos)} existing duplicates in DB")
         
+        # Skip duplicates from database and repeats within the same import batch
+        is_duplicate = duplicate_mask(fi_doc_nos, existing_fi_doc_nos)
+        duplicate_count = int(is_duplicate.sum())
+        
         # Step 3: Prepare records for batch insert (excluding duplicates)
         logger.info("Step 3/4: Preparing records for insert...")
         records_to_insert = []
-        seen_fi_doc_nos: Set[str] = set()  # Track within batch
         
-        for row_idx, actual in validated_records:
-            # Skip duplicates from database
-            if actual.fi_doc_no in existing_fi_doc_nos:
-                duplicate_count += 1
-                continue
-            
-            # Skip duplicates within the same import batch
-            if actual.fi_doc_no in seen_fi_doc_nos:
-                duplicate_count += 1
+        for (row_idx, actual), duplicate in zip(validated_records, is_duplicate):
+            if duplicate:
                 continue
             
-            # Mark this fi_doc_no as seen
-            seen_fi_doc_nos.add(actual.fi_doc_no)
-            
             try:
                 # Get project ID from cache (BLAZING FAST!)
                 project_id = await self._get_or_create_project_cached(
-                    actual.project_nr,
-                    actual.wbs_element or ""
+                    actual["project_nr"],
+                    actual["wbs_element"] or ""
                 )
                 
-                # Prepare record for batch insert
+                # Validated records are insert-ready (ISO dates, float amounts)
+                now = datetime.now().isoformat()
                 actual_data = {
                     "id": str(uuid4()),
-                    "fi_doc_no": actual.fi_doc_no,
-                    "posting_date": actual.posting_date.isoformat(),
-                    "document_date": actual.document_date.isoformat() if actual.document_date else None,
-                    "vendor": actual.vendor,
-                    "vendor_description": actual.vendor_description,
+                    **actual,
                     "project_id": str(project_id),
-                    "project_nr": actual.project_nr,
-                    "wbs_element": actual.wbs_element,
-                    "amount": float(actual.amount),
-                    "currency": actual.currency,
-                    "item_text": actual.item_text,
-                    "document_type": actual.document_type,
-                    # Additional fields
-                    "document_type_desc": actual.document_type_desc,
-                    "po_no": actual.po_no,
-                    "po_line_no": actual.po_line_no,
-                    "vendor_invoice_no": actual.vendor_invoice_no,
-                    "project_description": actual.project_description,
-                    "wbs_description": actual.wbs_description,
-                    "gl_account": actual.gl_account,
-                    "gl_account_desc": actual.gl_account_desc,
-                    "cost_center": actual.cost_center,
-                    "cost_center_desc": actual.cost_center_desc,
-                    "product_desc": actual.product_desc,
-                    "document_header_text": actual.document_header_text,
-                    "payment_terms": actual.payment_terms,
-                    "net_due_date": actual.net_due_date.isoformat() if actual.net_due_date else None,
-                    "creation_date": actual.creation_date.isoformat() if actual.creation_date else None,
-                    "sap_invoice_no": actual.sap_invoice_no,
-                    "investment_profile": actual.investment_profile,
-                    "account_group_level1": actual.account_group_level1,
-                    "account_subgroup_level2": actual.account_subgroup_level2,
-                    "account_level3": actual.account_level3,
-                    "value_in_document_currency": float(actual.value_in_document_currency) if actual.value_in_document_currency else None,
-                    "document_currency_code": actual.document_currency_code,
-                    "quantity": float(actual.quantity) if actual.quantity else None,
-                    "personnel_number": actual.personnel_number,
-                    "po_final_invoice_indicator": actual.po_final_invoice_indicator,
-                    "value_type": actual.value_type,
-                    "miro_invoice_no": actual.miro_invoice_no,
-                    "goods_received_value": float(actual.goods_received_value) if actual.goods_received_value else None,
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
+                    "created_at": now,
+                    "updated_at": now
                 }
+                for key in ACTUAL_NULLABLE_AMOUNTS:
+                    actual_data[key] = actual_data[key] or None
                 records_to_insert.append((row_idx, actual_data))
                 
             except Exception as e:
@@ -386,7 +342,7 @@ class ActualsCommitmentsImportService:
                     errors.append(ImportError(
                         row=row_idx,
                         field="project_linking",
-                        value=actual.fi_doc_no,
+                        value=actual["fi_doc_no"],
                         error=f"Failed to link project: {str(e)}"
                     ))
                 logger.error(f"Row {row_idx}: Project linking error - {e}", exc_info=True)
@@ -528,32 +484,15 @@ class ActualsCommitmentsImportService:
         duplicate_count = 0
         error_count = 0
         errors: List[ImportError] = []
-        validated_records = []
-        collect_errors = True  # Stop collecting after MAX_ERRORS_TO_COLLECT
         
-        # Step 1: Validate and anonymize all records (ULTRA FAST)
-        logger.info("Step 1/4: Validating records (ULTRA FAST mode)...")
+        # Step 1: Validate and anonymize all records (columnar, process pool for large imports)
+        logger.info("Step 1/4: Validating records (columnar mode)...")
         validation_start = datetime.now()
         
-        for row_idx, record_data in enumerate(records, start=1):
-            validated, record_errors = self._validate_record_fast(
-                row_idx, record_data, 'commitment', anonymize
-            )
-            
-            if validated:
-                validated_records.append((row_idx, validated))
-            else:
-                error_count += len(record_errors) if record_errors else 1
-                if collect_errors and len(errors) < MAX_ERRORS_TO_COLLECT:
-                    errors.extend(record_errors or [])
-                elif len(errors) == MAX_ERRORS_TO_COLLECT:
-                    errors.append(ImportError(
-                        row=0,
-                        field="system",
-                        value=None,
-                        error=f"... und {error_count - MAX_ERRORS_TO_COLLECT} weitere Fehler (zu viele zum Anzeigen)"
-                    ))
-                    collect_errors = False
+        validated_records, error_count = await self._validate_records_columnar(
+            records, 'commitment', anonymize, errors
+        )
+        collect_errors = True  # Stop collecting after MAX_ERRORS_TO_COLLECT
         
         validation_time = (datetime.now() - validation_start).total_seconds()
         validation_rate = len(records) / validation_time if validation_time > 0 else 0
@@ -576,80 +515,40 @@ class ActualsCommitmentsImportService:
         
         # Step 2: Bulk check for duplicates (SINGLE QUERY!)
         logger.info(f"Step 2/4: Checking {len(validated_records)} records for duplicates...")
-        po_keys = [(commitment.po_number, commitment.po_line_nr) for _, commitment in validated_records]
-        existing_po_keys = await self.batch_check_duplicate_commitments(po_keys)
+        po_keys = [(commitment["po_number"], commitment["po_line_nr"]) for _, commitment in validated_records]
+        existing_po_keys = await self.batch_check_duplicate_commitments(unique_keys(po_keys))
         logger.info(f"✅ Found {len(existing_po_keys)} existing duplicates in DB")
         
+        # Skip duplicates from database and repeats within the same import batch
+        is_duplicate = duplicate_mask(po_keys, existing_po_keys)
+        duplicate_count = int(is_duplicate.sum())
+        
         # Step 3: Prepare records for batch insert (excluding duplicates)
         logger.info("Step 3/4: Preparing records for insert...")
         records_to_insert = []
-        seen_po_keys: Set[Tuple[str, int]] = set()  # Track within batch
         
-        for row_idx, commitment in validated_records:
-            # Skip duplicates from database
-            po_key = (commitment.po_number, commitment.po_line_nr)
-            if po_key in existing_po_keys:
-                duplicate_count += 1
+        for (row_idx, commitment), duplicate in zip(validated_records, is_duplicate):
+            if duplicate:
                 continue
             
-            # Skip duplicates within the same import batch
-            if po_key in seen_po_keys:
-                duplicate_count += 1
-                continue
-            
-            # Mark this po_key as seen
-            seen_po_keys.add(po_key)
-            
             try:
                 # Get project ID from cache (BLAZING FAST!)
                 project_id = await self._get_or_create_project_cached(
-                    commitment.project_nr,
-                    commitment.wbs_element or ""
+                    commitment["project_nr"],
+                    commitment["wbs_element"] or ""
                 )
                 
-                # Prepare record for batch insert
+                # Validated records are insert-ready (ISO dates, float amounts)
+                now = datetime.now().isoformat()
                 commitment_data = {
                     "id": str(uuid4()),
-                    "po_number": commitment.po_number,
-                    "po_date": commitment.po_date.isoformat(),
-                    "vendor": commitment.vendor,
-                    "vendor_description": commitment.vendor_description,
+                    **commitment,
                     "project_id": str(project_id),
-                    "project_nr": commitment.project_nr,
-                    "wbs_element": commitment.wbs_element,
-                    "po_net_amount": float(commitment.po_net_amount),
-                    "total_amount": float(commitment.total_amount),
-                    "currency": commitment.currency,
-                    "po_status": commitment.po_status,
-                    "po_line_nr": commitment.po_line_nr,
-                    "delivery_date": commitment.delivery_date.isoformat() if commitment.delivery_date else None,
-                    # Additional fields
-                    "requester": commitment.requester,
-                    "po_created_by": commitment.po_created_by,
-                    "shopping_cart_number": commitment.shopping_cart_number,
-                    "project_description": commitment.project_description,
-                    "wbs_description": commitment.wbs_description,
-                    "cost_center": commitment.cost_center,
-                    "cost_center_description": commitment.cost_center_description,
-                    "tax_amount": float(commitment.tax_amount) if commitment.tax_amount else None,
-                    "po_line_text": commitment.po_line_text,
-                    "document_currency_code": commitment.document_currency_code,
-                    "value_in_document_currency": float(commitment.value_in_document_currency) if commitment.value_in_document_currency else None,
-                    "investment_profile": commitment.investment_profile,
-                    "account_group_level1": commitment.account_group_level1,
-                    "account_subgroup_level2": commitment.account_subgroup_level2,
-                    "account_level3": commitment.account_level3,
-                    "change_date": commitment.change_date.isoformat() if commitment.change_date else None,
-                    "purchase_requisition": commitment.purchase_requisition,
-                    "procurement_plant": commitment.procurement_plant,
-                    "contract_number": commitment.contract_number,
-                    "joint_commodity_code": commitment.joint_commodity_code,
-                    "po_title": commitment.po_title,
-                    "version": commitment.version,
-                    "fi_doc_no": commitment.fi_doc_no,
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
+                    "created_at": now,
+                    "updated_at": now
                 }
+                for key in COMMITMENT_NULLABLE_AMOUNTS:
+                    commitment_data[key] = commitment_data[key] or None
                 records_to_insert.append((row_idx, commitment_data))
                 
             except Exception as e:
@@ -658,7 +557,7 @@ class ActualsCommitmentsImportService:
                     errors.append(ImportError(
                         row=row_idx,
                         field="project_linking",
-                        value=f"{commitment.po_number}-{commitment.po_line_nr}",
+                        value=f"{commitment['po_number']}-{commitment['po_line_nr']}",
                         error=f"Failed to link project: {str(e)}"
                     ))
                 logger.error(f"Row {row_idx}: Project linking error - {e}", exc_info=True)
@@ -799,7 +698,7 @@ class ActualsCommitmentsImportService:
         ULTRA FAST batch check if commitments with given (po_number, po_line_nr) exist.
         
         Optimizations:
-        - Single query with IN clause
+        - Chunked queries (2000 PO numbers per request) to avoid URL/request size limits
         - Only select necessary fields (minimal data transfer)
         - Uses database index for maximum speed
         
@@ -814,22 +713,23 @@ class ActualsCommitmentsImportService:
         if not po_keys:
             return set()
         
+        existing: Set[tuple] = set()
         try:
             # Extract unique PO numbers for efficient query
-            po_numbers = list(set(po_number for po_number, _ in po_keys))
-            
-            # ULTRA FAST: Query only fields we need, use index
-            response = self.supabase.table("commitments").select(
-                "po_number, po_line_nr"
-            ).in_("po_number", po_numbers).execute()
-            
-            # Return set for O(1) lookup
-            if response.data:
-                return {
-                    (record["po_number"], record["po_line_nr"]) 
-                    for record in response.data
-                }
-            return set()
+            po_numbers = list(dict.fromkeys(po_number for po_number, _ in po_keys))
+            
+            for i in range(0, len(po_numbers), self.DUPLICATE_CHECK_CHUNK):
+                chunk = po_numbers[i : i + self.DUPLICATE_CHECK_CHUNK]
+                # ULTRA FAST: Query only fields we need, use index
+                response = self.supabase.table("commitments").select(
+                    "po_number, po_line_nr"
+                ).in_("po_number", chunk).execute()
+                if response.data:
+                    existing.update(
+                        (record["po_number"], record["po_line_nr"])
+                        for record in response.data
+                    )
+            return existing
             
         except Exception as e:
             logger.error(f"Error batch checking duplicate commitments: {e}")
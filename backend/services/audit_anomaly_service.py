@@ -135,29 +135,31 @@ class AuditAnomalyService:
             # Ensure model is trained
             if not self.is_trained:
                 self.logger.warning("Model not trained, training on current data")
-                await self.train_model(events)
+                await self.train_model(events, feature_matrix=feature_matrix)
             
             # Predict anomaly scores
             anomaly_scores = self._compute_anomaly_scores_batch(feature_matrix)
             
             # Identify anomalies (score > threshold)
             anomalies = []
-            for i, (event, score) in enumerate(zip(events, anomaly_scores)):
-                if score > self.anomaly_threshold:
-                    # Create anomaly detection record
-                    anomaly = await self._create_anomaly_detection(
-                        event=event,
-                        anomaly_score=float(score),
-                        features=feature_matrix[i]
-                    )
-                    anomalies.append(anomaly)
-                    
-                    # Update event with anomaly flag
-                    await self._update_event_anomaly_status(
-                        event_id=event['id'],
-                        anomaly_score=float(score),
-                        is_anomaly=True
-                    )
+            for i in np.flatnonzero(anomaly_scores > self.anomaly_threshold):
+                event = events[i]
+                score = float(anomaly_scores[i])
+                
+                # Create anomaly detection record
+                anomaly = await self._create_anomaly_detection(
+                    event=event,
+                    anomaly_score=score,
+                    features=feature_matrix[i]
+                )
+                anomalies.append(anomaly)
+                
+                # Update event with anomaly flag
+                await self._update_event_anomaly_status(
+                    event_id=event['id'],
+                    anomaly_score=score,
+                    is_anomaly=True
+                )
             
             self.logger.info(f"Detected {len(anomalies)} anomalies out of {len(events)} events")
             
@@ -178,8 +180,8 @@ class AuditAnomalyService:
             Anomaly score between 0 and 1 (higher = more anomalous)
         """
         try:
-            # Extract features
-            features = await self.feature_extractor.extract_features(event)
+            # Extract features (batch path reuses the cached lookup tables)
+            features = (await self.feature_extractor.extract_batch_features([event]))[0]
             
             # Ensure model is trained
             if not self.is_trained:
@@ -230,7 +232,8 @@ class AuditAnomalyService:
     async def train_model(
         self,
         training_data: Optional[List[Dict[str, Any]]] = None,
-        days_of_history: int = 30
+        days_of_history: int = 30,
+        feature_matrix: Optional[np.ndarray] = None
     ) -> ModelMetrics:
         """
         Train Isolation Forest model on historical audit data.
@@ -238,6 +241,7 @@ class AuditAnomalyService:
         Args:
             training_data: Optional list of audit events to train on
             days_of_history: Number of days of historical data to use if training_data not provided
+            feature_matrix: Optional features already extracted from training_data
             
         Returns:
             Training metrics
@@ -260,7 +264,8 @@ class AuditAnomalyService:
             self.logger.info(f"Training model on {len(training_data)} events")
             
             # Extract features
-            feature_matrix = await self.feature_extractor.extract_batch_features(training_data)
+            if feature_matrix is None:
+                feature_matrix = await self.feature_extractor.extract_batch_features(training_data)
             
             # Fit scaler
             self.scaler.fit(feature_matrix)
@@ -9,12 +9,14 @@ Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.12
 """
 
 import os
+import asyncio
 import csv
 import io
 import json
 import logging
+import zlib
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Union
 from uuid import UUID
 from dataclasses import dataclass
 
@@ -49,6 +51,17 @@ except ImportError:
 from config.database import supabase
 
 
+# Columns written by the CSV exports
+EXPORT_FIELDNAMES = [
+    'id', 'timestamp', 'event_type', 'user_id', 'entity_type', 'entity_id',
+    'severity', 'category', 'risk_level', 'anomaly_score', 'is_anomaly',
+    'tags', 'action_details', 'ip_address', 'user_agent', 'project_id'
+]
+
+# Output formats supported by export_events_streaming
+STREAMING_EXPORT_FORMATS = ('csv', 'ndjson')
+
+
 @dataclass
 class TrendAnalysis:
     """Data class for trend analysis results."""
@@ -275,41 +288,14 @@ class AuditExportService:
             # Create CSV
             csv_buffer = io.StringIO()
             
-            # Define CSV columns
-            fieldnames = [
-                'id', 'timestamp', 'event_type', 'user_id', 'entity_type', 'entity_id',
-                'severity', 'category', 'risk_level', 'anomaly_score', 'is_anomaly',
-                'tags', 'action_details', 'ip_address', 'user_agent', 'project_id'
-            ]
-            
-            writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, extrasaction='ignore')
+            writer = csv.DictWriter(csv_buffer, fieldnames=EXPORT_FIELDNAMES, extrasaction='ignore')
             
             # Write header
             writer.writeheader()
             
             # Write events
             for event in events:
-                # Flatten complex fields
-                row = {
-                    'id': event.get('id'),
-                    'timestamp': event.get('timestamp'),
-                    'event_type': event.get('event_type'),
-                    'user_id': event.get('user_id'),
-                    'entity_type': event.get('entity_type'),
-                    'entity_id': event.get('entity_id'),
-                    'severity': event.get('severity'),
-                    'category': event.get('category'),
-                    'risk_level': event.get('risk_level'),
-                    'anomaly_score': event.get('anomaly_score'),
-                    'is_anomaly': event.get('is_anomaly'),
-                    'tags': json.dumps(event.get('tags', {})),
-                    'action_details': json.dumps(event.get('action_details', {})),
-                    'ip_address': event.get('ip_address'),
-                    'user_agent': event.get('user_agent'),
-                    'project_id': event.get('project_id')
-                }
-                
-                writer.writerow(row)
+                writer.writerow(self._flatten_event(event))
             
             csv_content = csv_buffer.getvalue()
             csv_buffer.close()
@@ -343,81 +329,144 @@ class AuditExportService:
             
         Requirements: 7.1, 7.6, 7.7
         """
-        try:
-            self.logger.info(f"Starting streaming CSV export with filters: {filters}")
+        async for chunk in self.export_events_streaming(filters, tenant_id, batch_size, output_format='csv'):
+            yield chunk
+    
+    async def export_events_streaming(
+        self,
+        filters: Dict[str, Any],
+        tenant_id: Optional[str] = None,
+        batch_size: int = 1000,
+        output_format: str = 'csv',
+        compress: bool = False
+    ) -> AsyncIterator[Union[str, bytes]]:
+        """
+        Stream filtered audit events as CSV or NDJSON, optionally gzip-compressed.
+        
+        Pages are read with a keyset cursor on (timestamp, id) instead of an
+        offset, so each page costs the same however deep the export is, and
+        events written while the export runs cannot shift rows between pages.
+        The next page is fetched in a worker thread while the current one is
+        serialized.
+        
+        Args:
+            filters: Dictionary of filters (date range, event types, severity, etc.)
+            tenant_id: Tenant ID for multi-tenant isolation
+            batch_size: Number of events per page (default: 1000)
+            output_format: 'csv' or 'ndjson'
+            compress: Yield a gzip stream (bytes) instead of text chunks
             
-            # Define CSV columns
-            fieldnames = [
-                'id', 'timestamp', 'event_type', 'user_id', 'entity_type', 'entity_id',
-                'severity', 'category', 'risk_level', 'anomaly_score', 'is_anomaly',
-                'tags', 'action_details', 'ip_address', 'user_agent', 'project_id'
-            ]
+        Yields:
+            Text chunks, or gzip-compressed bytes when compress is set
             
-            # Yield CSV header
-            csv_buffer = io.StringIO()
-            writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            yield csv_buffer.getvalue()
-            csv_buffer.close()
+        Raises:
+            ValueError: If output_format is not supported
+            
+        Requirements: 7.1, 7.6, 7.7
+        """
+        if output_format not in STREAMING_EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported export format '{output_format}'. "
+                f"Expected one of: {', '.join(STREAMING_EXPORT_FORMATS)}"
+            )
+        
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        
+        def encode(text: str) -> Union[str, bytes]:
+            return compressor.compress(text.encode('utf-8')) if compressor else text
+        
+        next_page: Optional[asyncio.Task] = None
+        try:
+            self.logger.info(f"Starting streaming {output_format} export with filters: {filters}")
+            
+            if output_format == 'csv':
+                csv_buffer = io.StringIO()
+                writer = csv.DictWriter(csv_buffer, fieldnames=EXPORT_FIELDNAMES, extrasaction='ignore')
+                writer.writeheader()
+                header = encode(csv_buffer.getvalue())
+                csv_buffer.close()
+                if header:
+                    yield header
             
-            # Stream events in batches
-            offset = 0
             total_exported = 0
+            next_page = asyncio.create_task(
+                asyncio.to_thread(self._fetch_event_page, filters, tenant_id, None, batch_size)
+            )
             
-            while True:
-                # Fetch batch of events
-                batch_filters = filters.copy()
-                batch_filters['limit'] = batch_size
-                batch_filters['offset'] = offset
-                
-                events = await self._fetch_filtered_events(batch_filters, tenant_id)
+            while next_page is not None:
+                events = await next_page
+                next_page = None
                 
                 if not events:
                     break
                 
-                # Generate CSV for this batch
-                csv_buffer = io.StringIO()
-                writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames, extrasaction='ignore')
+                # Prefetch the following page while this one is serialized
+                if len(events) == batch_size:
+                    cursor = (events[-1]['timestamp'], events[-1]['id'])
+                    next_page = asyncio.create_task(
+                        asyncio.to_thread(self._fetch_event_page, filters, tenant_id, cursor, batch_size)
+                    )
                 
-                for event in events:
-                    # Flatten complex fields
-                    row = {
-                        'id': event.get('id'),
-                        'timestamp': event.get('timestamp'),
-                        'event_type': event.get('event_type'),
-                        'user_id': event.get('user_id'),
-                        'entity_type': event.get('entity_type'),
-                        'entity_id': event.get('entity_id'),
-                        'severity': event.get('severity'),
-                        'category': event.get('category'),
-                        'risk_level': event.get('risk_level'),
-                        'anomaly_score': event.get('anomaly_score'),
-                        'is_anomaly': event.get('is_anomaly'),
-                        'tags': json.dumps(event.get('tags', {})),
-                        'action_details': json.dumps(event.get('action_details', {})),
-                        'ip_address': event.get('ip_address'),
-                        'user_agent': event.get('user_agent'),
-                        'project_id': event.get('project_id')
-                    }
-                    
-                    writer.writerow(row)
+                if output_format == 'csv':
+                    chunk = self._serialize_events_csv(events)
+                else:
+                    chunk = self._serialize_events_ndjson(events)
                 
-                # Yield batch
-                yield csv_buffer.getvalue()
-                csv_buffer.close()
+                chunk = encode(chunk)
+                if chunk:
+                    yield chunk
                 
                 total_exported += len(events)
-                offset += batch_size
-                
-                # If we got fewer events than batch_size, we're done
-                if len(events) < batch_size:
-                    break
             
-            self.logger.info(f"Streaming CSV export completed: {total_exported} events")
+            if compressor:
+                yield compressor.flush()
+            
+            self.logger.info(f"Streaming {output_format} export completed: {total_exported} events")
             
         except Exception as e:
-            self.logger.error(f"Streaming CSV export failed: {str(e)}")
+            self.logger.error(f"Streaming export failed: {str(e)}")
             raise
+        finally:
+            # Consumer stopped early: don't leave the prefetch running
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+    
+    def _serialize_events_csv(self, events: List[Dict[str, Any]]) -> str:
+        """Serialize a page of events as CSV rows (no header)."""
+        csv_buffer = io.StringIO()
+        writer = csv.DictWriter(csv_buffer, fieldnames=EXPORT_FIELDNAMES, extrasaction='ignore')
+        writer.writerows(self._flatten_event(event) for event in events)
+        content = csv_buffer.getvalue()
+        csv_buffer.close()
+        return content
+    
+    def _serialize_events_ndjson(self, events: List[Dict[str, Any]]) -> str:
+        """Serialize a page of events as newline-delimited JSON, one event per line."""
+        return ''.join(
+            json.dumps({field: event.get(field) for field in EXPORT_FIELDNAMES}, default=str) + '\n'
+            for event in events
+        )
+    
+    def _flatten_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten an audit event into a CSV row."""
+        return {
+            'id': event.get('id'),
+            'timestamp': event.get('timestamp'),
+            'event_type': event.get('event_type'),
+            'user_id': event.get('user_id'),
+            'entity_type': event.get('entity_type'),
+            'entity_id': event.get('entity_id'),
+            'severity': event.get('severity'),
+            'category': event.get('category'),
+            'risk_level': event.get('risk_level'),
+            'anomaly_score': event.get('anomaly_score'),
+            'is_anomaly': event.get('is_anomaly'),
+            'tags': json.dumps(event.get('tags', {})),
+            'action_details': json.dumps(event.get('action_details', {})),
+            'ip_address': event.get('ip_address'),
+            'user_agent': event.get('user_agent'),
+            'project_id': event.get('project_id')
+        }
     
     async def generate_executive_summary(
         self,
@@ -585,45 +634,9 @@ Provide a 4-5 sentence executive summary highlighting:
             List of matching audit events
         """
         try:
-            query = self.supabase.table("audit_logs").select("*")
-            
-            # Apply tenant isolation
-            if tenant_id:
-                query = query.eq("tenant_id", tenant_id)
-            
-            # Apply date range filters
-            if filters.get('start_date'):
-                query = query.gte("timestamp", filters['start_date'])
-            
-            if filters.get('end_date'):
-                query = query.lte("timestamp", filters['end_date'])
-            
-            # Apply event type filter
-            if filters.get('event_types'):
-                query = query.in_("event_type", filters['event_types'])
-            
-            # Apply severity filter
-            if filters.get('severity'):
-                query = query.eq("severity", filters['severity'])
-            
-            # Apply category filter
-            if filters.get('categories'):
-                query = query.in_("category", filters['categories'])
-            
-            # Apply risk level filter
-            if filters.get('risk_levels'):
-                query = query.in_("risk_level", filters['risk_levels'])
-            
-            # Apply user filter
-            if filters.get('user_id'):
-                query = query.eq("user_id", filters['user_id'])
-            
-            # Apply entity filters
-            if filters.get('entity_type'):
-                query = query.eq("entity_type", filters['entity_type'])
-            
-            if filters.get('entity_id'):
-                query = query.eq("entity_id", filters['entity_id'])
+            query = self._apply_event_filters(
+                self.supabase.table("audit_logs").select("*"), filters, tenant_id
+            )
             
             # Order by timestamp descending
             query = query.order("timestamp", desc=True)
@@ -642,6 +655,104 @@ Provide a 4-5 sentence executive summary highlighting:
             self.logger.error(f"Failed to fetch filtered events: {str(e)}")
             return []
     
+    def _apply_event_filters(
+        self,
+        query,
+        filters: Dict[str, Any],
+        tenant_id: Optional[str] = None
+    ):
+        """
+        Apply tenant isolation and export filters to an audit_logs query.
+        
+        Args:
+            query: Supabase query builder on audit_logs
+            filters: Dictionary of filters
+            tenant_id: Tenant ID for isolation
+            
+        Returns:
+            Filtered query builder
+        """
+        # Apply tenant isolation
+        if tenant_id:
+            query = query.eq("tenant_id", tenant_id)
+        
+        # Apply date range filters
+        if filters.get('start_date'):
+            query = query.gte("timestamp", filters['start_date'])
+        
+        if filters.get('end_date'):
+            query = query.lte("timestamp", filters['end_date'])
+        
+        # Apply event type filter
+        if filters.get('event_types'):
+            query = query.in_("event_type", filters['event_types'])
+        
+        # Apply severity filter
+        if filters.get('severity'):
+            query = query.eq("severity", filters['severity'])
+        
+        # Apply category filter
+        if filters.get('categories'):
+            query = query.in_("category", filters['categories'])
+        
+        # Apply risk level filter
+        if filters.get('risk_levels'):
+            query = query.in_("risk_level", filters['risk_levels'])
+        
+        # Apply user filter
+        if filters.get('user_id'):
+            query = query.eq("user_id", filters['user_id'])
+        
+        # Apply entity filters
+        if filters.get('entity_type'):
+            query = query.eq("entity_type", filters['entity_type'])
+        
+        if filters.get('entity_id'):
+            query = query.eq("entity_id", filters['entity_id'])
+        
+        return query
+    
+    def _fetch_event_page(
+        self,
+        filters: Dict[str, Any],
+        tenant_id: Optional[str],
+        cursor: Optional[Tuple[Any, Any]],
+        page_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of filtered events after a (timestamp, id) keyset cursor.
+        
+        Events are ordered by timestamp then id, both descending; the id
+        breaks ties between events sharing a timestamp. Blocking, so the
+        streaming export runs it in a worker thread. Errors propagate so an
+        export never ends silently truncated.
+        
+        Args:
+            filters: Dictionary of filters
+            tenant_id: Tenant ID for isolation
+            cursor: (timestamp, id) of the last event of the previous page, or None
+            page_size: Maximum number of events to return
+            
+        Returns:
+            List of audit events
+        """
+        query = self._apply_event_filters(
+            self.supabase.table("audit_logs").select("*"), filters, tenant_id
+        )
+        
+        if cursor is not None:
+            last_timestamp, last_id = cursor
+            # Quoted: timestamps contain characters PostgREST reserves in or() filters
+            query = query.or_(
+                f'timestamp.lt."{last_timestamp}",'
+                f'and(timestamp.eq."{last_timestamp}",id.lt."{last_id}")'
+            )
+        
+        query = query.order("timestamp", desc=True).order("id", desc=True).limit(page_size)
+        
+        response = query.execute()
+        return response.data or []
+    
     def _calculate_statistics(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate statistics from events for summary generation."""
         stats = {
@@ -880,12 +991,7 @@ Provide a 4-5 sentence executive summary highlighting:
     def _generate_empty_csv(self) -> str:
         """Generate empty CSV when no events found."""
         csv_buffer = io.StringIO()
-        fieldnames = [
-            'id', 'timestamp', 'event_type', 'user_id', 'entity_type', 'entity_id',
-            'severity', 'category', 'risk_level', 'anomaly_score', 'is_anomaly',
-            'tags', 'action_details', 'ip_address', 'user_agent', 'project_id'
-        ]
-        writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
+        writer = csv.DictWriter(csv_buffer, fieldnames=EXPORT_FIELDNAMES)
         writer.writeheader()
         
         csv_content = csv_buffer.getvalue()
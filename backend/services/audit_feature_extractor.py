@@ -14,9 +14,22 @@ from uuid import UUID
 import json
 import logging
 import numpy as np
+import pandas as pd
 from collections import defaultdict, Counter
 
 
+# Severity levels mapped to their feature value
+SEVERITY_SCORES = {
+    'info': 0.0,
+    'warning': 0.33,
+    'error': 0.66,
+    'critical': 1.0
+}
+
+# What may follow the 'YYYY-MM-DDTHH:MM:SS' prefix of an ISO timestamp
+_ISO_TIMESTAMP_SUFFIX = r'(?:\.\d{1,6})?(?:Z|[+-]\d{2}:?\d{2}(?::?\d{2}(?:\.\d{1,6})?)?)?'
+
+
 class AuditFeatureExtractor:
     """
     Extracts normalized features from audit events for anomaly detection.
@@ -40,6 +53,10 @@ class AuditFeatureExtractor:
         self._entity_access_patterns = {}
         self._last_cache_update = None
         self._cache_ttl = timedelta(hours=1)
+        
+        # Lookup tables derived from the cached statistics, rebuilt on cache refresh
+        self._lookup_tables = None
+        self._lookup_tables_built_at = None
     
     async def extract_features(
         self,
@@ -326,14 +343,7 @@ class AuditFeatureExtractor:
         """
         severity = event.get('severity', 'info')
         
-        severity_map = {
-            'info': 0.0,
-            'warning': 0.33,
-            'error': 0.66,
-            'critical': 1.0
-        }
-        
-        severity_score = severity_map.get(severity.lower(), 0.0)
+        severity_score = SEVERITY_SCORES.get(severity.lower(), 0.0)
         
         return [severity_score]
     
@@ -449,30 +459,187 @@ class AuditFeatureExtractor:
     
     async def extract_batch_features(
         self,
-        events: List[Dict[str, Any]]
+        events: List[Dict[str, Any]],
+        historical_context: Optional[Dict[str, Any]] = None
     ) -> np.ndarray:
         """
         Extract features for a batch of events efficiently.
         
+        Historical statistics are reduced once per batch to lookup arrays
+        indexed by the distinct event types, users and entities in the batch,
+        so the cost per event no longer grows with the number of historical
+        patterns. Produces the same vectors as extract_features.
+        
         Args:
             events: List of audit event dictionaries
+            historical_context: Optional pre-computed historical statistics
+            
+        Returns:
+            2D numpy array of shape (len(events), feature dimension)
+        """
+        if historical_context is None:
+            # Update cache once for the batch
+            await self._update_cache_if_needed()
             
+            if self._lookup_tables is None or self._lookup_tables_built_at != self._last_cache_update:
+                self._lookup_tables = self._build_lookup_tables({
+                    'event_type_frequencies': self._event_type_frequencies,
+                    'user_activity_stats': self._user_activity_stats,
+                    'entity_access_patterns': self._entity_access_patterns
+                })
+                self._lookup_tables_built_at = self._last_cache_update
+            tables = self._lookup_tables
+        else:
+            tables = self._build_lookup_tables(historical_context)
+        
+        return self._extract_feature_matrix(events, tables)
+    
+    def _build_lookup_tables(self, historical_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce historical statistics to per-key feature values.
+        
         Returns:
-            2D numpy array where each row is a feature vector
+            Dictionary of lookup tables keyed by event type, user and entity
         """
-        # Update cache once for the batch
-        await self._update_cache_if_needed()
+        frequencies = historical_context.get('event_type_frequencies', {})
+        total_events = sum(frequencies.values()) if frequencies else 1
+        event_types = {}
+        for event_type, count in frequencies.items():
+            frequency = count / total_events if total_events > 0 else 0
+            event_types[event_type] = (frequency, 1.0 - frequency if frequency > 0 else 1.0)
+        
+        users = {}
+        for user_id, user_stats in historical_context.get('user_activity_stats', {}).items():
+            users[str(user_id)] = self._extract_user_activity_features(
+                {'user_id': user_id},
+                {'user_activity_stats': {str(user_id): user_stats}}
+            )
         
-        historical_context = {
-            'event_type_frequencies': self._event_type_frequencies,
-            'user_activity_stats': self._user_activity_stats,
-            'entity_access_patterns': self._entity_access_patterns
+        access_patterns = historical_context.get('entity_access_patterns', {})
+        total_accesses = sum(access_patterns.values()) if access_patterns else 1
+        entity_type_counts = defaultdict(int)
+        for key, count in access_patterns.items():
+            entity_type_counts[key.split(':')[0]] += count
+        
+        def share(count):
+            return count / total_accesses if total_accesses > 0 else 0
+        
+        return {
+            'event_types': event_types,
+            'users': users,
+            'entities': {key: share(count) for key, count in access_patterns.items()},
+            'entity_types': {etype: share(count) for etype, count in entity_type_counts.items()},
+            'cross_entity_score': min(len(entity_type_counts) / 10.0, 1.0)
         }
+    
+    def _extract_feature_matrix(
+        self,
+        events: List[Dict[str, Any]],
+        tables: Dict[str, Any]
+    ) -> np.ndarray:
+        """Build the (events x features) matrix column block by column block."""
+        n_events = len(events)
+        matrix = np.zeros((n_events, self._get_feature_dimension()), dtype=np.float64)
+        if n_events == 0:
+            return matrix
+        
+        # Rows extract_features would zero out because extraction raised
+        failed = np.zeros(n_events, dtype=bool)
+        
+        # 1. Event type frequency features
+        matrix[:, 0:2] = self._lookup(
+            [event.get('event_type', 'unknown') for event in events],
+            tables['event_types'],
+            (0.0, 1.0)
+        )
+        
+        # 2. Time-based features
+        matrix[:, 2:6] = self._extract_time_feature_block(events)
+        
+        # 3. User activity features
+        matrix[:, 6:9] = self._lookup(
+            [str(event['user_id']) if event.get('user_id') else None for event in events],
+            tables['users'],
+            (0.0, 0.0, 0.0)
+        )
+        
+        # 4. Entity access features
+        entity_types = [event.get('entity_type', 'unknown') for event in events]
+        entity_keys = [
+            f"{entity_type}:{event.get('entity_id')}" if event.get('entity_id') else entity_type
+            for entity_type, event in zip(entity_types, events)
+        ]
+        matrix[:, 9] = self._lookup(entity_keys, tables['entities'], 0.0)
+        matrix[:, 10] = self._lookup(entity_types, tables['entity_types'], 0.0)
+        matrix[:, 11] = tables['cross_entity_score']
         
-        # Extract features for each event
-        feature_vectors = []
-        for event in events:
-            features = await self.extract_features(event, historical_context)
-            feature_vectors.append(features)
+        # 5-6. Action complexity and performance features (nested JSON, per event)
+        for row, event in enumerate(events):
+            try:
+                matrix[row, 12:15] = self._extract_action_complexity_features(event)
+                matrix[row, 15:17] = self._extract_performance_features(event)
+            except Exception:
+                failed[row] = True
+        
+        # 7. Severity features
+        severities = pd.Series([event.get('severity', 'info') for event in events], dtype=object)
+        is_text = severities.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        failed |= ~is_text
+        matrix[is_text, 17] = (
+            severities[is_text].str.lower().map(SEVERITY_SCORES).fillna(0.0).to_numpy(dtype=np.float64)
+        )
+        
+        matrix[failed] = 0.0
+        return np.nan_to_num(matrix, nan=0.0, posinf=1.0, neginf=0.0)
+    
+    def _extract_time_feature_block(self, events: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Time features for a batch of events.
+        
+        ISO strings are parsed in one vectorized pass on their wall-clock
+        prefix, matching the local hour and weekday datetime.fromisoformat
+        yields; anything else goes through _extract_time_features.
+        
+        Returns:
+            Array of shape (len(events), 4)
+        """
+        block = np.zeros((len(events), 4), dtype=np.float64)
+        timestamps = pd.Series([event.get('timestamp') for event in events], dtype=object)
+        
+        is_text = timestamps.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        parsed = pd.Series(pd.NaT, index=timestamps.index, dtype='datetime64[ns]')
+        if is_text.any():
+            text = timestamps[is_text].astype(str)
+            wall_clock = text.str.slice(0, 19)
+            well_formed = text.str.slice(19).str.fullmatch(_ISO_TIMESTAMP_SUFFIX) & (wall_clock.str.len() == 19)
+            parsed[is_text] = pd.to_datetime(
+                wall_clock.where(well_formed), format='%Y-%m-%dT%H:%M:%S', errors='coerce'
+            )
+            # Space separators and other fromisoformat variants
+            parsed[is_text] = parsed[is_text].fillna(
+                pd.to_datetime(wall_clock.where(well_formed), format='%Y-%m-%d %H:%M:%S', errors='coerce')
+            )
         
-        return np.array(feature_vectors)
+        vectorized = parsed.notna().to_numpy()
+        if vectorized.any():
+            hours = parsed[vectorized].dt.hour.to_numpy()
+            weekdays = parsed[vectorized].dt.weekday.to_numpy()
+            block[vectorized] = np.column_stack([
+                hours / 23.0,
+                weekdays / 6.0,
+                (weekdays >= 5).astype(np.float64),
+                ((weekdays < 5) & (hours >= 9) & (hours < 17)).astype(np.float64)
+            ])
+        
+        for row in np.flatnonzero(~vectorized):
+            block[row] = self._extract_time_features(events[row])
+        
+        return block
+    
+    @staticmethod
+    def _lookup(keys: List[Any], table: Dict[Any, Any], default: Any) -> np.ndarray:
+        """Map keys to table values, resolving each distinct key only once."""
+        codes, uniques = pd.factorize(pd.Series(keys, dtype=object), use_na_sentinel=True)
+        values = np.array([table.get(key, default) for key in uniques] + [default], dtype=np.float64)
+        # Missing keys have code -1, which indexes the trailing default
+        return values[codes]
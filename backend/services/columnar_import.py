@@ -0,0 +1,568 @@
+"""
+Columnar Import Engine for Actuals and Commitments
+
+Validates and transforms import batches column by column instead of record by
+record. A batch is loaded into one object array per model field, and date
+parsing, decimal parsing, required-field and length checks run as pandas
+vector operations over those arrays. Only rows the vector checks cannot accept
+are re-validated through the Pydantic models, so error messages stay identical
+to the per-record path and every error keeps its original row number.
+
+Valid rows come out insert-ready (ISO date strings, float amounts), which is
+also what keeps results cheap to ship back from worker processes: chunks are
+independent, so large imports validate them in a process pool.
+
+Requirements: 2.3, 3.3, 4.1, 4.2
+"""
+
+import asyncio
+import logging
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from multiprocessing import get_context
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+from pydantic import BaseModel, ValidationError
+
+from models.imports import ActualCreate, CommitmentCreate, ImportError
+
+logger = logging.getLogger(__name__)
+
+# Process pool tuning
+PARALLEL_VALIDATION_MIN_RECORDS = 50000  # Below this, pool start-up costs more than it saves
+MAX_VALIDATION_WORKERS = 8
+MAX_INVALID_ROWS_PER_CHUNK = 51  # MAX_ERRORS_TO_COLLECT + 1; later rows only contribute counts
+
+# Mirrors the date formats accepted by ActualCreate/CommitmentCreate.parse_date, in order
+DATE_FORMATS = ['%Y-%m-%d', '%d.%m.%Y', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d']
+
+# Plain decimal literal after separator normalisation (no NaN/Infinity, which Pydantic rejects)
+_DECIMAL_PATTERN = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+_INT_PATTERN = r'\s*[+-]?[0-9]+\s*'
+
+# Commitment fields whose before-validator turns empty cells into a "-" placeholder
+PLACEHOLDER_FIELDS = {'commitment': ('po_number', 'project_nr')}
+
+RECORD_MODELS: Dict[str, Type[BaseModel]] = {
+    'actual': ActualCreate,
+    'commitment': CommitmentCreate,
+}
+
+_ABSENT = object()
+
+
+@dataclass
+class ColumnSpec:
+    """Vector validation rules for one model field."""
+    name: str
+    kind: str  # 'str', 'decimal', 'date' or 'int'
+    optional: bool
+    has_default: bool
+    default: Any = None
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    ge: Optional[int] = None
+    placeholder: bool = False
+
+
+@dataclass
+class ChunkValidationResult:
+    """
+    Validation outcome for one chunk of records.
+
+    Valid rows are stored column-wise: ``rows[i]`` is the original row number
+    of ``columns[name][i]``. ``invalid`` holds the Pydantic errors of the first
+    invalid rows only; ``error_count`` covers every invalid row in the chunk.
+    """
+    rows: List[int] = field(default_factory=list)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    invalid: List[Tuple[int, List[ImportError]]] = field(default_factory=list)
+    invalid_rows: int = 0
+    error_count: int = 0
+
+    def records(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (row number, insert-ready field dict) per valid row."""
+        names = list(self.columns)
+        for row_idx, values in zip(self.rows, zip(*self.columns.values())):
+            yield row_idx, dict(zip(names, values))
+
+
+def _field_kind(annotation: Any) -> Tuple[Optional[str], bool]:
+    """Map a model annotation to a column kind and whether it is Optional."""
+    args = typing.get_args(annotation)
+    optional = type(None) in args
+    if optional:
+        annotation = next(arg for arg in args if arg is not type(None))
+    kinds = {str: 'str', Decimal: 'decimal', date: 'date', int: 'int'}
+    return kinds.get(annotation), optional
+
+
+def build_column_specs(record_type: str) -> List[ColumnSpec]:
+    """
+    Derive column rules from the Pydantic model so both paths stay in sync.
+
+    Args:
+        record_type: 'actual' or 'commitment'
+
+    Returns:
+        One ColumnSpec per model field
+    """
+    model = RECORD_MODELS[record_type]
+    placeholders = PLACEHOLDER_FIELDS.get(record_type, ())
+    specs = []
+    for name, info in model.model_fields.items():
+        kind, optional = _field_kind(info.annotation)
+        if kind is None:
+            raise ValueError(f"Unsupported field type for columnar import: {name}")
+        spec = ColumnSpec(
+            name=name,
+            kind=kind,
+            optional=optional,
+            has_default=not info.is_required(),
+            default=None if info.is_required() else info.default,
+            placeholder=name in placeholders,
+        )
+        for constraint in info.metadata:
+            spec.min_length = getattr(constraint, 'min_length', spec.min_length)
+            spec.max_length = getattr(constraint, 'max_length', spec.max_length)
+            spec.ge = getattr(constraint, 'ge', spec.ge)
+        specs.append(spec)
+    return specs
+
+
+_COLUMN_SPECS: Dict[str, List[ColumnSpec]] = {}
+
+
+def get_column_specs(record_type: str) -> List[ColumnSpec]:
+    """Return the cached column rules for a record type."""
+    if record_type not in _COLUMN_SPECS:
+        _COLUMN_SPECS[record_type] = build_column_specs(record_type)
+    return _COLUMN_SPECS[record_type]
+
+
+def _cell_types(column: pd.Series) -> Tuple[pd.Series, pd.Series, Optional[pd.Series]]:
+    """
+    Classify the cells of an object column.
+
+    Returns:
+        Tuple of (None mask, str mask, per-cell types). Types are only
+        computed for mixed columns; all-string columns return None.
+    """
+    missing = pd.Series(column.to_numpy() == None, index=column.index)  # noqa: E711
+    if infer_dtype(column, skipna=True) in ('string', 'empty') and not (column.isna() & ~missing).any():
+        return missing, ~missing, None
+    types = column.map(type)
+    return missing, types.eq(str), types
+
+
+def _of_type(types: Optional[pd.Series], index: pd.Index, *classes: type) -> pd.Series:
+    if types is None:
+        return pd.Series(False, index=index)
+    return types.isin(classes)
+
+
+def _object_series(values: np.ndarray, index: pd.Index) -> pd.Series:
+    return pd.Series(values, index=index, dtype=object)
+
+
+def parse_decimal_column(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Vectorized equivalent of the models' ``parse_amount`` validator.
+
+    Amounts are returned as floats, the precision the insert path stores.
+
+    Args:
+        column: Object column of raw cell values
+
+    Returns:
+        Tuple of (amounts with None for empty cells, accepted mask)
+    """
+    missing, is_str, types = _cell_types(column)
+    is_number = _of_type(types, column.index, int, float)
+    is_decimal = _of_type(types, column.index, Decimal)
+
+    text = column.where(is_number | is_str, None).astype(object)
+    text[is_number] = column[is_number].map(str)
+    text[is_str] = column[is_str].str.strip().str.replace(' ', '', regex=False)
+    empty = is_str & text.eq('')
+
+    values = text[(is_number | is_str) & ~empty]
+    has_comma = values.str.contains(',', regex=False)
+    has_dot = values.str.contains('.', regex=False)
+    if has_comma.any():
+        european = has_comma & has_dot & (values.str.rfind(',') > values.str.rfind('.'))
+        values = values.where(
+            ~european,
+            values.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+        )
+        values = values.where(~(has_comma & has_dot & ~european), values.str.replace(',', '', regex=False))
+        values = values.where(~(has_comma & ~has_dot), values.str.replace(',', '.', regex=False))
+    numeric = values.str.fullmatch(_DECIMAL_PATTERN).astype(bool)
+
+    parsed = np.full(len(column), None, dtype=object)
+    parsed[is_decimal.to_numpy(dtype=bool)] = [float(v) for v in column[is_decimal]]
+    parsed[column.index.get_indexer(numeric[numeric].index)] = values[numeric].astype(float).tolist()
+    accepted = missing | is_decimal | empty
+    accepted[numeric[numeric].index] = True
+    return _object_series(parsed, column.index), accepted
+
+
+def parse_date_column(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Vectorized equivalent of the models' ``parse_date`` validator.
+
+    Formats are tried in the validator's order, each pass only touching
+    cells the previous formats could not parse. Dates are returned as ISO
+    strings.
+
+    Args:
+        column: Object column of raw cell values
+
+    Returns:
+        Tuple of (ISO dates with None for empty cells, accepted mask)
+    """
+    missing, is_str, types = _cell_types(column)
+    # datetime is a date subclass but needs Pydantic's handling, so match the exact type
+    is_date = _of_type(types, column.index, date)
+    parsed = np.full(len(column), None, dtype=object)
+    parsed[is_date.to_numpy(dtype=bool)] = [v.isoformat() for v in column[is_date]]
+    accepted = missing | is_date
+
+    text = column[is_str].str.strip()
+    empty = text.eq('')
+    accepted[empty[empty].index] = True
+    pending = text[~empty]
+    for fmt in DATE_FORMATS:
+        if pending.empty:
+            break
+        converted = pd.to_datetime(pending, format=fmt, errors='coerce')
+        hit = converted.notna()
+        if hit.any():
+            parsed[column.index.get_indexer(hit[hit].index)] = [v.date().isoformat() for v in converted[hit]]
+            accepted[hit[hit].index] = True
+        pending = pending[~hit]
+    # pandas cannot represent every year strptime accepts (e.g. 0024), so the
+    # few leftover cells get the per-record parse
+    for index, value in pending.items():
+        parsed_date = _strptime_date(value)
+        if parsed_date is not None:
+            parsed[column.index.get_loc(index)] = parsed_date.isoformat()
+            accepted[index] = True
+    return _object_series(parsed, column.index), accepted
+
+
+def _strptime_date(value: str) -> Optional[date]:
+    """Parse one date string with the first matching DATE_FORMATS entry."""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_int_column(column: pd.Series, ge: Optional[int] = None) -> Tuple[pd.Series, pd.Series]:
+    """
+    Parse integer cells (ints and digit strings) with an optional lower bound.
+
+    Args:
+        column: Object column of raw cell values
+        ge: Minimum accepted value
+
+    Returns:
+        Tuple of (parsed values, accepted mask)
+    """
+    missing, is_str, types = _cell_types(column)
+    is_int = _of_type(types, column.index, int)
+    is_digits = is_str & column.where(is_str, '').str.fullmatch(_INT_PATTERN).astype(bool)
+
+    # Fill an object array directly so pandas never upcasts the ints to float
+    parsed = column.where(is_int, None).to_numpy(dtype=object, copy=True)
+    parsed[is_digits.to_numpy(dtype=bool)] = [int(v) for v in column[is_digits]]
+    accepted = is_int | is_digits
+    if ge is not None and accepted.any():
+        too_small = accepted.to_numpy(dtype=bool) & np.array(
+            [v is not None and v < ge for v in parsed], dtype=bool
+        )
+        accepted[too_small] = False
+    return _object_series(parsed, column.index), accepted | missing
+
+
+def parse_str_column(column: pd.Series, spec: ColumnSpec) -> Tuple[pd.Series, pd.Series]:
+    """
+    Check string cells against the field's length limits.
+
+    Args:
+        column: Object column of raw cell values
+        spec: Column rules for the field
+
+    Returns:
+        Tuple of (values, accepted mask)
+    """
+    missing, is_str, _ = _cell_types(column)
+    values = column.where(is_str, None).astype(object)
+    if spec.placeholder:
+        values[is_str] = values[is_str].str.strip()
+        values[missing | values.eq('')] = '-'
+        is_str = is_str | missing
+        missing = pd.Series(False, index=column.index)
+
+    lengths = values.where(is_str, '').str.len()
+    accepted = is_str.copy()
+    if spec.min_length is not None:
+        accepted &= lengths >= spec.min_length
+    if spec.max_length is not None:
+        accepted &= lengths <= spec.max_length
+    return values, accepted | missing
+
+
+def _parse_column(column: pd.Series, spec: ColumnSpec) -> Tuple[pd.Series, pd.Series]:
+    if (column.to_numpy() == None).all() and not spec.placeholder:  # noqa: E711
+        # Every cell empty: nothing to parse
+        parsed, accepted = column, pd.Series(True, index=column.index)
+    elif spec.kind == 'decimal':
+        parsed, accepted = parse_decimal_column(column)
+    elif spec.kind == 'date':
+        parsed, accepted = parse_date_column(column)
+    elif spec.kind == 'int':
+        parsed, accepted = parse_int_column(column, spec.ge)
+    else:
+        parsed, accepted = parse_str_column(column, spec)
+
+    if not (spec.optional or spec.placeholder):
+        # Required or defaulted fields: empty cells need Pydantic to decide
+        # between "use the default" and "missing value"
+        accepted &= parsed.notna()
+    return parsed, accepted
+
+
+def to_insert_values(validated: BaseModel, record_type: str) -> Dict[str, Any]:
+    """
+    Convert a validated model into the insert-ready form the columnar path emits.
+
+    Args:
+        validated: ActualCreate or CommitmentCreate instance
+        record_type: 'actual' or 'commitment'
+
+    Returns:
+        Field dict with ISO date strings and float amounts
+    """
+    values = validated.model_dump()
+    for spec in get_column_specs(record_type):
+        value = values[spec.name]
+        if value is None:
+            continue
+        if spec.kind == 'date':
+            values[spec.name] = value.isoformat()
+        elif spec.kind == 'decimal':
+            values[spec.name] = float(value)
+    return values
+
+
+def validate_record(
+    row_idx: int,
+    record_data: Dict[str, Any],
+    record_type: str
+) -> Tuple[Optional[BaseModel], Optional[List[ImportError]]]:
+    """
+    Validate a single record with the Pydantic model.
+
+    Args:
+        row_idx: Original row number
+        record_data: Record data
+        record_type: 'actual' or 'commitment'
+
+    Returns:
+        Tuple of (validated_record, errors)
+    """
+    try:
+        return (RECORD_MODELS[record_type](**record_data), None)
+
+    except ValidationError as e:
+        errors = []
+        for error in e.errors():
+            field_name = ".".join(str(loc) for loc in error['loc'])
+            errors.append(ImportError(
+                row=row_idx,
+                field=field_name,
+                value=record_data.get(field_name),
+                error=error['msg']
+            ))
+        return (None, errors)
+
+    except Exception as e:
+        return (None, [ImportError(
+            row=row_idx,
+            field="unknown",
+            value=None,
+            error=f"Unexpected error: {str(e)}"
+        )])
+
+
+def validate_chunk(
+    record_type: str,
+    records: List[Dict[str, Any]],
+    first_row: int
+) -> ChunkValidationResult:
+    """
+    Validate and transform a chunk of records column by column.
+
+    Rows that pass every vector check are taken straight from the parsed
+    columns; all other rows go through ``validate_record``. Module level so
+    it can run in a worker process.
+
+    Args:
+        record_type: 'actual' or 'commitment'
+        records: Raw record dicts
+        first_row: Original row number of ``records[0]``
+
+    Returns:
+        ChunkValidationResult with insert-ready columns and errors keyed by original row
+    """
+    result = ChunkValidationResult()
+    if not records:
+        return result
+
+    index = pd.RangeIndex(len(records))
+    accepted = np.ones(len(records), dtype=bool)
+    present = set().union(*records)
+    parsed_columns: Dict[str, np.ndarray] = {}
+
+    for spec in get_column_specs(record_type):
+        if spec.name not in present:
+            # Column not in this file: every row gets the model default
+            if not spec.has_default:
+                accepted[:] = False
+            parsed_columns[spec.name] = np.full(len(records), spec.default, dtype=object)
+            continue
+
+        raw = np.array([record.get(spec.name, _ABSENT) for record in records], dtype=object)
+        absent = raw == _ABSENT
+        raw[absent] = None
+        parsed, column_ok = _parse_column(_object_series(raw, index), spec)
+        parsed = parsed.to_numpy(dtype=object, copy=True)
+        column_ok = column_ok.to_numpy(dtype=bool)
+        if absent.any():
+            # Absent keys take the model default (or fail as required), exactly as Pydantic would
+            if spec.has_default:
+                parsed[absent] = spec.default
+                column_ok = column_ok | absent
+            else:
+                column_ok = column_ok & ~absent
+        accepted &= column_ok
+        parsed_columns[spec.name] = parsed
+
+    result.rows = (np.flatnonzero(accepted) + first_row).tolist()
+    result.columns = {name: values[accepted].tolist() for name, values in parsed_columns.items()}
+
+    rejected = np.flatnonzero(~accepted)
+    if len(rejected):
+        # Vector checks are conservative: let Pydantic decide these rows
+        fallback: List[Tuple[int, Dict[str, Any]]] = []
+        for position in rejected.tolist():
+            row_idx = first_row + position
+            validated, errors = validate_record(row_idx, records[position], record_type)
+            if validated is not None:
+                fallback.append((row_idx, to_insert_values(validated, record_type)))
+                continue
+
+            result.invalid_rows += 1
+            result.error_count += len(errors) if errors else 1
+            if len(result.invalid) < MAX_INVALID_ROWS_PER_CHUNK:
+                result.invalid.append((row_idx, errors or []))
+
+        if fallback:
+            _merge_rows(result, fallback)
+
+    return result
+
+
+def _merge_rows(result: ChunkValidationResult, extra: List[Tuple[int, Dict[str, Any]]]) -> None:
+    """Merge individually validated rows into the columns, keeping row order."""
+    rows = result.rows + [row_idx for row_idx, _ in extra]
+    order = np.argsort(rows, kind='stable')
+    result.rows = [rows[i] for i in order]
+    for name, values in result.columns.items():
+        merged = values + [record[name] for _, record in extra]
+        result.columns[name] = [merged[i] for i in order]
+
+
+async def validate_records(
+    records: List[Dict[str, Any]],
+    record_type: str,
+    chunk_size: int,
+    max_workers: Optional[int] = None
+) -> List[ChunkValidationResult]:
+    """
+    Validate all records in chunks, in a process pool for large imports.
+
+    Chunk results are returned in input order. If the pool cannot be used
+    (e.g. no process support in the host), chunks validate inline.
+
+    Args:
+        records: Raw record dicts, row 1 first
+        record_type: 'actual' or 'commitment'
+        chunk_size: Records per chunk
+        max_workers: Worker process count; defaults to the CPU count
+
+    Returns:
+        One ChunkValidationResult per chunk
+    """
+    chunks = [
+        (records[start:start + chunk_size], start + 1)
+        for start in range(0, len(records), chunk_size)
+    ]
+    workers = min(max_workers or os.cpu_count() or 1, MAX_VALIDATION_WORKERS, len(chunks))
+
+    if len(records) >= PARALLEL_VALIDATION_MIN_RECORDS and workers > 1:
+        loop = asyncio.get_running_loop()
+        try:
+            # spawn: forking a server process with live threads and sockets is unsafe
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+                return list(await asyncio.gather(*[
+                    loop.run_in_executor(executor, validate_chunk, record_type, chunk, first_row)
+                    for chunk, first_row in chunks
+                ]))
+        except Exception as e:
+            logger.warning(f"Parallel validation unavailable ({e}), validating inline")
+
+    results = []
+    for chunk, first_row in chunks:
+        results.append(validate_chunk(record_type, chunk, first_row))
+        await asyncio.sleep(0)  # Keep the event loop responsive between chunks
+    return results
+
+
+def duplicate_mask(keys: List[Any], existing: Iterable[Any]) -> np.ndarray:
+    """
+    Flag keys that already exist or repeat an earlier key in the batch.
+
+    Args:
+        keys: Duplicate-check key per record, scalars or tuples
+        existing: Keys already present in the database
+
+    Returns:
+        Boolean array, True for records to skip as duplicates
+    """
+    if not keys:
+        return np.zeros(0, dtype=bool)
+    existing_keys = list(set(existing))
+    if isinstance(keys[0], tuple):
+        index = pd.MultiIndex.from_tuples(keys)
+        in_db = index.isin(existing_keys) if existing_keys else np.zeros(len(keys), dtype=bool)
+    else:
+        index = pd.Index(keys, dtype=object)
+        in_db = index.isin(existing_keys)
+    return np.asarray(in_db, dtype=bool) | index.duplicated(keep='first')
+
+
+def unique_keys(keys: List[Any]) -> List[Any]:
+    """Distinct keys in first-seen order, for duplicate lookups."""
+    return list(dict.fromkeys(keys))
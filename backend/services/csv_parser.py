@@ -46,6 +46,9 @@ class CSVParser:
     # Required columns that must be present in CSV
     REQUIRED_COLUMNS = ["name", "budget", "status"]
     
+    # Columns parsed as ISO 8601 dates
+    DATE_COLUMNS = ["start_date", "end_date"]
+    
     def parse_csv(
         self,
         file_content: bytes,
@@ -92,6 +95,9 @@ class CSVParser:
         # Validate required columns are present
         self._validate_columns(df)
         
+        # Parse date columns once, column-wise, instead of per row
+        df = self._parse_date_columns(df)
+        
         # Convert each row to ProjectCreate object
         projects = []
         for index, row in df.iterrows():
@@ -254,6 +260,33 @@ class CSVParser:
         
         return value
     
+    def _parse_date_columns(
+        self,
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Convert the date columns to date objects in one vectorized pass.
+        
+        Cells that do not parse are left as-is so the per-row
+        _parse_date reports them with their row number.
+        
+        Args:
+            df: Pandas DataFrame from CSV
+            
+        Returns:
+            DataFrame with parsed date cells
+        """
+        for col in df.columns:
+            if col.lower().strip() not in self.DATE_COLUMNS:
+                continue
+            try:
+                parsed = pd.to_datetime(df[col], format='ISO8601', errors='coerce')
+            except (ValueError, TypeError):
+                # e.g. mixed UTC offsets; leave the column to the per-row parser
+                continue
+            df[col] = df[col].astype(object).where(parsed.isna(), parsed.dt.date)
+        return df
+    
     def _parse_date(
         self,
         date_str: str
@@ -270,6 +303,9 @@ class CSVParser:
         Raises:
             CSVParseError: If date cannot be parsed
         """
+        if isinstance(date_str, date):
+            # Already parsed by _parse_date_columns
+            return date_str
         try:
             # Try to parse as ISO format
             parsed = pd.to_datetime(date_str, format='ISO8601')
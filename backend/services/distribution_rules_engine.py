@@ -1,12 +1,19 @@
 """
 Distribution Rules Engine for Cash Out Forecast
 Phase 2 & 3: Automated distribution settings and AI-powered rules
+
+Single budgets are distributed period by period; distribute_batch spreads
+many line items (commitments, PO lines) at once over a shared calendar with
+NumPy, producing an items x periods matrix that can be aggregated by project
+or cost code.
 """
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 from enum import Enum
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +35,7 @@ class Granularity(str, Enum):
     """Time period granularity"""
     WEEK = "week"
     MONTH = "month"
+    QUARTER = "quarter"
 
 
 class DistributionPeriod:
@@ -84,6 +92,102 @@ class DistributionResult:
         return result
 
 
+def _period_index(days: np.ndarray, granularity: Granularity) -> np.ndarray:
+    """Calendar period number of each day (weeks start on Monday)"""
+    if granularity == Granularity.WEEK:
+        # 1970-01-01 was a Thursday; shift by 3 days so weeks start on Monday
+        return (days.astype(np.int64) + 3) // 7
+    months = days.astype("datetime64[M]").astype(np.int64)
+    if granularity == Granularity.QUARTER:
+        return months // 3
+    return months
+
+
+def _period_start(index: np.ndarray, granularity: Granularity) -> np.ndarray:
+    """First day of each calendar period number"""
+    if granularity == Granularity.WEEK:
+        return (index * 7 - 3).astype("datetime64[D]")
+    if granularity == Granularity.QUARTER:
+        index = index * 3
+    return index.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def _logistic(x: np.ndarray) -> np.ndarray:
+    """Cumulative S-curve used by generate_s_curve_distribution"""
+    return 1 / (1 + np.exp(-10 * (x - 0.5)))
+
+
+class BatchDistributionResult:
+    """
+    Distribution of many line items over a shared period calendar.
+
+    Amounts are held as (item, period, amount) triplets so that aggregation
+    does not need the dense matrix; matrix builds it on demand.
+    """
+    def __init__(
+        self,
+        period_starts: np.ndarray,
+        item_count: int,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        values: np.ndarray,
+        errors: Dict[int, str]
+    ):
+        self.period_starts = period_starts  # datetime64[D] start of each calendar period
+        self.item_count = item_count
+        self.rows = rows
+        self.columns = columns
+        self.values = values
+        self.errors = errors  # item index -> reason the item has no distribution
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Dense (items x periods) amounts"""
+        dense = np.zeros((self.item_count, len(self.period_starts)))
+        dense[self.rows, self.columns] = self.values
+        return dense
+    
+    def totals(self) -> np.ndarray:
+        """Amount per period across all items"""
+        return np.bincount(self.columns, weights=self.values, minlength=len(self.period_starts))
+    
+    def aggregate(self, keys: Sequence[Any]) -> Tuple[List[Any], np.ndarray]:
+        """
+        Sum item distributions by key (e.g. project ID or cost code).
+        
+        Args:
+            keys: One key per item
+        
+        Returns:
+            (distinct keys, (keys x periods) amounts)
+        """
+        if len(keys) != self.item_count:
+            raise ValueError(f"Expected {self.item_count} keys, got {len(keys)}")
+        
+        labels, inverse = np.unique(np.asarray(keys, dtype=object).astype(str), return_inverse=True)
+        period_count = len(self.period_starts)
+        grouped = np.bincount(
+            inverse[self.rows] * period_count + self.columns,
+            weights=self.values,
+            minlength=len(labels) * period_count
+        )
+        return labels.tolist(), grouped.reshape(len(labels), period_count)
+    
+    def to_dict(self, keys: Optional[Sequence[Any]] = None) -> Dict:
+        """Convert to dictionary, aggregated by keys if given"""
+        if keys is None:
+            labels, amounts = ["total"], self.totals()[np.newaxis, :]
+        else:
+            labels, amounts = self.aggregate(keys)
+        return {
+            "periods": [str(start) for start in self.period_starts],
+            "series": {
+                str(label): np.round(row, 2).tolist() for label, row in zip(labels, amounts)
+            },
+            "errors": {str(index): error for index, error in self.errors.items()}
+        }
+
+
 class DistributionRulesEngine:
     """
     Distribution Rules Engine for automated budget distribution
@@ -108,6 +212,14 @@ class DistributionRulesEngine:
             
             if granularity == Granularity.WEEK:
                 period_end = min(current + timedelta(days=7), end_date)
+            elif granularity == Granularity.QUARTER:
+                # Calculate next quarter start
+                quarter_month = (current.month - 1) // 3 * 3 + 4
+                if quarter_month > 12:
+                    period_end = current.replace(year=current.year + 1, month=quarter_month - 12, day=1)
+                else:
+                    period_end = current.replace(month=quarter_month, day=1)
+                period_end = min(period_end, end_date)
             else:  # MONTH
                 # Calculate next month
                 if current.month == 12:
@@ -385,3 +497,171 @@ class DistributionRulesEngine:
                 profile=profile,
                 error=f"Unknown rule type: {rule_type}"
             )
+    
+    def distribute_batch(
+        self,
+        amounts: Sequence[float],
+        start_dates: Sequence[Any],
+        end_dates: Sequence[Any],
+        profiles: Sequence[Any],
+        granularity: Granularity,
+        custom_percentages: Optional[Sequence[Optional[Sequence[float]]]] = None,
+        current_spend: Optional[Sequence[float]] = None,
+        current_date: Optional[datetime] = None
+    ) -> BatchDistributionResult:
+        """
+        Distribute many line items at once over a shared period calendar
+        Portfolio cash-flow forecasting for commitments and PO lines
+        
+        Periods are calendar weeks (starting Monday), months or quarters, so
+        each item gets the same periods and percentages as calculate_periods
+        and the single-item methods for monthly and quarterly granularity;
+        weekly periods follow calendar weeks rather than the item start date.
+        Dates are taken at day resolution and end dates are exclusive.
+        
+        Args:
+            amounts: Budget per item
+            start_dates: Start per item (datetime, date, ISO string or datetime64)
+            end_dates: End per item (exclusive)
+            profiles: DistributionProfile per item (linear, custom or ai_generated)
+            granularity: Period granularity
+            custom_percentages: Percentages per period for custom profile items
+            current_spend: Spend to date per item; if given every item is
+                reprofiled as in apply_reprofiling
+            current_date: Reprofiling cut-off (defaults to now)
+        
+        Returns:
+            BatchDistributionResult; items that cannot be distributed are left
+            empty and listed in errors with the single-item error messages
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        starts = np.asarray(start_dates, dtype="datetime64[D]")
+        ends = np.asarray(end_dates, dtype="datetime64[D]")
+        profile_values = np.asarray([getattr(p, "value", p) for p in profiles], dtype=object)
+        item_count = len(amounts)
+        
+        if not len(starts) == len(ends) == len(profile_values) == item_count:
+            raise ValueError("amounts, start_dates, end_dates and profiles must have the same length")
+        
+        errors: Dict[int, str] = {}
+        valid = ends > starts
+        for index in np.flatnonzero(~valid):
+            errors[int(index)] = "No periods available"
+        
+        if not valid.any():
+            empty = np.zeros(0, dtype=np.int64)
+            return BatchDistributionResult(
+                np.zeros(0, dtype="datetime64[D]"), item_count, empty, empty, np.zeros(0), errors
+            )
+        
+        first = _period_index(starts, granularity)
+        last = _period_index(ends - np.timedelta64(1, "D"), granularity)
+        counts = np.where(valid, last - first + 1, 0)
+        base = first[valid].min()
+        period_starts = _period_start(np.arange(base, last[valid].max() + 1), granularity)
+        
+        # One entry per (item, period) the item spans
+        offsets = np.cumsum(counts) - counts
+        rows = np.repeat(np.arange(item_count), counts)
+        position = np.arange(len(rows)) - offsets[rows]
+        columns = first[rows] - base + position
+        n = counts[rows]
+        
+        if current_spend is not None:
+            weights, amounts = self._reprofile_weights(
+                amounts, np.asarray(current_spend, dtype=float), starts, period_starts,
+                rows, columns, position, current_date or datetime.now(), errors
+            )
+        else:
+            weights = np.zeros(len(rows))
+            is_linear = profile_values == DistributionProfile.LINEAR.value
+            is_s_curve = profile_values == DistributionProfile.AI_GENERATED.value
+            is_custom = profile_values == DistributionProfile.CUSTOM.value
+            
+            linear = is_linear[rows]
+            weights[linear] = 1.0 / n[linear]
+            
+            # Incremental S-curve, normalised by the cumulative value at the last period
+            s_curve = is_s_curve[rows]
+            span = np.maximum(n[s_curve] - 1, 1)
+            k = position[s_curve]
+            cumulative = _logistic(k / span)
+            previous = np.where(k > 0, _logistic((k - 1) / span), 0.0)
+            weights[s_curve] = (cumulative - previous) / _logistic((n[s_curve] > 1).astype(float))
+            
+            for index in np.flatnonzero(valid & is_custom):
+                error = self._fill_custom_weights(
+                    weights, offsets[index], counts[index],
+                    custom_percentages[index] if custom_percentages is not None else None
+                )
+                if error:
+                    errors[int(index)] = error
+            
+            for index in np.flatnonzero(valid & ~(is_linear | is_s_curve | is_custom)):
+                errors[int(index)] = f"Unknown profile: {profile_values[index]}"
+        
+        failed = np.zeros(item_count, dtype=bool)
+        failed[list(errors)] = True
+        keep = ~failed[rows]
+        
+        return BatchDistributionResult(
+            period_starts=period_starts,
+            item_count=item_count,
+            rows=rows[keep],
+            columns=columns[keep],
+            values=weights[keep] * amounts[rows[keep]],
+            errors=errors
+        )
+    
+    def _fill_custom_weights(
+        self,
+        weights: np.ndarray,
+        offset: int,
+        count: int,
+        percentages: Optional[Sequence[float]]
+    ) -> Optional[str]:
+        """Write one item's custom percentages as weights; returns an error message if invalid"""
+        if not percentages:
+            return "Custom distribution requires percentages"
+        if len(percentages) != count:
+            return f"Expected {count} percentages, got {len(percentages)}"
+        total_percentage = sum(percentages)
+        if abs(total_percentage - 100.0) > 0.01:
+            return f"Percentages must sum to 100%, got {total_percentage:.2f}%"
+        weights[offset:offset + count] = np.asarray(percentages, dtype=float) / 100.0
+        return None
+    
+    def _reprofile_weights(
+        self,
+        amounts: np.ndarray,
+        current_spend: np.ndarray,
+        starts: np.ndarray,
+        period_starts: np.ndarray,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        position: np.ndarray,
+        current_date: datetime,
+        errors: Dict[int, str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Spread each item's remaining budget linearly over its future periods
+        
+        Returns:
+            (weight per entry, remaining budget per item)
+        """
+        remaining = amounts - current_spend
+        
+        # A period's own start is the item start for its first period; compare
+        # with the full cut-off timestamp like apply_reprofiling, so a period
+        # starting at midnight today is already past once the day has begun
+        local_starts = np.where(position == 0, starts[rows], period_starts[columns])
+        future = local_starts.astype("datetime64[us]") >= np.datetime64(current_date, "us")
+        future_counts = np.bincount(rows[future], minlength=len(amounts))
+        
+        for index in np.flatnonzero(remaining <= 0):
+            errors.setdefault(int(index), "Budget fully consumed")
+        for index in np.flatnonzero(future_counts == 0):
+            errors.setdefault(int(index), "No remaining periods")
+        
+        weights = np.where(future, 1.0 / np.maximum(future_counts[rows], 1), 0.0)
+        return weights, remaining
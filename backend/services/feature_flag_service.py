@@ -1,12 +1,34 @@
 """
 Feature flag service for gradual rollout and user-based access control
+
+Flag checks are evaluated against a compiled in-memory snapshot of the
+feature_flags table: allowed users and roles are frozensets and percentage
+buckets are cached, so a check does no database or hashing work on the hot
+path. The snapshot is reloaded with a single query when its version changes
+(local writes, or an invalidation message on Redis pub/sub from another
+worker) or when it is older than the snapshot TTL.
 """
 
-from typing import Optional, List, Dict, Any
-from uuid import UUID
+import os
+import time
+import uuid
 import hashlib
+import logging
+import itertools
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, FrozenSet, Iterable
+from uuid import UUID
 from datetime import datetime
 
+# Try to import Redis for cross-worker invalidation
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 from models.feature_flags import (
     FeatureFlagCreate,
     FeatureFlagUpdate,
@@ -16,12 +38,208 @@ from models.feature_flags import (
     RolloutStrategy
 )
 
+logger = logging.getLogger(__name__)
+
+FLAG_SNAPSHOT_TTL_SECONDS = 30  # Backstop reload interval when invalidations are missed
+FLAG_INVALIDATION_CHANNEL = "feature_flags:invalidate"  # Redis pub/sub channel for flag writes
+PERCENTAGE_BUCKET_CACHE_SIZE = 65536  # Cached (user, feature) rollout buckets
+
+_monotonic = time.monotonic  # Snapshot clock, patched in tests
+
+
+@lru_cache(maxsize=PERCENTAGE_BUCKET_CACHE_SIZE)
+def _percentage_bucket(user_id: str, feature_name: str) -> int:
+    """Stable rollout bucket (0-99) of a user for a feature"""
+    # Combine user ID and feature name for consistent hashing
+    hash_input = f"{user_id}:{feature_name}"
+    hash_bytes = hashlib.sha256(hash_input.encode()).digest()
+    # Convert first 4 bytes to integer and mod by 100
+    hash_int = int.from_bytes(hash_bytes[:4], byteorder='big')
+    return hash_int % 100
+
+
+def _canonical_user_id(user_id: Any) -> Optional[str]:
+    """User ID in the form CompiledFeatureFlag stores allowed_user_ids in"""
+    if not user_id:
+        return None
+    try:
+        return str(UUID(str(user_id)))
+    except ValueError:
+        return str(user_id)
+
+
+class CompiledFeatureFlag:
+    """Feature flag row prepared for repeated evaluation"""
+    
+    __slots__ = ("name", "status", "rollout_strategy", "rollout_percentage", "user_ids", "roles", "metadata")
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.name: str = data["name"]
+        self.status = FeatureFlagStatus(data["status"])
+        self.rollout_strategy = RolloutStrategy(data["rollout_strategy"])
+        self.rollout_percentage: Optional[int] = data.get("rollout_percentage")
+        # Canonical UUID strings so membership does not depend on input casing
+        self.user_ids: FrozenSet[str] = frozenset(
+            str(UUID(str(uid))) for uid in data.get("allowed_user_ids") or []
+        )
+        self.roles: FrozenSet[str] = frozenset(data.get("allowed_roles") or [])
+        self.metadata: Optional[Dict[str, Any]] = data.get("metadata")
+    
+    def evaluate(
+        self,
+        user_id: Optional[str],
+        user_roles: FrozenSet[str]
+    ) -> FeatureFlagCheckResponse:
+        """
+        Evaluate the flag for one user.
+        
+        Args:
+            user_id: Canonical user ID string, or None
+            user_roles: The user's roles
+        
+        Returns:
+            Feature flag check response with enabled status and reason
+        """
+        feature_name = self.name
+        
+        if self.status == FeatureFlagStatus.DISABLED:
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=False,
+                reason="Feature is disabled",
+                metadata=self.metadata
+            )
+        
+        if self.status == FeatureFlagStatus.DEPRECATED:
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=False,
+                reason="Feature is deprecated",
+                metadata=self.metadata
+            )
+        
+        if self.rollout_strategy == RolloutStrategy.ALL_USERS:
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=True,
+                reason="Feature enabled for all users",
+                metadata=self.metadata
+            )
+        
+        if self.rollout_strategy == RolloutStrategy.USER_LIST:
+            if not user_id:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=False,
+                    reason="User ID required for user list strategy"
+                )
+            
+            if user_id in self.user_ids:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=True,
+                    reason="User in allowed list",
+                    metadata=self.metadata
+                )
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=False,
+                reason="User not in allowed list"
+            )
+        
+        if self.rollout_strategy == RolloutStrategy.ROLE_BASED:
+            if not user_roles:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=False,
+                    reason="User roles required for role-based strategy"
+                )
+            
+            if not self.roles:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=False,
+                    reason="No allowed roles configured"
+                )
+            
+            if not self.roles.isdisjoint(user_roles):
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=True,
+                    reason="User has allowed role",
+                    metadata=self.metadata
+                )
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=False,
+                reason="User does not have allowed role"
+            )
+        
+        if self.rollout_strategy == RolloutStrategy.PERCENTAGE:
+            if not user_id:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=False,
+                    reason="User ID required for percentage rollout"
+                )
+            
+            if self.rollout_percentage is None:
+                return FeatureFlagCheckResponse(
+                    feature_name=feature_name,
+                    is_enabled=False,
+                    reason="Rollout percentage not configured"
+                )
+            
+            # Use consistent hashing to determine if user is in rollout percentage
+            is_enabled = _percentage_bucket(user_id, feature_name) < self.rollout_percentage
+            
+            return FeatureFlagCheckResponse(
+                feature_name=feature_name,
+                is_enabled=is_enabled,
+                reason=f"User {'in' if is_enabled else 'not in'} {self.rollout_percentage}% rollout",
+                metadata=self.metadata
+            )
+        
+        # Default to disabled
+        return FeatureFlagCheckResponse(
+            feature_name=feature_name,
+            is_enabled=False,
+            reason="Unknown rollout strategy"
+        )
+
+
+@dataclass
+class FeatureFlagSnapshot:
+    """Compiled flags keyed by name, tagged with the version they were loaded at"""
+    flags: Dict[str, CompiledFeatureFlag]
+    version: int
+    loaded_at: float  # _monotonic() of the load
+
 
 class FeatureFlagService:
     """Service for managing feature flags and access control"""
     
-    def __init__(self, supabase_client):
+    def __init__(
+        self,
+        supabase_client,
+        snapshot_ttl: float = FLAG_SNAPSHOT_TTL_SECONDS,
+        redis_url: Optional[str] = None
+    ):
         self.supabase = supabase_client
+        self.snapshot_ttl = snapshot_ttl
+        
+        # Compiled snapshot, reloaded when _version moves past snapshot.version
+        self._snapshot: Optional[FeatureFlagSnapshot] = None
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._snapshot_lock = threading.Lock()
+        
+        # Redis pub/sub for invalidations from other workers
+        # (connected by start_invalidation_listener, not on construction)
+        self._instance_id = uuid.uuid4().hex
+        self._redis_url = redis_url if REDIS_AVAILABLE else None
+        self._redis = None
+        self._listener = None
     
     def create_feature_flag(
         self,
@@ -65,6 +283,7 @@ class FeatureFlagService:
         if not result.data:
             raise Exception("Failed to create feature flag")
         
+        self.invalidate_snapshot()
         return self._map_to_response(result.data[0])
     
     def update_feature_flag(
@@ -113,6 +332,7 @@ class FeatureFlagService:
         if not result.data:
             raise ValueError(f"Feature flag {flag_id} not found")
         
+        self.invalidate_snapshot()
         return self._map_to_response(result.data[0])
     
     def get_feature_flag(self, flag_id: UUID) -> Optional[FeatureFlagResponse]:
@@ -157,6 +377,8 @@ class FeatureFlagService:
             "id", str(flag_id)
         ).execute()
         
+        if result.data:
+            self.invalidate_snapshot()
         return bool(result.data)
     
     def check_feature_enabled(
@@ -168,7 +390,8 @@ class FeatureFlagService:
         """
         Check if a feature is enabled for a specific user.
         
-        This method implements the core feature flag logic:
+        This method implements the core feature flag logic against the
+        compiled snapshot (no database query unless the snapshot is stale):
         1. Check if feature flag exists
         2. Check if feature is globally disabled
         3. Apply rollout strategy (all users, percentage, user list, role-based)
@@ -181,8 +404,7 @@ class FeatureFlagService:
         Returns:
             Feature flag check response with enabled status and reason
         """
-        # Get feature flag
-        flag = self.get_feature_flag_by_name(feature_name)
+        flag = self._get_snapshot().flags.get(feature_name)
         
         # If flag doesn't exist, default to disabled
         if not flag:
@@ -192,119 +414,152 @@ class FeatureFlagService:
                 reason="Feature flag not found"
             )
         
-        # If flag is disabled, return false
-        if flag.status == FeatureFlagStatus.DISABLED:
-            return FeatureFlagCheckResponse(
-                feature_name=feature_name,
-                is_enabled=False,
-                reason="Feature is disabled",
-                metadata=flag.metadata
-            )
+        return flag.evaluate(
+            _canonical_user_id(user_id),
+            frozenset(user_roles or ())
+        )
+    
+    def evaluate_all_flags(
+        self,
+        user_id: Optional[UUID] = None,
+        user_roles: Optional[List[str]] = None
+    ) -> Dict[str, FeatureFlagCheckResponse]:
+        """
+        Evaluate every feature flag for a user in one pass.
         
-        # If flag is deprecated, return false
-        if flag.status == FeatureFlagStatus.DEPRECATED:
-            return FeatureFlagCheckResponse(
-                feature_name=feature_name,
-                is_enabled=False,
-                reason="Feature is deprecated",
-                metadata=flag.metadata
-            )
+        Uses the same rules and reasons as check_feature_enabled, with the
+        user's roles converted to a set once for all flags.
         
-        # Apply rollout strategy
-        if flag.rollout_strategy == RolloutStrategy.ALL_USERS:
-            return FeatureFlagCheckResponse(
-                feature_name=feature_name,
-                is_enabled=True,
-                reason="Feature enabled for all users",
-                metadata=flag.metadata
-            )
-        
-        if flag.rollout_strategy == RolloutStrategy.USER_LIST:
-            if not user_id:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="User ID required for user list strategy"
-                )
+        Args:
+            user_id: Optional user ID for user-specific checks
+            user_roles: Optional user roles for role-based checks
             
-            if flag.allowed_user_ids and user_id in flag.allowed_user_ids:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=True,
-                    reason="User in allowed list",
-                    metadata=flag.metadata
-                )
-            else:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="User not in allowed list"
-                )
+        Returns:
+            Dict of feature name to check response
+        """
+        snapshot = self._get_snapshot()
+        user_key = _canonical_user_id(user_id)
+        roles = frozenset(user_roles or ())
         
-        if flag.rollout_strategy == RolloutStrategy.ROLE_BASED:
-            if not user_roles:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="User roles required for role-based strategy"
-                )
-            
-            if flag.allowed_roles:
-                # Check if user has any of the allowed roles
-                has_allowed_role = any(role in flag.allowed_roles for role in user_roles)
-                if has_allowed_role:
-                    return FeatureFlagCheckResponse(
-                        feature_name=feature_name,
-                        is_enabled=True,
-                        reason="User has allowed role",
-                        metadata=flag.metadata
-                    )
-                else:
-                    return FeatureFlagCheckResponse(
-                        feature_name=feature_name,
-                        is_enabled=False,
-                        reason="User does not have allowed role"
-                    )
-            else:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="No allowed roles configured"
-                )
+        return {
+            name: flag.evaluate(user_key, roles)
+            for name, flag in snapshot.flags.items()
+        }
+    
+    def invalidate_snapshot(self, publish: bool = True) -> None:
+        """
+        Mark the compiled snapshot stale so the next check reloads it.
         
-        if flag.rollout_strategy == RolloutStrategy.PERCENTAGE:
-            if not user_id:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="User ID required for percentage rollout"
-                )
-            
-            if flag.rollout_percentage is None:
-                return FeatureFlagCheckResponse(
-                    feature_name=feature_name,
-                    is_enabled=False,
-                    reason="Rollout percentage not configured"
-                )
+        Args:
+            publish: Also notify other workers over Redis pub/sub
+        """
+        self._version = next(self._versions)
+        
+        if publish and self._redis is not None:
+            try:
+                self._redis.publish(FLAG_INVALIDATION_CHANNEL, self._instance_id)
+            except Exception as e:
+                logger.warning(f"Failed to publish feature flag invalidation: {e}")
+    
+    def start_invalidation_listener(self) -> None:
+        """
+        Subscribe to flag invalidations published by other workers.
+        
+        Blocks while connecting to Redis, so call it once at application
+        startup rather than on import. No-op without a Redis URL or when
+        the listener is already running.
+        """
+        if self._redis_url and self._listener is None:
+            self._start_invalidation_listener(self._redis_url)
+    
+    def close(self) -> None:
+        """Stop the invalidation listener"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._redis = None
+    
+    def _get_snapshot(self) -> FeatureFlagSnapshot:
+        """Return the compiled snapshot, reloading it if stale."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot):
+            return snapshot
+        
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot):
+                return snapshot
             
-            # Use consistent hashing to determine if user is in rollout percentage
-            user_hash = self._hash_user_for_percentage(str(user_id), feature_name)
-            is_enabled = user_hash < flag.rollout_percentage
+            # Capture the version first so a write during the load forces another reload
+            version = self._version
+            try:
+                result = self.supabase.table("feature_flags").select("*").execute()
+            except Exception as e:
+                if snapshot is None:
+                    raise
+                logger.error(f"Failed to reload feature flags, serving previous snapshot: {e}")
+                return snapshot
             
-            return FeatureFlagCheckResponse(
-                feature_name=feature_name,
-                is_enabled=is_enabled,
-                reason=f"User {'in' if is_enabled else 'not in'} {flag.rollout_percentage}% rollout",
-                metadata=flag.metadata
+            self._snapshot = FeatureFlagSnapshot(
+                flags=self._compile_flags(result.data or []),
+                version=version,
+                loaded_at=_monotonic()
             )
-        
-        # Default to disabled
-        return FeatureFlagCheckResponse(
-            feature_name=feature_name,
-            is_enabled=False,
-            reason="Unknown rollout strategy"
+            return self._snapshot
+    
+    def _is_fresh(self, snapshot: FeatureFlagSnapshot) -> bool:
+        return (
+            snapshot.version == self._version
+            and _monotonic() - snapshot.loaded_at < self.snapshot_ttl
         )
     
+    def _compile_flags(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, CompiledFeatureFlag]:
+        """Compile flag rows, skipping rows that cannot be evaluated."""
+        flags = {}
+        for row in rows:
+            try:
+                flags[row["name"]] = CompiledFeatureFlag(row)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.error(f"Skipping invalid feature flag {row.get('name')}: {e}")
+        return flags
+    
+    def _start_invalidation_listener(self, redis_url: str) -> None:
+        """Subscribe to flag invalidations published by other workers."""
+        try:
+            client = redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5
+            )
+            client.ping()
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{FLAG_INVALIDATION_CHANNEL: self._on_invalidation})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._on_listener_error
+            )
+            self._redis = client
+            logger.info("Feature flag invalidation listener started")
+        except Exception as e:
+            logger.warning(
+                f"Redis unavailable for feature flag invalidation: {e}. "
+                f"Flags refresh every {self.snapshot_ttl}s."
+            )
+    
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        if message.get("data") != self._instance_id:
+            self.invalidate_snapshot(publish=False)
+    
+    def _on_listener_error(self, error: Exception, pubsub, thread) -> None:
+        """Fall back to TTL refresh when the pub/sub connection fails."""
+        logger.warning(f"Feature flag invalidation listener stopped: {error}")
+        thread.stop()
+        pubsub.close()
+        self._listener = None
+        self._redis = None
+        self.invalidate_snapshot(publish=False)
+    
     def _hash_user_for_percentage(self, user_id: str, feature_name: str) -> int:
         """
         Generate a consistent hash for percentage-based rollout.
@@ -315,12 +570,7 @@ class FeatureFlagService:
         Returns:
             Integer between 0 and 99
         """
-        # Combine user ID and feature name for consistent hashing
-        hash_input = f"{user_id}:{feature_name}"
-        hash_bytes = hashlib.sha256(hash_input.encode()).digest()
-        # Convert first 4 bytes to integer and mod by 100
-        hash_int = int.from_bytes(hash_bytes[:4], byteorder='big')
-        return hash_int % 100
+        return _percentage_bucket(user_id, feature_name)
     
     def _map_to_response(self, data: Dict[str, Any]) -> FeatureFlagResponse:
         """Map database record to response model"""
@@ -338,3 +588,15 @@ class FeatureFlagService:
             updated_at=datetime.fromisoformat(data["updated_at"]),
             created_by=UUID(data["created_by"])
         )
+
+
+# Global service instance
+_service_instance: Optional[FeatureFlagService] = None
+
+
+def get_feature_flag_service(supabase_client) -> FeatureFlagService:
+    """Get or create the shared feature flag service (one snapshot per worker)"""
+    global _service_instance
+    if _service_instance is None:
+        _service_instance = FeatureFlagService(supabase_client, redis_url=os.getenv("REDIS_URL"))
+    return _service_instance
@@ -0,0 +1,169 @@
+"""
+Hierarchy Progress Rollup
+
+Recalculates parent progress for task and WBS hierarchies in a single
+bottom-up pass over rows already loaded into memory. The union of the
+starting parents and all of their ancestors is collected by walking parent
+links, ordered deepest first, and each node is recalculated exactly once
+from its children's (already updated) values, instead of re-querying and
+rewriting every ancestor once per changed child.
+
+Used by ScheduleManager for single and bulk task progress updates and by
+WBSManager for WBS element rollups. Hierarchies are read in pages so that
+schedules larger than the PostgREST row cap are loaded completely, and only
+the changed fields are written back, grouped into one update per distinct
+set of values, so concurrent edits to other columns are not overwritten.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+READ_BATCH_SIZE = 200  # IDs per .in_() filter, keeps request URLs short
+READ_PAGE_SIZE = 1000  # PostgREST default max rows per request
+
+RollupFields = Callable[[List[Dict[str, Any]]], Dict[str, Any]]
+
+
+def effort_weighted_progress(children: List[Dict[str, Any]]) -> float:
+    """
+    Progress of a parent task weighted by its children's planned effort.
+
+    Args:
+        children: Child rows with progress_percentage and planned_effort_hours
+
+    Returns:
+        Progress percentage (0-100) rounded to two decimals
+    """
+    if not children:
+        return 0.0
+
+    total_weighted_progress = 0.0
+    total_effort = 0.0
+
+    for child in children:
+        progress = child.get("progress_percentage") or 0
+        effort = child.get("planned_effort_hours", 1) or 1  # Default to 1 to avoid division by zero
+
+        total_weighted_progress += progress * effort
+        total_effort += effort
+
+    if total_effort == 0:
+        return 0.0
+
+    return round(total_weighted_progress / total_effort, 2)
+
+
+def average_progress(children: List[Dict[str, Any]]) -> float:
+    """Simple average of the children's progress (used for WBS elements)."""
+    if not children:
+        return 0.0
+    return sum(child.get("progress_percentage") or 0 for child in children) / len(children)
+
+
+def roll_up(
+    rows: Dict[str, Dict[str, Any]],
+    parent_ids: Iterable[str],
+    parent_key: str,
+    rollup_fields: RollupFields,
+    fixed_ids: Iterable[str] = ()
+) -> List[str]:
+    """
+    Recalculate parent_ids and all of their ancestors, deepest first, in place.
+
+    Args:
+        rows: Every row of the hierarchy keyed by ID, with children's values
+            already updated
+        parent_ids: Parents whose children changed
+        parent_key: Field holding a row's parent ID
+        rollup_fields: Maps a parent's children to the fields to set on it
+        fixed_ids: Rows that keep their own values (e.g. explicitly updated
+            parents) but still feed their ancestors
+
+    Returns:
+        IDs of the recalculated rows in the order they were updated
+    """
+    children: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows.values():
+        parent = row.get(parent_key)
+        if parent:
+            children[str(parent)].append(row)
+
+    # Distance from the root of every affected node, collecting the union of
+    # ancestors on the way; walks stop at nodes whose depth is already known
+    depths: Dict[str, int] = {}
+    for start in parent_ids:
+        path: List[str] = []
+        node: Optional[str] = str(start)
+        while node and node in rows and node not in depths:
+            if node in path:
+                logger.error(f"Circular {parent_key} reference at {node}, stopping rollup")
+                break
+            path.append(node)
+            parent = rows[node].get(parent_key)
+            node = str(parent) if parent else None
+
+        depth = depths[node] + 1 if node in depths else 0
+        for node in reversed(path):
+            depths[node] = depth
+            depth += 1
+
+    fixed = {str(node) for node in fixed_ids}
+    order = sorted(depths, key=depths.get, reverse=True)
+    for node in order:
+        if children[node] and node not in fixed:
+            rows[node].update(rollup_fields(children[node]))
+    return order
+
+
+def fetch_all(build_query: Callable[[], Any]) -> List[Dict[str, Any]]:
+    """
+    Read every row of a query, one READ_PAGE_SIZE page at a time.
+
+    Args:
+        build_query: Returns a fresh filtered select query for each page
+
+    Returns:
+        All matching rows, ordered by ID
+    """
+    rows: List[Dict[str, Any]] = []
+    offset = 0
+    while True:
+        result = build_query().order("id").range(offset, offset + READ_PAGE_SIZE - 1).execute()
+        page = result.data or []
+        rows.extend(page)
+        if len(page) < READ_PAGE_SIZE:
+            return rows
+        offset += READ_PAGE_SIZE
+
+
+def write_changes(db: Any, table: str, changes: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Write changed fields only, one update().in_() per distinct set of values.
+
+    Args:
+        db: Supabase client
+        table: Table to update
+        changes: Row ID to the fields to set on that row
+
+    Returns:
+        Dict of row ID to the row returned by the database
+    """
+    groups: Dict[Any, List[str]] = defaultdict(list)
+    for row_id, fields in changes.items():
+        groups[tuple(sorted(fields.items()))].append(row_id)
+
+    written: Dict[str, Dict[str, Any]] = {}
+    for fields, row_ids in groups.items():
+        for batch in iter_batches(row_ids, READ_BATCH_SIZE):
+            result = db.table(table).update(dict(fields)).in_("id", batch).execute()
+            written.update((str(row["id"]), row) for row in result.data or [])
+    return written
+
+
+def iter_batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -8,12 +8,14 @@ and conflict resolution.
 **Validates: Requirements 1.1, 1.2, 10.1**
 """
 
+import asyncio
+import codecs
 import csv
 import io
 import logging
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
 from uuid import UUID, uuid4
 
 from fastapi import UploadFile, HTTPException
@@ -35,7 +37,7 @@ from models.po_breakdown import (
     ImportBatchStatus,
     ImportBatchErrorDetail,
 )
-from services.po_breakdown_service import POBreakdownDatabaseService
+from services.po_breakdown_service import POBreakdownDatabaseService, MAX_HIERARCHY_DEPTH
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,6 +47,14 @@ logger = logging.getLogger(__name__)
 MAX_FILE_SIZE_MB = 50
 SUPPORTED_CSV_ENCODINGS = ['utf-8', 'utf-8-sig', 'latin-1', 'iso-8859-1']
 REQUIRED_FIELDS = ['name']  # Minimum required field for PO breakdown
+BULK_INSERT_CHUNK = 500  # Rows per multi-row upsert when materializing a hierarchy
+CONFLICT_LOOKUP_CHUNK = 500  # PostgREST/URL limit for IN filters
+CONFLICT_LOOKUP_PAGE_SIZE = 1000  # PostgREST default max rows per request
+MAX_STREAMING_FILE_SIZE_MB = 1024
+STREAM_READ_CHUNK_BYTES = 1024 * 1024  # Upload bytes read per chunk in streaming mode
+STREAM_BATCH_SIZE = 1000  # Rows per transform -> validate -> write batch
+STREAM_QUEUE_DEPTH = 2  # Parsed batches buffered ahead of the writer before parsing waits
+STREAM_RESULT_ISSUE_LIMIT = 1000  # Errors/warnings echoed in a streaming ImportResult (all are stored)
 
 
 class ImportProcessingService:
@@ -187,6 +197,9 @@ class ImportProcessingService:
         Returns:
             ImportResult with processing details
         """
+        if config.streaming:
+            return await self.process_streaming_import(file, project_id, config, user_id)
+        
         start_time = datetime.now()
         
         # Validate file
@@ -241,15 +254,27 @@ class ImportProcessingService:
             if use_hierarchy_construction:
                 # Use hierarchy construction workflow
                 try:
-                    created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_from_import(
-                        parsed_rows=parsed_rows,
-                        project_id=project_id,
-                        config=config,
-                        user_id=user_id,
-                        batch_id=batch_id,
-                        errors=errors,
-                        warnings=warnings
-                    )
+                    if config.bulk_insert:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_bulk(
+                            parsed_rows=parsed_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=errors,
+                            warnings=warnings,
+                            conflicts=conflicts
+                        )
+                    else:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_from_import(
+                            parsed_rows=parsed_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=errors,
+                            warnings=warnings
+                        )
                     
                     successful_records = len(created_breakdown_ids)
                     processed_records = total_records
@@ -477,6 +502,9 @@ class ImportProcessingService:
         Returns:
             ImportResult with processing details
         """
+        if config.streaming:
+            return await self.process_streaming_import(file, project_id, config, user_id)
+        
         try:
             import openpyxl
         except ImportError:
@@ -542,15 +570,27 @@ class ImportProcessingService:
             if use_hierarchy_construction:
                 # Use hierarchy construction workflow
                 try:
-                    created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_from_import(
-                        parsed_rows=parsed_rows,
-                        project_id=project_id,
-                        config=config,
-                        user_id=user_id,
-                        batch_id=batch_id,
-                        errors=errors,
-                        warnings=warnings
-                    )
+                    if config.bulk_insert:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_bulk(
+                            parsed_rows=parsed_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=errors,
+                            warnings=warnings,
+                            conflicts=conflicts
+                        )
+                    else:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_from_import(
+                            parsed_rows=parsed_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=errors,
+                            warnings=warnings
+                        )
                     
                     successful_records = len(created_breakdown_ids)
                     processed_records = total_records
@@ -742,157 +782,854 @@ class ImportProcessingService:
 
     
     # =========================================================================
-    # Import Batch Management
+    # Streaming Import Processing
     # =========================================================================
     
-    async def create_import_batch(
+    async def process_streaming_import(
         self,
+        file: UploadFile,
         project_id: UUID,
-        source: str,
-        user_id: UUID,
-        file_name: Optional[str] = None,
-        file_size_bytes: Optional[int] = None,
-        file_type: Optional[str] = None,
-        import_config: Optional[ImportConfig] = None
-    ) -> UUID:
+        config: ImportConfig,
+        user_id: UUID
+    ) -> ImportResult:
         """
-        Create a new import batch record for comprehensive tracking.
+        Process a CSV or Excel import without holding the file in memory.
         
-        **Validates: Requirements 1.6, 10.3, 10.4**
+        **Validates: Requirements 1.1, 1.2, 1.6, 10.1**
+        
+        The upload is read in chunks and parsed incrementally (Excel through
+        openpyxl's read-only row iterator). Parsed rows are queued in bounded
+        batches, so parsing waits whenever the writer falls behind, and each
+        batch is transformed, checked against existing records with one
+        set-based lookup and written with chunked upserts. Errors, warnings
+        and conflicts are stored per batch and progress is written to the
+        batch record, so ``get_import_status`` reports it while the import runs.
+        
+        Hierarchy imports are parsed the same way, but the hierarchy itself is
+        materialized once all rows are read since parents may follow their
+        children in the file.
         
         Args:
-            project_id: Project UUID
-            source: Source description (e.g., filename)
+            file: CSV or XLSX file to import
+            project_id: Target project UUID
+            config: Import configuration with column mappings
             user_id: User performing the import
-            file_name: Original filename
-            file_size_bytes: File size in bytes
-            file_type: File type (csv, xlsx, xls)
-            import_config: Import configuration for reference
             
         Returns:
-            UUID of the created batch
+            ImportResult with processing details. Errors and warnings are
+            truncated to STREAM_RESULT_ISSUE_LIMIT entries; all of them are
+            stored with the batch.
         """
-        batch_id = uuid4()
+        start_time = datetime.now()
         
-        try:
-            batch_data = {
-                'id': str(batch_id),
-                'project_id': str(project_id),
-                'source': source,
-                'file_name': file_name,
-                'file_size_bytes': file_size_bytes,
-                'file_type': file_type,
-                'status': ImportStatus.pending.value,
-                'status_message': 'Import batch created, awaiting processing',
-                'total_records': 0,
-                'processed_records': 0,
-                'successful_records': 0,
-                'failed_records': 0,
-                'skipped_records': 0,
-                'updated_records': 0,
-                'created_hierarchies': 0,
-                'max_hierarchy_depth': 0,
-                'error_count': 0,
-                'warning_count': 0,
-                'conflict_count': 0,
-                'errors': [],
-                'warnings': [],
-                'conflicts': [],
-                'import_config': import_config.model_dump() if import_config else {},
-                'can_rollback': True,
-                'created_breakdown_ids': [],
-                'imported_by': str(user_id),
-                'started_at': datetime.now().isoformat(),
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat()
-            }
-            
-            # Insert into database
-            result = self.supabase.table(self.import_batch_table).insert(batch_data).execute()
-            
-            if not result.data:
-                logger.warning(f"Failed to insert batch record, but continuing with batch_id {batch_id}")
-            else:
-                logger.info(f"Created import batch {batch_id} for project {project_id}")
-            
-            return batch_id
-            
-        except Exception as e:
-            logger.error(f"Failed to create import batch: {e}")
-            # Return batch_id anyway so import can proceed
-            return batch_id
-    
-    async def get_import_status(self, batch_id: UUID) -> ImportBatchStatus:
-        """
-        Get the comprehensive status of an import batch.
+        # Validate file
+        validation = await self._validate_streaming_upload(file)
+        if not validation['is_valid']:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File validation failed: {', '.join(validation['errors'])}"
+            )
         
-        **Validates: Requirements 1.6, 10.3, 10.4**
+        file_type = validation['file_info']['file_type']
+        if file_type != 'csv':
+            try:
+                import openpyxl  # noqa: F401
+            except ImportError:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Excel support not available. Install openpyxl package."
+                )
+        
+        # Create import batch
+        batch_id = await self.create_import_batch(
+            project_id=project_id,
+            source=f"{'CSV' if file_type == 'csv' else 'Excel'}: {file.filename}",
+            user_id=user_id,
+            file_name=file.filename,
+            file_size_bytes=validation['file_info'].get('file_size', 0),
+            file_type=file_type,
+            import_config=config
+        )
+        
+        progress: Dict[str, Any] = {
+            'file_size': validation['file_info'].get('file_size', 0),
+            'bytes_read': 0,
+            'total_records': 0,
+            'processed_records': 0,
+            'successful_records': 0,
+            'failed_records': 0,
+            'skipped_records': 0,
+            'error_count': 0,
+            'warning_count': 0,
+            'conflict_count': 0,
+            'errors_by_category': {},
+            'errors_by_severity': {},
+        }
+        errors: List[ImportError] = []
+        warnings: List[ImportWarning] = []
+        conflicts: List[ImportConflict] = []
+        parse_errors: List[ImportError] = []
+        created_breakdown_ids: List[UUID] = []
+        created_hierarchies = 0
+        max_hierarchy_depth = 0
+        
+        # Check if hierarchy construction is needed
+        use_hierarchy_construction = (
+            config.hierarchy_column is not None or 
+            config.parent_reference_column is not None
+        )
+        hierarchy_rows: List[Dict[str, Any]] = []
+        seen_codes = set()
+        
+        await self._update_batch_status(
+            batch_id=batch_id,
+            status=ImportStatus.processing,
+            status_message="Streaming import started"
+        )
         
-        Args:
-            batch_id: Import batch UUID
-            
-        Returns:
-            ImportBatchStatus with complete batch information
-        """
         try:
-            result = self.supabase.table(self.import_batch_table)\
-                .select('*')\
-                .eq('id', str(batch_id))\
-                .execute()
+            if file_type == 'csv':
+                rows = self._stream_csv_rows(file, config, parse_errors, progress)
+            else:
+                rows = self._stream_excel_rows(file, config, parse_errors)
             
-            if not result.data:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Import batch {batch_id} not found"
-                )
+            queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_DEPTH)
+            producer = asyncio.create_task(
+                self._produce_row_batches(rows, config, queue, parse_errors)
+            )
             
-            batch_data = result.data[0]
+            try:
+                while True:
+                    batch = await queue.get()
+                    if batch is None:
+                        break
+                    
+                    progress['total_records'] += len(batch)
+                    batch_errors = parse_errors[:]
+                    parse_errors.clear()
+                    batch_warnings: List[ImportWarning] = []
+                    batch_conflicts: List[ImportConflict] = []
+                    
+                    if use_hierarchy_construction:
+                        hierarchy_rows.extend(row_data for _, row_data in batch)
+                    else:
+                        created = await self._process_stream_batch(
+                            batch=batch,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            source=file.filename,
+                            seen_codes=seen_codes,
+                            errors=batch_errors,
+                            warnings=batch_warnings,
+                            conflicts=batch_conflicts,
+                            progress=progress
+                        )
+                        created_breakdown_ids.extend(created)
+                    
+                    await self._record_stream_issues(
+                        batch_id, config, progress,
+                        batch_errors, batch_warnings, batch_conflicts,
+                        errors, warnings, conflicts
+                    )
+                    await self._update_batch_status(
+                        batch_id=batch_id,
+                        status=ImportStatus.processing,
+                        status_message=self._stream_progress_message(progress),
+                        metrics=self._stream_progress_metrics(progress)
+                    )
+            finally:
+                if not producer.done():
+                    producer.cancel()
             
-            # Parse created_breakdown_ids from JSONB
-            created_ids = batch_data.get('created_breakdown_ids', [])
-            if isinstance(created_ids, str):
-                import json
-                created_ids = json.loads(created_ids)
-            created_ids = [UUID(id_str) for id_str in created_ids if id_str]
+            await producer
             
-            # Parse timestamps
-            started_at = None
-            if batch_data.get('started_at'):
-                started_at = datetime.fromisoformat(batch_data['started_at'].replace('Z', '+00:00'))
+            batch_errors = parse_errors[:]
+            batch_warnings = []
+            batch_conflicts = []
             
-            completed_at = None
-            if batch_data.get('completed_at'):
-                completed_at = datetime.fromisoformat(batch_data['completed_at'].replace('Z', '+00:00'))
+            if use_hierarchy_construction:
+                try:
+                    if config.bulk_insert:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_bulk(
+                            parsed_rows=hierarchy_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=batch_errors,
+                            warnings=batch_warnings,
+                            conflicts=batch_conflicts
+                        )
+                    else:
+                        created_breakdown_ids, created_hierarchies = await self.construct_hierarchy_from_import(
+                            parsed_rows=hierarchy_rows,
+                            project_id=project_id,
+                            config=config,
+                            user_id=user_id,
+                            batch_id=batch_id,
+                            errors=batch_errors,
+                            warnings=batch_warnings
+                        )
+                    progress['successful_records'] = len(created_breakdown_ids)
+                    progress['failed_records'] = progress['total_records'] - len(created_breakdown_ids)
+                except Exception as e:
+                    logger.error(f"Hierarchy construction failed: {e}")
+                    batch_errors.append(ImportError(
+                        row_number=1,
+                        field='general',
+                        error_type='hierarchy_construction_error',
+                        message=f"Failed to construct hierarchy: {str(e)}",
+                        raw_value=None
+                    ))
+                    progress['failed_records'] = progress['total_records']
+                progress['processed_records'] = progress['total_records']
+                
+                if created_breakdown_ids:
+                    max_hierarchy_depth = await self._get_max_hierarchy_depth(created_breakdown_ids)
+            elif created_breakdown_ids:
+                self.po_service.invalidate_tree_index(project_id)
+                await self.po_service.schedule_automatic_variance_recalculation(
+                    project_id=project_id,
+                    trigger_event='breakdown_created',
+                    event_data={'import_batch_id': str(batch_id), 'created_count': len(created_breakdown_ids)}
+                )
             
-            rolled_back_at = None
-            if batch_data.get('rolled_back_at'):
-                rolled_back_at = datetime.fromisoformat(batch_data['rolled_back_at'].replace('Z', '+00:00'))
+            await self._record_stream_issues(
+                batch_id, config, progress,
+                batch_errors, batch_warnings, batch_conflicts,
+                errors, warnings, conflicts
+            )
             
-            # Parse errors_by_category and errors_by_severity
-            errors_by_category = batch_data.get('errors_by_category', {})
-            if isinstance(errors_by_category, str):
-                import json
-                errors_by_category = json.loads(errors_by_category)
+            # Calculate processing time
+            processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             
-            errors_by_severity = batch_data.get('errors_by_severity', {})
-            if isinstance(errors_by_severity, str):
-                import json
-                errors_by_severity = json.loads(errors_by_severity)
+            # Determine final status
+            successful_records = progress['successful_records']
+            failed_records = progress['failed_records']
+            if failed_records == 0 and progress['error_count'] == 0:
+                status = ImportStatus.completed
+                status_message = f"Import completed successfully. {successful_records} records imported."
+            elif successful_records > 0:
+                status = ImportStatus.partially_completed
+                status_message = f"Import partially completed. {successful_records} succeeded, {failed_records} failed."
+            else:
+                status = ImportStatus.failed
+                status_message = f"Import failed. {failed_records} records failed to import."
             
-            return ImportBatchStatus(
-                id=UUID(batch_data['id']),
-                project_id=UUID(batch_data['project_id']),
-                source=batch_data['source'],
-                file_name=batch_data.get('file_name'),
-                file_size_bytes=batch_data.get('file_size_bytes'),
-                file_type=batch_data.get('file_type'),
-                status=ImportStatus(batch_data['status']),
-                status_message=batch_data.get('status_message'),
-                total_records=batch_data.get('total_records', 0),
-                processed_records=batch_data.get('processed_records', 0),
-                successful_records=batch_data.get('successful_records', 0),
-                failed_records=batch_data.get('failed_records', 0),
-                skipped_records=batch_data.get('skipped_records', 0),
+            await self._update_batch_status(
+                batch_id=batch_id,
+                status=status,
+                status_message=status_message,
+                metrics={
+                    **self._stream_progress_metrics(progress),
+                    'updated_records': 0,
+                    'created_hierarchies': created_hierarchies,
+                    'max_hierarchy_depth': max_hierarchy_depth,
+                    'processing_time_ms': processing_time_ms,
+                    'created_breakdown_ids': [str(id) for id in created_breakdown_ids]
+                }
+            )
+            
+            result = ImportResult(
+                batch_id=batch_id,
+                status=status,
+                status_message=status_message,
+                total_records=progress['total_records'],
+                processed_records=progress['processed_records'],
+                successful_records=successful_records,
+                failed_records=failed_records,
+                skipped_records=progress['skipped_records'],
+                updated_records=0,
+                conflicts=conflicts,
+                errors=errors,
+                warnings=warnings,
+                error_count=progress['error_count'],
+                warning_count=progress['warning_count'],
+                conflict_count=progress['conflict_count'],
+                errors_by_category=progress['errors_by_category'],
+                errors_by_severity=progress['errors_by_severity'],
+                processing_time_ms=processing_time_ms,
+                created_hierarchies=created_hierarchies,
+                max_hierarchy_depth=max_hierarchy_depth,
+                created_breakdown_ids=created_breakdown_ids,
+                can_rollback=True,
+                rollback_instructions=f"Use rollback_import_batch({batch_id}) to delete all {len(created_breakdown_ids)} created breakdowns."
+            )
+            
+            logger.info(
+                f"Streaming import completed: batch_id={batch_id}, "
+                f"status={status}, successful={successful_records}/{progress['total_records']}, "
+                f"errors={progress['error_count']}, warnings={progress['warning_count']}, "
+                f"conflicts={progress['conflict_count']}"
+            )
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Streaming import failed: {e}")
+            await self._update_batch_status(
+                batch_id=batch_id,
+                status=ImportStatus.failed,
+                status_message=f"Import failed with exception: {str(e)}",
+                metrics=self._stream_progress_metrics(progress)
+            )
+            raise HTTPException(
+                status_code=500,
+                detail=f"Import processing failed: {str(e)}"
+            )
+    
+    async def _validate_streaming_upload(self, file: UploadFile) -> Dict[str, Any]:
+        """
+        Validate an upload for streaming import without reading its contents.
+        
+        **Validates: Requirements 1.1, 10.1**
+        
+        Same result shape as ``validate_import_file``. The size comes from the
+        spooled upload file and is checked against MAX_STREAMING_FILE_SIZE_MB.
+        """
+        errors = []
+        warnings = []
+        
+        # Check file exists
+        if not file:
+            errors.append("No file provided")
+            return {
+                'is_valid': False,
+                'errors': errors,
+                'warnings': warnings,
+                'file_info': {}
+            }
+        
+        filename = file.filename or "unknown"
+        file_size = 0
+        
+        # Check file extension
+        file_ext = filename.lower().split('.')[-1] if '.' in filename else ''
+        if file_ext not in ['csv', 'xlsx']:
+            errors.append(f"Unsupported file format for streaming import: {file_ext}. Supported formats: CSV, XLSX")
+        
+        # Check file size
+        try:
+            file.file.seek(0, io.SEEK_END)
+            file_size = file.file.tell()
+            await file.seek(0)
+            
+            max_size_bytes = MAX_STREAMING_FILE_SIZE_MB * 1024 * 1024
+            if file_size > max_size_bytes:
+                errors.append(f"File size ({file_size / 1024 / 1024:.2f} MB) exceeds maximum allowed size ({MAX_STREAMING_FILE_SIZE_MB} MB)")
+            elif file_size == 0:
+                errors.append("File is empty")
+        except Exception as e:
+            errors.append(f"Failed to read file: {str(e)}")
+        
+        return {
+            'is_valid': len(errors) == 0,
+            'errors': errors,
+            'warnings': warnings,
+            'file_info': {
+                'filename': filename,
+                'file_size': file_size,
+                'file_type': file_ext
+            }
+        }
+    
+    async def _stream_csv_rows(
+        self,
+        file: UploadFile,
+        config: ImportConfig,
+        errors: List[ImportError],
+        progress: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (row number, mapped row) pairs while reading the upload in chunks.
+        
+        **Validates: Requirements 1.1, 1.2**
+        
+        Decoded text is cut into records at line ends outside quoted fields,
+        so quoted values may span lines and chunk boundaries. Header and skip
+        handling match ``_parse_csv_content``.
+        """
+        decoder = codecs.getincrementaldecoder(config.encoding)()
+        headers: Optional[List[str]] = None
+        rows_to_skip = max(config.skip_header_rows - 1, 0)
+        row_num = config.skip_header_rows
+        remainder = ''
+        record_lines: List[str] = []
+        in_quotes = False
+        
+        await file.seek(0)
+        while True:
+            chunk = await file.read(STREAM_READ_CHUNK_BYTES)
+            progress['bytes_read'] += len(chunk)
+            
+            lines = (remainder + decoder.decode(chunk, final=not chunk)).split('\n')
+            remainder = lines.pop() if chunk else ''
+            
+            complete_lines = []
+            for line in lines:
+                record_lines.append(line + '\n')
+                if line.count('"') % 2:
+                    in_quotes = not in_quotes
+                if not in_quotes:
+                    complete_lines.extend(record_lines)
+                    record_lines = []
+            
+            if not chunk:
+                # Unterminated quote at end of file; let the CSV reader handle it
+                complete_lines.extend(record_lines)
+            
+            for values in csv.reader(complete_lines, delimiter=config.delimiter):
+                if not values:
+                    continue
+                if headers is None:
+                    headers = values
+                    continue
+                if rows_to_skip:
+                    rows_to_skip -= 1
+                    continue
+                
+                row_num += 1
+                row = dict(zip(headers, values))
+                for header in headers[len(values):]:
+                    row[header] = None
+                
+                yield row_num, self._map_csv_row(row, row_num, config, errors)
+            
+            if not chunk:
+                break
+    
+    async def _stream_excel_rows(
+        self,
+        file: UploadFile,
+        config: ImportConfig,
+        errors: List[ImportError]
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield (sheet row number, mapped row) pairs from the first sheet using
+        openpyxl's read-only row iterator on the spooled upload, without
+        loading it into memory. Blank rows are skipped but keep their numbers.
+        
+        **Validates: Requirements 1.1, 1.2**
+        """
+        import openpyxl
+        
+        await file.seek(0)
+        workbook = openpyxl.load_workbook(file.file, read_only=True)
+        try:
+            # Use first sheet by default
+            sheet = workbook.active
+            header_row_idx = config.skip_header_rows
+            headers: List[str] = []
+            
+            for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                if row_idx == header_row_idx:
+                    headers = [str(cell) if cell is not None else '' for cell in row]
+                    continue
+                elif row_idx < header_row_idx:
+                    continue
+                
+                parsed_row = self._map_excel_row(row, headers, row_idx, config, errors)
+                if parsed_row is not None:
+                    yield row_idx, parsed_row
+        finally:
+            workbook.close()
+    
+    async def _produce_row_batches(
+        self,
+        rows: AsyncIterator[Tuple[int, Dict[str, Any]]],
+        config: ImportConfig,
+        queue: asyncio.Queue,
+        errors: List[ImportError]
+    ) -> None:
+        """
+        Feed (row number, row) pairs into the bounded queue in STREAM_BATCH_SIZE
+        batches, keeping the source row numbers from the readers.
+        
+        ``queue.put`` blocks while STREAM_QUEUE_DEPTH batches are waiting, which
+        pauses reading and parsing until the writer catches up. A ``None``
+        sentinel always ends the stream.
+        """
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        row_num = config.skip_header_rows
+        
+        try:
+            async for row_num, row_data in rows:
+                batch.append((row_num, row_data))
+                if len(batch) >= STREAM_BATCH_SIZE:
+                    await queue.put(batch)
+                    batch = []
+            
+            if batch:
+                await queue.put(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            errors.append(ImportError(
+                row_number=row_num + 1,
+                field='general',
+                error_type='parse_error',
+                message=f"Failed to parse file: {str(e)}",
+                raw_value=None
+            ))
+            logger.error(f"Streaming parse failed after row {row_num}: {e}")
+            if batch:
+                await queue.put(batch)
+        
+        await queue.put(None)
+    
+    async def _process_stream_batch(
+        self,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        project_id: UUID,
+        config: ImportConfig,
+        user_id: UUID,
+        batch_id: UUID,
+        source: Optional[str],
+        seen_codes: set,
+        errors: List[ImportError],
+        warnings: List[ImportWarning],
+        conflicts: List[ImportConflict],
+        progress: Dict[str, Any]
+    ) -> List[UUID]:
+        """
+        Transform, validate and write one batch of streamed rows.
+        
+        **Validates: Requirements 1.2, 1.4, 10.1, 10.2**
+        
+        Conflict handling follows the row-by-row CSV path: conflicts are
+        skipped or flagged per ``config.conflict_resolution``, and a code that
+        already exists in the project or earlier in the file fails the row.
+        
+        Returns:
+            IDs of the breakdowns created from this batch
+        """
+        candidates: List[Tuple[int, Dict[str, Any], POBreakdownCreate]] = []
+        for row_num, row_data in batch:
+            progress['processed_records'] += 1
+            breakdown_data = self._transform_row_to_breakdown(
+                row_data=row_data,
+                config=config,
+                row_number=row_num,
+                errors=errors,
+                warnings=warnings
+            )
+            if breakdown_data:
+                candidates.append((row_num, row_data, breakdown_data))
+        
+        # One set-based lookup for the whole batch
+        existing_by_code, existing_by_sap_ref = self._find_existing_breakdowns(
+            project_id=project_id,
+            codes={data.code for _, _, data in candidates if data.code},
+            sap_po_numbers={
+                data.sap_po_number for _, _, data in candidates
+                if data.sap_po_number and data.sap_line_item
+            }
+        )
+        
+        nodes: List[Dict[str, Any]] = []
+        for row_num, row_data, breakdown_data in candidates:
+            conflict = self._match_existing_conflict(
+                breakdown_data=breakdown_data,
+                existing_by_code=existing_by_code,
+                existing_by_sap_ref=existing_by_sap_ref,
+                row_number=row_num
+            )
+            
+            if conflict:
+                conflicts.append(conflict)
+                
+                # Apply conflict resolution strategy
+                if config.conflict_resolution == ConflictResolution.skip:
+                    warnings.append(ImportWarning(
+                        row_number=row_num,
+                        field=conflict.field_conflicts[0] if conflict.field_conflicts else 'general',
+                        warning_type='conflict_skipped',
+                        message=f"Skipped due to conflict: {conflict.conflict_type.value}"
+                    ))
+                    continue
+                elif config.conflict_resolution == ConflictResolution.update:
+                    warnings.append(ImportWarning(
+                        row_number=row_num,
+                        field='general',
+                        warning_type='conflict_updated',
+                        message=f"Updated existing record {conflict.existing_record['id']}"
+                    ))
+            
+            if breakdown_data.code and (
+                breakdown_data.code in seen_codes or breakdown_data.code in existing_by_code
+            ):
+                progress['failed_records'] += 1
+                errors.append(ImportError(
+                    row_number=row_num,
+                    field='general',
+                    error_type='processing_error',
+                    message=f"Failed to process row: Code '{breakdown_data.code}' already exists in project",
+                    raw_value=str(row_data)
+                ))
+                continue
+            
+            if breakdown_data.code:
+                seen_codes.add(breakdown_data.code)
+            
+            nodes.append({
+                'id': uuid4(),
+                'row_number': row_num,
+                'row_data': row_data,
+                'breakdown_data': breakdown_data,
+                'hierarchy_level': 0,
+                'parent_id': None,
+                'auto_created': False,
+                'source': source,
+                'error_type': 'processing_error',
+            })
+        
+        insert_rows = self._build_bulk_insert_rows(
+            nodes=nodes,
+            project_id=project_id,
+            user_id=user_id,
+            batch_id=batch_id
+        )
+        inserted_nodes = await self._upsert_planned_rows(
+            nodes=nodes,
+            insert_rows=insert_rows,
+            user_id=user_id,
+            batch_id=batch_id,
+            errors=errors,
+            warnings=warnings
+        )
+        
+        progress['successful_records'] += len(inserted_nodes)
+        progress['failed_records'] += len(nodes) - len(inserted_nodes)
+        
+        return [node['id'] for node in inserted_nodes]
+    
+    async def _record_stream_issues(
+        self,
+        batch_id: UUID,
+        config: ImportConfig,
+        progress: Dict[str, Any],
+        batch_errors: List[ImportError],
+        batch_warnings: List[ImportWarning],
+        batch_conflicts: List[ImportConflict],
+        errors: List[ImportError],
+        warnings: List[ImportWarning],
+        conflicts: List[ImportConflict]
+    ) -> None:
+        """
+        Store one batch's errors, warnings and conflicts and fold them into the
+        running counts, keeping at most STREAM_RESULT_ISSUE_LIMIT of each in memory.
+        """
+        await self._store_batch_errors(batch_id, batch_errors)
+        await self._store_batch_warnings(batch_id, batch_warnings)
+        await self._store_batch_conflicts(batch_id, batch_conflicts)
+        
+        for error in batch_errors:
+            category = error.category.value
+            severity = error.severity.value
+            progress['errors_by_category'][category] = progress['errors_by_category'].get(category, 0) + 1
+            progress['errors_by_severity'][severity] = progress['errors_by_severity'].get(severity, 0) + 1
+        
+        progress['error_count'] += len(batch_errors)
+        progress['warning_count'] += len(batch_warnings)
+        progress['conflict_count'] += len(batch_conflicts)
+        if config.conflict_resolution == ConflictResolution.skip:
+            progress['skipped_records'] += len(batch_conflicts)
+        
+        errors.extend(batch_errors[:STREAM_RESULT_ISSUE_LIMIT - len(errors)])
+        warnings.extend(batch_warnings[:STREAM_RESULT_ISSUE_LIMIT - len(warnings)])
+        conflicts.extend(batch_conflicts[:STREAM_RESULT_ISSUE_LIMIT - len(conflicts)])
+    
+    def _stream_progress_metrics(self, progress: Dict[str, Any]) -> Dict[str, Any]:
+        """Batch record columns for the current streaming progress."""
+        return {
+            key: value for key, value in progress.items()
+            if key not in ('file_size', 'bytes_read')
+        }
+    
+    def _stream_progress_message(self, progress: Dict[str, Any]) -> str:
+        """Human-readable streaming progress for the batch status message."""
+        message = (
+            f"Streaming import in progress. {progress['total_records']} records read, "
+            f"{progress['processed_records']} processed"
+        )
+        if progress['bytes_read'] and progress['file_size']:
+            percent = min(100, int(progress['bytes_read'] * 100 / progress['file_size']))
+            message += f" ({percent}% of file read)"
+        return message + "."
+    
+    async def _get_max_hierarchy_depth(self, breakdown_ids: List[UUID]) -> int:
+        """Deepest hierarchy level among the given breakdowns."""
+        max_hierarchy_depth = 0
+        try:
+            for i in range(0, len(breakdown_ids), CONFLICT_LOOKUP_CHUNK):
+                result_query = self.supabase.table('po_breakdowns')\
+                    .select('hierarchy_level')\
+                    .in_('id', [str(id) for id in breakdown_ids[i:i + CONFLICT_LOOKUP_CHUNK]])\
+                    .execute()
+                if result_query.data:
+                    max_hierarchy_depth = max(
+                        max_hierarchy_depth,
+                        max(row.get('hierarchy_level', 0) for row in result_query.data)
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to calculate max hierarchy depth: {e}")
+        return max_hierarchy_depth
+
+    
+    # =========================================================================
+    # Import Batch Management
+    # =========================================================================
+    
+    async def create_import_batch(
+        self,
+        project_id: UUID,
+        source: str,
+        user_id: UUID,
+        file_name: Optional[str] = None,
+        file_size_bytes: Optional[int] = None,
+        file_type: Optional[str] = None,
+        import_config: Optional[ImportConfig] = None
+    ) -> UUID:
+        """
+        Create a new import batch record for comprehensive tracking.
+        
+        **Validates: Requirements 1.6, 10.3, 10.4**
+        
+        Args:
+            project_id: Project UUID
+            source: Source description (e.g., filename)
+            user_id: User performing the import
+            file_name: Original filename
+            file_size_bytes: File size in bytes
+            file_type: File type (csv, xlsx, xls)
+            import_config: Import configuration for reference
+            
+        Returns:
+            UUID of the created batch
+        """
+        batch_id = uuid4()
+        
+        try:
+            batch_data = {
+                'id': str(batch_id),
+                'project_id': str(project_id),
+                'source': source,
+                'file_name': file_name,
+                'file_size_bytes': file_size_bytes,
+                'file_type': file_type,
+                'status': ImportStatus.pending.value,
+                'status_message': 'Import batch created, awaiting processing',
+                'total_records': 0,
+                'processed_records': 0,
+                'successful_records': 0,
+                'failed_records': 0,
+                'skipped_records': 0,
+                'updated_records': 0,
+                'created_hierarchies': 0,
+                'max_hierarchy_depth': 0,
+                'error_count': 0,
+                'warning_count': 0,
+                'conflict_count': 0,
+                'errors': [],
+                'warnings': [],
+                'conflicts': [],
+                'import_config': import_config.model_dump() if import_config else {},
+                'can_rollback': True,
+                'created_breakdown_ids': [],
+                'imported_by': str(user_id),
+                'started_at': datetime.now().isoformat(),
+                'created_at': datetime.now().isoformat(),
+                'updated_at': datetime.now().isoformat()
+            }
+            
+            # Insert into database
+            result = self.supabase.table(self.import_batch_table).insert(batch_data).execute()
+            
+            if not result.data:
+                logger.warning(f"Failed to insert batch record, but continuing with batch_id {batch_id}")
+            else:
+                logger.info(f"Created import batch {batch_id} for project {project_id}")
+            
+            return batch_id
+            
+        except Exception as e:
+            logger.error(f"Failed to create import batch: {e}")
+            # Return batch_id anyway so import can proceed
+            return batch_id
+    
+    async def get_import_status(self, batch_id: UUID) -> ImportBatchStatus:
+        """
+        Get the comprehensive status of an import batch.
+        
+        **Validates: Requirements 1.6, 10.3, 10.4**
+        
+        Args:
+            batch_id: Import batch UUID
+            
+        Returns:
+            ImportBatchStatus with complete batch information
+        """
+        try:
+            result = self.supabase.table(self.import_batch_table)\
+                .select('*')\
+                .eq('id', str(batch_id))\
+                .execute()
+            
+            if not result.data:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Import batch {batch_id} not found"
+                )
+            
+            batch_data = result.data[0]
+            
+            # Parse created_breakdown_ids from JSONB
+            created_ids = batch_data.get('created_breakdown_ids', [])
+            if isinstance(created_ids, str):
+                import json
+                created_ids = json.loads(created_ids)
+            created_ids = [UUID(id_str) for id_str in created_ids if id_str]
+            
+            # Parse timestamps
+            started_at = None
+            if batch_data.get('started_at'):
+                started_at = datetime.fromisoformat(batch_data['started_at'].replace('Z', '+00:00'))
+            
+            completed_at = None
+            if batch_data.get('completed_at'):
+                completed_at = datetime.fromisoformat(batch_data['completed_at'].replace('Z', '+00:00'))
+            
+            rolled_back_at = None
+            if batch_data.get('rolled_back_at'):
+                rolled_back_at = datetime.fromisoformat(batch_data['rolled_back_at'].replace('Z', '+00:00'))
+            
+            # Parse errors_by_category and errors_by_severity
+            errors_by_category = batch_data.get('errors_by_category', {})
+            if isinstance(errors_by_category, str):
+                import json
+                errors_by_category = json.loads(errors_by_category)
+            
+            errors_by_severity = batch_data.get('errors_by_severity', {})
+            if isinstance(errors_by_severity, str):
+                import json
+                errors_by_severity = json.loads(errors_by_severity)
+            
+            return ImportBatchStatus(
+                id=UUID(batch_data['id']),
+                project_id=UUID(batch_data['project_id']),
+                source=batch_data['source'],
+                file_name=batch_data.get('file_name'),
+                file_size_bytes=batch_data.get('file_size_bytes'),
+                file_type=batch_data.get('file_type'),
+                status=ImportStatus(batch_data['status']),
+                status_message=batch_data.get('status_message'),
+                total_records=batch_data.get('total_records', 0),
+                processed_records=batch_data.get('processed_records', 0),
+                successful_records=batch_data.get('successful_records', 0),
+                failed_records=batch_data.get('failed_records', 0),
+                skipped_records=batch_data.get('skipped_records', 0),
                 updated_records=batch_data.get('updated_records', 0),
                 created_hierarchies=batch_data.get('created_hierarchies', 0),
                 max_hierarchy_depth=batch_data.get('max_hierarchy_depth', 0),
@@ -1260,34 +1997,7 @@ class ImportProcessingService:
             
             # Parse each row
             for row_num, row in enumerate(csv_reader, start=config.skip_header_rows + 1):
-                parsed_row = {}
-                
-                # Apply column mappings
-                for target_field, csv_column in config.column_mappings.items():
-                    if csv_column in row:
-                        parsed_row[target_field] = row[csv_column]
-                    else:
-                        # Column not found in CSV
-                        if target_field in REQUIRED_FIELDS:
-                            errors.append(ImportError(
-                                row_number=row_num,
-                                field=target_field,
-                                error_type='missing_column',
-                                message=f"Required column '{csv_column}' not found in CSV",
-                                raw_value=None
-                            ))
-                
-                # Store unmapped columns as custom fields
-                custom_fields = {}
-                mapped_columns = set(config.column_mappings.values())
-                for csv_col, value in row.items():
-                    if csv_col not in mapped_columns and value and value.strip():
-                        custom_fields[csv_col] = value.strip()
-                
-                if custom_fields:
-                    parsed_row['custom_fields'] = custom_fields
-                
-                parsed_rows.append(parsed_row)
+                parsed_rows.append(self._map_csv_row(row, row_num, config, errors))
             
         except Exception as e:
             errors.append(ImportError(
@@ -1327,41 +2037,9 @@ class ImportProcessingService:
                 elif row_idx < header_row_idx:
                     continue
                 
-                # Parse data rows
-                parsed_row = {}
-                
-                # Apply column mappings
-                for target_field, csv_column in config.column_mappings.items():
-                    try:
-                        col_idx = headers.index(csv_column)
-                        if col_idx < len(row):
-                            cell_value = row[col_idx]
-                            parsed_row[target_field] = str(cell_value) if cell_value is not None else ''
-                    except ValueError:
-                        # Column not found
-                        if target_field in REQUIRED_FIELDS:
-                            errors.append(ImportError(
-                                row_number=row_idx,
-                                field=target_field,
-                                error_type='missing_column',
-                                message=f"Required column '{csv_column}' not found in Excel",
-                                raw_value=None
-                            ))
-                
-                # Store unmapped columns as custom fields
-                custom_fields = {}
-                mapped_columns = set(config.column_mappings.values())
-                for col_idx, header in enumerate(headers):
-                    if header not in mapped_columns and col_idx < len(row):
-                        cell_value = row[col_idx]
-                        if cell_value is not None and str(cell_value).strip():
-                            custom_fields[header] = str(cell_value).strip()
-                
-                if custom_fields:
-                    parsed_row['custom_fields'] = custom_fields
-                
-                # Only add non-empty rows
-                if any(v for v in parsed_row.values() if v):
+                # Parse data rows, only adding non-empty ones
+                parsed_row = self._map_excel_row(row, headers, row_idx, config, errors)
+                if parsed_row is not None:
                     parsed_rows.append(parsed_row)
             
         except Exception as e:
@@ -1374,8 +2052,90 @@ class ImportProcessingService:
             ))
             logger.error(f"Excel parsing failed: {e}")
         
-        return parsed_rows
-
+        return parsed_rows
+
+    
+    def _map_csv_row(
+        self,
+        row: Dict[str, Any],
+        row_num: int,
+        config: ImportConfig,
+        errors: List[ImportError]
+    ) -> Dict[str, Any]:
+        """Apply column mappings to one CSV record keyed by header."""
+        parsed_row = {}
+        
+        # Apply column mappings
+        for target_field, csv_column in config.column_mappings.items():
+            if csv_column in row:
+                parsed_row[target_field] = row[csv_column]
+            else:
+                # Column not found in CSV
+                if target_field in REQUIRED_FIELDS:
+                    errors.append(ImportError(
+                        row_number=row_num,
+                        field=target_field,
+                        error_type='missing_column',
+                        message=f"Required column '{csv_column}' not found in CSV",
+                        raw_value=None
+                    ))
+        
+        # Store unmapped columns as custom fields
+        custom_fields = {}
+        mapped_columns = set(config.column_mappings.values())
+        for csv_col, value in row.items():
+            if csv_col not in mapped_columns and value and value.strip():
+                custom_fields[csv_col] = value.strip()
+        
+        if custom_fields:
+            parsed_row['custom_fields'] = custom_fields
+        
+        return parsed_row
+    
+    def _map_excel_row(
+        self,
+        row: Tuple[Any, ...],
+        headers: List[str],
+        row_idx: int,
+        config: ImportConfig,
+        errors: List[ImportError]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply column mappings to one Excel row; returns None for empty rows."""
+        parsed_row = {}
+        
+        # Apply column mappings
+        for target_field, csv_column in config.column_mappings.items():
+            try:
+                col_idx = headers.index(csv_column)
+                if col_idx < len(row):
+                    cell_value = row[col_idx]
+                    parsed_row[target_field] = str(cell_value) if cell_value is not None else ''
+            except ValueError:
+                # Column not found
+                if target_field in REQUIRED_FIELDS:
+                    errors.append(ImportError(
+                        row_number=row_idx,
+                        field=target_field,
+                        error_type='missing_column',
+                        message=f"Required column '{csv_column}' not found in Excel",
+                        raw_value=None
+                    ))
+        
+        # Store unmapped columns as custom fields
+        custom_fields = {}
+        mapped_columns = set(config.column_mappings.values())
+        for col_idx, header in enumerate(headers):
+            if header not in mapped_columns and col_idx < len(row):
+                cell_value = row[col_idx]
+                if cell_value is not None and str(cell_value).strip():
+                    custom_fields[header] = str(cell_value).strip()
+        
+        if custom_fields:
+            parsed_row['custom_fields'] = custom_fields
+        
+        if not any(v for v in parsed_row.values() if v):
+            return None
+        return parsed_row
     
     def _transform_row_to_breakdown(
         self,
@@ -1833,6 +2593,608 @@ class ImportProcessingService:
         
         return created_breakdown_ids, hierarchy_count
     
+    async def construct_hierarchy_bulk(
+        self,
+        parsed_rows: List[Dict[str, Any]],
+        project_id: UUID,
+        config: ImportConfig,
+        user_id: UUID,
+        batch_id: UUID,
+        errors: List[ImportError],
+        warnings: List[ImportWarning],
+        conflicts: Optional[List[ImportConflict]] = None
+    ) -> Tuple[List[UUID], int]:
+        """
+        Construct hierarchical relationships from imported data in bulk.
+        
+        **Validates: Requirements 1.3, 1.4, 10.2**
+        
+        Same parent resolution as ``construct_hierarchy_from_import``, but the
+        whole hierarchy is planned in memory before anything is written:
+        1. Parent IDs and levels are resolved from SAP structure codes, with
+           missing parents planned as auto-created items
+        2. Existing codes and SAP references are fetched with one chunked
+           lookup per batch instead of one query per row
+        3. Parent totals are rolled up from their children in one bottom-up pass
+        4. Rows and their version records are written with chunked multi-row
+           upserts, parents before children
+        
+        Args:
+            parsed_rows: List of parsed row data
+            project_id: Target project UUID
+            config: Import configuration
+            user_id: User performing the import
+            batch_id: Import batch ID
+            errors: List to append errors to
+            warnings: List to append warnings to
+            conflicts: Optional list to append conflicts with existing records to
+            
+        Returns:
+            Tuple of (created_breakdown_ids, hierarchy_count)
+        """
+        if conflicts is None:
+            conflicts = []
+        
+        # Phase 1: Parse hierarchy information and transform all rows
+        hierarchy_info = self._parse_hierarchy_information(
+            parsed_rows=parsed_rows,
+            config=config,
+            errors=errors,
+            warnings=warnings
+        )
+        sorted_items = sorted(
+            hierarchy_info,
+            key=lambda x: (x['hierarchy_level'], x['row_number'])
+        )
+        
+        candidates: List[Tuple[Dict[str, Any], POBreakdownCreate]] = []
+        for item_info in sorted_items:
+            breakdown_data = self._transform_row_to_breakdown(
+                row_data=item_info['row_data'],
+                config=config,
+                row_number=item_info['row_number'],
+                errors=errors,
+                warnings=warnings
+            )
+            if breakdown_data:
+                candidates.append((item_info, breakdown_data))
+        
+        # Phase 2: One set-based lookup for existing codes and SAP references
+        lookup_codes = set()
+        sap_po_numbers = set()
+        for item_info, breakdown_data in candidates:
+            if breakdown_data.code:
+                lookup_codes.add(breakdown_data.code)
+            if breakdown_data.sap_po_number and breakdown_data.sap_line_item:
+                sap_po_numbers.add(breakdown_data.sap_po_number)
+            parent_code = item_info['parent_code']
+            while parent_code and parent_code not in lookup_codes:
+                lookup_codes.add(parent_code)
+                _, parent_code = self._parse_sap_structure_code(
+                    structure_code=parent_code,
+                    row_number=item_info['row_number'],
+                    errors=[]
+                )
+        
+        existing_by_code, existing_by_sap_ref = self._find_existing_breakdowns(
+            project_id=project_id,
+            codes=lookup_codes,
+            sap_po_numbers=sap_po_numbers
+        )
+        
+        # Phase 3: Resolve parents and levels in memory (parents first)
+        hierarchy_map: Dict[str, UUID] = {}  # Maps structure code to breakdown ID
+        levels: Dict[UUID, int] = {}  # Hierarchy level of every resolved breakdown
+        planned_by_code: Dict[str, Dict[str, Any]] = {}
+        nodes: List[Dict[str, Any]] = []  # Planned items in parent-before-child order
+        
+        for item_info, breakdown_data in candidates:
+            row_num = item_info['row_number']
+            row_data = item_info['row_data']
+            structure_code = item_info['structure_code']
+            parent_code = item_info['parent_code']
+            
+            # Determine parent ID from hierarchy
+            parent_id = None
+            if parent_code:
+                if parent_code in hierarchy_map:
+                    parent_id = hierarchy_map[parent_code]
+                elif config.create_missing_parents:
+                    parent_id = self._plan_missing_parent(
+                        parent_code=parent_code,
+                        config=config,
+                        hierarchy_map=hierarchy_map,
+                        levels=levels,
+                        planned_by_code=planned_by_code,
+                        existing_by_code=existing_by_code,
+                        nodes=nodes,
+                        warnings=warnings,
+                        row_number=row_num
+                    )
+                else:
+                    errors.append(ImportError(
+                        row_number=row_num,
+                        field='parent_reference',
+                        error_type='parent_not_found',
+                        message=f"Parent with code '{parent_code}' not found and create_missing_parents is disabled",
+                        raw_value=parent_code
+                    ))
+                    continue
+            
+            # Override parent_breakdown_id with hierarchy-derived parent
+            breakdown_data.parent_breakdown_id = parent_id
+            
+            # Check for duplicates within this import batch
+            duplicate_check = self._check_batch_duplicate(
+                breakdown_data=breakdown_data,
+                hierarchy_map=hierarchy_map,
+                structure_code=structure_code,
+                row_number=row_num
+            )
+            
+            if duplicate_check:
+                warnings.append(ImportWarning(
+                    row_number=row_num,
+                    field='code',
+                    warning_type='duplicate_in_batch',
+                    message=duplicate_check
+                ))
+                continue
+            
+            # Check for conflicts with existing records
+            conflict = self._match_existing_conflict(
+                breakdown_data=breakdown_data,
+                existing_by_code=existing_by_code,
+                existing_by_sap_ref=existing_by_sap_ref,
+                row_number=row_num
+            )
+            
+            if conflict:
+                conflicts.append(conflict)
+                
+                if config.conflict_resolution == ConflictResolution.skip:
+                    warnings.append(ImportWarning(
+                        row_number=row_num,
+                        field=conflict.field_conflicts[0] if conflict.field_conflicts else 'general',
+                        warning_type='conflict_skipped',
+                        message=f"Skipped due to conflict: {conflict.conflict_type.value}"
+                    ))
+                    continue
+            
+            failure = None
+            hierarchy_level = levels[parent_id] + 1 if parent_id else 0
+            if hierarchy_level > MAX_HIERARCHY_DEPTH:
+                failure = f"Maximum hierarchy depth of {MAX_HIERARCHY_DEPTH} exceeded"
+            elif breakdown_data.code and (
+                breakdown_data.code in planned_by_code or breakdown_data.code in existing_by_code
+            ):
+                failure = f"Code '{breakdown_data.code}' already exists in project"
+            
+            if failure:
+                errors.append(ImportError(
+                    row_number=row_num,
+                    field='general',
+                    error_type='hierarchy_construction_error',
+                    message=f"Failed to create item in hierarchy: {failure}",
+                    raw_value=str(row_data)
+                ))
+                continue
+            
+            node = {
+                'id': uuid4(),
+                'row_number': row_num,
+                'row_data': row_data,
+                'breakdown_data': breakdown_data,
+                'hierarchy_level': hierarchy_level,
+                'parent_id': parent_id,
+                'auto_created': False,
+                'source': f"Import batch {batch_id}",
+            }
+            nodes.append(node)
+            levels[node['id']] = hierarchy_level
+            if breakdown_data.code:
+                planned_by_code[breakdown_data.code] = node
+            
+            # Track in hierarchy map
+            if structure_code:
+                hierarchy_map[structure_code] = node['id']
+        
+        # Phase 4: Roll up parent totals bottom-up in one pass
+        insert_rows = self._build_bulk_insert_rows(
+            nodes=nodes,
+            project_id=project_id,
+            user_id=user_id,
+            batch_id=batch_id
+        )
+        
+        # Phase 5: Chunked multi-row upserts, parents before children
+        inserted_nodes = await self._upsert_planned_rows(
+            nodes=nodes,
+            insert_rows=insert_rows,
+            user_id=user_id,
+            batch_id=batch_id,
+            errors=errors,
+            warnings=warnings
+        )
+        
+        if inserted_nodes:
+            self.po_service.invalidate_tree_index(project_id)
+            
+            # Existing parents that received new children roll up against all their children
+            planned_ids = {node['id'] for node in nodes}
+            existing_parent_ids = {
+                node['parent_id'] for node in inserted_nodes
+                if node['parent_id'] and node['parent_id'] not in planned_ids
+            }
+            for parent_id in existing_parent_ids:
+                await self.po_service._recalculate_parent_totals(parent_id)
+            
+            await self.po_service.schedule_automatic_variance_recalculation(
+                project_id=project_id,
+                trigger_event='breakdown_created',
+                event_data={'import_batch_id': str(batch_id), 'created_count': len(inserted_nodes)}
+            )
+        
+        created_breakdown_ids = [node['id'] for node in inserted_nodes if not node['auto_created']]
+        
+        # Count unique hierarchy levels created
+        hierarchy_count = len(set(item['hierarchy_level'] for item in hierarchy_info))
+        
+        logger.info(
+            f"Bulk hierarchy import for batch {batch_id}: {len(created_breakdown_ids)} items, "
+            f"{len(inserted_nodes) - len(created_breakdown_ids)} auto-created parents"
+        )
+        
+        return created_breakdown_ids, hierarchy_count
+    
+    def _find_existing_breakdowns(
+        self,
+        project_id: UUID,
+        codes: set,
+        sap_po_numbers: set
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[Tuple[str, str], Dict[str, Any]]]:
+        """
+        Fetch active breakdowns matching any of the given codes or SAP PO numbers.
+        
+        Returns:
+            Tuple of (rows by code, rows by (sap_po_number, sap_line_item))
+        """
+        existing_by_code: Dict[str, Dict[str, Any]] = {}
+        existing_by_sap_ref: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        for column, values in (('code', sorted(codes)), ('sap_po_number', sorted(sap_po_numbers))):
+            for i in range(0, len(values), CONFLICT_LOOKUP_CHUNK):
+                offset = 0
+                while True:
+                    result = self.supabase.table('po_breakdowns')\
+                        .select('*')\
+                        .eq('project_id', str(project_id))\
+                        .eq('is_active', True)\
+                        .in_(column, values[i:i + CONFLICT_LOOKUP_CHUNK])\
+                        .order('id')\
+                        .range(offset, offset + CONFLICT_LOOKUP_PAGE_SIZE - 1)\
+                        .execute()
+                    page = result.data or []
+                    
+                    for row in page:
+                        if row.get('code'):
+                            existing_by_code.setdefault(row['code'], row)
+                        if row.get('sap_po_number') and row.get('sap_line_item'):
+                            existing_by_sap_ref.setdefault((row['sap_po_number'], row['sap_line_item']), row)
+                    
+                    if len(page) < CONFLICT_LOOKUP_PAGE_SIZE:
+                        break
+                    offset += CONFLICT_LOOKUP_PAGE_SIZE
+        
+        return existing_by_code, existing_by_sap_ref
+    
+    def _match_existing_conflict(
+        self,
+        breakdown_data: POBreakdownCreate,
+        existing_by_code: Dict[str, Dict[str, Any]],
+        existing_by_sap_ref: Dict[Tuple[str, str], Dict[str, Any]],
+        row_number: int
+    ) -> Optional[ImportConflict]:
+        """
+        In-memory equivalent of ``_check_for_conflicts`` against prefetched rows.
+        
+        **Validates: Requirements 1.4, 10.2**
+        """
+        if breakdown_data.code and breakdown_data.code in existing_by_code:
+            return ImportConflict(
+                row_number=row_number,
+                conflict_type=ConflictType.duplicate_code,
+                existing_record=existing_by_code[breakdown_data.code],
+                new_record=breakdown_data.model_dump(),
+                suggested_resolution=ConflictResolution.update,
+                field_conflicts=['code']
+            )
+        
+        sap_ref = (breakdown_data.sap_po_number, breakdown_data.sap_line_item)
+        if breakdown_data.sap_po_number and breakdown_data.sap_line_item and sap_ref in existing_by_sap_ref:
+            return ImportConflict(
+                row_number=row_number,
+                conflict_type=ConflictType.duplicate_sap_reference,
+                existing_record=existing_by_sap_ref[sap_ref],
+                new_record=breakdown_data.model_dump(),
+                suggested_resolution=ConflictResolution.update,
+                field_conflicts=['sap_po_number', 'sap_line_item']
+            )
+        
+        return None
+    
+    def _plan_missing_parent(
+        self,
+        parent_code: str,
+        config: ImportConfig,
+        hierarchy_map: Dict[str, UUID],
+        levels: Dict[UUID, int],
+        planned_by_code: Dict[str, Dict[str, Any]],
+        existing_by_code: Dict[str, Dict[str, Any]],
+        nodes: List[Dict[str, Any]],
+        warnings: List[ImportWarning],
+        row_number: int
+    ) -> Optional[UUID]:
+        """
+        In-memory equivalent of ``_create_missing_parent`` for bulk imports.
+        
+        **Validates: Requirements 1.3, 10.2**
+        
+        Reuses a breakdown with the same code from the batch or the database,
+        otherwise plans an auto-created parent (and its own missing ancestors).
+        
+        Returns:
+            UUID of the resolved or planned parent, or None if it cannot be created
+        """
+        # Check if parent already exists in this batch or the database
+        if parent_code in planned_by_code:
+            parent_id = planned_by_code[parent_code]['id']
+            hierarchy_map[parent_code] = parent_id
+            return parent_id
+        
+        if parent_code in existing_by_code:
+            existing = existing_by_code[parent_code]
+            parent_id = UUID(existing['id'])
+            hierarchy_map[parent_code] = parent_id
+            levels[parent_id] = existing.get('hierarchy_level') or 0
+            return parent_id
+        
+        # Determine parent's parent
+        _, grandparent_code = self._parse_sap_structure_code(
+            structure_code=parent_code,
+            row_number=row_number,
+            errors=[]
+        )
+        
+        grandparent_id = None
+        if grandparent_code:
+            if grandparent_code in hierarchy_map:
+                grandparent_id = hierarchy_map[grandparent_code]
+            else:
+                # Recursively plan grandparent
+                grandparent_id = self._plan_missing_parent(
+                    parent_code=grandparent_code,
+                    config=config,
+                    hierarchy_map=hierarchy_map,
+                    levels=levels,
+                    planned_by_code=planned_by_code,
+                    existing_by_code=existing_by_code,
+                    nodes=nodes,
+                    warnings=warnings,
+                    row_number=row_number
+                )
+        
+        hierarchy_level = levels[grandparent_id] + 1 if grandparent_id else 0
+        if hierarchy_level > MAX_HIERARCHY_DEPTH:
+            warnings.append(ImportWarning(
+                row_number=row_number,
+                field='parent_reference',
+                warning_type='parent_creation_failed',
+                message=(
+                    f"Failed to auto-create parent '{parent_code}': "
+                    f"Maximum hierarchy depth of {MAX_HIERARCHY_DEPTH} exceeded"
+                )
+            ))
+            return None
+        
+        parent_data = POBreakdownCreate(
+            name=f"Auto-created: {parent_code}",
+            code=parent_code,
+            parent_breakdown_id=grandparent_id,
+            breakdown_type=config.breakdown_type_default,
+            currency=config.currency_default,
+            planned_amount=Decimal('0.00'),
+            committed_amount=Decimal('0.00'),
+            actual_amount=Decimal('0.00'),
+            custom_fields={'auto_created': True, 'created_from_import': True}
+        )
+        
+        node = {
+            'id': uuid4(),
+            'row_number': row_number,
+            'row_data': None,
+            'breakdown_data': parent_data,
+            'hierarchy_level': hierarchy_level,
+            'parent_id': grandparent_id,
+            'auto_created': True,
+            'source': None,
+        }
+        nodes.append(node)
+        levels[node['id']] = hierarchy_level
+        planned_by_code[parent_code] = node
+        
+        # Track in hierarchy map
+        hierarchy_map[parent_code] = node['id']
+        
+        warnings.append(ImportWarning(
+            row_number=row_number,
+            field='parent_reference',
+            warning_type='parent_auto_created',
+            message=f"Auto-created missing parent with code '{parent_code}'",
+            suggestion="Review auto-created parent and update details as needed"
+        ))
+        
+        return node['id']
+    
+    def _build_bulk_insert_rows(
+        self,
+        nodes: List[Dict[str, Any]],
+        project_id: UUID,
+        user_id: UUID,
+        batch_id: UUID
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Build insert rows for planned hierarchy items, rolling parent totals up
+        from their children in a single bottom-up pass.
+        
+        **Validates: Requirements 2.3**
+        
+        Items are planned parents-first, so walking them in reverse visits every
+        child before its parent. A parent's amounts become the sum of its
+        children's, matching ``POBreakdownDatabaseService._recalculate_parent_totals``.
+        
+        Returns:
+            Map of breakdown ID to insert row
+        """
+        child_totals: Dict[UUID, List[Decimal]] = {}
+        insert_rows: Dict[UUID, Dict[str, Any]] = {}
+        
+        for node in reversed(nodes):
+            breakdown_data = node['breakdown_data']
+            row = self.po_service._build_insert_data(
+                project_id, breakdown_data, node['hierarchy_level'], user_id
+            )
+            row['id'] = str(node['id'])
+            row['import_batch_id'] = str(batch_id)
+            row['import_source'] = node['source'] or f"Auto-created parent for import batch {batch_id}"
+            
+            amounts = child_totals.get(node['id'])
+            if amounts is not None:
+                planned, committed, actual = amounts
+                row['planned_amount'] = str(planned)
+                row['committed_amount'] = str(committed)
+                row['actual_amount'] = str(actual)
+                row['remaining_amount'] = str(planned - actual)
+            else:
+                amounts = [
+                    breakdown_data.planned_amount,
+                    breakdown_data.committed_amount,
+                    breakdown_data.actual_amount,
+                ]
+            
+            if node['parent_id'] is not None:
+                parent_totals = child_totals.setdefault(
+                    node['parent_id'], [Decimal('0'), Decimal('0'), Decimal('0')]
+                )
+                for i in range(3):
+                    parent_totals[i] += amounts[i]
+            
+            insert_rows[node['id']] = row
+        
+        return insert_rows
+    
+    async def _upsert_planned_rows(
+        self,
+        nodes: List[Dict[str, Any]],
+        insert_rows: Dict[UUID, Dict[str, Any]],
+        user_id: UUID,
+        batch_id: UUID,
+        errors: List[ImportError],
+        warnings: List[ImportWarning]
+    ) -> List[Dict[str, Any]]:
+        """
+        Write planned breakdown rows and their version records in chunks.
+        
+        A failed chunk fails its items and, transitively, any later items whose
+        parent was in it.
+        
+        Returns:
+            Planned items that were written
+        """
+        failed_ids = set()
+        inserted_nodes: List[Dict[str, Any]] = []
+        
+        for i in range(0, len(nodes), BULK_INSERT_CHUNK):
+            chunk = []
+            for node in nodes[i:i + BULK_INSERT_CHUNK]:
+                if node['parent_id'] in failed_ids:
+                    failed_ids.add(node['id'])
+                    self._record_bulk_failure(node, "Parent item could not be created", errors, warnings)
+                else:
+                    chunk.append(node)
+            
+            if not chunk:
+                continue
+            
+            try:
+                self.supabase.table('po_breakdowns')\
+                    .upsert([insert_rows[node['id']] for node in chunk])\
+                    .execute()
+            except Exception as e:
+                logger.error(f"Failed to upsert hierarchy chunk of {len(chunk)} items: {e}")
+                for node in chunk:
+                    failed_ids.add(node['id'])
+                    self._record_bulk_failure(node, str(e), errors, warnings)
+                continue
+            
+            inserted_nodes.extend(chunk)
+            
+            # Initial version records for the audit trail
+            version_rows = []
+            for node in chunk:
+                row = insert_rows[node['id']]
+                version_rows.append(self.po_service._build_version_data(
+                    breakdown_id=node['id'],
+                    version_number=1,
+                    changes={'action': 'create', 'data': row},
+                    user_id=user_id,
+                    change_type='create',
+                    change_summary=f"Created breakdown: {row['name']}",
+                    before_values={},
+                    after_values=row,
+                    is_import=True,
+                    import_batch_id=batch_id
+                ))
+            
+            try:
+                self.supabase.table(self.po_service.version_table).insert(version_rows).execute()
+            except Exception as e:
+                logger.warning(f"Failed to create version records for hierarchy chunk: {e}")
+        
+        return inserted_nodes
+    
+    def _record_bulk_failure(
+        self,
+        node: Dict[str, Any],
+        reason: str,
+        errors: List[ImportError],
+        warnings: List[ImportWarning]
+    ) -> None:
+        """Report a planned hierarchy item that could not be written."""
+        if node['auto_created']:
+            warnings.append(ImportWarning(
+                row_number=node['row_number'],
+                field='parent_reference',
+                warning_type='parent_creation_failed',
+                message=f"Failed to auto-create parent '{node['breakdown_data'].code}': {reason}"
+            ))
+        elif node.get('error_type') == 'processing_error':
+            errors.append(ImportError(
+                row_number=node['row_number'],
+                field='general',
+                error_type='processing_error',
+                message=f"Failed to process row: {reason}",
+                raw_value=str(node['row_data'])
+            ))
+        else:
+            errors.append(ImportError(
+                row_number=node['row_number'],
+                field='general',
+                error_type='hierarchy_construction_error',
+                message=f"Failed to create item in hierarchy: {reason}",
+                raw_value=str(node['row_data'])
+            ))
+    
     def _parse_hierarchy_information(
         self,
         parsed_rows: List[Dict[str, Any]],
@@ -15,6 +15,7 @@ from uuid import UUID, uuid4
 
 from supabase import Client
 
+from config.database import execute_async
 from models.po_breakdown import (
     POBreakdownCreate,
     POBreakdownResponse,
@@ -59,6 +60,138 @@ VARIANCE_THRESHOLDS = {
 }
 
 
+class POBreakdownTreeIndex:
+    """
+    In-memory index over one project's PO breakdown hierarchy.
+    
+    Built from a single load of the project's breakdown rows, it keeps a
+    parent -> active children map and materialized root -> node paths, so
+    descendant, depth, path and move checks need no further round trips.
+    Rows are the raw database dicts and are updated in place by the owning
+    service when it writes hierarchy fields.
+    """
+    
+    def __init__(self, project_id: UUID, rows: List[Dict[str, Any]]):
+        self.project_id = project_id
+        self.rows_by_id: Dict[str, Dict[str, Any]] = {str(row['id']): row for row in rows}
+        self.children_by_parent: Dict[str, List[str]] = {}
+        self._paths: Dict[str, Tuple[str, ...]] = {}
+        
+        for breakdown_id, row in self.rows_by_id.items():
+            parent_id = row.get('parent_breakdown_id')
+            if parent_id and row.get('is_active', True):
+                self.children_by_parent.setdefault(str(parent_id), []).append(breakdown_id)
+        
+        for breakdown_id in self.rows_by_id:
+            self._materialize_path(breakdown_id)
+    
+    def __contains__(self, breakdown_id: object) -> bool:
+        return str(breakdown_id) in self.rows_by_id
+    
+    def __len__(self) -> int:
+        return len(self.rows_by_id)
+    
+    def get(self, breakdown_id: Union[UUID, str]) -> Optional[Dict[str, Any]]:
+        """Raw row for a breakdown, or None if it is not in this project."""
+        return self.rows_by_id.get(str(breakdown_id))
+    
+    def children(self, breakdown_id: Union[UUID, str]) -> List[Dict[str, Any]]:
+        """Active direct children of a breakdown."""
+        return [self.rows_by_id[child_id] for child_id in self.children_by_parent.get(str(breakdown_id), [])]
+    
+    def descendants_with_depth(
+        self,
+        breakdown_id: Union[UUID, str],
+        max_depth: Optional[int] = None
+    ) -> List[Tuple[Dict[str, Any], int]]:
+        """
+        Active descendants in depth-first pre-order with their depth below the
+        breakdown (children are depth 1), optionally limited to ``max_depth``.
+        """
+        if max_depth is not None and max_depth <= 0:
+            return []
+        
+        result = []
+        visited = {str(breakdown_id)}
+        stack = [(child_id, 1) for child_id in reversed(self.children_by_parent.get(str(breakdown_id), []))]
+        
+        while stack:
+            current_id, depth = stack.pop()
+            if current_id in visited:
+                continue
+            visited.add(current_id)
+            result.append((self.rows_by_id[current_id], depth))
+            
+            if max_depth is None or depth < max_depth:
+                stack.extend(
+                    (child_id, depth + 1)
+                    for child_id in reversed(self.children_by_parent.get(current_id, []))
+                )
+        
+        return result
+    
+    def descendants(self, breakdown_id: Union[UUID, str], max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Active descendants in depth-first pre-order."""
+        return [row for row, _ in self.descendants_with_depth(breakdown_id, max_depth)]
+    
+    def max_child_depth(self, breakdown_id: Union[UUID, str]) -> int:
+        """Depth of the deepest active descendant below a breakdown (0 if none)."""
+        return max((depth for _, depth in self.descendants_with_depth(breakdown_id)), default=0)
+    
+    def path(self, breakdown_id: Union[UUID, str]) -> List[UUID]:
+        """Breakdown IDs from the root down to the given breakdown."""
+        path = self._paths.get(str(breakdown_id)) or self._materialize_path(str(breakdown_id))
+        return [UUID(node_id) for node_id in path[-(MAX_HIERARCHY_DEPTH + 1):]]
+    
+    def depth(self, breakdown_id: Union[UUID, str]) -> int:
+        """Number of ancestors above a breakdown."""
+        return len(self.path(breakdown_id)) - 1
+    
+    def would_create_cycle(self, breakdown_id: Union[UUID, str], new_parent_id: Union[UUID, str]) -> bool:
+        """Whether placing ``breakdown_id`` under ``new_parent_id`` would create a cycle."""
+        if str(new_parent_id) == str(breakdown_id):
+            return True
+        return any(str(row['id']) == str(new_parent_id) for row in self.descendants(breakdown_id))
+    
+    def move(self, breakdown_id: Union[UUID, str], new_parent_id: Optional[Union[UUID, str]]) -> None:
+        """Re-parent a breakdown in the index after it was moved in the database."""
+        breakdown_id = str(breakdown_id)
+        row = self.rows_by_id.get(breakdown_id)
+        if row is None:
+            return
+        
+        old_parent_id = row.get('parent_breakdown_id')
+        if old_parent_id and breakdown_id in self.children_by_parent.get(str(old_parent_id), []):
+            self.children_by_parent[str(old_parent_id)].remove(breakdown_id)
+        
+        row['parent_breakdown_id'] = str(new_parent_id) if new_parent_id else None
+        if new_parent_id and row.get('is_active', True):
+            self.children_by_parent.setdefault(str(new_parent_id), []).append(breakdown_id)
+        
+        # Paths below the moved node changed; rebuild them lazily
+        self._paths.clear()
+    
+    def _materialize_path(self, breakdown_id: str) -> Tuple[str, ...]:
+        """Compute and memoize root -> node paths for a breakdown and its uncached ancestors."""
+        chain = []
+        seen = set()
+        current_id = breakdown_id
+        
+        while current_id and current_id not in self._paths and current_id not in seen:
+            seen.add(current_id)
+            chain.append(current_id)
+            row = self.rows_by_id.get(current_id)
+            parent_id = row.get('parent_breakdown_id') if row else None
+            current_id = str(parent_id) if parent_id else None
+        
+        prefix = self._paths.get(current_id, ()) if current_id else ()
+        for node_id in reversed(chain):
+            prefix = prefix + (node_id,)
+            self._paths[node_id] = prefix
+        
+        return self._paths[breakdown_id]
+
+
 class POBreakdownDatabaseService:
     """
     Database service layer for PO breakdown CRUD operations.
@@ -69,12 +202,17 @@ class POBreakdownDatabaseService:
     **Validates: Requirements 1.1, 1.2, 2.1, 3.1**
     """
     
+    TREE_INDEX_PAGE_SIZE = 1000  # PostgREST default max rows per request
+    HIERARCHY_UPDATE_CHUNK = 500  # PostgREST/URL limit for ID filters
+    
     def __init__(self, supabase_client: Client):
         """Initialize the service with a Supabase client."""
         self.supabase = supabase_client
         self.table_name = 'po_breakdowns'
         self.version_table = 'po_breakdown_versions'
         self.alert_table = 'variance_alerts'
+        # Per-project hierarchy indexes, dropped whenever breakdowns are written
+        self._tree_indexes: Dict[str, POBreakdownTreeIndex] = {}
     
     # =========================================================================
     # CRUD Operations
@@ -122,46 +260,12 @@ class POBreakdownDatabaseService:
                 if existing:
                     raise ValueError(f"Code '{breakdown_data.code}' already exists in project")
             
-            # Calculate remaining amount
-            remaining_amount = breakdown_data.planned_amount - breakdown_data.actual_amount
-            
             # Prepare insert data
-            insert_data = {
-                'id': str(uuid4()),
-                'project_id': str(project_id),
-                'name': breakdown_data.name,
-                'code': breakdown_data.code,
-                'sap_po_number': breakdown_data.sap_po_number,
-                'sap_line_item': breakdown_data.sap_line_item,
-                'hierarchy_level': hierarchy_level,
-                'parent_breakdown_id': str(breakdown_data.parent_breakdown_id) if breakdown_data.parent_breakdown_id else None,
-                # Initialize SAP relationship preservation fields
-                'original_sap_parent_id': str(breakdown_data.parent_breakdown_id) if breakdown_data.parent_breakdown_id else None,
-                'sap_hierarchy_path': None,  # Will be calculated on first modification
-                'has_custom_parent': False,
-                'cost_center': breakdown_data.cost_center,
-                'gl_account': breakdown_data.gl_account,
-                'planned_amount': str(breakdown_data.planned_amount),
-                'committed_amount': str(breakdown_data.committed_amount),
-                'actual_amount': str(breakdown_data.actual_amount),
-                'remaining_amount': str(remaining_amount),
-                'currency': breakdown_data.currency,
-                'exchange_rate': '1.0',
-                'breakdown_type': breakdown_data.breakdown_type.value,
-                'category': breakdown_data.category,
-                'subcategory': breakdown_data.subcategory,
-                'custom_fields': breakdown_data.custom_fields,
-                'tags': breakdown_data.tags,
-                'notes': breakdown_data.notes,
-                'version': 1,
-                'is_active': True,
-                'created_by': str(user_id),
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
-            }
+            insert_data = self._build_insert_data(project_id, breakdown_data, hierarchy_level, user_id)
             
             # Insert into database
-            result = self.supabase.table(self.table_name).insert(insert_data).execute()
+            result = await execute_async(self.supabase.table(self.table_name).insert(insert_data), label=self.table_name)
+            self.invalidate_tree_index(project_id)
             
             if not result.data:
                 raise Exception("Failed to create PO breakdown")
@@ -199,6 +303,51 @@ class POBreakdownDatabaseService:
             logger.error(f"Failed to create PO breakdown: {e}")
             raise
     
+    def _build_insert_data(
+        self,
+        project_id: UUID,
+        breakdown_data: POBreakdownCreate,
+        hierarchy_level: int,
+        user_id: UUID
+    ) -> Dict[str, Any]:
+        """Build the database row for a new breakdown at a resolved hierarchy level."""
+        # Calculate remaining amount
+        remaining_amount = breakdown_data.planned_amount - breakdown_data.actual_amount
+        
+        return {
+            'id': str(uuid4()),
+            'project_id': str(project_id),
+            'name': breakdown_data.name,
+            'code': breakdown_data.code,
+            'sap_po_number': breakdown_data.sap_po_number,
+            'sap_line_item': breakdown_data.sap_line_item,
+            'hierarchy_level': hierarchy_level,
+            'parent_breakdown_id': str(breakdown_data.parent_breakdown_id) if breakdown_data.parent_breakdown_id else None,
+            # Initialize SAP relationship preservation fields
+            'original_sap_parent_id': str(breakdown_data.parent_breakdown_id) if breakdown_data.parent_breakdown_id else None,
+            'sap_hierarchy_path': None,  # Will be calculated on first modification
+            'has_custom_parent': False,
+            'cost_center': breakdown_data.cost_center,
+            'gl_account': breakdown_data.gl_account,
+            'planned_amount': str(breakdown_data.planned_amount),
+            'committed_amount': str(breakdown_data.committed_amount),
+            'actual_amount': str(breakdown_data.actual_amount),
+            'remaining_amount': str(remaining_amount),
+            'currency': breakdown_data.currency,
+            'exchange_rate': '1.0',
+            'breakdown_type': breakdown_data.breakdown_type.value,
+            'category': breakdown_data.category,
+            'subcategory': breakdown_data.subcategory,
+            'custom_fields': breakdown_data.custom_fields,
+            'tags': breakdown_data.tags,
+            'notes': breakdown_data.notes,
+            'version': 1,
+            'is_active': True,
+            'created_by': str(user_id),
+            'created_at': datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat(),
+        }
+    
     async def get_breakdown_by_id(self, breakdown_id: UUID) -> Optional[POBreakdownResponse]:
         """
         Get a specific PO breakdown by ID.
@@ -210,10 +359,9 @@ class POBreakdownDatabaseService:
             POBreakdownResponse or None if not found
         """
         try:
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
             
             if not result.data:
                 return None
@@ -281,10 +429,10 @@ class POBreakdownDatabaseService:
             update_data['updated_at'] = datetime.now().isoformat()
             
             # Execute update
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
+            self._drop_tree_index_for(breakdown_id)
             
             if not result.data:
                 raise Exception("Failed to update PO breakdown")
@@ -385,20 +533,20 @@ class POBreakdownDatabaseService:
             
             if hard_delete:
                 # Permanent deletion (rarely used)
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .delete()\
-                    .eq('id', str(breakdown_id))\
-                    .execute()
+                    .eq('id', str(breakdown_id)), label=self.table_name)
+                self._drop_tree_index_for(breakdown_id)
                 after_snapshot = {}
             else:
                 # Soft delete - mark as inactive (Requirement 6.4)
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .update({
                         'is_active': False,
                         'updated_at': datetime.now().isoformat()
                     })\
-                    .eq('id', str(breakdown_id))\
-                    .execute()
+                    .eq('id', str(breakdown_id)), label=self.table_name)
+                self._drop_tree_index_for(breakdown_id)
                 
                 # Capture after snapshot for soft delete
                 after_snapshot = {**before_snapshot, 'is_active': False}
@@ -478,7 +626,7 @@ class POBreakdownDatabaseService:
             query = query.order('hierarchy_level').order('name')\
                 .range(offset, offset + page_size - 1)
             
-            result = query.execute()
+            result = await execute_async(query)
             
             items = [self._map_to_response(row) for row in result.data]
             total_count = result.count or len(items)
@@ -532,7 +680,7 @@ class POBreakdownDatabaseService:
             # Apply database-level filters
             query = self._apply_filters(query, filter_criteria)
             
-            result = query.execute()
+            result = await execute_async(query)
             items = [self._map_to_response(row) for row in result.data]
             
             # Apply post-query filters for calculated fields
@@ -646,7 +794,8 @@ class POBreakdownDatabaseService:
             if include_root:
                 branch_items.append(root)
             
-            # Recursively get descendants
+            # Get descendants from the project's hierarchy index
+            await self._get_tree_index(project_id)
             descendants = await self._get_branch_descendants(
                 root_breakdown_id,
                 current_depth=0,
@@ -681,24 +830,16 @@ class POBreakdownDatabaseService:
         current_depth: int,
         max_depth: Optional[int]
     ) -> List[POBreakdownResponse]:
-        """Recursively get descendants up to max_depth."""
+        """Get descendants up to max_depth from the project's hierarchy index."""
         if max_depth is not None and current_depth >= max_depth:
             return []
         
-        descendants = []
-        children = await self._get_children(parent_id, active_only=True)
-        
-        for child in children:
-            descendants.append(child)
-            # Recursively get child's descendants
-            child_descendants = await self._get_branch_descendants(
-                child.id,
-                current_depth + 1,
-                max_depth
-            )
-            descendants.extend(child_descendants)
+        index = await self._get_tree_index_for_breakdown(parent_id)
+        if index is None:
+            return []
         
-        return descendants
+        remaining_depth = None if max_depth is None else max_depth - current_depth
+        return [self._map_to_response(row) for row in index.descendants(parent_id, remaining_depth)]
     
     async def _item_matches_filter(
         self,
@@ -806,11 +947,10 @@ class POBreakdownDatabaseService:
                 raise ValueError("At least one filter must be provided")
             
             # Get all active breakdowns for the project
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
-                .eq('is_active', True)\
-                .execute()
+                .eq('is_active', True), label=self.table_name)
             
             all_items = [self._map_to_response(row) for row in result.data]
             
@@ -901,11 +1041,10 @@ class POBreakdownDatabaseService:
             
             # If setting as default, unset other defaults for this user/project
             if is_default:
-                self.supabase.table('saved_po_filters')\
+                await execute_async(self.supabase.table('saved_po_filters')\
                     .update({'is_default': False})\
                     .eq('project_id', str(project_id))\
-                    .eq('created_by', str(user_id))\
-                    .execute()
+                    .eq('created_by', str(user_id)), label='saved_po_filters')
             
             # Prepare filter data
             filter_data = {
@@ -920,7 +1059,7 @@ class POBreakdownDatabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            result = self.supabase.table('saved_po_filters').insert(filter_data).execute()
+            result = await execute_async(self.supabase.table('saved_po_filters').insert(filter_data), label='saved_po_filters')
             
             if not result.data:
                 raise Exception("Failed to save filter")
@@ -949,10 +1088,9 @@ class POBreakdownDatabaseService:
             Saved filter data or None if not found
         """
         try:
-            result = self.supabase.table('saved_po_filters')\
+            result = await execute_async(self.supabase.table('saved_po_filters')\
                 .select('*')\
-                .eq('id', str(filter_id))\
-                .execute()
+                .eq('id', str(filter_id)), label='saved_po_filters')
             
             if not result.data:
                 return None
@@ -1004,7 +1142,7 @@ class POBreakdownDatabaseService:
             if user_id:
                 query = query.eq('created_by', str(user_id))
             
-            result = query.execute()
+            result = await execute_async(query)
             
             from models.po_breakdown import SavedFilter
             
@@ -1053,10 +1191,9 @@ class POBreakdownDatabaseService:
             if str(filter_data.get('created_by')) != str(user_id):
                 raise ValueError("Only the filter creator can delete it")
             
-            result = self.supabase.table('saved_po_filters')\
+            result = await execute_async(self.supabase.table('saved_po_filters')\
                 .delete()\
-                .eq('id', str(filter_id))\
-                .execute()
+                .eq('id', str(filter_id)), label='saved_po_filters')
             
             if result.data or result.count == 0:
                 logger.info(f"Deleted saved filter {filter_id}")
@@ -1175,11 +1312,10 @@ class POBreakdownDatabaseService:
                 items = search_result.items
             else:
                 # Export all active items
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .select('*')\
                     .eq('project_id', str(project_id))\
-                    .eq('is_active', True)\
-                    .execute()
+                    .eq('is_active', True), label=self.table_name)
                 items = [self._map_to_response(row) for row in result.data]
             
             # Convert items to export format
@@ -1240,13 +1376,12 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get all active breakdowns for project
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
                 .eq('is_active', True)\
                 .order('hierarchy_level')\
-                .order('name')\
-                .execute()
+                .order('name'), label=self.table_name)
             
             breakdowns = result.data or []
             
@@ -1337,14 +1472,15 @@ class POBreakdownDatabaseService:
                 'version': current.version + 1
             }
             
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
             
             if not result.data:
                 raise Exception("Failed to move breakdown")
             
+            self._apply_move_to_tree_index(breakdown_id, move_request.new_parent_id, result.data[0])
+            
             # Update children's hierarchy levels recursively
             await self._update_children_levels(breakdown_id, new_level)
             
@@ -1397,31 +1533,41 @@ class POBreakdownDatabaseService:
         affected_items = [breakdown_id]
         new_level = 0
         
+        index = await self._get_tree_index(project_id)
+        
         if new_parent_id:
-            # Check parent exists
-            parent = await self.get_breakdown_by_id(new_parent_id)
-            if not parent:
-                errors.append(f"Parent breakdown {new_parent_id} not found")
-                return HierarchyValidationResult(
-                    is_valid=False,
-                    errors=errors,
-                    warnings=warnings,
-                    affected_items=affected_items
-                )
-            
-            # Check same project
-            if parent.project_id != project_id:
-                errors.append("Cannot move to parent in different project")
+            # Check parent exists and is in the same project
+            parent_row = index.get(new_parent_id)
+            if parent_row is None:
+                parent = await self.get_breakdown_by_id(new_parent_id)
+                if not parent:
+                    errors.append(f"Parent breakdown {new_parent_id} not found")
+                    return HierarchyValidationResult(
+                        is_valid=False,
+                        errors=errors,
+                        warnings=warnings,
+                        affected_items=affected_items
+                    )
+                
+                if parent.project_id != project_id:
+                    errors.append("Cannot move to parent in different project")
+                else:
+                    # Parent was created after the index was built
+                    self.invalidate_tree_index(project_id)
+                    index = await self._get_tree_index(project_id)
+                parent_level = parent.hierarchy_level
+            else:
+                parent_level = parent_row.get('hierarchy_level', 0)
             
             # Check for circular reference (Requirement 2.2)
-            if await self._would_create_circular_reference(breakdown_id, new_parent_id):
+            if index.would_create_cycle(breakdown_id, new_parent_id):
                 errors.append("Move would create circular reference")
             
             # Calculate new level
-            new_level = parent.hierarchy_level + 1
+            new_level = parent_level + 1
             
             # Check max depth including children
-            max_child_depth = await self._get_max_child_depth(breakdown_id)
+            max_child_depth = index.max_child_depth(breakdown_id)
             total_depth = new_level + max_child_depth
             
             if total_depth > MAX_HIERARCHY_DEPTH:
@@ -1431,8 +1577,7 @@ class POBreakdownDatabaseService:
                 )
         
         # Get affected children
-        children = await self._get_all_descendants(breakdown_id)
-        affected_items.extend([c.id for c in children])
+        affected_items.extend([UUID(str(row['id'])) for row in index.descendants(breakdown_id)])
         
         return HierarchyValidationResult(
             is_valid=len(errors) == 0,
@@ -1456,30 +1601,92 @@ class POBreakdownDatabaseService:
         # Check if potential parent is in descendants
         return str(potential_parent_id) in descendant_ids
     
-    async def _get_all_descendants(self, breakdown_id: UUID) -> List[POBreakdownResponse]:
-        """Get all descendants of a breakdown recursively."""
-        descendants = []
-        children = await self._get_children(breakdown_id, active_only=True)
+    async def _get_tree_index(self, project_id: UUID) -> POBreakdownTreeIndex:
+        """
+        Get the hierarchy index for a project, loading all of its breakdowns
+        in one paginated query on first use.
+        """
+        key = str(project_id)
+        index = self._tree_indexes.get(key)
+        if index is not None:
+            return index
+        
+        rows = []
+        offset = 0
+        while True:
+            result = await execute_async(self.supabase.table(self.table_name)\
+                .select('*')\
+                .eq('project_id', key)\
+                .order('id')\
+                .range(offset, offset + self.TREE_INDEX_PAGE_SIZE - 1), label=self.table_name)
+            page = result.data or []
+            rows.extend(page)
+            if len(page) < self.TREE_INDEX_PAGE_SIZE:
+                break
+            offset += self.TREE_INDEX_PAGE_SIZE
         
-        for child in children:
-            descendants.append(child)
-            child_descendants = await self._get_all_descendants(child.id)
-            descendants.extend(child_descendants)
+        index = POBreakdownTreeIndex(project_id, rows)
+        self._tree_indexes[key] = index
+        return index
+    
+    async def _get_tree_index_for_breakdown(self, breakdown_id: UUID) -> Optional[POBreakdownTreeIndex]:
+        """Get the hierarchy index of the project a breakdown belongs to."""
+        for index in self._tree_indexes.values():
+            if breakdown_id in index:
+                return index
+        
+        breakdown = await self.get_breakdown_by_id(breakdown_id)
+        if not breakdown:
+            return None
+        
+        return await self._get_tree_index(breakdown.project_id)
+    
+    def invalidate_tree_index(self, project_id: Optional[UUID] = None) -> None:
+        """
+        Drop cached hierarchy indexes after breakdowns are written.
+        
+        Args:
+            project_id: Project to invalidate (None clears every project)
+        """
+        if project_id is None:
+            self._tree_indexes.clear()
+        else:
+            self._tree_indexes.pop(str(project_id), None)
+    
+    def _apply_move_to_tree_index(
+        self,
+        breakdown_id: UUID,
+        new_parent_id: Optional[UUID],
+        updated_row: Dict[str, Any]
+    ) -> None:
+        """Re-parent a moved breakdown in its cached hierarchy index, if any."""
+        for index in self._tree_indexes.values():
+            if breakdown_id in index:
+                index.move(breakdown_id, new_parent_id)
+                index.get(breakdown_id).update(updated_row)
+                return
+    
+    def _drop_tree_index_for(self, breakdown_id: UUID) -> None:
+        """Drop any cached hierarchy index containing a breakdown that was just written."""
+        for key, index in list(self._tree_indexes.items()):
+            if breakdown_id in index:
+                del self._tree_indexes[key]
+    
+    async def _get_all_descendants(self, breakdown_id: UUID) -> List[POBreakdownResponse]:
+        """Get all descendants of a breakdown from the project's hierarchy index."""
+        index = await self._get_tree_index_for_breakdown(breakdown_id)
+        if index is None:
+            return []
         
-        return descendants
+        return [self._map_to_response(row) for row in index.descendants(breakdown_id)]
     
     async def _get_max_child_depth(self, breakdown_id: UUID) -> int:
         """Get the maximum depth of children below this breakdown."""
-        children = await self._get_children(breakdown_id, active_only=True)
-        if not children:
+        index = await self._get_tree_index_for_breakdown(breakdown_id)
+        if index is None:
             return 0
         
-        max_depth = 0
-        for child in children:
-            child_depth = 1 + await self._get_max_child_depth(child.id)
-            max_depth = max(max_depth, child_depth)
-        
-        return max_depth
+        return index.max_child_depth(breakdown_id)
     
     async def _get_children(
         self,
@@ -1494,53 +1701,68 @@ class POBreakdownDatabaseService:
         if active_only:
             query = query.eq('is_active', True)
         
-        result = query.execute()
+        result = await execute_async(query)
         return [self._map_to_response(row) for row in result.data]
     
     async def _update_children_levels(self, parent_id: UUID, parent_level: int) -> None:
-        """Recursively update hierarchy levels of children."""
-        children = await self._get_children(parent_id, active_only=True)
+        """Update hierarchy levels of all descendants, one write per level."""
+        index = await self._get_tree_index_for_breakdown(parent_id)
+        if index is None:
+            return
         
-        for child in children:
-            new_level = parent_level + 1
-            self.supabase.table(self.table_name)\
-                .update({'hierarchy_level': new_level})\
-                .eq('id', str(child.id))\
-                .execute()
-            
-            await self._update_children_levels(child.id, new_level)
+        ids_by_level: Dict[int, List[str]] = {}
+        for row, depth in index.descendants_with_depth(parent_id):
+            new_level = parent_level + depth
+            if row.get('hierarchy_level') != new_level:
+                row['hierarchy_level'] = new_level
+                ids_by_level.setdefault(new_level, []).append(str(row['id']))
+        
+        for new_level, ids in ids_by_level.items():
+            for i in range(0, len(ids), self.HIERARCHY_UPDATE_CHUNK):
+                await execute_async(self.supabase.table(self.table_name)\
+                    .update({'hierarchy_level': new_level})\
+                    .in_('id', ids[i:i + self.HIERARCHY_UPDATE_CHUNK]), label=self.table_name)
     
     async def _recalculate_parent_totals(self, parent_id: UUID) -> None:
         """
-        Recalculate totals for a parent based on children.
+        Recalculate totals for a parent based on children, walking up to the root.
         
         **Validates: Requirements 2.3, 2.4**
         """
-        children = await self._get_children(parent_id, active_only=True)
-        
-        if not children:
+        index = await self._get_tree_index_for_breakdown(parent_id)
+        if index is None:
             return
         
-        total_planned = sum(c.planned_amount for c in children)
-        total_committed = sum(c.committed_amount for c in children)
-        total_actual = sum(c.actual_amount for c in children)
-        total_remaining = total_planned - total_actual
-        
-        self.supabase.table(self.table_name)\
-            .update({
+        current_id = str(parent_id)
+        for _ in range(MAX_HIERARCHY_DEPTH + 1):
+            children = index.children(current_id)
+            if not children:
+                return
+            
+            total_planned = sum(Decimal(str(c.get('planned_amount') or 0)) for c in children)
+            total_committed = sum(Decimal(str(c.get('committed_amount') or 0)) for c in children)
+            total_actual = sum(Decimal(str(c.get('actual_amount') or 0)) for c in children)
+            totals = {
                 'planned_amount': str(total_planned),
                 'committed_amount': str(total_committed),
                 'actual_amount': str(total_actual),
-                'remaining_amount': str(total_remaining),
-                'updated_at': datetime.now().isoformat()
-            })\
-            .eq('id', str(parent_id))\
-            .execute()
-        
-        # Recursively update parent's parent
-        parent = await self.get_breakdown_by_id(parent_id)
-        if parent and parent.parent_breakdown_id:
-            await self._recalculate_parent_totals(parent.parent_breakdown_id)
+                'remaining_amount': str(total_planned - total_actual),
+            }
+            
+            await execute_async(self.supabase.table(self.table_name)\
+                .update({**totals, 'updated_at': datetime.now().isoformat()})\
+                .eq('id', current_id), label=self.table_name)
+            
+            # Keep the index in step so ancestors roll up the new totals
+            row = index.get(current_id)
+            if row is None:
+                return
+            row.update(totals)
+            
+            parent_breakdown_id = row.get('parent_breakdown_id')
+            if not parent_breakdown_id:
+                return
+            current_id = str(parent_breakdown_id)
     
     # =========================================================================
     # Variance Calculations
@@ -1600,11 +1822,10 @@ class POBreakdownDatabaseService:
         **Validates: Requirements 3.4, 5.2**
         """
         # Get all active breakdowns
-        result = self.supabase.table(self.table_name)\
+        result = await execute_async(self.supabase.table(self.table_name)\
             .select('*')\
             .eq('project_id', str(project_id))\
-            .eq('is_active', True)\
-            .execute()
+            .eq('is_active', True), label=self.table_name)
         
         breakdowns = result.data or []
         
@@ -1755,11 +1976,10 @@ class POBreakdownDatabaseService:
         alerts = []
         
         # Get all active breakdowns
-        result = self.supabase.table(self.table_name)\
+        result = await execute_async(self.supabase.table(self.table_name)\
             .select('*')\
             .eq('project_id', str(project_id))\
-            .eq('is_active', True)\
-            .execute()
+            .eq('is_active', True), label=self.table_name)
         
         for b in result.data or []:
             planned = Decimal(str(b['planned_amount']))
@@ -1837,7 +2057,7 @@ class POBreakdownDatabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            result = self.supabase.table(self.alert_table).insert(alert_data).execute()
+            result = await execute_async(self.supabase.table(self.alert_table).insert(alert_data), label=self.alert_table)
             
             if not result.data:
                 raise Exception("Failed to store variance alert")
@@ -1884,7 +2104,7 @@ class POBreakdownDatabaseService:
             if severity:
                 query = query.eq('severity', severity)
             
-            result = query.execute()
+            result = await execute_async(query)
             
             alerts = []
             for row in result.data:
@@ -1939,10 +2159,9 @@ class POBreakdownDatabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            result = self.supabase.table(self.alert_table)\
+            result = await execute_async(self.supabase.table(self.alert_table)\
                 .update(update_data)\
-                .eq('id', str(alert_id))\
-                .execute()
+                .eq('id', str(alert_id)), label=self.alert_table)
             
             if result.data:
                 logger.info(f"Acknowledged variance alert {alert_id} by user {user_id}")
@@ -1979,10 +2198,9 @@ class POBreakdownDatabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            result = self.supabase.table(self.alert_table)\
+            result = await execute_async(self.supabase.table(self.alert_table)\
                 .update(update_data)\
-                .eq('id', str(alert_id))\
-                .execute()
+                .eq('id', str(alert_id)), label=self.alert_table)
             
             if result.data:
                 logger.info(f"Resolved variance alert {alert_id} by user {user_id}")
@@ -2139,10 +2357,9 @@ class POBreakdownDatabaseService:
                 raise ValueError(f"Breakdown {breakdown_id} not found")
             
             # Verify financial record exists
-            financial_result = self.supabase.table('financial_tracking')\
+            financial_result = await execute_async(self.supabase.table('financial_tracking')\
                 .select('*')\
-                .eq('id', str(financial_record_id))\
-                .execute()
+                .eq('id', str(financial_record_id)), label='financial_tracking')
             
             if not financial_result.data:
                 raise ValueError(f"Financial record {financial_record_id} not found")
@@ -2168,10 +2385,10 @@ class POBreakdownDatabaseService:
                 'version': breakdown.version + 1
             }
             
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
+            self._drop_tree_index_for(breakdown_id)
             
             if result.data:
                 # Create audit record
@@ -2245,10 +2462,10 @@ class POBreakdownDatabaseService:
                 'version': breakdown.version + 1
             }
             
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
+            self._drop_tree_index_for(breakdown_id)
             
             if result.data:
                 # Create audit record
@@ -2297,10 +2514,9 @@ class POBreakdownDatabaseService:
                 return []
             
             # Fetch linked financial records
-            result = self.supabase.table('financial_tracking')\
+            result = await execute_async(self.supabase.table('financial_tracking')\
                 .select('*')\
-                .in_('id', financial_links)\
-                .execute()
+                .in_('id', financial_links), label='financial_tracking')
             
             return result.data or []
             
@@ -2342,11 +2558,10 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get PO breakdown totals
-            po_result = self.supabase.table(self.table_name)\
+            po_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
-                .eq('is_active', True)\
-                .execute()
+                .eq('is_active', True), label=self.table_name)
             
             po_breakdowns = po_result.data or []
             
@@ -2373,10 +2588,9 @@ class POBreakdownDatabaseService:
             data_sources = ['po_breakdown']
             
             if include_financial_tracking:
-                financial_result = self.supabase.table('financial_tracking')\
+                financial_result = await execute_async(self.supabase.table('financial_tracking')\
                     .select('*')\
-                    .eq('project_id', str(project_id))\
-                    .execute()
+                    .eq('project_id', str(project_id)), label='financial_tracking')
                 
                 financial_records = financial_result.data or []
                 
@@ -2496,19 +2710,17 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get unlinked financial records
-            financial_result = self.supabase.table('financial_tracking')\
+            financial_result = await execute_async(self.supabase.table('financial_tracking')\
                 .select('*')\
-                .eq('project_id', str(project_id))\
-                .execute()
+                .eq('project_id', str(project_id)), label='financial_tracking')
             
             financial_records = financial_result.data or []
             
             # Get existing breakdowns to check for links
-            po_result = self.supabase.table(self.table_name)\
+            po_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
-                .eq('is_active', True)\
-                .execute()
+                .eq('is_active', True), label=self.table_name)
             
             po_breakdowns = po_result.data or []
             
@@ -2726,11 +2938,10 @@ class POBreakdownDatabaseService:
             report_date = datetime.now()
             
             # 1. Get PO breakdown data
-            po_result = self.supabase.table(self.table_name)\
+            po_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
-                .eq('is_active', True)\
-                .execute()
+                .eq('is_active', True), label=self.table_name)
             
             po_breakdowns = po_result.data or []
             
@@ -2756,10 +2967,9 @@ class POBreakdownDatabaseService:
             }
             
             if config['include_financial_tracking']:
-                financial_result = self.supabase.table('financial_tracking')\
+                financial_result = await execute_async(self.supabase.table('financial_tracking')\
                     .select('*')\
-                    .eq('project_id', str(project_id))\
-                    .execute()
+                    .eq('project_id', str(project_id)), label='financial_tracking')
                 
                 financial_records = financial_result.data or []
                 
@@ -2798,10 +3008,9 @@ class POBreakdownDatabaseService:
             
             if config['include_change_requests']:
                 try:
-                    cr_result = self.supabase.table('change_requests')\
+                    cr_result = await execute_async(self.supabase.table('change_requests')\
                         .select('*')\
-                        .eq('project_id', str(project_id))\
-                        .execute()
+                        .eq('project_id', str(project_id)), label='change_requests')
                     
                     change_requests = cr_result.data or []
                     change_request_source['request_count'] = len(change_requests)
@@ -2832,10 +3041,9 @@ class POBreakdownDatabaseService:
             
             if config['include_budget_data']:
                 try:
-                    project_result = self.supabase.table('projects')\
+                    project_result = await execute_async(self.supabase.table('projects')\
                         .select('budget, allocated_budget')\
-                        .eq('id', str(project_id))\
-                        .execute()
+                        .eq('id', str(project_id)), label='projects')
                     
                     if project_result.data:
                         project_data = project_result.data[0]
@@ -3145,10 +3353,10 @@ class POBreakdownDatabaseService:
                     'updated_at': datetime.now().isoformat()
                 }
                 
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .update(update_data)\
-                    .eq('id', str(item_id))\
-                    .execute()
+                    .eq('id', str(item_id)), label=self.table_name)
+                self._drop_tree_index_for(item_id)
                 
                 if result.data:
                     # Create audit record
@@ -3215,10 +3423,10 @@ class POBreakdownDatabaseService:
                     'updated_at': datetime.now().isoformat()
                 }
                 
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .update(update_data)\
-                    .eq('id', str(breakdown_id))\
-                    .execute()
+                    .eq('id', str(breakdown_id)), label=self.table_name)
+                self._drop_tree_index_for(breakdown_id)
                 
                 if result.data:
                     # Create audit record
@@ -3281,13 +3489,13 @@ class POBreakdownDatabaseService:
             
             # Mark as having custom parent if parent changed
             if move_request.new_parent_id != current.parent_breakdown_id:
-                self.supabase.table(self.table_name)\
+                await execute_async(self.supabase.table(self.table_name)\
                     .update({
                         'has_custom_parent': True,
                         'updated_at': datetime.now().isoformat()
                     })\
-                    .eq('id', str(breakdown_id))\
-                    .execute()
+                    .eq('id', str(breakdown_id)), label=self.table_name)
+                self._drop_tree_index_for(breakdown_id)
                 
                 logger.info(f"Marked breakdown {breakdown_id} as having custom parent")
             
@@ -3432,12 +3640,13 @@ class POBreakdownDatabaseService:
                         'version': breakdown.version + 1
                     }
                     
-                    result = self.supabase.table(self.table_name)\
+                    result = await execute_async(self.supabase.table(self.table_name)\
                         .update(update_data)\
-                        .eq('id', str(breakdown_id))\
-                        .execute()
+                        .eq('id', str(breakdown_id)), label=self.table_name)
                     
                     if result.data:
+                        self._apply_move_to_tree_index(breakdown_id, sap_info.original_parent_id, result.data[0])
+                        
                         # Update children's hierarchy levels
                         await self._update_children_levels(breakdown_id, new_level)
                         
@@ -3517,24 +3726,11 @@ class POBreakdownDatabaseService:
         Returns:
             List of UUIDs representing the path from root to breakdown
         """
-        path = []
-        current_id = breakdown_id
-        
-        # Prevent infinite loops
-        max_iterations = MAX_HIERARCHY_DEPTH + 1
-        iterations = 0
-        
-        while current_id and iterations < max_iterations:
-            path.insert(0, current_id)
-            breakdown = await self.get_breakdown_by_id(current_id)
-            
-            if not breakdown or not breakdown.parent_breakdown_id:
-                break
-            
-            current_id = breakdown.parent_breakdown_id
-            iterations += 1
+        index = await self._get_tree_index_for_breakdown(breakdown_id)
+        if index is None:
+            return [breakdown_id]
         
-        return path
+        return index.path(breakdown_id)
     
     async def validate_custom_code(
         self,
@@ -3591,7 +3787,7 @@ class POBreakdownDatabaseService:
                 .eq('code', code)\
                 .eq('is_active', True)
             
-            result = query.execute()
+            result = await execute_async(query)
             
             conflicts = []
             if result.data:
@@ -3614,12 +3810,11 @@ class POBreakdownDatabaseService:
                 for i in range(1, 6):
                     suggested_code = f"{code}_{i}"
                     # Check if suggestion is available
-                    check_result = self.supabase.table(self.table_name)\
+                    check_result = await execute_async(self.supabase.table(self.table_name)\
                         .select('id')\
                         .eq('project_id', str(project_id))\
                         .eq('code', suggested_code)\
-                        .eq('is_active', True)\
-                        .execute()
+                        .eq('is_active', True), label=self.table_name)
                     
                     if not check_result.data:
                         suggestions.append(suggested_code)
@@ -3712,10 +3907,10 @@ class POBreakdownDatabaseService:
                         'version': current.version + 1
                     }
                     
-                    result = self.supabase.table(self.table_name)\
+                    result = await execute_async(self.supabase.table(self.table_name)\
                         .update(update_data)\
-                        .eq('id', str(breakdown_id))\
-                        .execute()
+                        .eq('id', str(breakdown_id)), label=self.table_name)
+                    self._drop_tree_index_for(breakdown_id)
                     
                     if result.data:
                         # Create audit record
@@ -3758,12 +3953,11 @@ class POBreakdownDatabaseService:
     
     async def _check_code_exists(self, project_id: UUID, code: str) -> bool:
         """Check if a code already exists in the project."""
-        result = self.supabase.table(self.table_name)\
+        result = await execute_async(self.supabase.table(self.table_name)\
             .select('id')\
             .eq('project_id', str(project_id))\
             .eq('code', code)\
-            .eq('is_active', True)\
-            .execute()
+            .eq('is_active', True), label=self.table_name)
         return len(result.data) > 0
     
     async def _create_version_record(
@@ -3803,52 +3997,85 @@ class POBreakdownDatabaseService:
             user_agent: Optional user agent string
         """
         try:
-            # Determine change type from changes if not provided
-            if not change_type:
-                if 'action' in changes:
-                    change_type = changes['action']
-                elif 'parent_breakdown_id' in changes:
-                    change_type = 'move'
-                elif 'custom_fields' in changes:
-                    change_type = 'custom_field_update'
-                elif 'tags' in changes:
-                    change_type = 'tag_update'
-                elif any(k in changes for k in ['planned_amount', 'committed_amount', 'actual_amount']):
-                    change_type = 'financial_update'
-                else:
-                    change_type = 'update'
-            
-            # Generate change summary if not provided
-            if not change_summary and changes:
-                changed_fields = [k for k in changes.keys() if k != 'action']
-                if changed_fields:
-                    change_summary = f"Updated fields: {', '.join(changed_fields[:5])}"
-                    if len(changed_fields) > 5:
-                        change_summary += f" and {len(changed_fields) - 5} more"
-            
-            version_data = {
-                'id': str(uuid4()),
-                'breakdown_id': str(breakdown_id),
-                'version_number': version_number,
-                'changes': changes,
-                'change_type': change_type,
-                'change_summary': change_summary,
-                'before_values': before_values or {},
-                'after_values': after_values or {},
-                'changed_by': str(user_id),
-                'changed_at': datetime.now().isoformat(),
-                'change_reason': change_reason,
-                'is_import': is_import,
-                'import_batch_id': str(import_batch_id) if import_batch_id else None,
-                'ip_address': ip_address,
-                'user_agent': user_agent
-            }
+            version_data = self._build_version_data(
+                breakdown_id=breakdown_id,
+                version_number=version_number,
+                changes=changes,
+                user_id=user_id,
+                change_type=change_type,
+                change_summary=change_summary,
+                before_values=before_values,
+                after_values=after_values,
+                change_reason=change_reason,
+                is_import=is_import,
+                import_batch_id=import_batch_id,
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
             
-            self.supabase.table(self.version_table).insert(version_data).execute()
-            logger.info(f"Created version record for breakdown {breakdown_id}, version {version_number}, type: {change_type}")
+            await execute_async(self.supabase.table(self.version_table).insert(version_data), label=self.version_table)
+            logger.info(f"Created version record for breakdown {breakdown_id}, version {version_number}, type: {version_data['change_type']}")
         except Exception as e:
             logger.warning(f"Failed to create version record for breakdown {breakdown_id}: {e}")
     
+    def _build_version_data(
+        self,
+        breakdown_id: UUID,
+        version_number: int,
+        changes: Dict[str, Any],
+        user_id: UUID,
+        change_type: Optional[str] = None,
+        change_summary: Optional[str] = None,
+        before_values: Optional[Dict[str, Any]] = None,
+        after_values: Optional[Dict[str, Any]] = None,
+        change_reason: Optional[str] = None,
+        is_import: bool = False,
+        import_batch_id: Optional[UUID] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a version record row; see ``_create_version_record`` for arguments."""
+        # Determine change type from changes if not provided
+        if not change_type:
+            if 'action' in changes:
+                change_type = changes['action']
+            elif 'parent_breakdown_id' in changes:
+                change_type = 'move'
+            elif 'custom_fields' in changes:
+                change_type = 'custom_field_update'
+            elif 'tags' in changes:
+                change_type = 'tag_update'
+            elif any(k in changes for k in ['planned_amount', 'committed_amount', 'actual_amount']):
+                change_type = 'financial_update'
+            else:
+                change_type = 'update'
+        
+        # Generate change summary if not provided
+        if not change_summary and changes:
+            changed_fields = [k for k in changes.keys() if k != 'action']
+            if changed_fields:
+                change_summary = f"Updated fields: {', '.join(changed_fields[:5])}"
+                if len(changed_fields) > 5:
+                    change_summary += f" and {len(changed_fields) - 5} more"
+        
+        return {
+            'id': str(uuid4()),
+            'breakdown_id': str(breakdown_id),
+            'version_number': version_number,
+            'changes': changes,
+            'change_type': change_type,
+            'change_summary': change_summary,
+            'before_values': before_values or {},
+            'after_values': after_values or {},
+            'changed_by': str(user_id),
+            'changed_at': datetime.now().isoformat(),
+            'change_reason': change_reason,
+            'is_import': is_import,
+            'import_batch_id': str(import_batch_id) if import_batch_id else None,
+            'ip_address': ip_address,
+            'user_agent': user_agent
+        }
+    
     def _apply_filters(self, query, filter_criteria: POBreakdownFilter):
         """
         Apply comprehensive filter criteria to a query.
@@ -4075,10 +4302,9 @@ class POBreakdownDatabaseService:
                 raise ValueError(f"PO breakdown {breakdown_id} not found")
             
             # Validate change request exists
-            cr_result = self.supabase.table('change_requests')\
+            cr_result = await execute_async(self.supabase.table('change_requests')\
                 .select('id, project_id, status')\
-                .eq('id', str(change_request_id))\
-                .execute()
+                .eq('id', str(change_request_id)), label='change_requests')
             
             if not cr_result.data:
                 raise ValueError(f"Change request {change_request_id} not found")
@@ -4098,12 +4324,11 @@ class POBreakdownDatabaseService:
                 raise ValueError(f"Invalid impact_type. Must be one of: {', '.join(valid_impact_types)}")
             
             # Check if link already exists
-            existing_link = self.supabase.table('change_request_po_links')\
+            existing_link = await execute_async(self.supabase.table('change_request_po_links')\
                 .select('id')\
                 .eq('change_request_id', str(change_request_id))\
                 .eq('po_breakdown_id', str(breakdown_id))\
-                .eq('impact_type', impact_type)\
-                .execute()
+                .eq('impact_type', impact_type), label='change_request_po_links')
             
             if existing_link.data:
                 raise ValueError(
@@ -4123,7 +4348,7 @@ class POBreakdownDatabaseService:
                 'created_at': datetime.now().isoformat()
             }
             
-            result = self.supabase.table('change_request_po_links').insert(link_data).execute()
+            result = await execute_async(self.supabase.table('change_request_po_links').insert(link_data), label='change_request_po_links')
             
             if not result.data:
                 raise Exception("Failed to create PO breakdown-change request link")
@@ -4209,7 +4434,7 @@ class POBreakdownDatabaseService:
             if impact_type:
                 query = query.eq('impact_type', impact_type)
             
-            result = query.execute()
+            result = await execute_async(query)
             
             if result.data:
                 # Trigger automatic financial impact assessment update
@@ -4264,10 +4489,9 @@ class POBreakdownDatabaseService:
             List of change request link details
         """
         try:
-            result = self.supabase.table('change_request_po_links')\
+            result = await execute_async(self.supabase.table('change_request_po_links')\
                 .select('*, change_requests(id, change_number, title, status, priority)')\
-                .eq('po_breakdown_id', str(breakdown_id))\
-                .execute()
+                .eq('po_breakdown_id', str(breakdown_id)), label='change_request_po_links')
             
             links = []
             for row in result.data:
@@ -4308,10 +4532,9 @@ class POBreakdownDatabaseService:
             List of PO breakdown link details
         """
         try:
-            result = self.supabase.table('change_request_po_links')\
+            result = await execute_async(self.supabase.table('change_request_po_links')\
                 .select('*, po_breakdowns(id, name, code, planned_amount, actual_amount, currency)')\
-                .eq('change_request_id', str(change_request_id))\
-                .execute()
+                .eq('change_request_id', str(change_request_id)), label='change_request_po_links')
             
             links = []
             for row in result.data:
@@ -4406,10 +4629,9 @@ class POBreakdownDatabaseService:
                 cost_breakdown['by_impact_type'][key] = str(cost_breakdown['by_impact_type'][key])
             
             # Check if change_impacts record exists
-            impacts_result = self.supabase.table('change_impacts')\
+            impacts_result = await execute_async(self.supabase.table('change_impacts')\
                 .select('id')\
-                .eq('change_request_id', str(change_request_id))\
-                .execute()
+                .eq('change_request_id', str(change_request_id)), label='change_impacts')
             
             impact_data = {
                 'direct_costs': str(total_cost_increase),
@@ -4420,26 +4642,24 @@ class POBreakdownDatabaseService:
             
             if impacts_result.data:
                 # Update existing record
-                self.supabase.table('change_impacts')\
+                await execute_async(self.supabase.table('change_impacts')\
                     .update(impact_data)\
-                    .eq('change_request_id', str(change_request_id))\
-                    .execute()
+                    .eq('change_request_id', str(change_request_id)), label='change_impacts')
             else:
                 # Create new record
                 impact_data['id'] = str(uuid4())
                 impact_data['change_request_id'] = str(change_request_id)
                 impact_data['created_at'] = datetime.now().isoformat()
                 
-                self.supabase.table('change_impacts').insert(impact_data).execute()
+                await execute_async(self.supabase.table('change_impacts').insert(impact_data), label='change_impacts')
             
             # Update the change request's estimated_cost_impact field
-            self.supabase.table('change_requests')\
+            await execute_async(self.supabase.table('change_requests')\
                 .update({
                     'estimated_cost_impact': str(net_impact),
                     'updated_at': datetime.now().isoformat()
                 })\
-                .eq('id', str(change_request_id))\
-                .execute()
+                .eq('id', str(change_request_id)), label='change_requests')
             
             logger.info(
                 f"Updated financial impact for change request {change_request_id}: "
@@ -4475,13 +4695,12 @@ class POBreakdownDatabaseService:
             List of POBreakdownVersion objects in reverse chronological order
         """
         try:
-            result = self.supabase.table(self.version_table)\
+            result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
                 .eq('breakdown_id', str(breakdown_id))\
                 .order('version_number', desc=True)\
                 .order('changed_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
+                .range(offset, offset + limit - 1), label=self.version_table)
             
             versions = []
             for row in result.data or []:
@@ -4532,10 +4751,9 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get all breakdown IDs for the project
-            breakdowns_result = self.supabase.table(self.table_name)\
+            breakdowns_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('id, name, code')\
-                .eq('project_id', str(project_id))\
-                .execute()
+                .eq('project_id', str(project_id)), label=self.table_name)
             
             breakdown_map = {
                 row['id']: {'name': row['name'], 'code': row.get('code')}
@@ -4561,9 +4779,8 @@ class POBreakdownDatabaseService:
                 query = query.in_('changed_by', [str(uid) for uid in user_ids])
             
             # Execute query with pagination
-            result = query.order('changed_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
+            result = await execute_async(query.order('changed_at', desc=True)\
+                .range(offset, offset + limit - 1))
             
             # Enrich with breakdown and user information
             audit_records = []
@@ -4664,10 +4881,9 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get all breakdown IDs for the project
-            breakdowns_result = self.supabase.table(self.table_name)\
+            breakdowns_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('id')\
-                .eq('project_id', str(project_id))\
-                .execute()
+                .eq('project_id', str(project_id)), label=self.table_name)
             
             breakdown_ids = [row['id'] for row in breakdowns_result.data or []]
             
@@ -4681,10 +4897,9 @@ class POBreakdownDatabaseService:
                 }
             
             # Get all version records
-            versions_result = self.supabase.table(self.version_table)\
+            versions_result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
-                .in_('breakdown_id', breakdown_ids)\
-                .execute()
+                .in_('breakdown_id', breakdown_ids), label=self.version_table)
             
             versions = versions_result.data or []
             
@@ -4713,10 +4928,9 @@ class POBreakdownDatabaseService:
             for v in recent_versions:
                 # Get breakdown name
                 breakdown_id = v['breakdown_id']
-                breakdown_result = self.supabase.table(self.table_name)\
+                breakdown_result = await execute_async(self.supabase.table(self.table_name)\
                     .select('name')\
-                    .eq('id', breakdown_id)\
-                    .execute()
+                    .eq('id', breakdown_id), label=self.table_name)
                 
                 breakdown_name = 'Unknown'
                 if breakdown_result.data:
@@ -4768,11 +4982,10 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get the target version
-            version_result = self.supabase.table(self.version_table)\
+            version_result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
                 .eq('breakdown_id', str(breakdown_id))\
-                .eq('version_number', version_number)\
-                .execute()
+                .eq('version_number', version_number), label=self.version_table)
             
             if not version_result.data:
                 raise ValueError(f"Version {version_number} not found for breakdown {breakdown_id}")
@@ -4805,10 +5018,10 @@ class POBreakdownDatabaseService:
             update_data['updated_at'] = datetime.now().isoformat()
             
             # Execute update
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
+            self._drop_tree_index_for(breakdown_id)
             
             if not result.data:
                 raise Exception("Failed to restore breakdown version")
@@ -4870,10 +5083,9 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get the breakdown (including inactive ones)
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
             
             if not result.data:
                 raise ValueError(f"Breakdown {breakdown_id} not found")
@@ -4893,10 +5105,10 @@ class POBreakdownDatabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            restore_result = self.supabase.table(self.table_name)\
+            restore_result = await execute_async(self.supabase.table(self.table_name)\
                 .update(update_data)\
-                .eq('id', str(breakdown_id))\
-                .execute()
+                .eq('id', str(breakdown_id)), label=self.table_name)
+            self._drop_tree_index_for(breakdown_id)
             
             if not restore_result.data:
                 raise Exception("Failed to restore breakdown")
@@ -4947,13 +5159,12 @@ class POBreakdownDatabaseService:
             List of soft-deleted POBreakdownResponse objects
         """
         try:
-            result = self.supabase.table(self.table_name)\
+            result = await execute_async(self.supabase.table(self.table_name)\
                 .select('*')\
                 .eq('project_id', str(project_id))\
                 .eq('is_active', False)\
                 .order('updated_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
+                .range(offset, offset + limit - 1), label=self.table_name)
             
             breakdowns = [self._map_to_response(row) for row in result.data or []]
             
@@ -5000,12 +5211,11 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get version history from database
-            result = self.supabase.table(self.version_table)\
+            result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
                 .eq('breakdown_id', str(breakdown_id))\
                 .order('changed_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
+                .range(offset, offset + limit - 1), label=self.version_table)
             
             if not result.data:
                 return []
@@ -5094,12 +5304,11 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get all version records
-            result = self.supabase.table(self.version_table)\
+            result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
                 .eq('breakdown_id', str(breakdown_id))\
                 .order('changed_at', desc=True)\
-                .limit(limit)\
-                .execute()
+                .limit(limit), label=self.version_table)
             
             field_history = []
             
@@ -5158,10 +5367,9 @@ class POBreakdownDatabaseService:
         """
         try:
             # Get all breakdown IDs for the project
-            breakdowns_result = self.supabase.table(self.table_name)\
+            breakdowns_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('id, name, code, is_active')\
-                .eq('project_id', str(project_id))\
-                .execute()
+                .eq('project_id', str(project_id)), label=self.table_name)
             
             breakdown_map = {
                 row['id']: {
@@ -5188,9 +5396,8 @@ class POBreakdownDatabaseService:
                 query = query.lte('changed_at', end_date.isoformat())
             
             # Execute query
-            result = query.order('changed_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
+            result = await execute_async(query.order('changed_at', desc=True)\
+                .range(offset, offset + limit - 1))
             
             deletion_records = []
             
@@ -5316,10 +5523,9 @@ class POBreakdownDatabaseService:
             breakdown_ids = config.breakdown_ids
             if not breakdown_ids and config.project_id:
                 # Get all breakdowns for project
-                result = self.supabase.table(self.table_name)\
+                result = await execute_async(self.supabase.table(self.table_name)\
                     .select('id')\
-                    .eq('project_id', str(config.project_id))\
-                    .execute()
+                    .eq('project_id', str(config.project_id)), label=self.table_name)
                 breakdown_ids = [UUID(row['id']) for row in result.data or []]
             
             if not breakdown_ids:
@@ -5336,10 +5542,9 @@ class POBreakdownDatabaseService:
                     continue
                 
                 # Get version history
-                versions_result = self.supabase.table(self.version_table)\
+                versions_result = await execute_async(self.supabase.table(self.version_table)\
                     .select('*')\
-                    .eq('breakdown_id', str(breakdown_id))\
-                    .execute()
+                    .eq('breakdown_id', str(breakdown_id)), label=self.version_table)
                 
                 versions = versions_result.data or []
                 
@@ -5561,10 +5766,9 @@ class POBreakdownDatabaseService:
             logger.info(f"Generating compliance report for project {config.project_id}")
             
             # Get all breakdowns for the project
-            breakdowns_result = self.supabase.table(self.table_name)\
+            breakdowns_result = await execute_async(self.supabase.table(self.table_name)\
                 .select('id, name, code, is_active')\
-                .eq('project_id', str(config.project_id))\
-                .execute()
+                .eq('project_id', str(config.project_id)), label=self.table_name)
             
             breakdown_ids = [row['id'] for row in breakdowns_result.data or []]
             total_breakdowns = len(breakdown_ids)
@@ -5573,12 +5777,11 @@ class POBreakdownDatabaseService:
                 raise ValueError(f"No breakdowns found for project {config.project_id}")
             
             # Get all version records for the period
-            versions_result = self.supabase.table(self.version_table)\
+            versions_result = await execute_async(self.supabase.table(self.version_table)\
                 .select('*')\
                 .in_('breakdown_id', breakdown_ids)\
                 .gte('changed_at', config.report_period_start.isoformat())\
-                .lte('changed_at', config.report_period_end.isoformat())\
-                .execute()
+                .lte('changed_at', config.report_period_end.isoformat()), label=self.version_table)
             
             versions = versions_result.data or []
             total_changes = len(versions)
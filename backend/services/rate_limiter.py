@@ -1,30 +1,93 @@
 """
 Rate Limiting Service for RAG Knowledge Base
-Implements rate limiting using slowapi library to prevent abuse
+Implements sliding-window-counter rate limiting to prevent abuse.
+
+Each key keeps two counters (current and previous fixed window) and the
+previous window is weighted by how much of it still overlaps the sliding
+window, so memory and CPU per request are constant regardless of the limit.
+With a Redis URL the counters live in Redis and are updated atomically by a
+Lua script, so limits hold across all worker processes.
 """
 
+import os
+import time
 import logging
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+from dataclasses import dataclass
 import asyncio
 
+# Try to import Redis for shared counters across workers
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    RedisError = Exception
+
 logger = logging.getLogger(__name__)
 
+REDIS_RETRY_SECONDS = 30  # Back-off before retrying Redis after an error
+
+# KEYS[1] = current window counter, KEYS[2] = previous window counter
+# ARGV[1] = limit, ARGV[2] = weight of the previous window, ARGV[3] = counter TTL
+# Returns {allowed, estimated count after this request}
+SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimated = previous * tonumber(ARGV[2]) + current
+if estimated >= tonumber(ARGV[1]) then
+    return {0, tostring(estimated)}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {1, tostring(estimated + 1)}
+"""
+
 
 class RateLimitExceeded(Exception):
     """Exception raised when rate limit is exceeded"""
     pass
 
 
+@dataclass
+class RateLimitDecision:
+    """Outcome of a single rate limit check"""
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: int  # Unix time when the current window ends
+
+
+class _WindowCounter:
+    """Request counts for the current and previous fixed window of one key"""
+
+    __slots__ = ("window", "current", "previous")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, window: int) -> None:
+        """Advance to the given window, carrying the count over if adjacent."""
+        if window != self.window:
+            self.previous = self.current if window == self.window + 1 else 0
+            self.current = 0
+            self.window = window
+
+
 class RateLimiter:
     """
     Rate limiter for API endpoints.
 
     Features:
     - Configurable limits per user/time window
-    - Sliding window rate limiting
+    - Sliding window counter with constant memory per user
     - Different limits for different user roles
+    - Optional Redis backend shared by all workers
     - Automatic cleanup of old entries
     """
 
@@ -32,14 +95,17 @@ class RateLimiter:
         self,
         default_limit: int = 100,  # requests per hour
         window_seconds: int = 3600,  # 1 hour window
-        cleanup_interval: int = 300  # 5 minutes cleanup
+        cleanup_interval: int = 300,  # 5 minutes cleanup
+        redis_url: Optional[str] = None,
+        key_prefix: str = "ratelimit"
     ):
         self.default_limit = default_limit
         self.window_seconds = window_seconds
         self.cleanup_interval = cleanup_interval
+        self.key_prefix = key_prefix
 
-        # Storage: user_id -> list of request timestamps
-        self.requests: Dict[str, list] = defaultdict(list)
+        # Storage: user_id -> window counters (used without Redis or as fallback)
+        self.counters: Dict[str, _WindowCounter] = {}
 
         # Role-based limits
         self.role_limits = {
@@ -49,6 +115,13 @@ class RateLimiter:
             "anonymous": 10  # Lower limit for anonymous users
         }
 
+        # Redis backend (connected lazily on first use)
+        self.redis_url = redis_url
+        self._redis = None
+        self._redis_script = None
+        self._redis_retry_at = 0.0
+        self._redis_connect_lock = asyncio.Lock()
+
         # Start cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
 
@@ -58,7 +131,7 @@ class RateLimiter:
             self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
 
     async def stop(self):
-        """Stop the cleanup task"""
+        """Stop the cleanup task and close the Redis connection"""
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
@@ -66,6 +139,13 @@ class RateLimiter:
             except asyncio.CancelledError:
                 pass
             self._cleanup_task = None
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                pass
+            self._redis = None
+            self._redis_script = None
 
     def get_limit_for_user(self, user_id: str, role: str = "user") -> int:
         """
@@ -80,6 +160,40 @@ class RateLimiter:
         """
         return self.role_limits.get(role, self.default_limit)
 
+    async def acquire(self, user_id: str, role: str = "user") -> RateLimitDecision:
+        """
+        Count a request if it is within the limit and report the outcome.
+
+        Args:
+            user_id: User identifier
+            role: User role
+
+        Returns:
+            RateLimitDecision with the limit, remaining requests and reset time
+        """
+        limit = self.get_limit_for_user(user_id, role)
+        now = time.time()
+        window, weight = self._window_position(now)
+
+        estimated = None
+        allowed = False
+        redis_client = await self._get_redis()
+        if redis_client is not None:
+            try:
+                allowed, estimated = await self._acquire_redis(user_id, limit, window, weight)
+            except RedisError as e:
+                self._disable_redis(e)
+
+        if estimated is None:
+            allowed, estimated = self._acquire_local(user_id, limit, window, weight)
+
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(0, int(limit - estimated)),
+            reset_at=int((window + 1) * self.window_seconds)
+        )
+
     async def check_rate_limit(self, user_id: str, role: str = "user") -> bool:
         """
         Check if request is within rate limits.
@@ -94,22 +208,12 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: If rate limit is exceeded
         """
-        limit = self.get_limit_for_user(user_id, role)
-
-        # Get current request timestamps for user
-        user_requests = self.requests[user_id]
-
-        # Remove old requests outside the time window
-        cutoff_time = datetime.now() - timedelta(seconds=self.window_seconds)
-        user_requests[:] = [ts for ts in user_requests if ts > cutoff_time]
-
-        # Check if under limit
-        if len(user_requests) >= limit:
+        decision = await self.acquire(user_id, role)
+        if not decision.allowed:
             logger.warning(f"Rate limit exceeded for user {user_id} (role: {role})")
-            raise RateLimitExceeded(f"Rate limit exceeded. Maximum {limit} requests per {self.window_seconds} seconds.")
-
-        # Add current request
-        user_requests.append(datetime.now())
+            raise RateLimitExceeded(
+                f"Rate limit exceeded. Maximum {decision.limit} requests per {self.window_seconds} seconds."
+            )
         return True
 
     async def get_remaining_requests(self, user_id: str, role: str = "user") -> int:
@@ -124,13 +228,24 @@ class RateLimiter:
             Number of remaining requests
         """
         limit = self.get_limit_for_user(user_id, role)
-        user_requests = self.requests[user_id]
-
-        # Clean old requests
-        cutoff_time = datetime.now() - timedelta(seconds=self.window_seconds)
-        user_requests[:] = [ts for ts in user_requests if ts > cutoff_time]
+        window, weight = self._window_position(time.time())
 
-        return max(0, limit - len(user_requests))
+        redis_client = await self._get_redis()
+        if redis_client is not None:
+            try:
+                current, previous = await redis_client.mget(
+                    self._redis_key(user_id, window), self._redis_key(user_id, window - 1)
+                )
+                estimated = int(previous or 0) * weight + int(current or 0)
+                return max(0, int(limit - estimated))
+            except RedisError as e:
+                self._disable_redis(e)
+
+        counter = self.counters.get(user_id)
+        if counter is None:
+            return limit
+        counter.roll(window)
+        return max(0, int(limit - (counter.previous * weight + counter.current)))
 
     async def reset_user_limit(self, user_id: str):
         """
@@ -139,32 +254,111 @@ class RateLimiter:
         Args:
             user_id: User identifier
         """
-        if user_id in self.requests:
-            del self.requests[user_id]
-            logger.info(f"Rate limit reset for user {user_id}")
+        self.counters.pop(user_id, None)
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get rate limiting statistics"""
-        total_users = len(self.requests)
-        total_requests = sum(len(requests) for requests in self.requests.values())
+        redis_client = await self._get_redis()
+        if redis_client is not None:
+            window, _ = self._window_position(time.time())
+            try:
+                await redis_client.delete(
+                    self._redis_key(user_id, window), self._redis_key(user_id, window - 1)
+                )
+            except RedisError as e:
+                self._disable_redis(e)
 
-        # Clean all old requests for accurate stats
-        cutoff_time = datetime.now() - timedelta(seconds=self.window_seconds)
-        cleaned_requests = 0
+        logger.info(f"Rate limit reset for user {user_id}")
 
-        for user_requests in self.requests.values():
-            old_count = len(user_requests)
-            user_requests[:] = [ts for ts in user_requests if ts > cutoff_time]
-            cleaned_requests += old_count - len(user_requests)
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiting statistics (local counters only)"""
+        window, weight = self._window_position(time.time())
+        total_active = 0.0
+
+        for counter in self.counters.values():
+            counter.roll(window)
+            total_active += counter.previous * weight + counter.current
 
         return {
-            "total_users": total_users,
-            "total_active_requests": total_requests - cleaned_requests,
+            "total_users": len(self.counters),
+            "total_active_requests": int(total_active),
             "default_limit": self.default_limit,
             "window_seconds": self.window_seconds,
-            "role_limits": self.role_limits.copy()
+            "role_limits": self.role_limits.copy(),
+            "backend": "redis" if self._redis is not None else "memory"
         }
 
+    def _window_position(self, now: float):
+        """Return the current window index and the weight of the previous window."""
+        window, offset = divmod(now, self.window_seconds)
+        return int(window), 1.0 - offset / self.window_seconds
+
+    def _acquire_local(self, user_id: str, limit: int, window: int, weight: float):
+        """In-process sliding window counter."""
+        counter = self.counters.get(user_id)
+        if counter is None:
+            counter = self.counters[user_id] = _WindowCounter(window)
+        counter.roll(window)
+
+        estimated = counter.previous * weight + counter.current
+        if estimated >= limit:
+            return False, estimated
+        counter.current += 1
+        return True, estimated + 1
+
+    async def _acquire_redis(self, user_id: str, limit: int, window: int, weight: float):
+        """Shared sliding window counter, updated atomically in Redis."""
+        allowed, estimated = await self._redis_script(
+            keys=[self._redis_key(user_id, window), self._redis_key(user_id, window - 1)],
+            args=[limit, weight, self.window_seconds * 2]
+        )
+        return bool(int(allowed)), float(estimated)
+
+    def _redis_key(self, user_id: str, window: int) -> str:
+        # Hash tag keeps both windows of a user in one cluster slot
+        return f"{self.key_prefix}:{{{user_id}}}:{window}"
+
+    async def _get_redis(self):
+        """Return the Redis client, connecting on first use; None if unavailable."""
+        if not self.redis_url or not REDIS_AVAILABLE:
+            return None
+        if self._redis is not None:
+            return self._redis
+
+        async with self._redis_connect_lock:
+            # Another request may have connected (or failed) while we waited
+            if self._redis is not None:
+                return self._redis
+            if time.time() < self._redis_retry_at:
+                return None
+
+            client = None
+            try:
+                client = aioredis.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5
+                )
+                await client.ping()
+                self._redis_script = client.register_script(SLIDING_WINDOW_SCRIPT)
+                self._redis = client
+                logger.info("Redis rate limit backend initialized")
+            except Exception as e:
+                if client is not None:
+                    try:
+                        await client.aclose()
+                    except Exception:
+                        pass
+                self._disable_redis(e)
+            return self._redis
+
+    def _disable_redis(self, error: Exception) -> None:
+        """Fall back to in-process counters until the retry back-off expires."""
+        logger.warning(f"Redis rate limit backend unavailable: {error}. Using in-memory limits.")
+        self._redis = None
+        self._redis_script = None
+        self._redis_retry_at = time.time() + REDIS_RETRY_SECONDS
+
     async def _periodic_cleanup(self):
         """Periodically clean up old request records"""
         while True:
@@ -177,21 +371,22 @@ class RateLimiter:
                 logger.error(f"Error during rate limit cleanup: {str(e)}")
 
     async def _cleanup_old_requests(self):
-        """Remove old request records"""
-        cutoff_time = datetime.now() - timedelta(seconds=self.window_seconds)
-        cleaned_count = 0
+        """Remove counters that no longer overlap the sliding window"""
+        window, _ = self._window_position(time.time())
+        stale = [
+            user_id for user_id, counter in self.counters.items()
+            if counter.window < window - 1
+        ]
 
-        for user_requests in self.requests.values():
-            old_count = len(user_requests)
-            user_requests[:] = [ts for ts in user_requests if ts > cutoff_time]
-            cleaned_count += old_count - len(user_requests)
+        for user_id in stale:
+            del self.counters[user_id]
 
-        if cleaned_count > 0:
-            logger.debug(f"Cleaned up {cleaned_count} old rate limit records")
+        if stale:
+            logger.debug(f"Cleaned up {len(stale)} idle rate limit counters")
 
 
-# Global rate limiter instance
-rate_limiter = RateLimiter()
+# Global rate limiter instance (shared across workers when REDIS_URL is set)
+rate_limiter = RateLimiter(redis_url=os.getenv("REDIS_URL"))
 
 
 async def check_user_rate_limit(user_id: str, role: str = "user") -> bool:
@@ -222,4 +417,4 @@ async def get_user_remaining_requests(user_id: str, role: str = "user") -> int:
     Returns:
         Number of remaining requests
     """
-    return await rate_limiter.get_remaining_requests(user_id, role)
\ No newline at end of file
+    return await rate_limiter.get_remaining_requests(user_id, role)
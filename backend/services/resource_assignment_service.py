@@ -22,6 +22,9 @@ from models.schedule import (
     ResourceAssignmentCreate, ResourceAssignmentResponse,
     ResourceUtilizationReport
 )
+from services.resource_load_profile import (
+    FULL_ALLOCATION, ResourceLoadProfile, build_load_profiles
+)
 
 logger = logging.getLogger(__name__)
 
@@ -170,36 +173,15 @@ class ResourceAssignmentService:
             assignments = assignments_result.data
             
             # Filter by date range if specified
-            if date_range_start or date_range_end:
-                filtered_assignments = []
-                for assignment in assignments:
-                    assign_start = date.fromisoformat(assignment["assignment_start_date"])
-                    assign_end = date.fromisoformat(assignment["assignment_end_date"])
-                    
-                    # Check if assignment overlaps with date range
-                    if date_range_start and assign_end < date_range_start:
-                        continue
-                    if date_range_end and assign_start > date_range_end:
-                        continue
-                    
-                    filtered_assignments.append(assignment)
-                
-                assignments = filtered_assignments
+            assignments = self._filter_assignments_by_date_range(
+                assignments, date_range_start, date_range_end
+            )
             
-            # Group assignments by resource and detect conflicts
+            # Build every resource's daily load in one pass and detect conflicts
             conflicts = []
-            resource_assignments = {}
-            
-            for assignment in assignments:
-                resource_id = assignment["resource_id"]
-                if resource_id not in resource_assignments:
-                    resource_assignments[resource_id] = []
-                resource_assignments[resource_id].append(assignment)
-            
-            # Check each resource for conflicts
-            for resource_id, resource_assigns in resource_assignments.items():
+            for resource_key, profile in build_load_profiles(assignments).items():
                 resource_conflicts = await self._detect_resource_specific_conflicts(
-                    resource_id, resource_assigns
+                    resource_key, assignments, profile=profile
                 )
                 conflicts.extend(resource_conflicts)
             
@@ -241,6 +223,7 @@ class ResourceAssignmentService:
                 return {"error": "No tasks found for schedule"}
             
             tasks = tasks_result.data
+            tasks_by_id = {task["id"]: task for task in tasks}
             
             # Generate leveling suggestions
             suggestions = []
@@ -248,13 +231,13 @@ class ResourceAssignmentService:
             for conflict in conflicts:
                 if conflict["type"] == ResourceConflictType.OVERALLOCATION.value:
                     # Suggest reducing allocation or splitting tasks
-                    suggestion = await self._generate_overallocation_suggestion(conflict, tasks)
+                    suggestion = await self._generate_overallocation_suggestion(conflict, tasks_by_id)
                     if suggestion:
                         suggestions.append(suggestion)
                 
                 elif conflict["type"] == ResourceConflictType.DOUBLE_BOOKING.value:
                     # Suggest rescheduling one of the conflicting tasks
-                    suggestion = await self._generate_rescheduling_suggestion(conflict, tasks)
+                    suggestion = await self._generate_rescheduling_suggestion(conflict, tasks_by_id)
                     if suggestion:
                         suggestions.append(suggestion)
             
@@ -304,24 +287,11 @@ class ResourceAssignmentService:
             assignments = assignments_result.data or []
             
             # Filter by date range if specified
-            if date_range_start or date_range_end:
-                filtered_assignments = []
-                for assignment in assignments:
-                    assign_start = date.fromisoformat(assignment["assignment_start_date"])
-                    assign_end = date.fromisoformat(assignment["assignment_end_date"])
-                    
-                    # Check if assignment overlaps with date range
-                    if date_range_start and assign_end < date_range_start:
-                        continue
-                    if date_range_end and assign_start > date_range_end:
-                        continue
-                    
-                    filtered_assignments.append(assignment)
-                
-                assignments = filtered_assignments
+            assignments = self._filter_assignments_by_date_range(
+                assignments, date_range_start, date_range_end
+            )
             
             # Calculate utilization metrics
-            total_allocation = 0
             total_planned_hours = 0.0
             total_actual_hours = 0.0
             conflicts = []
@@ -343,12 +313,22 @@ class ResourceAssignmentService:
                     updated_at=datetime.utcnow()
                 ))
                 
-                total_allocation += assignment["allocation_percentage"]
                 if assignment.get("planned_hours"):
                     total_planned_hours += assignment["planned_hours"]
                 if assignment.get("actual_hours"):
                     total_actual_hours += assignment["actual_hours"]
             
+            # Time-phased load of this resource over the reporting window
+            profile = build_load_profiles(
+                [{**assignment, "resource_id": str(resource_id)} for assignment in assignments]
+            ).get(str(resource_id))
+            window_start = date_range_start or (profile.origin if profile else None)
+            window_end = date_range_end or (profile.end_date if profile else None)
+            window_days = (window_end - window_start).days + 1 if profile else 0
+            
+            # Peak concurrent allocation on any day of the window
+            total_allocation = profile.peak() if profile else 0
+            
             # Calculate utilization percentage
             resource_capacity = resource_data.get("capacity", 40)  # Default 40 hours/week
             resource_availability = resource_data.get("availability", 100)  # Default 100%
@@ -356,19 +336,24 @@ class ResourceAssignmentService:
             available_capacity = resource_capacity * (resource_availability / 100.0)
             
             # Calculate utilization based on planned hours or allocation percentage
-            if total_planned_hours > 0:
-                utilization_percentage = (total_planned_hours / available_capacity) * 100
+            if total_planned_hours > 0 and available_capacity > 0 and window_days > 0:
+                # Planned hours against the weekly capacity over the window
+                utilization_percentage = (total_planned_hours / (available_capacity * window_days / 7.0)) * 100
+            elif profile:
+                # Average daily allocation over the window
+                utilization_percentage = profile.average(window_start, window_end)
             else:
-                # Estimate based on allocation percentages (rough calculation)
-                utilization_percentage = min(total_allocation, 100)
-            
-            # Detect conflicts for this resource
-            resource_conflicts = await self.detect_resource_conflicts(
-                schedule_id=None,  # Check across all schedules
-                resource_id=resource_id,
-                date_range_start=date_range_start,
-                date_range_end=date_range_end
-            )
+                utilization_percentage = 0.0
+            
+            # Detect conflicts for this resource from the same load profile
+            resource_conflicts = []
+            if profile:
+                resource_conflicts = await self._detect_resource_specific_conflicts(
+                    str(resource_id),
+                    assignments,
+                    profile=profile,
+                    resource_info=resource_data
+                )
             
             conflict_descriptions = [
                 f"{conflict['type']}: {conflict['description']}" 
@@ -739,92 +724,118 @@ class ResourceAssignmentService:
             updated_at=datetime.fromisoformat(assignment_data["updated_at"].replace('Z', '+00:00'))
         )
     
+    def _filter_assignments_by_date_range(
+        self,
+        assignments: List[Dict[str, Any]],
+        date_range_start: Optional[date],
+        date_range_end: Optional[date]
+    ) -> List[Dict[str, Any]]:
+        """Keep assignments overlapping the date range (ISO dates compare as strings)."""
+        if not (date_range_start or date_range_end):
+            return assignments
+        
+        range_start = date_range_start.isoformat() if date_range_start else None
+        range_end = date_range_end.isoformat() if date_range_end else None
+        return [
+            assignment for assignment in assignments
+            if not (range_start and assignment["assignment_end_date"][:10] < range_start)
+            and not (range_end and assignment["assignment_start_date"][:10] > range_end)
+        ]
+    
     async def _detect_resource_specific_conflicts(
         self,
         resource_id: str,
-        assignments: List[Dict[str, Any]]
+        assignments: List[Dict[str, Any]],
+        profile: Optional[ResourceLoadProfile] = None,
+        resource_info: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Detect conflicts for a specific resource.
         
+        Over-allocation is reported per interval of consecutive days on which
+        the resource's daily load exceeds 100%; double bookings are found with
+        a sweep over the assignments in start order.
+        
         Args:
             resource_id: ID of the resource
-            assignments: List of assignments for the resource
+            assignments: Assignment records; with a profile, the list it indexes into
+            profile: Optional prebuilt load profile of the resource
+            resource_info: Optional resource record (defaults to the joined "resources")
             
         Returns:
             List of conflicts detected
         """
         conflicts = []
         
-        if not assignments:
+        if profile is None:
+            profile = build_load_profiles(
+                [{**assignment, "resource_id": str(resource_id)} for assignment in assignments]
+            ).get(str(resource_id))
+        if profile is None:
             return conflicts
         
         # Get resource capacity information
-        resource_info = assignments[0]["resources"]  # All assignments have same resource
-        resource_capacity = resource_info.get("capacity", 40)
-        resource_availability = resource_info.get("availability", 100)
+        resource_info = resource_info or assignments[profile.assignment_indices[0]]["resources"]
         
-        # Check for overallocation
-        total_allocation = sum(assignment["allocation_percentage"] for assignment in assignments)
-        
-        if total_allocation > 100:
+        # Check for overallocation on each day
+        for interval in profile.overallocations(FULL_ALLOCATION):
+            peak_allocation = self._allocation_value(interval.peak_allocation)
             conflicts.append({
                 "type": ResourceConflictType.OVERALLOCATION.value,
                 "resource_id": resource_id,
                 "resource_name": resource_info["name"],
-                "total_allocation": total_allocation,
-                "excess_allocation": total_allocation - 100,
-                "description": f"Resource {resource_info['name']} is overallocated at {total_allocation}%",
-                "affected_tasks": [assignment["task_id"] for assignment in assignments],
-                "severity": "high" if total_allocation > 150 else "medium"
+                "total_allocation": peak_allocation,
+                "excess_allocation": peak_allocation - 100,
+                "overallocation_start": interval.start.isoformat(),
+                "overallocation_end": interval.end.isoformat(),
+                "overallocation_days": interval.days,
+                "description": f"Resource {resource_info['name']} is overallocated at {peak_allocation}% from {interval.start.isoformat()} to {interval.end.isoformat()}",
+                "affected_tasks": [assignments[i]["task_id"] for i in profile.assignments_during(interval)],
+                "severity": "high" if peak_allocation > 150 else "medium"
             })
         
         # Check for date overlaps (double booking)
-        for i, assignment1 in enumerate(assignments):
-            for assignment2 in assignments[i+1:]:
-                start1 = date.fromisoformat(assignment1["assignment_start_date"])
-                end1 = date.fromisoformat(assignment1["assignment_end_date"])
-                start2 = date.fromisoformat(assignment2["assignment_start_date"])
-                end2 = date.fromisoformat(assignment2["assignment_end_date"])
-                
-                # Check for overlap
-                if start1 <= end2 and start2 <= end1:
-                    overlap_start = max(start1, start2)
-                    overlap_end = min(end1, end2)
-                    overlap_days = (overlap_end - overlap_start).days + 1
-                    
-                    combined_allocation = assignment1["allocation_percentage"] + assignment2["allocation_percentage"]
-                    
-                    if combined_allocation > 100:
-                        conflicts.append({
-                            "type": ResourceConflictType.DOUBLE_BOOKING.value,
-                            "resource_id": resource_id,
-                            "resource_name": resource_info["name"],
-                            "task1_id": assignment1["task_id"],
-                            "task1_name": assignment1["tasks"]["name"],
-                            "task2_id": assignment2["task_id"],
-                            "task2_name": assignment2["tasks"]["name"],
-                            "overlap_start": overlap_start.isoformat(),
-                            "overlap_end": overlap_end.isoformat(),
-                            "overlap_days": overlap_days,
-                            "combined_allocation": combined_allocation,
-                            "description": f"Resource {resource_info['name']} has overlapping assignments with {combined_allocation}% allocation",
-                            "severity": "high" if combined_allocation > 150 else "medium"
-                        })
+        for first, second, overlap_start, overlap_end in profile.overlapping_pairs():
+            assignment1 = assignments[first]
+            assignment2 = assignments[second]
+            combined_allocation = assignment1["allocation_percentage"] + assignment2["allocation_percentage"]
+            
+            if combined_allocation > 100:
+                conflicts.append({
+                    "type": ResourceConflictType.DOUBLE_BOOKING.value,
+                    "resource_id": resource_id,
+                    "resource_name": resource_info["name"],
+                    "task1_id": assignment1["task_id"],
+                    "task1_name": assignment1["tasks"]["name"],
+                    "task2_id": assignment2["task_id"],
+                    "task2_name": assignment2["tasks"]["name"],
+                    "overlap_start": overlap_start.isoformat(),
+                    "overlap_end": overlap_end.isoformat(),
+                    "overlap_days": (overlap_end - overlap_start).days + 1,
+                    "combined_allocation": combined_allocation,
+                    "description": f"Resource {resource_info['name']} has overlapping assignments with {combined_allocation}% allocation",
+                    "severity": "high" if combined_allocation > 150 else "medium"
+                })
         
         return conflicts
     
+    @staticmethod
+    def _allocation_value(allocation: float):
+        """Round float load sums back to the int percentages they were built from."""
+        rounded = round(allocation, 6)
+        return int(rounded) if float(rounded).is_integer() else rounded
+    
     async def _generate_overallocation_suggestion(
         self,
         conflict: Dict[str, Any],
-        tasks: List[Dict[str, Any]]
+        tasks: Dict[str, Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
         Generate suggestion for resolving overallocation conflict.
         
         Args:
             conflict: Conflict information
-            tasks: List of all tasks in the schedule
+            tasks: Tasks of the schedule by ID
             
         Returns:
             Suggestion dictionary or None
@@ -839,7 +850,7 @@ class ResourceAssignmentService:
             # Find tasks that could have reduced allocation
             reduction_candidates = []
             for task_id in affected_task_ids:
-                task = next((t for t in tasks if t["id"] == task_id), None)
+                task = tasks.get(task_id)
                 if task:
                     reduction_candidates.append({
                         "task_id": task_id,
@@ -855,7 +866,11 @@ class ResourceAssignmentService:
             return {
                 "type": "reduce_allocation",
                 "conflict_id": conflict.get("resource_id"),
-                "description": f"Reduce allocation by {excess_allocation}% across tasks",
+                "description": (
+                    f"Reduce allocation by {excess_allocation}% across tasks"
+                    + (f" between {conflict['overallocation_start']} and {conflict['overallocation_end']}"
+                       if conflict.get("overallocation_start") else "")
+                ),
                 "suggested_actions": [
                     {
                         "action": "reduce_allocation",
@@ -885,14 +900,14 @@ class ResourceAssignmentService:
     async def _generate_rescheduling_suggestion(
         self,
         conflict: Dict[str, Any],
-        tasks: List[Dict[str, Any]]
+        tasks: Dict[str, Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
         Generate suggestion for resolving double booking conflict.
         
         Args:
             conflict: Conflict information
-            tasks: List of all tasks in the schedule
+            tasks: Tasks of the schedule by ID
             
         Returns:
             Suggestion dictionary or None
@@ -906,14 +921,15 @@ class ResourceAssignmentService:
                 return None
             
             # Find the conflicting tasks
-            task1 = next((t for t in tasks if t["id"] == task1_id), None)
-            task2 = next((t for t in tasks if t["id"] == task2_id), None)
+            task1 = tasks.get(task1_id)
+            task2 = tasks.get(task2_id)
             
             if not task1 or not task2:
                 return None
             
             # Determine which task should be rescheduled (prefer lower priority)
-            task1_priority = priority_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+            priority_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+            task1_priority = priority_order.get(task1.get("priority", "medium"), 1)
             task2_priority = priority_order.get(task2.get("priority", "medium"), 1)
             
             primary_task = task1 if task1_priority >= task2_priority else task2
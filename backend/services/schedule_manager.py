@@ -24,6 +24,9 @@ from models.schedule import (
     TaskCreate, TaskUpdate, TaskResponse, TaskProgressUpdate,
     TaskStatus, ScheduleWithTasksResponse, TaskHierarchyResponse,
 )
+from services.hierarchy_rollup import (
+    READ_BATCH_SIZE, effort_weighted_progress, fetch_all, iter_batches, roll_up, write_changes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -489,31 +492,8 @@ class ScheduleManager:
             
             existing_task = existing_result.data[0]
             
-            # Validate status transition
-            current_status = TaskStatus(existing_task["status"])
-            new_status = progress_data.status
-            
-            if not self._is_valid_status_transition(current_status, new_status):
-                raise ValueError(f"Invalid status transition from {current_status.value} to {new_status.value}")
-            
-            # Prepare update data
-            update_data = {
-                "progress_percentage": progress_data.progress_percentage,
-                "status": progress_data.status.value,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            if progress_data.actual_start_date:
-                update_data["actual_start_date"] = progress_data.actual_start_date.isoformat()
-            
-            if progress_data.actual_end_date:
-                update_data["actual_end_date"] = progress_data.actual_end_date.isoformat()
-            
-            if progress_data.actual_effort_hours is not None:
-                update_data["actual_effort_hours"] = progress_data.actual_effort_hours
-                # Update remaining effort
-                planned_effort = existing_task.get("planned_effort_hours", 0) or 0
-                update_data["remaining_effort_hours"] = max(0, planned_effort - progress_data.actual_effort_hours)
+            # Validate status transition and prepare update data
+            update_data = self._build_progress_update(existing_task, progress_data)
             
             # Update task
             result = self.db.table("tasks").update(update_data).eq("id", str(task_id)).execute()
@@ -555,23 +535,7 @@ class ScheduleManager:
             if not children_result.data:
                 return 0.0
             
-            children = children_result.data
-            
-            # Calculate effort-weighted progress
-            total_weighted_progress = 0.0
-            total_effort = 0.0
-            
-            for child in children:
-                progress = child.get("progress_percentage", 0)
-                effort = child.get("planned_effort_hours", 1) or 1  # Default to 1 to avoid division by zero
-                
-                total_weighted_progress += progress * effort
-                total_effort += effort
-            
-            if total_effort == 0:
-                return 0.0
-            
-            return round(total_weighted_progress / total_effort, 2)
+            return effort_weighted_progress(children_result.data)
             
         except Exception as e:
             logger.error(f"Error calculating rollup progress for task {parent_task_id}: {e}")
@@ -701,36 +665,85 @@ class ScheduleManager:
         
         return new_status in valid_transitions.get(current_status, [])
     
+    def _build_progress_update(
+        self,
+        existing_task: Dict[str, Any],
+        progress_data: TaskProgressUpdate
+    ) -> Dict[str, Any]:
+        """
+        Validate a progress update against the task's current state and build the update fields.
+        
+        Args:
+            existing_task: Current task row
+            progress_data: Progress update data
+            
+        Returns:
+            Dict of task fields to update
+            
+        Raises:
+            ValueError: If the status transition is not allowed
+        """
+        current_status = TaskStatus(existing_task["status"])
+        new_status = progress_data.status
+        
+        if not self._is_valid_status_transition(current_status, new_status):
+            raise ValueError(f"Invalid status transition from {current_status.value} to {new_status.value}")
+        
+        update_data = {
+            "progress_percentage": progress_data.progress_percentage,
+            "status": progress_data.status.value,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+        
+        if progress_data.actual_start_date:
+            update_data["actual_start_date"] = progress_data.actual_start_date.isoformat()
+        
+        if progress_data.actual_end_date:
+            update_data["actual_end_date"] = progress_data.actual_end_date.isoformat()
+        
+        if progress_data.actual_effort_hours is not None:
+            update_data["actual_effort_hours"] = progress_data.actual_effort_hours
+            # Update remaining effort
+            planned_effort = existing_task.get("planned_effort_hours", 0) or 0
+            update_data["remaining_effort_hours"] = max(0, planned_effort - progress_data.actual_effort_hours)
+        
+        return update_data
+    
+    @staticmethod
+    def _task_rollup_fields(children: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parent task fields derived from its children's progress."""
+        rollup_progress = effort_weighted_progress(children)
+        fields: Dict[str, Any] = {"progress_percentage": int(rollup_progress)}
+        
+        # Update status based on progress
+        if rollup_progress == 100:
+            fields["status"] = TaskStatus.COMPLETED.value
+        elif rollup_progress > 0:
+            fields["status"] = TaskStatus.IN_PROGRESS.value
+        
+        return fields
+    
     async def _update_parent_progress_rollup(self, parent_task_id: UUID) -> None:
         """
         Update parent task progress based on child task completion.
         
+        Only the parent's ancestor chain and the direct children of each
+        ancestor are loaded; the chain is recalculated with the same bottom-up
+        roll_up pass as bulk_update_task_progress and only the rolled-up
+        fields are written back.
+        
         Args:
             parent_task_id: ID of the parent task to update
         """
         try:
-            # Calculate rollup progress
-            rollup_progress = self.calculate_task_rollup_progress(parent_task_id)
-            
-            # Update parent task progress
-            update_data = {
-                "progress_percentage": int(rollup_progress),
-                "updated_at": datetime.utcnow().isoformat()
-            }
+            tasks = self._load_ancestor_chain(str(parent_task_id))
             
-            # Update status based on progress
-            if rollup_progress == 100:
-                update_data["status"] = TaskStatus.COMPLETED.value
-            elif rollup_progress > 0:
-                update_data["status"] = TaskStatus.IN_PROGRESS.value
+            rolled_up = roll_up(tasks, [str(parent_task_id)], "parent_task_id", self._task_rollup_fields)
             
-            result = self.db.table("tasks").update(update_data).eq("id", str(parent_task_id)).execute()
-            
-            if result.data:
-                # Check if this parent has its own parent and continue rollup
-                parent_data = result.data[0]
-                if parent_data.get("parent_task_id"):
-                    await self._update_parent_progress_rollup(UUID(parent_data["parent_task_id"]))
+            now = datetime.utcnow().isoformat()
+            write_changes(self.db, "tasks", {
+                task_id: self._rollup_changes(tasks[task_id], now) for task_id in rolled_up
+            })
             
         except Exception as e:
             logger.error(f"Error updating parent progress rollup for task {parent_task_id}: {e}")
@@ -1070,6 +1083,11 @@ class ScheduleManager:
         """
         Update progress for multiple tasks in a single operation.
         
+        Ancestors of the updated tasks are recalculated from their children,
+        except tasks that are themselves in progress_updates: an explicit
+        progress value for a parent task is kept and rolled up to its own
+        ancestors instead of being overwritten.
+        
         Args:
             progress_updates: List of progress update dictionaries
             updated_by: ID of the user updating progress
@@ -1081,6 +1099,8 @@ class ScheduleManager:
             successful_updates = []
             failed_updates = []
             
+            # Parse all updates before touching the database
+            parsed_updates: List[Tuple[str, TaskProgressUpdate]] = []
             for update in progress_updates:
                 try:
                     task_id = UUID(update["task_id"])
@@ -1092,13 +1112,7 @@ class ScheduleManager:
                         actual_effort_hours=update.get("actual_effort_hours"),
                         notes=update.get("notes")
                     )
-                    
-                    updated_task = await self.update_task_progress(task_id, progress_data, updated_by)
-                    successful_updates.append({
-                        "task_id": str(task_id),
-                        "success": True,
-                        "updated_task": updated_task
-                    })
+                    parsed_updates.append((str(task_id), progress_data))
                     
                 except Exception as e:
                     failed_updates.append({
@@ -1107,6 +1121,63 @@ class ScheduleManager:
                         "error": str(e)
                     })
             
+            # Load every task of the affected schedules once
+            tasks = self._load_schedule_tasks({task_id for task_id, _ in parsed_updates})
+            
+            # Apply leaf updates in memory, in request order
+            now = datetime.utcnow().isoformat()
+            changes: Dict[str, Dict[str, Any]] = {}
+            updated_ids: List[str] = []
+            history_records: List[Dict[str, Any]] = []
+            for task_id, progress_data in parsed_updates:
+                try:
+                    existing_task = tasks.get(task_id)
+                    if existing_task is None:
+                        raise ValueError(f"Task {task_id} not found")
+                    
+                    update_data = self._build_progress_update(existing_task, progress_data)
+                    update_data["updated_at"] = now
+                    existing_task.update(update_data)
+                    changes.setdefault(task_id, {}).update(update_data)
+                    updated_ids.append(task_id)
+                    history_records.append({
+                        "task_id": task_id,
+                        "progress_percentage": progress_data.progress_percentage,
+                        "status": progress_data.status.value,
+                        "notes": progress_data.notes
+                    })
+                    
+                except Exception as e:
+                    failed_updates.append({
+                        "task_id": task_id,
+                        "success": False,
+                        "error": f"Failed to update task progress: {str(e)}"
+                    })
+            
+            # Recalculate every affected ancestor once, bottom-up, keeping explicit updates
+            parent_ids = {
+                str(tasks[task_id]["parent_task_id"])
+                for task_id in updated_ids
+                if tasks[task_id].get("parent_task_id")
+            }
+            rolled_up = roll_up(
+                tasks, parent_ids, "parent_task_id", self._task_rollup_fields, fixed_ids=updated_ids
+            )
+            for task_id in rolled_up:
+                if task_id not in changes:
+                    changes[task_id] = self._rollup_changes(tasks[task_id], now)
+            
+            written = write_changes(self.db, "tasks", changes)
+            
+            await self._create_progress_history_records(history_records, updated_by)
+            
+            for task_id in updated_ids:
+                successful_updates.append({
+                    "task_id": task_id,
+                    "success": True,
+                    "updated_task": self._convert_task_to_response(written.get(task_id, tasks[task_id]))
+                })
+            
             return {
                 "total_updates": len(progress_updates),
                 "successful_updates": len(successful_updates),
@@ -1118,6 +1189,65 @@ class ScheduleManager:
             logger.error(f"Error in bulk update task progress: {e}")
             raise RuntimeError(f"Failed to bulk update task progress: {str(e)}")
     
+    def _load_schedule_tasks(self, task_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load all tasks of the schedules containing task_ids, keyed by task ID.
+        
+        Args:
+            task_ids: IDs of the tasks being updated
+            
+        Returns:
+            Dict of task ID to full task row
+        """
+        schedule_ids: Set[str] = set()
+        ids = list(task_ids)
+        for batch in iter_batches(ids, READ_BATCH_SIZE):
+            result = self.db.table("tasks").select("id, schedule_id").in_("id", batch).execute()
+            schedule_ids.update(str(row["schedule_id"]) for row in result.data or [])
+        
+        tasks: Dict[str, Dict[str, Any]] = {}
+        for schedule_id in sorted(schedule_ids):
+            rows = fetch_all(lambda: self.db.table("tasks").select("*").eq("schedule_id", schedule_id))
+            tasks.update((str(row["id"]), row) for row in rows)
+        return tasks
+    
+    def _load_ancestor_chain(self, task_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load a task, its ancestors and the direct children of each of them.
+        
+        Args:
+            task_id: ID of the lowest task of the chain
+            
+        Returns:
+            Dict of task ID to the task's rollup columns
+        """
+        columns = "id, parent_task_id, progress_percentage, planned_effort_hours, status"
+        chain: Dict[str, Dict[str, Any]] = {}
+        node: Optional[str] = task_id
+        while node and node not in chain:
+            result = self.db.table("tasks").select(columns).eq("id", node).execute()
+            if not result.data:
+                break
+            chain[node] = result.data[0]
+            parent = result.data[0].get("parent_task_id")
+            node = str(parent) if parent else None
+        
+        tasks = dict(chain)
+        for batch in iter_batches(list(chain), READ_BATCH_SIZE):
+            rows = fetch_all(lambda: self.db.table("tasks").select(columns).in_("parent_task_id", batch))
+            for row in rows:
+                tasks.setdefault(str(row["id"]), row)
+        return tasks
+    
+    @staticmethod
+    def _rollup_changes(task: Dict[str, Any], updated_at: str) -> Dict[str, Any]:
+        """Fields written back for a task whose progress was rolled up."""
+        return {
+            "progress_percentage": task.get("progress_percentage"),
+            "status": task.get("status"),
+            "updated_at": updated_at,
+        }
+    
     # Private helper methods for enhanced progress tracking
     
     def _calculate_schedule_health(
@@ -1179,17 +1309,54 @@ class ScheduleManager:
             notes: Progress notes
             updated_by: ID of the user who made the update
         """
+        await self._create_progress_history_records(
+            [{
+                "task_id": str(task_id),
+                "progress_percentage": progress_percentage,
+                "status": status.value,
+                "notes": notes
+            }],
+            updated_by
+        )
+    
+    async def _create_progress_history_records(
+        self,
+        records: List[Dict[str, Any]],
+        updated_by: Optional[UUID]
+    ) -> None:
+        """
+        Create progress history records for audit trail in one batch.
+        
+        Args:
+            records: Dicts with task_id, progress_percentage, status and notes
+            updated_by: ID of the user who made the updates
+        """
+        if not records:
+            return
+        
         try:
-            # This would typically insert into a task_progress_history table
-            # For now, just log the progress update
-            logger.info(
-                f"Progress update for task {task_id}: {progress_percentage}% - {status.value}"
-                f"{f' by user {updated_by}' if updated_by else ''}"
-                f"{f' - Notes: {notes}' if notes else ''}"
-            )
+            recorded_at = datetime.utcnow().isoformat()
+            history_rows = [
+                {
+                    **record,
+                    "updated_by": str(updated_by) if updated_by else None,
+                    "recorded_at": recorded_at
+                }
+                for record in records
+            ]
+            
+            # This would typically insert history_rows into a task_progress_history
+            # table in a single insert. For now, just log the progress updates
+            for row in history_rows:
+                notes = row["notes"]
+                logger.info(
+                    f"Progress update for task {row['task_id']}: {row['progress_percentage']}% - {row['status']}"
+                    f"{f' by user {updated_by}' if updated_by else ''}"
+                    f"{f' - Notes: {notes}' if notes else ''}"
+                )
             
         except Exception as e:
-            logger.error(f"Error creating progress history record: {e}")
+            logger.error(f"Error creating progress history records: {e}")
     
     async def recalculate_all_parent_progress(self, schedule_id: UUID) -> Dict[str, Any]:
         """
@@ -1202,30 +1369,31 @@ class ScheduleManager:
             Dict with recalculation results
         """
         try:
-            # Get all tasks with children
-            tasks_result = self.db.table("tasks").select("id, parent_task_id").eq("schedule_id", str(schedule_id)).execute()
+            # Get all tasks of the schedule
+            tasks_rows = fetch_all(lambda: self.db.table("tasks").select("*").eq("schedule_id", str(schedule_id)))
             
-            if not tasks_result.data:
+            if not tasks_rows:
                 return {"updated_tasks": 0, "errors": []}
             
-            tasks = tasks_result.data
+            tasks = {str(task["id"]): task for task in tasks_rows}
             
             # Find all parent tasks
-            parent_task_ids = set()
-            for task in tasks:
-                if task.get("parent_task_id"):
-                    parent_task_ids.add(UUID(task["parent_task_id"]))
+            parent_task_ids = {
+                str(task["parent_task_id"]) for task in tasks.values() if task.get("parent_task_id")
+            }
             
-            # Update progress for each parent task
-            updated_count = 0
-            errors = []
+            # Recalculate every parent once, bottom-up, and write them in batches
+            rolled_up = roll_up(tasks, parent_task_ids, "parent_task_id", self._task_rollup_fields)
             
-            for parent_id in parent_task_ids:
-                try:
-                    await self._update_parent_progress_rollup(parent_id)
-                    updated_count += 1
-                except Exception as e:
-                    errors.append(f"Failed to update parent {parent_id}: {str(e)}")
+            now = datetime.utcnow().isoformat()
+            errors = []
+            updated_count = 0
+            try:
+                updated_count = len(write_changes(self.db, "tasks", {
+                    task_id: self._rollup_changes(tasks[task_id], now) for task_id in rolled_up
+                }))
+            except Exception as e:
+                errors.append(f"Failed to update parent tasks: {str(e)}")
             
             return {
                 "updated_tasks": updated_count,
@@ -11,14 +11,14 @@ Handles all task dependency operations including:
 """
 
 import asyncio
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from typing import List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID, uuid4
 from enum import Enum
 import logging
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 
-from config.database import supabase
+from config.database import supabase, execute_async
 from models.schedule import (
     TaskDependencyCreate, TaskDependencyResponse, DependencyType,
     CriticalPathResult, FloatCalculation, ScheduleRecalculationResult,
@@ -40,10 +40,18 @@ class TaskDependencyEngine:
     - Schedule recalculation engine with real-time triggers
     """
     
+    DEPENDENCY_QUERY_CHUNK = 500  # PostgREST/URL limit for task ID filters
+    CRITICAL_PATH_WRITE_BATCH = 1000
+    CPM_STATE_CACHE_SIZE = 32  # Schedules whose CPM state is kept warm
+    
     def __init__(self):
         self.db = supabase
         if not self.db:
             raise RuntimeError("Database connection not available")
+        
+        # Per-schedule CPM state kept warm for incremental recalculation, as
+        # (schedules.cpm_revision, graph) in least-recently-used order
+        self._cpm_states: "OrderedDict[str, Tuple[int, CriticalPathGraph]]" = OrderedDict()
     
     async def create_dependency(
         self,
@@ -75,9 +83,9 @@ class TaskDependencyEngine:
                 raise ValueError("Creating this dependency would create a circular dependency")
             
             # Check if dependency already exists
-            existing_result = self.db.table("task_dependencies").select("id").eq(
+            existing_result = await execute_async(self.db.table("task_dependencies").select("id").eq(
                 "predecessor_task_id", str(predecessor_id)
-            ).eq("successor_task_id", str(successor_id)).execute()
+            ).eq("successor_task_id", str(successor_id)), label="task_dependencies")
             
             if existing_result.data:
                 raise ValueError("Dependency already exists between these tasks")
@@ -94,7 +102,7 @@ class TaskDependencyEngine:
             }
             
             # Insert dependency
-            result = self.db.table("task_dependencies").insert(dependency_record).execute()
+            result = await execute_async(self.db.table("task_dependencies").insert(dependency_record), label="task_dependencies")
             
             if not result.data:
                 raise RuntimeError("Failed to create dependency")
@@ -102,7 +110,7 @@ class TaskDependencyEngine:
             created_dependency = result.data[0]
             
             # Trigger schedule recalculation
-            await self._trigger_schedule_recalculation(successor_id)
+            await self._trigger_schedule_recalculation(successor_id, "dependency_added")
             
             return TaskDependencyResponse(
                 id=created_dependency["id"],
@@ -135,9 +143,9 @@ class TaskDependencyEngine:
         """
         try:
             # Get dependency details before deletion
-            dependency_result = self.db.table("task_dependencies").select("*").eq(
+            dependency_result = await execute_async(self.db.table("task_dependencies").select("*").eq(
                 "id", str(dependency_id)
-            ).execute()
+            ), label="task_dependencies")
             
             if not dependency_result.data:
                 raise ValueError(f"Dependency {dependency_id} not found")
@@ -151,15 +159,15 @@ class TaskDependencyEngine:
                 impact_analysis = await self._analyze_dependency_deletion_impact(dependency_id)
             
             # Delete dependency
-            delete_result = self.db.table("task_dependencies").delete().eq(
+            delete_result = await execute_async(self.db.table("task_dependencies").delete().eq(
                 "id", str(dependency_id)
-            ).execute()
+            ), label="task_dependencies")
             
             if not delete_result.data:
                 raise RuntimeError("Failed to delete dependency")
             
             # Trigger schedule recalculation for affected tasks
-            await self._trigger_schedule_recalculation(successor_id)
+            await self._trigger_schedule_recalculation(successor_id, "dependency_removed")
             
             return {
                 "dependency_id": str(dependency_id),
@@ -175,12 +183,14 @@ class TaskDependencyEngine:
     async def get_dependencies_for_task(self, task_id: UUID) -> List[TaskDependencyResponse]:
         """Get all dependencies where the task is predecessor or successor."""
         try:
-            pred = self.db.table("task_dependencies").select("*").eq(
-                "predecessor_task_id", str(task_id)
-            ).execute()
-            succ = self.db.table("task_dependencies").select("*").eq(
-                "successor_task_id", str(task_id)
-            ).execute()
+            pred, succ = await asyncio.gather(
+                execute_async(self.db.table("task_dependencies").select("*").eq(
+                    "predecessor_task_id", str(task_id)
+                ), label="task_dependencies"),
+                execute_async(self.db.table("task_dependencies").select("*").eq(
+                    "successor_task_id", str(task_id)
+                ), label="task_dependencies")
+            )
             seen = set()
             out = []
             for row in (pred.data or []) + (succ.data or []):
@@ -216,14 +226,14 @@ class TaskDependencyEngine:
         """
         try:
             # Get all tasks and dependencies for the schedule
-            tasks_result = self.db.table("tasks").select("id").eq("schedule_id", str(schedule_id)).execute()
+            tasks_result = await execute_async(self.db.table("tasks").select("id").eq("schedule_id", str(schedule_id)), label="tasks")
             if not tasks_result.data:
                 return []
             
             task_ids = {task["id"] for task in tasks_result.data}
             
             # Get all dependencies for tasks in this schedule
-            dependencies_result = self.db.table("task_dependencies").select("*").execute()
+            dependencies_result = await execute_async(self.db.table("task_dependencies").select("*"), label="task_dependencies")
             if not dependencies_result.data:
                 return []
             
@@ -296,70 +306,8 @@ class TaskDependencyEngine:
             # Get all tasks and dependencies for the schedule
             tasks_data = await self._get_schedule_tasks_and_dependencies(schedule_id)
             
-            if not tasks_data["tasks"]:
-                return CriticalPathResult(
-                    critical_tasks=[],
-                    project_duration_days=0,
-                    critical_path_length=0.0,
-                    schedule_risk_factors=[]
-                )
-            
-            tasks = tasks_data["tasks"]
-            dependencies = tasks_data["dependencies"]
-            
-            # Perform forward pass to calculate early dates
-            early_dates = await self._calculate_early_dates(tasks, dependencies)
-            
-            # Perform backward pass to calculate late dates
-            late_dates = await self._calculate_late_dates(tasks, dependencies, early_dates)
-            
-            # Calculate float for each task
-            float_calculations = {}
-            critical_tasks = []
-            
-            for task in tasks:
-                task_id = task["id"]
-                early_start = early_dates[task_id]["early_start"]
-                early_finish = early_dates[task_id]["early_finish"]
-                late_start = late_dates[task_id]["late_start"]
-                late_finish = late_dates[task_id]["late_finish"]
-                
-                total_float = (late_start - early_start).days
-                
-                float_calculations[task_id] = FloatCalculation(
-                    task_id=task_id,
-                    total_float_days=total_float,
-                    free_float_days=0,  # Will be calculated separately
-                    early_start_date=early_start,
-                    early_finish_date=early_finish,
-                    late_start_date=late_start,
-                    late_finish_date=late_finish
-                )
-                
-                # Task is critical if total float is zero
-                if total_float == 0:
-                    critical_tasks.append(task_id)
-            
-            # Calculate free float
-            await self._calculate_free_float(tasks, dependencies, float_calculations)
-            
-            # Update task records with calculated dates and critical status
-            await self._update_task_critical_path_data(float_calculations, critical_tasks)
-            
-            # Calculate project duration
-            project_end_date = max(early_dates[task_id]["early_finish"] for task_id in early_dates.keys())
-            project_start_date = min(early_dates[task_id]["early_start"] for task_id in early_dates.keys())
-            project_duration = (project_end_date - project_start_date).days + 1
-            
-            # Identify schedule risk factors
-            risk_factors = await self._identify_schedule_risk_factors(tasks, dependencies, critical_tasks)
-            
-            return CriticalPathResult(
-                critical_tasks=critical_tasks,
-                project_duration_days=project_duration,
-                critical_path_length=len(critical_tasks),
-                schedule_risk_factors=risk_factors
-            )
+            _, critical_path = await self._run_critical_path_analysis(tasks_data, schedule_id)
+            return critical_path
             
         except Exception as e:
             logger.error(f"Error calculating critical path for schedule {schedule_id}: {e}")
@@ -420,7 +368,7 @@ class TaskDependencyEngine:
                         "updated_at": datetime.utcnow().isoformat()
                     }
                     
-                    result = self.db.table("tasks").update(update_data).eq("id", task_id_str).execute()
+                    result = await execute_async(self.db.table("tasks").update(update_data).eq("id", task_id_str), label="tasks")
                     
                     if result.data:
                         calculated_tasks.append(task_id_str)
@@ -457,30 +405,8 @@ class TaskDependencyEngine:
             ScheduleRecalculationResult: Recalculation results
         """
         try:
-            # Get current critical path before recalculation
-            current_critical_path = await self.calculate_critical_path(schedule_id)
-            old_critical_tasks = set(current_critical_path.critical_tasks)
-            
-            # Find all tasks affected by the change
-            affected_tasks = await self._find_affected_tasks(changed_task_id)
-            
-            # Recalculate dates for affected tasks
-            date_calculation = await self.calculate_task_dates(schedule_id)
-            
-            # Recalculate critical path
-            new_critical_path = await self.calculate_critical_path(schedule_id)
-            new_critical_tasks = set(new_critical_path.critical_tasks)
-            
-            # Determine if critical path changed
-            critical_path_changed = old_critical_tasks != new_critical_tasks
-            
-            return ScheduleRecalculationResult(
-                schedule_id=str(schedule_id),
-                affected_tasks=affected_tasks,
-                critical_path_changed=critical_path_changed,
-                new_critical_path=new_critical_path.critical_tasks,
-                recalculation_timestamp=datetime.utcnow()
-            )
+            tasks_data = await self._get_schedule_tasks_and_dependencies(schedule_id)
+            return await self._recalculate_loaded_schedule(schedule_id, tasks_data, changed_task_id)
             
         except Exception as e:
             logger.error(f"Error recalculating schedule {schedule_id}: {e}")
@@ -491,9 +417,9 @@ class TaskDependencyEngine:
     async def _validate_dependency_tasks(self, predecessor_id: UUID, successor_id: UUID) -> None:
         """Validate that both tasks exist and are in the same schedule."""
         # Get both tasks
-        tasks_result = self.db.table("tasks").select("id, schedule_id").in_(
+        tasks_result = await execute_async(self.db.table("tasks").select("id, schedule_id").in_(
             "id", [str(predecessor_id), str(successor_id)]
-        ).execute()
+        ), label="tasks")
         
         if not tasks_result.data or len(tasks_result.data) != 2:
             raise ValueError("One or both tasks not found")
@@ -506,7 +432,7 @@ class TaskDependencyEngine:
     async def _would_create_circular_dependency(self, predecessor_id: UUID, successor_id: UUID) -> bool:
         """Check if creating a dependency would create a circular dependency."""
         # Get the schedule ID from one of the tasks
-        task_result = self.db.table("tasks").select("schedule_id").eq("id", str(predecessor_id)).execute()
+        task_result = await execute_async(self.db.table("tasks").select("schedule_id").eq("id", str(predecessor_id)), label="tasks")
         if not task_result.data:
             return False
         
@@ -542,197 +468,272 @@ class TaskDependencyEngine:
         return has_path(str(successor_id), str(predecessor_id))
     
     async def _get_schedule_tasks_and_dependencies(self, schedule_id: UUID) -> Dict[str, Any]:
-        """Get all tasks and dependencies for a schedule."""
+        """Get all tasks and dependencies for a schedule, with the schedule's CPM revision."""
+        # Read the revision before the rows so a concurrent edit can only make
+        # the cached state look older than it is, never newer
+        revision = await self._get_cpm_revision(schedule_id)
+        
         # Get tasks
-        tasks_result = self.db.table("tasks").select("*").eq("schedule_id", str(schedule_id)).execute()
+        tasks_result = await execute_async(self.db.table("tasks").select("*").eq("schedule_id", str(schedule_id)), label="tasks")
         tasks = tasks_result.data or []
         
         if not tasks:
-            return {"tasks": [], "dependencies": []}
+            return {"tasks": [], "dependencies": [], "cpm_revision": revision}
+        
+        task_id_list = [task["id"] for task in tasks]
+        task_ids = set(task_id_list)
         
-        task_ids = {task["id"] for task in tasks}
+        # Get only the dependencies whose successor belongs to this schedule,
+        # chunking the ID filter to stay within PostgREST URL limits; the
+        # chunks are fetched concurrently
+        chunk_results = await asyncio.gather(*(
+            execute_async(self.db.table("task_dependencies").select("*").in_(
+                "successor_task_id", task_id_list[i : i + self.DEPENDENCY_QUERY_CHUNK]
+            ), label="task_dependencies")
+            for i in range(0, len(task_id_list), self.DEPENDENCY_QUERY_CHUNK)
+        ))
         
-        # Get dependencies for these tasks
-        dependencies_result = self.db.table("task_dependencies").select("*").execute()
         dependencies = []
+        for dependencies_result in chunk_results:
+            for dep in dependencies_result.data or []:
+                if dep["predecessor_task_id"] in task_ids:
+                    dependencies.append(dep)
         
-        if dependencies_result.data:
-            dependencies = [
-                dep for dep in dependencies_result.data
-                if dep["predecessor_task_id"] in task_ids and dep["successor_task_id"] in task_ids
-            ]
+        return {"tasks": tasks, "dependencies": dependencies, "cpm_revision": revision}
+    
+    async def _get_cpm_revision(self, schedule_id: UUID) -> Optional[int]:
+        """
+        Get the schedule's CPM revision, bumped by database triggers whenever a
+        task's scheduling inputs or dependencies change (migration 079).
+        
+        Returns:
+            The revision, or None if it cannot be read (CPM state is then not cached)
+        """
+        try:
+            result = await execute_async(self.db.table("schedules").select("cpm_revision").eq(
+                "id", str(schedule_id)
+            ), label="schedules")
+        except Exception as e:
+            logger.warning(f"Could not read CPM revision for schedule {schedule_id}: {e}")
+            return None
         
-        return {"tasks": tasks, "dependencies": dependencies}
+        if not result.data:
+            return None
+        revision = result.data[0].get("cpm_revision")
+        return revision if isinstance(revision, int) else None
     
-    async def _calculate_early_dates(self, tasks: List[Dict], dependencies: List[Dict]) -> Dict[str, Dict]:
-        """Calculate early start and finish dates using forward pass algorithm."""
-        # Build dependency graph
-        predecessors = defaultdict(list)
-        for dep in dependencies:
-            predecessors[dep["successor_task_id"]].append(dep)
-        
-        # Initialize early dates
-        early_dates = {}
-        for task in tasks:
-            task_id = task["id"]
-            planned_start = date.fromisoformat(task["planned_start_date"])
-            duration = task["duration_days"]
-            
-            early_dates[task_id] = {
-                "early_start": planned_start,
-                "early_finish": planned_start + timedelta(days=duration - 1)
-            }
+    def _get_cpm_state(self, schedule_id: UUID) -> Optional[Tuple[int, "CriticalPathGraph"]]:
+        """Get a schedule's cached (revision, graph), marking it most recently used."""
+        key = str(schedule_id)
+        state = self._cpm_states.get(key)
+        if state is not None:
+            self._cpm_states.move_to_end(key)
+        return state
+    
+    def _store_cpm_state(self, schedule_id: UUID, revision: Optional[int], graph: "CriticalPathGraph") -> None:
+        """Cache a schedule's CPM state, evicting the least recently used schedules."""
+        key = str(schedule_id)
+        if revision is None:
+            # Without a revision the state could not be validated later
+            self._cpm_states.pop(key, None)
+            return
         
-        # Topological sort and forward pass
-        in_degree = defaultdict(int)
-        for dep in dependencies:
-            in_degree[dep["successor_task_id"]] += 1
+        self._cpm_states[key] = (revision, graph)
+        self._cpm_states.move_to_end(key)
+        while len(self._cpm_states) > self.CPM_STATE_CACHE_SIZE:
+            self._cpm_states.popitem(last=False)
+    
+    async def _run_critical_path_analysis(
+        self,
+        tasks_data: Dict[str, Any],
+        schedule_id: Optional[UUID] = None
+    ) -> Tuple["CriticalPathGraph", CriticalPathResult]:
+        """Run the CPM passes over loaded schedule data and persist the results."""
+        tasks = tasks_data["tasks"]
+        dependencies = tasks_data["dependencies"]
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
         
-        queue = deque([task["id"] for task in tasks if in_degree[task["id"]] == 0])
+        if schedule_id is not None:
+            self._store_cpm_state(schedule_id, tasks_data.get("cpm_revision"), graph)
         
-        while queue:
-            current_task_id = queue.popleft()
-            current_task = next(task for task in tasks if task["id"] == current_task_id)
-            duration = current_task["duration_days"]
-            
-            # Calculate early dates based on predecessors
-            if current_task_id in predecessors:
-                max_early_start = early_dates[current_task_id]["early_start"]
-                
-                for dep in predecessors[current_task_id]:
-                    pred_id = dep["predecessor_task_id"]
-                    dep_type = DependencyType(dep["dependency_type"])
-                    lag_days = dep["lag_days"]
-                    
-                    # Calculate constraint date based on dependency type
-                    if dep_type == DependencyType.FINISH_TO_START:
-                        constraint_date = early_dates[pred_id]["early_finish"] + timedelta(days=lag_days + 1)
-                    elif dep_type == DependencyType.START_TO_START:
-                        constraint_date = early_dates[pred_id]["early_start"] + timedelta(days=lag_days)
-                    elif dep_type == DependencyType.FINISH_TO_FINISH:
-                        constraint_date = early_dates[pred_id]["early_finish"] + timedelta(days=lag_days - duration + 1)
-                    elif dep_type == DependencyType.START_TO_FINISH:
-                        constraint_date = early_dates[pred_id]["early_start"] + timedelta(days=lag_days - duration + 1)
-                    
-                    max_early_start = max(max_early_start, constraint_date)
-                
-                early_dates[current_task_id]["early_start"] = max_early_start
-                early_dates[current_task_id]["early_finish"] = max_early_start + timedelta(days=duration - 1)
-            
-            # Add successors to queue
-            for dep in dependencies:
-                if dep["predecessor_task_id"] == current_task_id:
-                    successor_id = dep["successor_task_id"]
-                    in_degree[successor_id] -= 1
-                    if in_degree[successor_id] == 0:
-                        queue.append(successor_id)
+        if not tasks:
+            return graph, CriticalPathResult(
+                critical_tasks=[],
+                project_duration_days=0,
+                critical_path_length=0.0,
+                schedule_risk_factors=[]
+            )
+        
+        critical_tasks = graph.critical_task_ids()
+        
+        # Update task records whose stored dates or critical status are stale
+        stale_indices = [i for i, task in enumerate(tasks) if self._is_critical_path_data_stale(task, graph, i)]
+        await self._update_task_critical_path_data(
+            {graph.task_ids[i]: graph.float_calculation(i) for i in stale_indices},
+            critical_tasks
+        )
         
-        return early_dates
+        # Identify schedule risk factors
+        risk_factors = await self._identify_schedule_risk_factors(tasks, dependencies, critical_tasks)
+        
+        return graph, CriticalPathResult(
+            critical_tasks=critical_tasks,
+            project_duration_days=graph.project_duration_days(),
+            critical_path_length=len(critical_tasks),
+            schedule_risk_factors=risk_factors
+        )
     
-    async def _calculate_late_dates(self, tasks: List[Dict], dependencies: List[Dict], early_dates: Dict) -> Dict[str, Dict]:
-        """Calculate late start and finish dates using backward pass algorithm."""
-        # Find project end date
-        project_end = max(early_dates[task_id]["early_finish"] for task_id in early_dates.keys())
-        
-        # Initialize late dates
-        late_dates = {}
-        for task in tasks:
-            task_id = task["id"]
-            duration = task["duration_days"]
-            
-            late_dates[task_id] = {
-                "late_finish": project_end,
-                "late_start": project_end - timedelta(days=duration - 1)
-            }
+    async def _recalculate_loaded_schedule(
+        self,
+        schedule_id: UUID,
+        tasks_data: Dict[str, Any],
+        changed_task_id: UUID
+    ) -> ScheduleRecalculationResult:
+        """Recalculate a schedule whose tasks and dependencies are already loaded."""
+        # Critical flags as stored before this recalculation
+        old_critical_tasks = {task["id"] for task in tasks_data["tasks"] if task.get("is_critical")}
         
-        # Build successor graph
-        successors = defaultdict(list)
-        for dep in dependencies:
-            successors[dep["predecessor_task_id"]].append(dep)
+        graph, new_critical_path = await self._run_critical_path_analysis(tasks_data, schedule_id)
         
-        # Backward pass
-        # Start with tasks that have no successors
-        out_degree = defaultdict(int)
-        for dep in dependencies:
-            out_degree[dep["predecessor_task_id"]] += 1
+        # Find all tasks affected by the change
+        affected_tasks = graph.downstream_tasks(str(changed_task_id))
         
-        queue = deque([task["id"] for task in tasks if out_degree[task["id"]] == 0])
+        return ScheduleRecalculationResult(
+            schedule_id=str(schedule_id),
+            affected_tasks=affected_tasks,
+            critical_path_changed=old_critical_tasks != set(new_critical_path.critical_tasks),
+            new_critical_path=new_critical_path.critical_tasks,
+            recalculation_timestamp=datetime.utcnow()
+        )
+    
+    async def _recalculate_incrementally(
+        self,
+        schedule_id: UUID,
+        cached_revision: int,
+        graph: "CriticalPathGraph",
+        task: Dict[str, Any],
+        change_type: str
+    ) -> ScheduleRecalculationResult:
+        """
+        Propagate one task's change through the cached CPM state and persist only changed rows.
         
-        while queue:
-            current_task_id = queue.popleft()
-            current_task = next(task for task in tasks if task["id"] == current_task_id)
-            duration = current_task["duration_days"]
+        The cached state is only used if the schedule's CPM revision shows that
+        nothing but this change has been written since it was cached; otherwise
+        the whole schedule is recalculated.
+        """
+        task_id = task["id"]
+        old_critical_tasks = graph.critical_task_ids()
+        revision = await self._get_cpm_revision(schedule_id)
+        
+        try:
+            if change_type in ("dependency_added", "dependency_removed"):
+                dependencies_result = await execute_async(self.db.table("task_dependencies").select("*").eq(
+                    "successor_task_id", task_id
+                ), label="task_dependencies")
+                dependencies = dependencies_result.data or []
+                inputs_changed = graph.predecessors_differ(task_id, dependencies)
+            else:
+                inputs_changed = graph.task_inputs_differ(task_id, task["duration_days"], task["planned_start_date"])
             
-            # Calculate late dates based on successors
-            if current_task_id in successors:
-                min_late_finish = late_dates[current_task_id]["late_finish"]
-                
-                for dep in successors[current_task_id]:
-                    succ_id = dep["successor_task_id"]
-                    dep_type = DependencyType(dep["dependency_type"])
-                    lag_days = dep["lag_days"]
-                    
-                    # Calculate constraint date based on dependency type
-                    if dep_type == DependencyType.FINISH_TO_START:
-                        constraint_date = late_dates[succ_id]["late_start"] - timedelta(days=lag_days + 1)
-                    elif dep_type == DependencyType.START_TO_START:
-                        constraint_date = late_dates[succ_id]["late_start"] - timedelta(days=lag_days)
-                    elif dep_type == DependencyType.FINISH_TO_FINISH:
-                        constraint_date = late_dates[succ_id]["late_finish"] - timedelta(days=lag_days)
-                    elif dep_type == DependencyType.START_TO_FINISH:
-                        constraint_date = late_dates[succ_id]["late_finish"] - timedelta(days=lag_days)
-                    
-                    min_late_finish = min(min_late_finish, constraint_date)
-                
-                late_dates[current_task_id]["late_finish"] = min_late_finish
-                late_dates[current_task_id]["late_start"] = min_late_finish - timedelta(days=duration - 1)
+            # This change accounts for at most one revision bump; anything else
+            # means another writer touched the schedule
+            if revision is None or revision != cached_revision + (1 if inputs_changed else 0):
+                self.invalidate_cpm_state(schedule_id)
+                return await self.recalculate_schedule(schedule_id, task_id)
             
-            # Add predecessors to queue
-            for dep in dependencies:
-                if dep["successor_task_id"] == current_task_id:
-                    predecessor_id = dep["predecessor_task_id"]
-                    out_degree[predecessor_id] -= 1
-                    if out_degree[predecessor_id] == 0:
-                        queue.append(predecessor_id)
+            if change_type in ("dependency_added", "dependency_removed"):
+                changed_indices = graph.update_predecessors(task_id, dependencies)
+            else:
+                changed_indices = graph.update_task(task_id, task["duration_days"], task["planned_start_date"])
+            self._store_cpm_state(schedule_id, revision, graph)
+        except Exception:
+            # Cached state is unusable; rebuild it from the database next time
+            self.invalidate_cpm_state(schedule_id)
+            raise
+        
+        new_critical_tasks = graph.critical_task_ids()
+        affected_tasks = [graph.task_ids[i] for i in changed_indices]
         
-        return late_dates
+        # Write back only the changed rows in one batch
+        await self._update_task_critical_path_data(
+            {graph.task_ids[i]: graph.float_calculation(i) for i in changed_indices},
+            [affected_id for affected_id in affected_tasks if graph.total_float[graph.index[affected_id]] == 0]
+        )
+        
+        return ScheduleRecalculationResult(
+            schedule_id=str(schedule_id),
+            affected_tasks=affected_tasks,
+            critical_path_changed=old_critical_tasks != new_critical_tasks,
+            new_critical_path=new_critical_tasks,
+            recalculation_timestamp=datetime.utcnow()
+        )
+    
+    async def _calculate_early_dates(self, tasks: List[Dict], dependencies: List[Dict]) -> Dict[str, Dict]:
+        """Calculate early start and finish dates using forward pass algorithm."""
+        graph = CriticalPathGraph(tasks, dependencies)
+        early_start, early_finish = graph.forward_pass()
+        
+        return {
+            task_id: {
+                "early_start": date.fromordinal(early_start[i]),
+                "early_finish": date.fromordinal(early_finish[i])
+            }
+            for i, task_id in enumerate(graph.task_ids)
+        }
+    
+    async def _calculate_late_dates(self, tasks: List[Dict], dependencies: List[Dict], early_dates: Dict) -> Dict[str, Dict]:
+        """Calculate late start and finish dates using backward pass algorithm."""
+        graph = CriticalPathGraph(tasks, dependencies)
+        early_finish = [early_dates[task_id]["early_finish"].toordinal() for task_id in graph.task_ids]
+        late_start, late_finish = graph.backward_pass(early_finish)
+        
+        return {
+            task_id: {
+                "late_finish": date.fromordinal(late_finish[i]),
+                "late_start": date.fromordinal(late_start[i])
+            }
+            for i, task_id in enumerate(graph.task_ids)
+        }
     
     async def _calculate_free_float(self, tasks: List[Dict], dependencies: List[Dict], float_calculations: Dict) -> None:
         """Calculate free float for each task."""
-        # Build successor graph
-        successors = defaultdict(list)
-        for dep in dependencies:
-            successors[dep["predecessor_task_id"]].append(dep)
+        graph = CriticalPathGraph(tasks, dependencies)
+        calculations = [float_calculations[task_id] for task_id in graph.task_ids]
         
-        for task in tasks:
-            task_id = task["id"]
-            early_finish = float_calculations[task_id].early_finish_date
-            
-            # Free float is the minimum difference between this task's early finish
-            # and the early start of its immediate successors
-            min_successor_early_start = None
-            
-            if task_id in successors:
-                for dep in successors[task_id]:
-                    succ_id = dep["successor_task_id"]
-                    succ_early_start = float_calculations[succ_id].early_start_date
-                    
-                    if min_successor_early_start is None:
-                        min_successor_early_start = succ_early_start
-                    else:
-                        min_successor_early_start = min(min_successor_early_start, succ_early_start)
-            
-            if min_successor_early_start:
-                free_float_days = (min_successor_early_start - early_finish).days - 1
-                float_calculations[task_id].free_float_days = max(0, free_float_days)
-            else:
-                # No successors, free float equals total float
-                float_calculations[task_id].free_float_days = float_calculations[task_id].total_float_days
+        free_float = graph.free_floats(
+            [calc.early_start_date.toordinal() for calc in calculations],
+            [calc.early_finish_date.toordinal() for calc in calculations],
+            [calc.total_float_days for calc in calculations]
+        )
+        
+        for calc, free_float_days in zip(calculations, free_float):
+            calc.free_float_days = free_float_days
+    
+    @staticmethod
+    def _is_critical_path_data_stale(task: Dict[str, Any], graph: "CriticalPathGraph", i: int) -> bool:
+        """Whether a loaded task row differs from the graph's results at index ``i``."""
+        return (
+            bool(task.get("is_critical")) != (graph.total_float[i] == 0)
+            or task.get("total_float_days") != graph.total_float[i]
+            or task.get("free_float_days") != graph.free_float[i]
+            or task.get("early_start_date") != date.fromordinal(graph.early_start[i]).isoformat()
+            or task.get("early_finish_date") != date.fromordinal(graph.early_finish[i]).isoformat()
+            or task.get("late_start_date") != date.fromordinal(graph.late_start[i]).isoformat()
+            or task.get("late_finish_date") != date.fromordinal(graph.late_finish[i]).isoformat()
+        )
     
     async def _update_task_critical_path_data(self, float_calculations: Dict, critical_tasks: List[str]) -> None:
-        """Update task records with critical path calculation results."""
-        for task_id, float_calc in float_calculations.items():
-            update_data = {
+        """
+        Update task records with critical path calculation results.
+        
+        Rows are written in batches through the update_task_critical_path_batch
+        RPC, falling back to per-row updates if the RPC is unavailable.
+        """
+        critical_tasks = set(critical_tasks)
+        updated_at = datetime.utcnow().isoformat()
+        records = [
+            {
+                "id": task_id,
                 "is_critical": task_id in critical_tasks,
                 "total_float_days": float_calc.total_float_days,
                 "free_float_days": float_calc.free_float_days,
@@ -740,13 +741,30 @@ class TaskDependencyEngine:
                 "early_finish_date": float_calc.early_finish_date.isoformat(),
                 "late_start_date": float_calc.late_start_date.isoformat(),
                 "late_finish_date": float_calc.late_finish_date.isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
+                "updated_at": updated_at
             }
+            for task_id, float_calc in float_calculations.items()
+        ]
+        
+        use_rpc = True
+        for i in range(0, len(records), self.CRITICAL_PATH_WRITE_BATCH):
+            chunk = records[i : i + self.CRITICAL_PATH_WRITE_BATCH]
             
-            try:
-                self.db.table("tasks").update(update_data).eq("id", task_id).execute()
-            except Exception as e:
-                logger.error(f"Error updating critical path data for task {task_id}: {e}")
+            if use_rpc:
+                try:
+                    await execute_async(self.db.rpc("update_task_critical_path_batch", {"records": chunk}), label="update_task_critical_path_batch")
+                    continue
+                except Exception as e:
+                    logger.warning("update_task_critical_path_batch RPC failed (%s), falling back to row updates", e)
+                    use_rpc = False
+            
+            for record in chunk:
+                task_id = record["id"]
+                update_data = {key: value for key, value in record.items() if key != "id"}
+                try:
+                    await execute_async(self.db.table("tasks").update(update_data).eq("id", task_id), label="tasks")
+                except Exception as e:
+                    logger.error(f"Error updating critical path data for task {task_id}: {e}")
     
     async def _identify_schedule_risk_factors(self, tasks: List[Dict], dependencies: List[Dict], critical_tasks: List[str]) -> List[str]:
         """Identify potential schedule risk factors."""
@@ -757,7 +775,8 @@ class TaskDependencyEngine:
             risk_factors.append("High percentage of critical tasks")
         
         # Tasks with very short duration on critical path
-        critical_task_data = [task for task in tasks if task["id"] in critical_tasks]
+        critical_task_set = set(critical_tasks)
+        critical_task_data = [task for task in tasks if task["id"] in critical_task_set]
         short_duration_critical = [task for task in critical_task_data if task["duration_days"] <= 1]
         if len(short_duration_critical) > 0:
             risk_factors.append("Critical tasks with very short duration")
@@ -781,9 +800,9 @@ class TaskDependencyEngine:
         """Analyze the impact of deleting a dependency."""
         try:
             # Get dependency details
-            dependency_result = self.db.table("task_dependencies").select("*").eq(
+            dependency_result = await execute_async(self.db.table("task_dependencies").select("*").eq(
                 "id", str(dependency_id)
-            ).execute()
+            ), label="task_dependencies")
             
             if not dependency_result.data:
                 return {"error": "Dependency not found"}
@@ -808,58 +827,51 @@ class TaskDependencyEngine:
     async def _find_affected_tasks(self, changed_task_id: UUID) -> List[str]:
         """Find all tasks that could be affected by a change to the given task."""
         try:
-            # Get all dependencies
-            dependencies_result = self.db.table("task_dependencies").select("*").execute()
-            if not dependencies_result.data:
+            # Only the changed task's schedule can be affected
+            task_result = await execute_async(self.db.table("tasks").select("schedule_id").eq("id", str(changed_task_id)), label="tasks")
+            if not task_result.data:
                 return []
             
-            dependencies = dependencies_result.data
+            schedule_id = task_result.data[0]["schedule_id"]
+            state = self._get_cpm_state(schedule_id)
+            graph = state[1] if state is not None else None
             
-            # Build successor graph
-            successors = defaultdict(list)
-            for dep in dependencies:
-                successors[dep["predecessor_task_id"]].append(dep["successor_task_id"])
+            if (
+                graph is None
+                or str(changed_task_id) not in graph.index
+                or await self._get_cpm_revision(schedule_id) != state[0]
+            ):
+                tasks_data = await self._get_schedule_tasks_and_dependencies(UUID(schedule_id))
+                graph = CriticalPathGraph(tasks_data["tasks"], tasks_data["dependencies"])
             
             # Find all downstream tasks using BFS
-            affected_tasks = []
-            visited = set()
-            queue = deque([str(changed_task_id)])
-            
-            while queue:
-                current_task = queue.popleft()
-                if current_task in visited:
-                    continue
-                
-                visited.add(current_task)
-                affected_tasks.append(current_task)
-                
-                # Add successors to queue
-                for successor in successors[current_task]:
-                    if successor not in visited:
-                        queue.append(successor)
-            
-            return affected_tasks
+            return graph.downstream_tasks(str(changed_task_id))
             
         except Exception as e:
             logger.error(f"Error finding affected tasks: {e}")
             return []
     
-    async def _trigger_schedule_recalculation(self, task_id: UUID) -> None:
+    async def _trigger_schedule_recalculation(self, task_id: UUID, change_type: str = "date_change") -> None:
         """Trigger schedule recalculation for a task's schedule."""
         try:
-            # Get task's schedule
-            task_result = self.db.table("tasks").select("schedule_id").eq("id", str(task_id)).execute()
-            if not task_result.data:
-                return
-            
-            schedule_id = UUID(task_result.data[0]["schedule_id"])
-            
             # Trigger recalculation (in a real system, this might be async)
-            await self.recalculate_schedule(schedule_id, task_id)
+            await self.auto_recalculate_on_task_change(task_id, change_type)
             
         except Exception as e:
             logger.error(f"Error triggering schedule recalculation: {e}")
     
+    def invalidate_cpm_state(self, schedule_id: Optional[UUID] = None) -> None:
+        """
+        Drop cached CPM state so the next recalculation reloads from the database.
+        
+        Args:
+            schedule_id: Schedule to invalidate (None clears every schedule)
+        """
+        if schedule_id is None:
+            self._cpm_states.clear()
+        else:
+            self._cpm_states.pop(str(schedule_id), None)
+    
     async def get_task_float(
         self,
         task_id: UUID
@@ -875,7 +887,7 @@ class TaskDependencyEngine:
         """
         try:
             # Get task details
-            task_result = self.db.table("tasks").select("*").eq("id", str(task_id)).execute()
+            task_result = await execute_async(self.db.table("tasks").select("*").eq("id", str(task_id)), label="tasks")
             if not task_result.data:
                 raise ValueError(f"Task {task_id} not found")
             
@@ -910,9 +922,9 @@ class TaskDependencyEngine:
         """
         try:
             # Get all critical tasks for the schedule
-            critical_tasks_result = self.db.table("tasks").select("*").eq(
+            critical_tasks_result = await execute_async(self.db.table("tasks").select("*").eq(
                 "schedule_id", str(schedule_id)
-            ).eq("is_critical", True).execute()
+            ).eq("is_critical", True), label="tasks")
             
             if not critical_tasks_result.data:
                 return []
@@ -1106,6 +1118,12 @@ class TaskDependencyEngine:
         """
         Automatically recalculate schedule when a task changes.
         
+        When the schedule's CPM state is cached and still current (see
+        schedules.cpm_revision), the change is propagated only through the
+        task's downstream/upstream cone and the result lists just the tasks
+        whose dates, float or criticality changed. Otherwise the whole schedule
+        is recalculated and its state cached.
+        
         Args:
             task_id: ID of the changed task
             change_type: Type of change (date_change, duration_change, status_change, etc.)
@@ -1116,8 +1134,10 @@ class TaskDependencyEngine:
             ScheduleRecalculationResult: Recalculation results
         """
         try:
-            # Get task's schedule
-            task_result = self.db.table("tasks").select("schedule_id").eq("id", str(task_id)).execute()
+            # Get task's schedule and current scheduling inputs
+            task_result = await execute_async(self.db.table("tasks").select(
+                "id, schedule_id, duration_days, planned_start_date"
+            ).eq("id", str(task_id)), label="tasks")
             if not task_result.data:
                 raise ValueError(f"Task {task_id} not found")
             
@@ -1139,8 +1159,15 @@ class TaskDependencyEngine:
                     recalculation_timestamp=datetime.utcnow()
                 )
             
-            # Perform recalculation
-            return await self.recalculate_schedule(schedule_id, task_id)
+            state = self._get_cpm_state(schedule_id)
+            if state is None or str(task_id) not in state[1].index:
+                # Perform full recalculation, which caches the schedule's CPM state
+                return await self.recalculate_schedule(schedule_id, task_id)
+            
+            cached_revision, graph = state
+            return await self._recalculate_incrementally(
+                schedule_id, cached_revision, graph, task_result.data[0], change_type
+            )
             
         except Exception as e:
             logger.error(f"Error in auto-recalculation for task {task_id}: {e}")
@@ -1249,14 +1276,12 @@ class TaskDependencyEngine:
             for schedule_id in schedule_ids:
                 try:
                     # For batch processing, we'll recalculate without a specific changed task
-                    # Get any task from the schedule to use as trigger
-                    tasks_result = self.db.table("tasks").select("id").eq(
-                        "schedule_id", str(schedule_id)
-                    ).limit(1).execute()
+                    # Load the schedule once and use its first task as trigger
+                    tasks_data = await self._get_schedule_tasks_and_dependencies(schedule_id)
                     
-                    if tasks_result.data:
-                        trigger_task_id = UUID(tasks_result.data[0]["id"])
-                        result = await self.recalculate_schedule(schedule_id, trigger_task_id)
+                    if tasks_data["tasks"]:
+                        trigger_task_id = UUID(tasks_data["tasks"][0]["id"])
+                        result = await self._recalculate_loaded_schedule(schedule_id, tasks_data, trigger_task_id)
                         
                         batch_results["results"].append({
                             "schedule_id": str(schedule_id),
@@ -1464,9 +1489,9 @@ class TaskDependencyEngine:
         """Sort schedules by priority for batch processing."""
         try:
             # Get schedule information
-            schedules_result = self.db.table("schedules").select("id, end_date, status").in_(
+            schedules_result = await execute_async(self.db.table("schedules").select("id, end_date, status").in_(
                 "id", [str(sid) for sid in schedule_ids]
-            ).execute()
+            ), label="schedules")
             
             if not schedules_result.data:
                 return schedule_ids
@@ -1485,4 +1510,461 @@ class TaskDependencyEngine:
             
         except Exception as e:
             logger.error(f"Error sorting schedules by priority: {e}")
-            return schedule_ids
\ No newline at end of file
+            return schedule_ids
+
+
+class CriticalPathGraph:
+    """
+    Adjacency-indexed task network used for critical path calculations.
+    
+    Tasks are mapped to integer indices and dates are held as day ordinals in
+    parallel lists, with each task keeping the indices of its incoming and
+    outgoing dependency edges. The forward pass, backward pass and free float
+    calculation therefore visit every task and dependency exactly once.
+    Dependencies that reference tasks outside the network are ignored.
+    """
+    
+    FINISH_TO_START = 0
+    START_TO_START = 1
+    FINISH_TO_FINISH = 2
+    START_TO_FINISH = 3
+    
+    _DEPENDENCY_TYPE_CODES = {
+        DependencyType.FINISH_TO_START: FINISH_TO_START,
+        DependencyType.START_TO_START: START_TO_START,
+        DependencyType.FINISH_TO_FINISH: FINISH_TO_FINISH,
+        DependencyType.START_TO_FINISH: START_TO_FINISH,
+    }
+    
+    def __init__(self, tasks: List[Dict], dependencies: List[Dict]):
+        self.task_ids: List[str] = [task["id"] for task in tasks]
+        self.index: Dict[str, int] = {task_id: i for i, task_id in enumerate(self.task_ids)}
+        self.durations: List[int] = [int(task["duration_days"]) for task in tasks]
+        self.planned_starts: List[int] = [
+            date.fromisoformat(task["planned_start_date"]).toordinal() for task in tasks
+        ]
+        
+        self.edge_predecessors: List[int] = []
+        self.edge_successors: List[int] = []
+        self.edge_types: List[int] = []
+        self.edge_lags: List[int] = []
+        self.predecessor_edges: List[List[int]] = [[] for _ in self.task_ids]
+        self.successor_edges: List[List[int]] = [[] for _ in self.task_ids]
+        self.dead_edges = 0  # Edge slots no longer referenced by any adjacency list
+        
+        for dep in dependencies:
+            pred = self.index.get(dep["predecessor_task_id"])
+            succ = self.index.get(dep["successor_task_id"])
+            if pred is None or succ is None:
+                continue
+            
+            edge = len(self.edge_predecessors)
+            self.edge_predecessors.append(pred)
+            self.edge_successors.append(succ)
+            self.edge_types.append(self._DEPENDENCY_TYPE_CODES[DependencyType(dep["dependency_type"])])
+            self.edge_lags.append(int(dep.get("lag_days") or 0))
+            self.successor_edges[pred].append(edge)
+            self.predecessor_edges[succ].append(edge)
+        
+        self.early_start: List[int] = []
+        self.early_finish: List[int] = []
+        self.late_start: List[int] = []
+        self.late_finish: List[int] = []
+        self.total_float: List[int] = []
+        self.free_float: List[int] = []
+        self.project_end = 0
+        self.positions: List[int] = []
+        self.is_acyclic = True
+    
+    def __len__(self) -> int:
+        return len(self.task_ids)
+    
+    def forward_order(self) -> List[int]:
+        """
+        Topological order of task indices (Kahn's algorithm on in-degree).
+        
+        Tasks that sit on or downstream of a dependency cycle are omitted and
+        keep their planned dates, matching the previous forward pass.
+        """
+        in_degree = [len(edges) for edges in self.predecessor_edges]
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order = []
+        
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for edge in self.successor_edges[current]:
+                succ = self.edge_successors[edge]
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+        
+        return order
+    
+    def backward_order(self) -> List[int]:
+        """Reverse topological order of task indices (Kahn's algorithm on out-degree)."""
+        out_degree = [len(edges) for edges in self.successor_edges]
+        queue = deque(i for i, degree in enumerate(out_degree) if degree == 0)
+        order = []
+        
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for edge in self.predecessor_edges[current]:
+                pred = self.edge_predecessors[edge]
+                out_degree[pred] -= 1
+                if out_degree[pred] == 0:
+                    queue.append(pred)
+        
+        return order
+    
+    def forward_pass(self) -> Tuple[List[int], List[int]]:
+        """Calculate early start and finish ordinals for every task."""
+        self.early_start = list(self.planned_starts)
+        self.early_finish = [start + duration - 1 for start, duration in zip(self.early_start, self.durations)]
+        
+        order = self.forward_order()
+        for current in order:
+            if self.predecessor_edges[current]:
+                self._forward_task(current)
+        
+        self._set_positions(order)
+        return self.early_start, self.early_finish
+    
+    def backward_pass(self, early_finish: Optional[List[int]] = None) -> Tuple[List[int], List[int]]:
+        """Calculate late start and finish ordinals against the latest early finish."""
+        if early_finish is None:
+            early_finish = self.early_finish
+        
+        durations = self.durations
+        self.project_end = max(early_finish)
+        self.late_finish = [self.project_end] * len(durations)
+        self.late_start = [self.project_end - duration + 1 for duration in durations]
+        
+        for current in self.backward_order():
+            if self.successor_edges[current]:
+                self._backward_task(current)
+        
+        return self.late_start, self.late_finish
+    
+    def _forward_task(self, current: int) -> None:
+        """Recompute one task's early dates from its planned start and predecessors."""
+        early_start = self.early_start
+        early_finish = self.early_finish
+        duration = self.durations[current]
+        max_early_start = self.planned_starts[current]
+        
+        for edge in self.predecessor_edges[current]:
+            pred = self.edge_predecessors[edge]
+            dep_type = self.edge_types[edge]
+            lag_days = self.edge_lags[edge]
+            
+            if dep_type == self.FINISH_TO_START:
+                constraint = early_finish[pred] + lag_days + 1
+            elif dep_type == self.START_TO_START:
+                constraint = early_start[pred] + lag_days
+            elif dep_type == self.FINISH_TO_FINISH:
+                constraint = early_finish[pred] + lag_days - duration + 1
+            else:
+                constraint = early_start[pred] + lag_days - duration + 1
+            
+            if constraint > max_early_start:
+                max_early_start = constraint
+        
+        early_start[current] = max_early_start
+        early_finish[current] = max_early_start + duration - 1
+    
+    def _backward_task(self, current: int) -> None:
+        """Recompute one task's late dates from the project end and its successors."""
+        late_start = self.late_start
+        late_finish = self.late_finish
+        min_late_finish = self.project_end
+        
+        for edge in self.successor_edges[current]:
+            succ = self.edge_successors[edge]
+            dep_type = self.edge_types[edge]
+            lag_days = self.edge_lags[edge]
+            
+            if dep_type == self.FINISH_TO_START:
+                constraint = late_start[succ] - lag_days - 1
+            elif dep_type == self.START_TO_START:
+                constraint = late_start[succ] - lag_days
+            else:
+                constraint = late_finish[succ] - lag_days
+            
+            if constraint < min_late_finish:
+                min_late_finish = constraint
+        
+        late_finish[current] = min_late_finish
+        late_start[current] = min_late_finish - self.durations[current] + 1
+    
+    def _set_positions(self, order: List[int]) -> None:
+        """Cache each task's topological position; -1 marks tasks on or behind a cycle."""
+        self.positions = [-1] * len(self.task_ids)
+        for position, current in enumerate(order):
+            self.positions[current] = position
+        self.is_acyclic = len(order) == len(self.task_ids)
+    
+    def free_floats(
+        self,
+        early_start: List[int],
+        early_finish: List[int],
+        total_float: List[int]
+    ) -> List[int]:
+        """
+        Free float per task: the gap to the earliest successor start, or the
+        total float for tasks without successors.
+        """
+        free_float = list(total_float)
+        
+        for current, outgoing in enumerate(self.successor_edges):
+            if not outgoing:
+                continue
+            
+            min_successor_start = min(early_start[self.edge_successors[edge]] for edge in outgoing)
+            free_float[current] = max(0, min_successor_start - early_finish[current] - 1)
+        
+        return free_float
+    
+    def calculate(self) -> "CriticalPathGraph":
+        """Run the forward pass, backward pass and float calculations."""
+        if not self.task_ids:
+            return self
+        
+        self.forward_pass()
+        self.backward_pass()
+        self.total_float = [late - early for late, early in zip(self.late_start, self.early_start)]
+        self.free_float = self.free_floats(self.early_start, self.early_finish, self.total_float)
+        return self
+    
+    def update_task(self, task_id: str, duration_days: int, planned_start_date: str) -> List[int]:
+        """
+        Apply a task's new duration and planned start, propagating only through
+        its downstream (early dates) and upstream (late dates) cone.
+        
+        Returns:
+            Indices of tasks whose dates, float or criticality changed
+        """
+        current = self.index[task_id]
+        duration = int(duration_days)
+        planned_start = date.fromisoformat(planned_start_date).toordinal()
+        duration_changed = duration != self.durations[current]
+        
+        self.durations[current] = duration
+        self.planned_starts[current] = planned_start
+        
+        return self.recalculate([current], [current] if duration_changed else [])
+    
+    def task_inputs_differ(self, task_id: str, duration_days: int, planned_start_date: str) -> bool:
+        """Whether a task's duration or planned start differs from the graph's."""
+        current = self.index[task_id]
+        return (
+            int(duration_days) != self.durations[current]
+            or date.fromisoformat(planned_start_date).toordinal() != self.planned_starts[current]
+        )
+    
+    def predecessors_differ(self, task_id: str, dependencies: List[Dict]) -> bool:
+        """Whether a task's incoming dependency rows differ from the graph's edges."""
+        current = self.index[task_id]
+        cached = sorted(
+            (self.edge_predecessors[edge], self.edge_types[edge], self.edge_lags[edge])
+            for edge in self.predecessor_edges[current]
+        )
+        loaded = sorted(
+            (
+                self.index[dep["predecessor_task_id"]],
+                self._DEPENDENCY_TYPE_CODES[DependencyType(dep["dependency_type"])],
+                int(dep.get("lag_days") or 0)
+            )
+            for dep in dependencies
+            if dep["predecessor_task_id"] in self.index and dep["successor_task_id"] == task_id
+        )
+        return cached != loaded
+    
+    def update_predecessors(self, task_id: str, dependencies: List[Dict]) -> List[int]:
+        """
+        Replace a task's incoming dependencies and propagate the change.
+        
+        Args:
+            task_id: ID of the successor task
+            dependencies: Current dependency rows whose successor is ``task_id``
+            
+        Returns:
+            Indices of tasks whose dates, float or criticality changed
+        """
+        current = self.index[task_id]
+        affected_predecessors = set()
+        
+        for edge in self.predecessor_edges[current]:
+            pred = self.edge_predecessors[edge]
+            self.successor_edges[pred].remove(edge)
+            affected_predecessors.add(pred)
+        self.dead_edges += len(self.predecessor_edges[current])
+        self.predecessor_edges[current] = []
+        
+        for dep in dependencies:
+            pred = self.index.get(dep["predecessor_task_id"])
+            if pred is None or dep["successor_task_id"] != task_id:
+                continue
+            
+            edge = len(self.edge_predecessors)
+            self.edge_predecessors.append(pred)
+            self.edge_successors.append(current)
+            self.edge_types.append(self._DEPENDENCY_TYPE_CODES[DependencyType(dep["dependency_type"])])
+            self.edge_lags.append(int(dep.get("lag_days") or 0))
+            self.successor_edges[pred].append(edge)
+            self.predecessor_edges[current].append(edge)
+            affected_predecessors.add(pred)
+        
+        # Compact once replaced edges outnumber live ones, so edits keep the arrays bounded
+        if self.dead_edges * 2 > len(self.edge_predecessors):
+            self._compact_edges()
+        
+        self._set_positions(self.forward_order())
+        return self.recalculate([current], sorted(affected_predecessors))
+    
+    def _compact_edges(self) -> None:
+        """Drop edge slots that no task references and renumber the live edges."""
+        live = sorted(edge for edges in self.predecessor_edges for edge in edges)
+        renumbered = {edge: i for i, edge in enumerate(live)}
+        
+        self.edge_predecessors = [self.edge_predecessors[edge] for edge in live]
+        self.edge_successors = [self.edge_successors[edge] for edge in live]
+        self.edge_types = [self.edge_types[edge] for edge in live]
+        self.edge_lags = [self.edge_lags[edge] for edge in live]
+        self.predecessor_edges = [[renumbered[edge] for edge in edges] for edges in self.predecessor_edges]
+        self.successor_edges = [[renumbered[edge] for edge in edges] for edges in self.successor_edges]
+        self.dead_edges = 0
+    
+    def recalculate(self, forward_seeds: List[int], backward_seeds: List[int]) -> List[int]:
+        """
+        Re-run the CPM passes for the cone affected by a change.
+        
+        Early dates are recomputed for the seeds' downstream tasks in
+        topological order. Late dates are recomputed for the upstream tasks
+        of ``backward_seeds``, or for every task when the project end moves.
+        Float is refreshed for all tasks whose inputs changed. Falls back to a
+        full calculation if the network contains a cycle.
+        
+        Returns:
+            Indices of tasks whose dates, float or criticality changed
+        """
+        previous = (
+            list(self.early_start), list(self.early_finish),
+            list(self.late_start), list(self.late_finish),
+            list(self.total_float), list(self.free_float)
+        )
+        
+        if not self.is_acyclic:
+            self.calculate()
+            return self._changed_indices(previous, range(len(self.task_ids)))
+        
+        positions = self.positions
+        forward_cone = self._reachable(forward_seeds, self.successor_edges, self.edge_successors)
+        for current in sorted(forward_cone, key=positions.__getitem__):
+            self._forward_task(current)
+        
+        if max(self.early_finish) != self.project_end:
+            self.backward_pass()
+            float_cone = set(range(len(self.task_ids)))
+        else:
+            backward_cone = self._reachable(backward_seeds, self.predecessor_edges, self.edge_predecessors)
+            for current in sorted(backward_cone, key=positions.__getitem__, reverse=True):
+                self._backward_task(current)
+            float_cone = forward_cone | backward_cone
+        
+        for current in float_cone:
+            self.total_float[current] = self.late_start[current] - self.early_start[current]
+        
+        # Free float also depends on successors' early starts
+        free_float_cone = set(float_cone)
+        for current in forward_cone:
+            for edge in self.predecessor_edges[current]:
+                free_float_cone.add(self.edge_predecessors[edge])
+        for current in free_float_cone:
+            self.free_float[current] = self._free_float_for(current)
+        
+        return self._changed_indices(previous, free_float_cone)
+    
+    def _reachable(self, seeds: List[int], adjacency: List[List[int]], edge_targets: List[int]) -> Set[int]:
+        """Seeds plus every task reachable from them along ``adjacency`` edges."""
+        visited = set(seeds)
+        queue = deque(visited)
+        
+        while queue:
+            current = queue.popleft()
+            for edge in adjacency[current]:
+                target = edge_targets[edge]
+                if target not in visited:
+                    visited.add(target)
+                    queue.append(target)
+        
+        return visited
+    
+    def _free_float_for(self, current: int) -> int:
+        """Free float of a single task from the current early dates and total float."""
+        outgoing = self.successor_edges[current]
+        if not outgoing:
+            return self.total_float[current]
+        
+        min_successor_start = min(self.early_start[self.edge_successors[edge]] for edge in outgoing)
+        return max(0, min_successor_start - self.early_finish[current] - 1)
+    
+    def _changed_indices(self, previous: Tuple[List[int], ...], candidates) -> List[int]:
+        """Candidate indices whose dates or float differ from the ``previous`` snapshot."""
+        current = (
+            self.early_start, self.early_finish,
+            self.late_start, self.late_finish,
+            self.total_float, self.free_float
+        )
+        return sorted(
+            i for i in candidates
+            if any(before[i] != after[i] for before, after in zip(previous, current))
+        )
+    
+    def critical_task_ids(self) -> List[str]:
+        """Task IDs with zero total float, in task order."""
+        return [task_id for task_id, total in zip(self.task_ids, self.total_float) if total == 0]
+    
+    def project_duration_days(self) -> int:
+        """Calendar span from the earliest early start to the latest early finish."""
+        if not self.task_ids:
+            return 0
+        return max(self.early_finish) - min(self.early_start) + 1
+    
+    def float_calculation(self, i: int) -> FloatCalculation:
+        """Build the FloatCalculation for the task at index ``i``."""
+        return FloatCalculation(
+            task_id=self.task_ids[i],
+            total_float_days=self.total_float[i],
+            free_float_days=self.free_float[i],
+            early_start_date=date.fromordinal(self.early_start[i]),
+            early_finish_date=date.fromordinal(self.early_finish[i]),
+            late_start_date=date.fromordinal(self.late_start[i]),
+            late_finish_date=date.fromordinal(self.late_finish[i])
+        )
+    
+    def float_calculations(self) -> Dict[str, FloatCalculation]:
+        """FloatCalculation for every task, keyed by task ID."""
+        return {task_id: self.float_calculation(i) for i, task_id in enumerate(self.task_ids)}
+    
+    def downstream_tasks(self, task_id: str) -> List[str]:
+        """Breadth-first list of the task and every task reachable through its successors."""
+        start = self.index.get(task_id)
+        if start is None:
+            return [task_id]
+        
+        visited = {start}
+        queue = deque([start])
+        affected = []
+        
+        while queue:
+            current = queue.popleft()
+            affected.append(self.task_ids[current])
+            for edge in self.successor_edges[current]:
+                succ = self.edge_successors[edge]
+                if succ not in visited:
+                    visited.add(succ)
+                    queue.append(succ)
+        
+        return affected
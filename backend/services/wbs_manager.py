@@ -25,6 +25,7 @@ from config.database import supabase
 from models.schedule import (
     WBSElementCreate, WBSElementResponse, WBSHierarchy, WBSValidationResult
 )
+from services.hierarchy_rollup import average_progress, fetch_all, roll_up, write_changes
 
 logger = logging.getLogger(__name__)
 
@@ -774,41 +775,48 @@ class WBSManager:
         """
         Update parent WBS element progress based on child element completion.
         
+        The parent and all of its ancestors are recalculated in one bottom-up
+        pass over the schedule's elements, loaded page by page, and only their
+        progress is written back.
+        
         Args:
             parent_element_id: ID of the parent element to update
         """
         try:
-            # Get child elements
-            children_result = self.db.table("wbs_elements").select(
-                "progress_percentage"
-            ).eq("parent_element_id", str(parent_element_id)).execute()
+            parent_result = self.db.table("wbs_elements").select("schedule_id").eq(
+                "id", str(parent_element_id)
+            ).execute()
             
-            if not children_result.data:
+            if not parent_result.data:
                 return
             
-            children = children_result.data
-            
-            # Calculate average progress (simple average for WBS elements)
-            total_progress = sum(child.get("progress_percentage", 0) for child in children)
-            average_progress = total_progress / len(children)
-            
-            # Update parent progress
-            update_data = {
-                "progress_percentage": int(round(average_progress)),
-                "updated_at": datetime.utcnow().isoformat()
+            # Load the whole WBS of the schedule once
+            schedule_id = str(parent_result.data[0]["schedule_id"])
+            elements = {
+                str(element["id"]): element
+                for element in fetch_all(lambda: self.db.table("wbs_elements").select(
+                    "id, parent_element_id, progress_percentage"
+                ).eq("schedule_id", schedule_id))
             }
             
-            result = self.db.table("wbs_elements").update(update_data).eq("id", str(parent_element_id)).execute()
+            rolled_up = roll_up(
+                elements, [str(parent_element_id)], "parent_element_id", self._wbs_rollup_fields
+            )
             
-            if result.data:
-                # Check if this parent has its own parent and continue rollup
-                parent_data = result.data[0]
-                if parent_data.get("parent_element_id"):
-                    await self._update_parent_wbs_progress_rollup(UUID(parent_data["parent_element_id"]))
+            now = datetime.utcnow().isoformat()
+            write_changes(self.db, "wbs_elements", {
+                element_id: {"progress_percentage": elements[element_id]["progress_percentage"], "updated_at": now}
+                for element_id in rolled_up
+            })
             
         except Exception as e:
             logger.error(f"Error updating parent WBS progress rollup for element {parent_element_id}: {e}")
     
+    @staticmethod
+    def _wbs_rollup_fields(children: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parent WBS element fields derived from its children (simple average for WBS elements)."""
+        return {"progress_percentage": int(round(average_progress(children)))}
+    
     # Work Package Management Methods
     
     async def create_work_package(
@@ -5,7 +5,9 @@ Provides batch processing capabilities for workflow operations to improve
 performance when handling multiple workflows or approvals simultaneously.
 """
 
+import json
 import logging
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
@@ -13,6 +15,7 @@ import asyncio
 
 from supabase import Client
 
+from config.database import execute_async
 from models.workflow import (
     WorkflowInstance,
     WorkflowApproval,
@@ -34,19 +37,21 @@ class WorkflowBatchProcessor:
     - Bulk notification sending
     """
     
-    def __init__(self, db: Client, batch_size: int = 100):
+    def __init__(self, db: Client, batch_size: int = 100, max_concurrent_writes: int = 10):
         """
         Initialize batch processor.
         
         Args:
             db: Supabase client instance
             batch_size: Maximum batch size for operations
+            max_concurrent_writes: Maximum grouped updates in flight at once
         """
         if not db:
             raise ValueError("Database client is required")
         
         self.db = db
         self.batch_size = batch_size
+        self.max_concurrent_writes = max_concurrent_writes
         
         logger.info(f"Initialized workflow batch processor with batch_size={batch_size}")
     
@@ -95,7 +100,7 @@ class WorkflowBatchProcessor:
                     batch_data.append(instance_data)
                 
                 # Execute batch insert
-                result = self.db.table("workflow_instances").insert(batch_data).execute()
+                result = await execute_async(self.db.table("workflow_instances").insert(batch_data), label="workflow_instances")
                 
                 if result.data:
                     created_instances.extend(result.data)
@@ -126,33 +131,13 @@ class WorkflowBatchProcessor:
         if not updates:
             return 0, []
         
-        success_count = 0
-        errors = []
-        
-        # Process updates concurrently with semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(10)  # Limit to 10 concurrent updates
-        
-        async def update_single(instance_id: UUID, update_data: Dict[str, Any]) -> bool:
-            async with semaphore:
-                try:
-                    update_data["updated_at"] = datetime.utcnow().isoformat()
-                    
-                    result = self.db.table("workflow_instances").update(update_data).eq(
-                        "id", str(instance_id)
-                    ).execute()
-                    
-                    return bool(result.data)
-                    
-                except Exception as e:
-                    errors.append(f"Instance {instance_id}: {str(e)}")
-                    logger.error(f"Error updating workflow instance {instance_id}: {e}")
-                    return False
-        
-        # Execute updates concurrently
-        tasks = [update_single(instance_id, update_data) for instance_id, update_data in updates]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (instance_id, {**update_data, "updated_at": now})
+            for instance_id, update_data in updates
+        ]
         
-        success_count = sum(1 for r in results if r is True)
+        success_count, errors = await self._update_rows_grouped("workflow_instances", rows, "Instance")
         
         logger.info(f"Updated {success_count}/{len(updates)} workflow instances in batch")
         
@@ -200,7 +185,7 @@ class WorkflowBatchProcessor:
                     batch_data.append(approval_data)
                 
                 # Execute batch insert
-                result = self.db.table("workflow_approvals").insert(batch_data).execute()
+                result = await execute_async(self.db.table("workflow_approvals").insert(batch_data), label="workflow_approvals")
                 
                 if result.data:
                     created_approvals.extend(result.data)
@@ -231,49 +216,78 @@ class WorkflowBatchProcessor:
         if not updates:
             return 0, []
         
-        success_count = 0
-        errors = []
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (approval_id, {
+                "status": decision,
+                "comments": comments,
+                "approved_at": now,
+                "updated_at": now
+            })
+            for approval_id, decision, comments in updates
+        ]
         
-        # Process updates concurrently with semaphore
-        semaphore = asyncio.Semaphore(10)
+        success_count, errors = await self._update_rows_grouped("workflow_approvals", rows, "Approval")
         
-        async def update_single(
-            approval_id: UUID,
-            decision: str,
-            comments: Optional[str]
-        ) -> bool:
+        logger.info(f"Updated {success_count}/{len(updates)} approvals in batch")
+        
+        return success_count, errors
+    
+    async def _update_rows_grouped(
+        self,
+        table: str,
+        rows: List[Tuple[UUID, Dict[str, Any]]],
+        error_label: str
+    ) -> Tuple[int, List[str]]:
+        """
+        Apply per-row updates as one filtered UPDATE per distinct payload.
+        
+        Rows are merged by id (later updates win), grouped by identical
+        payload and written with update(...).in_("id", chunk), so a bulk
+        status change costs len(rows) / batch_size requests instead of one
+        per row. Groups run concurrently up to max_concurrent_writes.
+        
+        Args:
+            table: Table to update
+            rows: List of (row_id, update_dict) tuples
+            error_label: Prefix for per-row error messages ("Instance", "Approval")
+            
+        Returns:
+            Tuple of (updated_row_count, error_messages)
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for row_id, payload in rows:
+            merged.setdefault(str(row_id), {}).update(payload)
+        
+        groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+        for row_id, payload in merged.items():
+            key = json.dumps(payload, sort_keys=True, default=str)
+            groups.setdefault(key, (payload, []))[1].append(row_id)
+        
+        errors = []
+        semaphore = asyncio.Semaphore(self.max_concurrent_writes)
+        
+        async def update_group(payload: Dict[str, Any], ids: List[str]) -> int:
             async with semaphore:
                 try:
-                    update_data = {
-                        "status": decision,
-                        "comments": comments,
-                        "approved_at": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat()
-                    }
-                    
-                    result = self.db.table("workflow_approvals").update(update_data).eq(
-                        "id", str(approval_id)
-                    ).execute()
-                    
-                    return bool(result.data)
+                    result = await execute_async(
+                        self.db.table(table).update(payload).in_("id", ids),
+                        label=table
+                    )
+                    return len(result.data or [])
                     
                 except Exception as e:
-                    errors.append(f"Approval {approval_id}: {str(e)}")
-                    logger.error(f"Error updating approval {approval_id}: {e}")
-                    return False
-        
-        # Execute updates concurrently
-        tasks = [
-            update_single(approval_id, decision, comments)
-            for approval_id, decision, comments in updates
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+                    errors.extend(f"{error_label} {row_id}: {str(e)}" for row_id in ids)
+                    logger.error(f"Error updating {len(ids)} rows in {table}: {e}")
+                    return 0
         
-        success_count = sum(1 for r in results if r is True)
+        counts = await asyncio.gather(*(
+            update_group(payload, ids[i:i + self.batch_size])
+            for payload, ids in groups.values()
+            for i in range(0, len(ids), self.batch_size)
+        ))
         
-        logger.info(f"Updated {success_count}/{len(updates)} approvals in batch")
-        
-        return success_count, errors
+        return sum(counts), errors
     
     # ==================== Batch Query Operations ====================
     
@@ -304,9 +318,9 @@ class WorkflowBatchProcessor:
                 id_strings = [str(id) for id in batch]
                 
                 # Execute batch query
-                result = self.db.table("workflow_instances").select("*").in_(
+                result = await execute_async(self.db.table("workflow_instances").select("*").in_(
                     "id", id_strings
-                ).execute()
+                ), label="workflow_instances")
                 
                 if result.data:
                     # Map results by ID
@@ -355,9 +369,9 @@ class WorkflowBatchProcessor:
                 id_strings = [str(id) for id in batch]
                 
                 # Execute batch query
-                result = self.db.table("workflow_approvals").select("*").in_(
+                result = await execute_async(self.db.table("workflow_approvals").select("*").in_(
                     "workflow_instance_id", id_strings
-                ).order("step_number").execute()
+                ).order("step_number"), label="workflow_approvals")
                 
                 if result.data:
                     # Group approvals by instance ID
@@ -452,6 +466,9 @@ class WorkflowBatchProcessor:
         """
         Expire multiple approvals in batch.
         
+        All approvals share one payload, so this is a single filtered
+        UPDATE per batch_size ids.
+        
         Args:
             approval_ids: List of approval IDs to expire
             
@@ -476,6 +493,9 @@ class WorkflowBatchProcessor:
         """
         Cancel multiple workflow instances in batch.
         
+        All instances share one payload, so this is a single filtered
+        UPDATE per batch_size ids.
+        
         Args:
             instance_ids: List of instance IDs to cancel
             reason: Cancellation reason
@@ -486,10 +506,11 @@ class WorkflowBatchProcessor:
         if not instance_ids:
             return 0, []
         
+        cancelled_at = datetime.utcnow().isoformat()
         updates = [
             (instance_id, {
                 "status": WorkflowStatus.CANCELLED.value,
-                "cancelled_at": datetime.utcnow().isoformat(),
+                "cancelled_at": cancelled_at,
                 "cancellation_reason": reason
             })
             for instance_id in instance_ids
@@ -520,3 +541,146 @@ class WorkflowBatchProcessor:
         
         self.batch_size = batch_size
         logger.info(f"Updated batch size to {batch_size}")
+
+
+class WorkflowWriteBuffer:
+    """
+    Coalesces workflow instance and approval updates into batched writes.
+    
+    Updates are held per row id (repeated updates to the same row merge, the
+    latest values winning) and flushed through WorkflowBatchProcessor when
+    max_pending rows are queued or flush_interval seconds have passed since
+    the oldest pending update. Use as an async context manager, or call
+    close(), so the tail is flushed.
+    """
+    
+    def __init__(
+        self,
+        processor: WorkflowBatchProcessor,
+        max_pending: Optional[int] = None,
+        flush_interval: float = 1.0
+    ):
+        """
+        Initialize write buffer.
+        
+        Args:
+            processor: Batch processor used to write flushed updates
+            max_pending: Pending rows that trigger a flush (default: processor batch size)
+            flush_interval: Seconds an update may wait before a flush
+        """
+        self.processor = processor
+        self.max_pending = max_pending or processor.get_batch_size()
+        self.flush_interval = flush_interval
+        
+        self._instance_updates: Dict[str, Dict[str, Any]] = {}
+        self._approval_updates: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._oldest_pending: Optional[float] = None
+        self._timer: Optional[asyncio.Task] = None
+        self._timer_flushing = False
+        self._closing = False
+        self._lock = asyncio.Lock()
+        
+        self.success_count = 0
+        self.errors: List[str] = []
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of rows waiting to be written."""
+        return len(self._instance_updates) + len(self._approval_updates)
+    
+    async def update_instance(self, instance_id: UUID, update_data: Dict[str, Any]) -> None:
+        """Queue an update to a workflow instance."""
+        self._instance_updates.setdefault(str(instance_id), {}).update(update_data)
+        await self._after_add()
+    
+    async def update_approval(self, approval_id: UUID, decision: str, comments: Optional[str] = None) -> None:
+        """Queue a decision on a workflow approval."""
+        self._approval_updates[str(approval_id)] = (decision, comments)
+        await self._after_add()
+    
+    async def flush(self) -> Tuple[int, List[str]]:
+        """
+        Write all pending updates.
+        
+        Returns:
+            Tuple of (success_count, error_messages) for this flush
+        """
+        async with self._lock:
+            instance_updates = list(self._instance_updates.items())
+            approval_updates = [
+                (approval_id, decision, comments)
+                for approval_id, (decision, comments) in self._approval_updates.items()
+            ]
+            self._instance_updates = {}
+            self._approval_updates = {}
+            self._oldest_pending = None
+            
+            success_count = 0
+            errors = []
+            
+            if instance_updates:
+                count, instance_errors = await self.processor.update_workflow_instances_batch(instance_updates)
+                success_count += count
+                errors.extend(instance_errors)
+            
+            if approval_updates:
+                count, approval_errors = await self.processor.update_approvals_batch(approval_updates)
+                success_count += count
+                errors.extend(approval_errors)
+            
+            self.success_count += success_count
+            self.errors.extend(errors)
+            
+            return success_count, errors
+    
+    async def close(self) -> None:
+        """Stop the flush timer and write anything still pending."""
+        timer, self._timer = self._timer, None
+        if timer is not None and not timer.done():
+            if self._timer_flushing:
+                # The timed flush has already taken its rows off the queue;
+                # cancelling it would drop them, so let it finish instead
+                self._closing = True
+                try:
+                    await timer
+                finally:
+                    self._closing = False
+            else:
+                timer.cancel()
+        
+        if self.pending_count:
+            await self.flush()
+    
+    async def __aenter__(self) -> "WorkflowWriteBuffer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _after_add(self) -> None:
+        """Flush on size or age, otherwise make sure the timer is running."""
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+        
+        if (
+            self.pending_count >= self.max_pending or
+            time.monotonic() - self._oldest_pending >= self.flush_interval
+        ):
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_after_interval())
+    
+    async def _flush_after_interval(self) -> None:
+        """Flush pending updates once the oldest has waited flush_interval."""
+        while self._oldest_pending is not None and not self._closing:
+            remaining = self.flush_interval - (time.monotonic() - self._oldest_pending)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+            self._timer_flushing = True
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Timed flush of workflow write buffer failed: {e}")
+            finally:
+                self._timer_flushing = False
@@ -13,6 +13,7 @@ from uuid import UUID
 from supabase import Client
 from postgrest.exceptions import APIError
 
+from config.database import execute_async
 from models.workflow import (
     WorkflowDefinition,
     WorkflowInstance,
@@ -77,7 +78,7 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflows").insert(workflow_data).execute()
+            result = await execute_async(self.db.table("workflows").insert(workflow_data), label="workflows")
             
             if not result.data:
                 raise RuntimeError("Failed to create workflow - no data returned")
@@ -108,9 +109,9 @@ class WorkflowRepository:
             return cached_workflow
         
         try:
-            result = self.db.table("workflows").select("*").eq(
+            result = await execute_async(self.db.table("workflows").select("*").eq(
                 "id", str(workflow_id)
-            ).execute()
+            ), label="workflows")
             
             workflow_data = result.data[0] if result.data else None
             
@@ -147,9 +148,9 @@ class WorkflowRepository:
             if status:
                 query = query.eq("status", status.value)
             
-            result = query.order("created_at", desc=True).range(
+            result = await execute_async(query.order("created_at", desc=True).range(
                 offset, offset + limit - 1
-            ).execute()
+            ), label="workflows")
             
             return result.data or []
             
@@ -175,9 +176,9 @@ class WorkflowRepository:
         try:
             updates["updated_at"] = datetime.utcnow().isoformat()
             
-            result = self.db.table("workflows").update(updates).eq(
+            result = await execute_async(self.db.table("workflows").update(updates).eq(
                 "id", str(workflow_id)
-            ).execute()
+            ), label="workflows")
             
             if result.data:
                 logger.info(f"Updated workflow: {workflow_id}")
@@ -305,9 +306,9 @@ class WorkflowRepository:
             True if deleted, False otherwise
         """
         try:
-            result = self.db.table("workflows").delete().eq(
+            result = await execute_async(self.db.table("workflows").delete().eq(
                 "id", str(workflow_id)
-            ).execute()
+            ), label="workflows")
             
             success = bool(result.data)
             if success:
@@ -387,9 +388,9 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflows").update(updates).eq(
+            result = await execute_async(self.db.table("workflows").update(updates).eq(
                 "id", str(workflow_id)
-            ).execute()
+            ), label="workflows")
             
             if not result.data:
                 raise RuntimeError("Failed to create workflow version - no data returned")
@@ -441,7 +442,7 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflow_instances").insert(instance_data).execute()
+            result = await execute_async(self.db.table("workflow_instances").insert(instance_data), label="workflow_instances")
             
             if not result.data:
                 raise RuntimeError("Failed to create workflow instance - no data returned")
@@ -497,7 +498,7 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflow_instances").insert(instance_data).execute()
+            result = await execute_async(self.db.table("workflow_instances").insert(instance_data), label="workflow_instances")
             
             if not result.data:
                 raise RuntimeError("Failed to create workflow instance - no data returned")
@@ -534,9 +535,9 @@ class WorkflowRepository:
             return cached_instance
         
         try:
-            result = self.db.table("workflow_instances").select("*").eq(
+            result = await execute_async(self.db.table("workflow_instances").select("*").eq(
                 "id", str(instance_id)
-            ).execute()
+            ), label="workflow_instances")
             
             instance_data = result.data[0] if result.data else None
             
@@ -568,9 +569,9 @@ class WorkflowRepository:
         try:
             updates["updated_at"] = datetime.utcnow().isoformat()
             
-            result = self.db.table("workflow_instances").update(updates).eq(
+            result = await execute_async(self.db.table("workflow_instances").update(updates).eq(
                 "id", str(instance_id)
-            ).execute()
+            ), label="workflow_instances")
             
             if result.data:
                 logger.info(f"Updated workflow instance: {instance_id}")
@@ -623,9 +624,9 @@ class WorkflowRepository:
             if started_by:
                 query = query.eq("started_by", str(started_by))
             
-            result = query.order("created_at", desc=True).range(
+            result = await execute_async(query.order("created_at", desc=True).range(
                 offset, offset + limit - 1
-            ).execute()
+            ), label="workflow_instances")
             
             return result.data or []
             
@@ -660,7 +661,7 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflow_approvals").insert(approval_data).execute()
+            result = await execute_async(self.db.table("workflow_approvals").insert(approval_data), label="workflow_approvals")
             
             if not result.data:
                 raise RuntimeError("Failed to create approval - no data returned")
@@ -700,9 +701,9 @@ class WorkflowRepository:
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            result = self.db.table("workflow_approvals").update(updates).eq(
+            result = await execute_async(self.db.table("workflow_approvals").update(updates).eq(
                 "id", str(approval_id)
-            ).execute()
+            ), label="workflow_approvals")
             
             if result.data:
                 logger.info(f"Updated approval: {approval_id} with decision: {decision}")
@@ -739,7 +740,7 @@ class WorkflowRepository:
             if step_number is not None:
                 query = query.eq("step_number", step_number)
             
-            result = query.order("step_number").execute()
+            result = await execute_async(query.order("step_number"), label="workflow_approvals")
             
             return result.data or []
             
@@ -772,7 +773,7 @@ class WorkflowRepository:
         
         try:
             # Get pending approvals for user
-            approvals_result = self.db.table("workflow_approvals").select(
+            approvals_result = await execute_async(self.db.table("workflow_approvals").select(
                 "*, workflow_instances!inner(*), workflows!inner(*)"
             ).eq(
                 "approver_id", str(user_id)
@@ -780,7 +781,7 @@ class WorkflowRepository:
                 "status", ApprovalStatus.PENDING.value
             ).order("created_at", desc=True).range(
                 offset, offset + limit - 1
-            ).execute()
+            ), label="workflow_approvals")
             
             approvals_data = approvals_result.data or []
             
@@ -805,9 +806,9 @@ class WorkflowRepository:
             Dict containing approval data or None if not found
         """
         try:
-            result = self.db.table("workflow_approvals").select("*").eq(
+            result = await execute_async(self.db.table("workflow_approvals").select("*").eq(
                 "id", str(approval_id)
-            ).execute()
+            ), label="workflow_approvals")
             
             return result.data[0] if result.data else None
             
@@ -831,9 +832,9 @@ class WorkflowRepository:
             Dict containing workflow and instance data or None if not found
         """
         try:
-            result = self.db.table("workflow_instances").select(
+            result = await execute_async(self.db.table("workflow_instances").select(
                 "*, workflows(*)"
-            ).eq("id", str(instance_id)).execute()
+            ).eq("id", str(instance_id)), label="workflow_instances")
             
             return result.data[0] if result.data else None
             
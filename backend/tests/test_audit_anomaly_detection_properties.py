@@ -477,6 +477,43 @@ async def test_feature_extraction_severity_mapping():
         )
 
 
+@pytest.mark.asyncio
+async def test_batch_feature_extraction_with_historical_context():
+    """
+    Test batch extraction matches per-event extraction against populated statistics,
+    including timestamps the vectorized parser hands back to the per-event path.
+    """
+    extractor = AuditFeatureExtractor(supabase_client=None)
+
+    historical_context = {
+        'event_type_frequencies': {'user_login': 30, 'budget_change': 5},
+        'user_activity_stats': {
+            'user-1': {'events_per_hour': 4.0, 'events_per_day': 90.0,
+                       'avg_events_per_day': 60.0, 'std_events_per_day': 10.0}
+        },
+        'entity_access_patterns': {'project:p-1': 12, 'project': 3, 'risk:r-1': 5}
+    }
+
+    events = [
+        {'event_type': 'user_login', 'user_id': 'user-1', 'entity_type': 'project',
+         'entity_id': 'p-1', 'severity': 'WARNING', 'timestamp': '2024-01-13T10:30:00+05:30'},
+        {'event_type': 'budget_change', 'user_id': 'user-2', 'entity_type': 'risk',
+         'entity_id': 'r-1', 'severity': 'critical', 'timestamp': '2024-01-15 09:00:00Z',
+         'action_details': {'changes': [{'field': 'budget'}]},
+         'performance_metrics': {'execution_time': 12}},
+        {'event_type': 'report_generated', 'entity_type': 'project',
+         'timestamp': datetime(2024, 1, 16, 18, 0)},
+        {'event_type': 'user_login', 'timestamp': '2024-01-17', 'severity': None},
+        {'event_type': 'user_login', 'timestamp': 'not a timestamp'},
+    ]
+
+    individual = [await extractor.extract_features(event, historical_context) for event in events]
+    batch = await extractor.extract_batch_features(events, historical_context)
+
+    assert batch.shape == (len(events), 18)
+    assert np.allclose(batch, np.array(individual))
+
+
 # ============================================================================
 # Unit Tests for Alert Generation
 # ============================================================================
@@ -789,6 +789,322 @@ class TestDependencyEdgeCases:
             f"Task 2 should start at or after {expected_task2_start}, got {actual_task2_start}"
 
 
+# =====================================================
+# ADJACENCY-INDEXED CPM ENGINE
+# **Validates: Requirements 4.1, 4.3, 4.4**
+# =====================================================
+
+@st.composite
+def mixed_type_network_strategy(draw, min_tasks=2, max_tasks=25):
+    """Generate an acyclic task network using all four dependency types."""
+    network = draw(task_network_strategy(min_tasks=min_tasks, max_tasks=max_tasks))
+    tasks = network["tasks"]
+    
+    dependencies = []
+    num_deps = draw(st.integers(min_value=0, max_value=2 * len(tasks)))
+    for _ in range(num_deps):
+        pred_idx = draw(st.integers(min_value=0, max_value=len(tasks) - 2))
+        succ_idx = draw(st.integers(min_value=pred_idx + 1, max_value=len(tasks) - 1))
+        dependencies.append({
+            "predecessor_task_id": tasks[pred_idx]["id"],
+            "successor_task_id": tasks[succ_idx]["id"],
+            "dependency_type": draw(dependency_type_strategy()),
+            "lag_days": draw(st.integers(min_value=-3, max_value=5))
+        })
+    
+    return {"tasks": draw(st.permutations(tasks)), "dependencies": dependencies}
+
+
+class TestCriticalPathGraph:
+    """Property tests for the adjacency-indexed CriticalPathGraph used by TaskDependencyEngine."""
+    
+    @given(mixed_type_network_strategy())
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    def test_graph_matches_reference_passes(self, network: Dict):
+        """
+        Property: The indexed forward/backward passes produce the same dates and
+        total float as the reference list-scanning algorithm.
+        
+        **Validates: Requirements 4.1, 4.3**
+        """
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        tasks = network["tasks"]
+        dependencies = network["dependencies"]
+        
+        early_dates = calculate_early_dates(tasks, dependencies)
+        late_dates = calculate_late_dates(tasks, dependencies, early_dates)
+        float_calcs = calculate_float(tasks, dependencies, early_dates, late_dates)
+        
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
+        graph_calcs = graph.float_calculations()
+        
+        for task_id, calc in graph_calcs.items():
+            assert calc.early_start_date == early_dates[task_id]["early_start"]
+            assert calc.early_finish_date == early_dates[task_id]["early_finish"]
+            assert calc.late_start_date == late_dates[task_id]["late_start"]
+            assert calc.late_finish_date == late_dates[task_id]["late_finish"]
+            assert calc.total_float_days == float_calcs[task_id]["total_float_days"]
+        
+        assert set(graph.critical_task_ids()) == set(identify_critical_path(float_calcs))
+    
+    def test_ignores_dependencies_outside_schedule(self):
+        """Dependencies referencing tasks outside the network do not affect dates."""
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        tasks = [{"id": "a", "planned_start_date": "2026-01-01", "duration_days": 3}]
+        dependencies = [{
+            "predecessor_task_id": "other-schedule-task",
+            "successor_task_id": "a",
+            "dependency_type": "finish_to_start",
+            "lag_days": 10
+        }]
+        
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
+        
+        assert graph.float_calculations()["a"].early_start_date == date(2026, 1, 1)
+        assert graph.critical_task_ids() == ["a"]
+        assert graph.project_duration_days() == 3
+    
+    def test_large_chain_is_linear(self):
+        """A 15,000-task chain is scheduled end to end with every task critical."""
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        count = 15000
+        tasks = [
+            {"id": f"t{i}", "planned_start_date": "2026-01-01", "duration_days": 2}
+            for i in range(count)
+        ]
+        dependencies = [
+            {
+                "predecessor_task_id": f"t{i}",
+                "successor_task_id": f"t{i + 1}",
+                "dependency_type": "finish_to_start",
+                "lag_days": 0
+            }
+            for i in range(count - 1)
+        ]
+        
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
+        
+        assert graph.project_duration_days() == 2 * count
+        assert len(graph.critical_task_ids()) == count
+        assert graph.downstream_tasks("t14998") == ["t14998", "t14999"]
+    
+    def test_replaced_edges_are_compacted(self):
+        """Repeated dependency edits on a cached graph keep the edge arrays bounded."""
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        tasks = [
+            {"id": f"t{i}", "planned_start_date": "2026-01-01", "duration_days": 2}
+            for i in range(4)
+        ]
+        
+        def chain(lag_days):
+            return [
+                {
+                    "predecessor_task_id": f"t{i}",
+                    "successor_task_id": f"t{i + 1}",
+                    "dependency_type": "finish_to_start",
+                    "lag_days": lag_days
+                }
+                for i in range(3)
+            ]
+        
+        graph = CriticalPathGraph(tasks, chain(0)).calculate()
+        for lag_days in range(1, 50):
+            dependencies = chain(lag_days)
+            for dep in dependencies:
+                graph.update_predecessors(dep["successor_task_id"], [dep])
+            
+            assert len(graph.edge_predecessors) <= 2 * len(dependencies)
+            expected = CriticalPathGraph(tasks, dependencies).calculate()
+            assert graph.float_calculations() == expected.float_calculations()
+    
+    @given(mixed_type_network_strategy(), st.data())
+    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    def test_incremental_update_matches_full_recalculation(self, network: Dict, data):
+        """
+        Property: Propagating a duration/start edit or a dependency change through
+        the cached state gives the same results as a full recalculation, and
+        reports exactly the tasks whose dates or float changed.
+        
+        **Validates: Requirements 4.4, 4.5**
+        """
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        tasks = [dict(task) for task in network["tasks"]]
+        dependencies = list(network["dependencies"])
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
+        
+        def snapshot(g):
+            return [list(values) for values in (
+                g.early_start, g.early_finish, g.late_start, g.late_finish, g.total_float, g.free_float
+            )]
+        
+        for _ in range(3):
+            before = snapshot(graph)
+            task = data.draw(st.sampled_from(tasks))
+            
+            edit = data.draw(st.sampled_from(["task", "remove_predecessors", "add_predecessors"]))
+            
+            if edit == "task":
+                task["duration_days"] = data.draw(st.integers(min_value=1, max_value=10))
+                task["planned_start_date"] = (
+                    date(2026, 1, 1) + timedelta(days=data.draw(st.integers(min_value=0, max_value=60)))
+                ).isoformat()
+                changed = graph.update_task(task["id"], task["duration_days"], task["planned_start_date"])
+            elif edit == "remove_predecessors":
+                dependencies = [dep for dep in dependencies if dep["successor_task_id"] != task["id"]]
+                changed = graph.update_predecessors(task["id"], [])
+            else:
+                # Any task outside the edited task's downstream cone can become a
+                # predecessor without creating a cycle
+                downstream = set(graph.downstream_tasks(task["id"]))
+                candidates = [t["id"] for t in tasks if t["id"] not in downstream]
+                assume(candidates)
+                for predecessor_id in data.draw(st.lists(
+                    st.sampled_from(candidates), min_size=1, max_size=3, unique=True
+                )):
+                    dependencies.append({
+                        "predecessor_task_id": predecessor_id,
+                        "successor_task_id": task["id"],
+                        "dependency_type": data.draw(dependency_type_strategy()),
+                        "lag_days": data.draw(st.integers(min_value=-3, max_value=5))
+                    })
+                changed = graph.update_predecessors(
+                    task["id"], [dep for dep in dependencies if dep["successor_task_id"] == task["id"]]
+                )
+            
+            expected = CriticalPathGraph(tasks, dependencies).calculate()
+            after = snapshot(expected)
+            
+            assert snapshot(graph) == after
+            assert changed == [
+                i for i in range(len(tasks))
+                if any(old[i] != new[i] for old, new in zip(before, after))
+            ]
+    
+    @staticmethod
+    def _cached_engine_fixture():
+        """An engine with a mocked database, and a four-task schedule to cache."""
+        from unittest.mock import MagicMock, patch
+        from services.task_dependency_engine import TaskDependencyEngine
+        
+        schedule_id = str(uuid4())
+        tasks = [
+            {"id": "a", "schedule_id": schedule_id, "planned_start_date": "2026-01-01", "duration_days": 5},
+            {"id": "b", "schedule_id": schedule_id, "planned_start_date": "2026-01-01", "duration_days": 3},
+            {"id": "c", "schedule_id": schedule_id, "planned_start_date": "2026-01-01", "duration_days": 2},
+            {"id": "x", "schedule_id": schedule_id, "planned_start_date": "2026-01-01", "duration_days": 1},
+        ]
+        dependencies = [
+            {"predecessor_task_id": "a", "successor_task_id": "b",
+             "dependency_type": "finish_to_start", "lag_days": 0},
+            {"predecessor_task_id": "b", "successor_task_id": "c",
+             "dependency_type": "finish_to_start", "lag_days": 0},
+        ]
+        
+        mock_db = MagicMock()
+        with patch("services.task_dependency_engine.supabase", mock_db):
+            engine = TaskDependencyEngine()
+        
+        def serve(rows_by_table):
+            """Answer table(...).select(...).eq(...)/.in_(...) queries from per-table rows."""
+            def table(name):
+                rows = rows_by_table.get(name, [])
+                query = MagicMock()
+                query.select.return_value.eq.side_effect = lambda column, value: MagicMock(
+                    execute=MagicMock(return_value=MagicMock(
+                        data=[row for row in rows if str(row.get(column)) == str(value)]
+                    ))
+                )
+                query.select.return_value.in_.side_effect = lambda column, values: MagicMock(
+                    execute=MagicMock(return_value=MagicMock(
+                        data=[row for row in rows if row.get(column) in values]
+                    ))
+                )
+                return query
+            mock_db.reset_mock()
+            mock_db.table.side_effect = table
+        
+        return engine, mock_db, serve, schedule_id, tasks, dependencies
+    
+    def test_auto_recalculation_writes_only_changed_rows(self):
+        """A cached schedule propagates a duration edit and batch-writes only changed tasks."""
+        import asyncio
+        
+        engine, mock_db, serve, schedule_id, tasks, dependencies = self._cached_engine_fixture()
+        
+        async def run():
+            await engine._run_critical_path_analysis(
+                {"tasks": tasks, "dependencies": dependencies, "cpm_revision": 7}, schedule_id
+            )
+            
+            # The edit itself bumped the revision once
+            serve({
+                "tasks": [tasks[0], dict(tasks[1], duration_days=4), tasks[2], tasks[3]],
+                "schedules": [{"id": schedule_id, "cpm_revision": 8}],
+            })
+            return await engine.auto_recalculate_on_task_change("b", "duration_change")
+        
+        result = asyncio.run(run())
+        
+        # b and c slip a day; x gains a day of float; a is unaffected
+        assert result.affected_tasks == ["b", "c", "x"]
+        assert result.new_critical_path == ["a", "b", "c"]
+        assert not result.critical_path_changed
+        
+        mock_db.rpc.assert_called_once()
+        rpc_name, rpc_params = mock_db.rpc.call_args[0]
+        assert rpc_name == "update_task_critical_path_batch"
+        assert [record["id"] for record in rpc_params["records"]] == ["b", "c", "x"]
+        assert engine._cpm_states[schedule_id][0] == 8
+    
+    def test_auto_recalculation_reloads_state_changed_by_another_writer(self):
+        """A revision that moved beyond this edit discards the cached graph for a full recalculation."""
+        import asyncio
+        
+        engine, mock_db, serve, schedule_id, tasks, dependencies = self._cached_engine_fixture()
+        
+        async def run():
+            await engine._run_critical_path_analysis(
+                {"tasks": tasks, "dependencies": dependencies, "cpm_revision": 7}, schedule_id
+            )
+            
+            # Another writer extended a to 10 days in addition to this edit of b
+            serve({
+                "tasks": [dict(tasks[0], duration_days=10), dict(tasks[1], duration_days=4), tasks[2], tasks[3]],
+                "schedules": [{"id": schedule_id, "cpm_revision": 9}],
+                "task_dependencies": dependencies,
+            })
+            return await engine.auto_recalculate_on_task_change("b", "duration_change")
+        
+        result = asyncio.run(run())
+        
+        # A full recalculation sees a's new duration: 10 + 4 + 2 days
+        assert result.new_critical_path == ["a", "b", "c"]
+        revision, graph = engine._cpm_states[schedule_id]
+        assert revision == 9
+        assert graph.project_duration_days() == 16
+    
+    def test_cpm_state_cache_is_bounded(self):
+        """The least recently used schedules are evicted beyond CPM_STATE_CACHE_SIZE."""
+        from services.task_dependency_engine import CriticalPathGraph
+        
+        engine, _, _, _, tasks, dependencies = self._cached_engine_fixture()
+        graph = CriticalPathGraph(tasks, dependencies).calculate()
+        schedule_ids = [str(uuid4()) for _ in range(engine.CPM_STATE_CACHE_SIZE + 1)]
+        
+        for schedule_id in schedule_ids:
+            engine._store_cpm_state(schedule_id, 1, graph)
+            engine._get_cpm_state(schedule_ids[0])
+        
+        assert len(engine._cpm_states) == engine.CPM_STATE_CACHE_SIZE
+        assert schedule_ids[0] in engine._cpm_states
+        assert schedule_ids[1] not in engine._cpm_states
+
+
 # =====================================================
 # RUN TESTS
 # =====================================================
@@ -3,6 +3,7 @@ Tests for Distribution Rules Engine
 Phase 2 & 3: Distribution Settings and Rules
 """
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 from services.distribution_rules_engine import (
     DistributionRulesEngine,
@@ -42,6 +43,18 @@ class TestCalculatePeriods:
         assert len(periods) == 3
         assert periods[0].start_date == start
     
+    def test_quarterly_periods(self, engine):
+        """Test quarterly period generation from a mid-quarter start"""
+        start = datetime(2024, 2, 15)
+        end = datetime(2025, 1, 1)
+        
+        periods = engine.calculate_periods(start, end, Granularity.QUARTER)
+        
+        assert [p.start_date for p in periods] == [
+            start, datetime(2024, 4, 1), datetime(2024, 7, 1), datetime(2024, 10, 1)
+        ]
+        assert periods[-1].end_date == end
+    
     def test_periods_are_contiguous(self, engine):
         """Test that periods have no gaps"""
         start = datetime(2024, 1, 1)
@@ -282,3 +295,90 @@ class TestApplyRule:
         assert result.error is None
         assert result.profile == DistributionProfile.AI_GENERATED
         assert result.confidence is not None
+
+
+class TestBatchDistribution:
+    """Test vectorized distribution of many line items"""
+    
+    ITEMS = [
+        (120000, datetime(2024, 1, 15), datetime(2024, 7, 1), DistributionProfile.LINEAR),
+        (80000, datetime(2024, 3, 1), datetime(2024, 11, 20), DistributionProfile.AI_GENERATED),
+        (50000, datetime(2024, 2, 1), datetime(2024, 5, 1), DistributionProfile.CUSTOM),
+        (10000, datetime(2024, 6, 1), datetime(2024, 6, 1), DistributionProfile.LINEAR),
+    ]
+    CUSTOM = [None, None, [20.0, 30.0, 50.0], None]
+    
+    def distribute(self, engine, granularity=Granularity.MONTH, **kwargs):
+        amounts, starts, ends, profiles = zip(*self.ITEMS)
+        return engine.distribute_batch(
+            amounts, starts, ends, profiles, granularity, custom_percentages=self.CUSTOM, **kwargs
+        )
+    
+    @pytest.mark.parametrize("granularity", [Granularity.MONTH, Granularity.QUARTER])
+    def test_rows_match_single_item_distribution(self, engine, granularity):
+        """Test each matrix row equals the single-item result on the shared calendar"""
+        result = self.distribute(engine, granularity)
+        matrix = result.matrix
+        
+        singles = [
+            engine.apply_linear_distribution(120000, self.ITEMS[0][1], self.ITEMS[0][2], granularity),
+            engine.generate_s_curve_distribution(80000, self.ITEMS[1][1], self.ITEMS[1][2], granularity),
+        ]
+        for row, single in zip(matrix, singles):
+            columns = np.flatnonzero(row)
+            assert np.allclose(row[columns], [p.amount for p in single.periods])
+            assert result.period_starts[columns[0]] <= np.datetime64(single.periods[0].start_date.date())
+        
+        if granularity == Granularity.MONTH:
+            assert np.allclose(matrix[2][matrix[2] > 0], [10000, 15000, 25000])
+    
+    def test_invalid_items_are_reported(self, engine):
+        """Test empty date ranges and bad custom percentages leave rows empty"""
+        result = self.distribute(engine, Granularity.QUARTER)
+        
+        assert result.errors == {2: "Expected 2 percentages, got 3", 3: "No periods available"}
+        assert not result.matrix[2:].any()
+    
+    def test_aggregate_by_key(self, engine):
+        """Test aggregation by project sums item rows per period"""
+        result = self.distribute(engine)
+        
+        labels, amounts = result.aggregate(["p1", "p2", "p1", "p2"])
+        
+        assert labels == ["p1", "p2"]
+        assert np.allclose(amounts[0], result.matrix[0] + result.matrix[2])
+        assert np.allclose(amounts.sum(axis=0), result.totals())
+        assert abs(amounts.sum() - 250000) < 0.01
+    
+    def test_weekly_periods_start_on_monday(self, engine):
+        """Test weekly calendar is aligned to Mondays"""
+        result = self.distribute(engine, Granularity.WEEK)
+        
+        assert all(start.astype(datetime).weekday() == 0 for start in result.period_starts)
+        assert abs(result.matrix[0].sum() - 120000) < 0.01
+    
+    def test_reprofiling_spreads_remaining_budget(self, engine):
+        """Test batch reprofiling matches apply_reprofiling"""
+        current_date = datetime(2024, 4, 1)
+        result = self.distribute(engine, current_spend=[40000, 90000, 10000, 0], current_date=current_date)
+        
+        single = engine.apply_reprofiling(
+            120000, 40000, self.ITEMS[0][1], self.ITEMS[0][2], Granularity.MONTH, current_date
+        )
+        row = result.matrix[0]
+        assert np.allclose(row[row > 0], [p.amount for p in single.periods if p.amount > 0])
+        assert result.errors[1] == "Budget fully consumed"
+        assert abs(result.matrix[2].sum() - 40000) < 0.01
+    
+    def test_reprofiling_cut_off_keeps_time_of_day(self, engine):
+        """Test a period starting on the cut-off day is past once the day has begun"""
+        current_date = datetime(2024, 4, 1, 10, 30)
+        result = self.distribute(engine, current_spend=[40000, 0, 0, 0], current_date=current_date)
+        
+        single = engine.apply_reprofiling(
+            120000, 40000, self.ITEMS[0][1], self.ITEMS[0][2], Granularity.MONTH, current_date
+        )
+        row = result.matrix[0]
+        assert np.allclose(row[row > 0], [p.amount for p in single.periods if p.amount > 0])
+        assert np.count_nonzero(row) == 2
+
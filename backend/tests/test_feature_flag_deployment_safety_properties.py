@@ -157,6 +157,9 @@ class MockTable:
         return self
     
     def execute(self):
+        if self._data is None and self.table_name == 'feature_flags' and 'select' in self._query:
+            # Unfiltered select returns every flag
+            return MockResponse(list(self.client.feature_flags.values()))
         return MockResponse(self._data if self._data is not None else [])
 
 
@@ -680,9 +680,159 @@ class TestBatchManagement:
 
 
 # ============================================================================
-# Edge Cases and Error Handling Tests
+# Streaming Import Tests
 # ============================================================================
 
+class TestStreamingImport:
+    """Tests for chunked, constant-memory import processing."""
+    
+    @pytest.fixture
+    def streaming_service(self):
+        """Service with a real PO service over a chainable Supabase mock."""
+        client = Mock()
+        for method in ('table', 'select', 'insert', 'update', 'upsert', 'eq', 'in_', 'order', 'range'):
+            setattr(client, method, Mock(return_value=client))
+        client.execute = Mock(return_value=Mock(data=[]))
+        
+        service = ImportProcessingService(client)
+        service.po_service.schedule_automatic_variance_recalculation = AsyncMock(return_value=True)
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_stream_csv_rows_matches_full_parse(self, import_service, default_import_config):
+        """Test that chunked parsing handles quotes and newlines across chunk boundaries."""
+        csv_content = (
+            'Name,Code,PO Number,Planned Amount,Actual Amount,Notes\r\n'
+            'Item 1,T001,PO1,"10,000.00",5000.00,"multi\nline ""quoted"" note"\r\n'
+            '\r\n'
+            'Ünïcode item,T002,PO2,200.00,100.00,\r\n'
+            'Short row,T003'
+        )
+        config = default_import_config.model_copy(update={'encoding': 'utf-8-sig'})
+        file = UploadFile(filename="test.csv", file=io.BytesIO(csv_content.encode('utf-8-sig')))
+        
+        streamed = []
+        errors = []
+        progress = {'bytes_read': 0}
+        with patch('services.import_processing_service.STREAM_READ_CHUNK_BYTES', 5):
+            async for row_num, row in import_service._stream_csv_rows(file, config, errors, progress):
+                streamed.append(row)
+        
+        expected = import_service._parse_csv_content(csv_content, config, [], [])
+        assert streamed == expected
+        assert len(streamed) == 3
+        assert streamed[0]['custom_fields']['Notes'] == 'multi\nline "quoted" note'
+        assert progress['bytes_read'] == len(csv_content.encode('utf-8-sig'))
+    
+    @pytest.mark.asyncio
+    async def test_streaming_import_writes_bounded_batches(self, streaming_service, default_import_config):
+        """Test that rows are written batch by batch with progress reported between batches."""
+        rows = '\n'.join(f"Item {i},T{i:03d},PO{i},100.00,50.00" for i in range(5))
+        csv_content = "Name,Code,PO Number,Planned Amount,Actual Amount\n" + rows + "\n"
+        file = UploadFile(filename="big.csv", file=io.BytesIO(csv_content.encode('utf-8')))
+        config = default_import_config.model_copy(update={'streaming': True})
+        
+        status_updates = []
+        
+        async def record_status(batch_id, status, status_message=None, metrics=None):
+            status_updates.append((status, dict(metrics or {})))
+        
+        streaming_service._update_batch_status = record_status
+        
+        with patch('services.import_processing_service.STREAM_BATCH_SIZE', 2):
+            result = await streaming_service.process_csv_import(
+                file=file,
+                project_id=uuid4(),
+                config=config,
+                user_id=uuid4()
+            )
+        
+        assert result.status == ImportStatus.completed
+        assert result.total_records == 5
+        assert result.successful_records == 5
+        assert len(result.created_breakdown_ids) == 5
+        assert streaming_service.supabase.upsert.call_count == 3
+        
+        progress_updates = [metrics for status, metrics in status_updates if status == ImportStatus.processing and metrics]
+        assert [m['processed_records'] for m in progress_updates] == [2, 4, 5]
+        streaming_service.po_service.schedule_automatic_variance_recalculation.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_streaming_import_skips_duplicate_codes(self, streaming_service, default_import_config):
+        """Test that codes repeated in the file fail the later row, as in row-by-row imports."""
+        csv_content = (
+            "Name,Code,PO Number,Planned Amount,Actual Amount\n"
+            "Item 1,T001,PO1,100.00,50.00\n"
+            "Item 2,T001,PO2,100.00,50.00\n"
+        )
+        file = UploadFile(filename="dup.csv", file=io.BytesIO(csv_content.encode('utf-8')))
+        config = default_import_config.model_copy(update={'streaming': True})
+        
+        result = await streaming_service.process_csv_import(
+            file=file,
+            project_id=uuid4(),
+            config=config,
+            user_id=uuid4()
+        )
+        
+        assert result.successful_records == 1
+        assert result.failed_records == 1
+        assert result.status == ImportStatus.partially_completed
+        assert "already exists" in result.errors[0].message
+    
+    @pytest.mark.asyncio
+    async def test_stream_excel_rows(self, import_service, default_import_config):
+        """Test that Excel rows are streamed from the spooled upload."""
+        openpyxl = pytest.importorskip('openpyxl')
+        
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Name', 'Code', 'PO Number', 'Planned Amount', 'Actual Amount'])
+        sheet.append(['Item 1', 'T001', 'PO1', 100, 50])
+        sheet.append([None, None, None, None, None])
+        sheet.append(['Item 2', 'T002', 'PO2', 200, 75])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+        
+        file = UploadFile(filename="test.xlsx", file=buffer)
+        rows = [row async for row in import_service._stream_excel_rows(file, default_import_config, [])]
+        
+        assert [row_num for row_num, row in rows] == [2, 4]
+        assert [row['code'] for row_num, row in rows] == ['T001', 'T002']
+        assert rows[1][1]['planned_amount'] == '200'
+    
+    @pytest.mark.asyncio
+    async def test_streaming_excel_errors_keep_sheet_row_numbers(self, streaming_service, default_import_config):
+        """Test that errors after blank Excel rows report the row number shown in the sheet."""
+        openpyxl = pytest.importorskip('openpyxl')
+        
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Name', 'Code', 'PO Number', 'Planned Amount', 'Actual Amount'])
+        sheet.append(['Item 1', 'T001', 'PO1', 100, 50])
+        sheet.append([None, None, None, None, None])
+        sheet.append([None, None, None, None, None])
+        sheet.append(['Item 2', 'T001', 'PO2', 200, 75])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+        
+        file = UploadFile(filename="gaps.xlsx", file=buffer)
+        config = default_import_config.model_copy(update={'streaming': True})
+        
+        result = await streaming_service.process_excel_import(
+            file=file,
+            project_id=uuid4(),
+            config=config,
+            user_id=uuid4()
+        )
+        
+        assert result.successful_records == 1
+        assert result.failed_records == 1
+        assert [error.row_number for error in result.errors] == [5]
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
@@ -944,4 +944,484 @@ class TestMonteCarloEngineProperties:
         assert np.all(np.isfinite(results.schedule_outcomes))
         
         # Cost outcomes should be non-zero for cost impact risk
-        assert np.mean(np.abs(results.cost_outcomes)) > 0
\ No newline at end of file
+        assert np.mean(np.abs(results.cost_outcomes)) > 0
+    
+    @given(risk_list_strategy())
+    @settings(max_examples=5, deadline=30000)
+    def test_vectorized_execution_equivalence(self, risks):
+        """
+        **Feature: monte-carlo-risk-simulations, Property 9: Cost Simulation Accuracy**
+        
+        For any set of risks, the vectorized execution mode should produce results that are
+        statistically equivalent to the per-iteration execution mode.
+        **Validates: Requirements 4.1**
+        """
+        engine = MonteCarloEngine()
+        iterations = 10000
+        
+        iterative_results = engine.run_simulation(risks, iterations, random_seed=42)
+        vectorized_results = engine.run_simulation(risks, iterations, random_seed=43, vectorized=True)
+        
+        assert vectorized_results.iteration_count == iterations
+        assert set(vectorized_results.risk_contributions.keys()) == {risk.id for risk in risks}
+        
+        for attribute in ('cost_outcomes', 'schedule_outcomes'):
+            iterative = getattr(iterative_results, attribute)
+            vectorized = getattr(vectorized_results, attribute)
+            assert len(vectorized) == iterations
+            assert np.all(np.isfinite(vectorized))
+            
+            # Means should agree within a few standard errors
+            standard_error = np.sqrt((np.var(iterative) + np.var(vectorized)) / iterations)
+            assert abs(np.mean(iterative) - np.mean(vectorized)) <= 6 * standard_error + 1e-6
+        
+        # Same seed should reproduce the vectorized run exactly
+        repeated_results = engine.run_simulation(risks, iterations, random_seed=43, vectorized=True)
+        np.testing.assert_array_equal(repeated_results.cost_outcomes, vectorized_results.cost_outcomes)
+    
+    def test_vectorized_execution_with_correlations(self):
+        """
+        Correlated risks in the vectorized mode should keep their correlation structure and
+        the same double-counting adjustments as the per-iteration mode.
+        """
+        engine = MonteCarloEngine()
+        iterations = 10000
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.NORMAL, {'mean': 1.0, 'std': 0.2}
+                ),
+                baseline_impact=1000.0
+            )
+            for i in range(3)
+        ]
+        correlations = CorrelationMatrix(
+            correlations={('risk_0', 'risk_1'): 0.8, ('risk_1', 'risk_2'): 0.4},
+            risk_ids=['risk_0', 'risk_1', 'risk_2']
+        )
+        
+        iterative_results = engine.run_simulation(risks, iterations, correlations, random_seed=7)
+        vectorized_results = engine.run_simulation(risks, iterations, correlations, random_seed=7, vectorized=True)
+        
+        for risk in risks:
+            iterative_mean = np.mean(iterative_results.risk_contributions[risk.id])
+            vectorized_mean = np.mean(vectorized_results.risk_contributions[risk.id])
+            assert abs(iterative_mean - vectorized_mean) < 0.02 * abs(iterative_mean)
+        
+        sample_correlation = np.corrcoef(
+            vectorized_results.risk_contributions['risk_0'],
+            vectorized_results.risk_contributions['risk_1']
+        )[0, 1]
+        assert abs(sample_correlation - 0.8) < 0.05
+    
+    def test_sharded_execution_reproducibility(self):
+        """
+        Sharded simulations should be reproducible for a given seed and shard count,
+        independent of the number of workers or the executor type.
+        """
+        engine = MonteCarloEngine()
+        iterations = 12000
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.BOTH,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.TRIANGULAR, {'min': 0.5, 'mode': 1.0, 'max': 2.0}
+                ),
+                baseline_impact=500.0
+            )
+            for i in range(4)
+        ]
+        
+        process_results = engine.run_simulation_sharded(risks, iterations, random_seed=11, num_shards=3, max_workers=2)
+        thread_results = engine.run_simulation_sharded(
+            risks, iterations, random_seed=11, num_shards=3, max_workers=3, use_processes=False
+        )
+        
+        assert process_results.iteration_count == iterations
+        assert len(process_results.cost_outcomes) == iterations
+        assert all(len(c) == iterations for c in process_results.risk_contributions.values())
+        np.testing.assert_array_equal(process_results.cost_outcomes, thread_results.cost_outcomes)
+        np.testing.assert_array_equal(process_results.schedule_outcomes, thread_results.schedule_outcomes)
+        
+        # Shards must draw from independent streams
+        shard_size = iterations // 3
+        assert not np.array_equal(
+            process_results.cost_outcomes[:shard_size],
+            process_results.cost_outcomes[shard_size:2 * shard_size]
+        )
+        
+        # Results are cached like single-process runs
+        assert engine.get_cached_results(process_results.simulation_id) is process_results
+    
+    def test_convergence_tracker_merge(self):
+        """Merged shard statistics should match statistics computed over the pooled samples."""
+        from monte_carlo.engine import ConvergenceTracker
+        
+        random_state = np.random.RandomState(3)
+        cost_a, cost_b = random_state.normal(100, 10, 4000), random_state.normal(120, 20, 3000)
+        schedule_a, schedule_b = random_state.normal(5, 1, 4000), random_state.normal(6, 2, 3000)
+        
+        tracker_a, tracker_b = ConvergenceTracker(), ConvergenceTracker()
+        for i in range(1000, 4000, 1000):
+            tracker_a.update(cost_a[:i+1], schedule_a[:i+1])
+        for i in range(1000, 3000, 1000):
+            tracker_b.update(cost_b[:i+1], schedule_b[:i+1])
+        
+        merged = tracker_a.merge(tracker_b)
+        
+        # Only checkpoints reached by both shards are kept
+        assert len(merged.cost_means) == 2
+        assert merged.check_interval == 2000
+        for k, i in enumerate(range(1000, 3000, 1000)):
+            pooled_cost = np.concatenate([cost_a[:i+1], cost_b[:i+1]])
+            pooled_schedule = np.concatenate([schedule_a[:i+1], schedule_b[:i+1]])
+            assert merged.checkpoint_counts[k] == len(pooled_cost)
+            assert merged.cost_means[k] == pytest.approx(np.mean(pooled_cost))
+            assert merged.cost_variances[k] == pytest.approx(np.var(pooled_cost))
+            assert merged.schedule_variances[k] == pytest.approx(np.var(pooled_schedule))
+    
+    @pytest.mark.parametrize("vectorized", [False, True])
+    def test_adaptive_iterations_early_stopping(self, vectorized):
+        """
+        Adaptive runs should stop once P50/P80/P95 are stable and report the iterations used.
+        """
+        engine = MonteCarloEngine()
+        max_iterations = 50000
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.TRIANGULAR, {'min': 0.5, 'mode': 1.0, 'max': 2.0}
+                ),
+                baseline_impact=1000.0
+            )
+            for i in range(10)
+        ]
+        
+        results = engine.run_simulation(
+            risks, max_iterations, random_seed=5, vectorized=vectorized,
+            adaptive_iterations=True, convergence_tolerance=0.01
+        )
+        
+        assert results.iteration_count < max_iterations
+        assert len(results.cost_outcomes) == results.iteration_count
+        assert len(results.schedule_outcomes) == results.iteration_count
+        assert all(len(c) == results.iteration_count for c in results.risk_contributions.values())
+        assert results.convergence_metrics.converged
+        assert results.convergence_metrics.iterations_to_convergence == results.iteration_count
+        
+        # A tolerance that can never be met runs the full iteration budget
+        full_results = engine.run_simulation(
+            risks, 10000, random_seed=5, vectorized=vectorized,
+            adaptive_iterations=True, convergence_tolerance=0.0
+        )
+        assert full_results.iteration_count == 10000
+    
+    def test_convergence_tracker_streaming_statistics(self):
+        """Streaming checkpoint statistics should match statistics over the full prefix."""
+        from monte_carlo.engine import ConvergenceTracker
+        
+        random_state = np.random.RandomState(17)
+        cost_outcomes = random_state.lognormal(10, 0.5, 20000)
+        schedule_outcomes = random_state.normal(30, 5, 20000)
+        
+        tracker = ConvergenceTracker(percentiles=(10, 50, 80, 90, 95))
+        for i in range(1000, 20000, 1000):
+            tracker.update(cost_outcomes[:i+1], schedule_outcomes[:i+1])
+        
+        prefix = cost_outcomes[:19001]
+        assert tracker.count == 19001
+        assert tracker.cost_means[-1] == pytest.approx(np.mean(prefix))
+        assert tracker.cost_variances[-1] == pytest.approx(np.var(prefix))
+        assert tracker.schedule_variances[-1] == pytest.approx(np.var(schedule_outcomes[:19001]))
+        for p in (10, 50, 80, 90, 95):
+            assert tracker.percentile_history[p][-1] == pytest.approx(np.percentile(prefix, p), rel=0.01)
+    
+    def test_results_cache_lru_eviction_and_spill(self, tmp_path):
+        """
+        The results cache should keep at most cache_size_limit runs in memory and reload
+        evicted runs from the spill directory as memory-mapped arrays.
+        """
+        engine = MonteCarloEngine()
+        engine.update_configuration(cache_size_limit=2, results_spill_directory=str(tmp_path))
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.UNIFORM, {'min': 0.5, 'max': 1.5}
+                ),
+                baseline_impact=100.0
+            )
+            for i in range(3)
+        ]
+        
+        runs = [engine.run_simulation(risks, 10000, random_seed=seed, vectorized=True) for seed in range(3)]
+        
+        cache = engine._simulation_cache
+        assert not cache.is_in_memory(runs[0].simulation_id)
+        assert cache.is_in_memory(runs[1].simulation_id)
+        assert cache.is_in_memory(runs[2].simulation_id)
+        
+        reloaded = engine.get_cached_results(runs[0].simulation_id)
+        assert isinstance(reloaded.cost_outcomes, np.memmap)
+        np.testing.assert_array_equal(reloaded.cost_outcomes, runs[0].cost_outcomes)
+        for risk in risks:
+            np.testing.assert_array_equal(
+                reloaded.risk_contributions[risk.id], runs[0].risk_contributions[risk.id]
+            )
+        assert reloaded.convergence_metrics == runs[0].convergence_metrics
+        
+        # Reloading promoted the spilled run, evicting the least recently used one
+        assert not cache.is_in_memory(runs[1].simulation_id)
+        
+        engine.invalidate_cache_for_risk('risk_0')
+        assert all(engine.get_cached_results(run.simulation_id) is None for run in runs)
+        assert not any(tmp_path.iterdir())
+    
+    def test_invalidate_cache_for_risk_does_not_reload_spilled_runs(self, tmp_path, monkeypatch):
+        """Invalidating a risk should drop only runs that include it, without reading spilled runs."""
+        from monte_carlo import results_storage
+        
+        engine = MonteCarloEngine()
+        engine.update_configuration(cache_size_limit=1, results_spill_directory=str(tmp_path))
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.UNIFORM, {'min': 0.5, 'max': 1.5}
+                ),
+                baseline_impact=100.0
+            )
+            for i in range(3)
+        ]
+        
+        runs = [engine.run_simulation([risk], 10000, random_seed=0, vectorized=True) for risk in risks]
+        
+        def fail_load(*args, **kwargs):
+            raise AssertionError("spilled results were reloaded")
+        
+        monkeypatch.setattr(results_storage, "load_simulation_results", fail_load)
+        engine.invalidate_cache_for_risk('risk_0')
+        monkeypatch.undo()
+        
+        assert engine.get_cached_results(runs[0].simulation_id) is None
+        assert engine.get_cached_results(runs[1].simulation_id) is not None
+        assert engine.get_cached_results(runs[2].simulation_id) is not None
+        assert engine._simulation_cache.simulation_ids_for_risk('risk_0') == []
+    
+    def test_discarded_runs_drop_their_parameter_hashes(self):
+        """Runs evicted without a spill directory should not leave change-detection hashes behind."""
+        engine = MonteCarloEngine()
+        engine.update_configuration(cache_size_limit=2, results_spill_directory=None)
+        risk = Risk(
+            id="risk_0",
+            name="Risk 0",
+            category=RiskCategory.COST,
+            impact_type=ImpactType.COST,
+            probability_distribution=ProbabilityDistribution(
+                DistributionType.UNIFORM, {'min': 0.5, 'max': 1.5}
+            ),
+            baseline_impact=100.0
+        )
+        
+        runs = [engine.run_simulation([risk], 10000, random_seed=seed, vectorized=True) for seed in range(5)]
+        
+        kept = {run.simulation_id for run in runs[-2:]}
+        assert set(engine._simulation_cache) == kept
+        assert set(engine._parameter_cache) == kept
+        assert set(engine._risk_fingerprint_cache) == kept
+    
+    def test_compact_results_storage(self):
+        """
+        Compact storage should pack risk contributions into one float32 column-major matrix
+        without changing cost/schedule outcomes or the contribution ranking.
+        """
+        from monte_carlo.results_analyzer import SimulationResultsAnalyzer
+        from monte_carlo.results_storage import ColumnarRiskContributions
+        
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.NORMAL, {'mean': 1.0, 'std': 0.1 * (i + 1)}
+                ),
+                baseline_impact=1000.0
+            )
+            for i in range(4)
+        ]
+        
+        plain_results = MonteCarloEngine().run_simulation(risks, 10000, random_seed=3, vectorized=True)
+        compact_engine = MonteCarloEngine()
+        compact_engine.update_configuration(compact_results_storage=True)
+        compact_results = compact_engine.run_simulation(risks, 10000, random_seed=3, vectorized=True)
+        
+        contributions = compact_results.risk_contributions
+        assert isinstance(contributions, ColumnarRiskContributions)
+        assert contributions.matrix.dtype == np.float32
+        assert contributions.matrix.flags['F_CONTIGUOUS']
+        np.testing.assert_array_equal(compact_results.cost_outcomes, plain_results.cost_outcomes)
+        
+        analyzer = SimulationResultsAnalyzer()
+        plain_ranking = analyzer.identify_top_risk_contributors(plain_results)
+        compact_ranking = analyzer.identify_top_risk_contributors(compact_results)
+        assert [c.risk_id for c in compact_ranking] == [c.risk_id for c in plain_ranking]
+        for plain, compact in zip(plain_ranking, compact_ranking):
+            assert compact.contribution_percentage == pytest.approx(plain.contribution_percentage, rel=1e-4)
+            for risk_id, correlation in plain.correlation_effects.items():
+                assert compact.correlation_effects[risk_id] == pytest.approx(correlation, abs=1e-4)
+    
+    def test_incremental_resimulation_on_risk_edit(self):
+        """
+        Editing one risk with incremental caching should keep the other risks' samples and
+        resample only the edited risk, or its whole correlated block.
+        """
+        engine = MonteCarloEngine()
+        iterations = 10000
+        
+        def make_risks(scale):
+            return [
+                Risk(
+                    id=f"risk_{i}",
+                    name=f"Risk {i}",
+                    category=RiskCategory.COST,
+                    impact_type=ImpactType.BOTH,
+                    probability_distribution=ProbabilityDistribution(
+                        DistributionType.NORMAL, {'mean': scale if i == 0 else 1.0, 'std': 0.2}
+                    ),
+                    baseline_impact=1000.0
+                )
+                for i in range(4)
+            ]
+        
+        correlations = CorrelationMatrix(
+            correlations={('risk_1', 'risk_2'): 0.6},
+            risk_ids=['risk_0', 'risk_1', 'risk_2', 'risk_3']
+        )
+        
+        base = engine.run_simulation_with_caching(
+            make_risks(1.0), iterations, correlations, random_seed=5, vectorized=True
+        )
+        
+        # Independent edit: only risk_0 is resampled
+        edited = engine.run_simulation_with_caching(
+            make_risks(2.0), iterations, correlations, random_seed=5,
+            previous_simulation_id=base.simulation_id, vectorized=True, incremental=True
+        )
+        assert edited.simulation_id != base.simulation_id
+        for risk_id in ('risk_1', 'risk_2', 'risk_3'):
+            np.testing.assert_array_equal(edited.risk_contributions[risk_id], base.risk_contributions[risk_id])
+        assert np.mean(edited.risk_contributions['risk_0']) == pytest.approx(2000.0, rel=0.01)
+        expected_cost = sum(edited.risk_contributions[f"risk_{i}"] for i in range(4))
+        np.testing.assert_allclose(edited.cost_outcomes, expected_cost)
+        np.testing.assert_allclose(edited.schedule_outcomes, expected_cost)
+        
+        # Repeating the same edit is reproducible
+        repeated = engine.run_simulation_with_caching(
+            make_risks(2.0), iterations, correlations, random_seed=5,
+            previous_simulation_id=base.simulation_id, vectorized=True, incremental=True
+        )
+        np.testing.assert_array_equal(repeated.cost_outcomes, edited.cost_outcomes)
+        
+        # Correlated edit: risk_1 and risk_2 are resampled together, keeping their correlation
+        correlated_risks = make_risks(1.0)
+        correlated_risks[1].probability_distribution = ProbabilityDistribution(
+            DistributionType.NORMAL, {'mean': 1.5, 'std': 0.3}
+        )
+        correlated_edit = engine.run_simulation_with_caching(
+            correlated_risks, iterations, correlations, random_seed=5,
+            previous_simulation_id=base.simulation_id, vectorized=True, incremental=True
+        )
+        for risk_id in ('risk_0', 'risk_3'):
+            np.testing.assert_array_equal(
+                correlated_edit.risk_contributions[risk_id], base.risk_contributions[risk_id]
+            )
+        assert not np.array_equal(
+            correlated_edit.risk_contributions['risk_2'], base.risk_contributions['risk_2']
+        )
+        sample_correlation = np.corrcoef(
+            correlated_edit.risk_contributions['risk_1'], correlated_edit.risk_contributions['risk_2']
+        )[0, 1]
+        assert abs(sample_correlation - 0.6) < 0.05
+        
+        # Changing the seed falls back to a full rerun
+        reseeded = engine.run_simulation_with_caching(
+            make_risks(2.0), iterations, correlations, random_seed=6,
+            previous_simulation_id=base.simulation_id, vectorized=True, incremental=True
+        )
+        assert not np.array_equal(reseeded.risk_contributions['risk_3'], base.risk_contributions['risk_3'])
+    
+    def test_vectorized_schedule_impact_equivalence(self):
+        """
+        The precompiled schedule impact model should reproduce the distribution of the
+        per-iteration schedule model, including milestones and resource conflicts.
+        """
+        activities = [
+            Activity(
+                id=f"activity_{i}",
+                name=f"Activity {i}",
+                baseline_duration=10.0 + i,
+                earliest_start=i * 3.0,
+                latest_start=i * 3.0 + 2.0,
+                float_time=float(i % 3),
+                critical_path=i % 2 == 0,
+                resource_requirements={'crew': 2.0 + i % 3}
+            )
+            for i in range(8)
+        ]
+        schedule_data = ScheduleData(
+            milestones=[
+                Milestone(id="m1", name="Design", planned_date=datetime(2026, 3, 1),
+                          baseline_duration=30.0, critical_path=True),
+                Milestone(id="m2", name="Build", planned_date=datetime(2026, 6, 1),
+                          baseline_duration=20.0, dependencies=["m1"])
+            ],
+            activities=activities,
+            resource_constraints=[
+                ResourceConstraint(resource_id='crew', resource_name='Crew', total_availability=6.0,
+                                   utilization_limit=0.9, availability_periods=[(5.0, 15.0, 0.5)])
+            ],
+            project_baseline_duration=60.0
+        )
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.SCHEDULE,
+                impact_type=ImpactType.SCHEDULE,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.NORMAL, {'mean': 1.0, 'std': 0.3}
+                ),
+                baseline_impact=5.0
+            )
+            for i in range(5)
+        ]
+        
+        engine = MonteCarloEngine()
+        iterative = engine.run_simulation(risks, 10000, random_seed=1, schedule_data=schedule_data)
+        vectorized = engine.run_simulation(risks, 10000, random_seed=2, schedule_data=schedule_data, vectorized=True)
+        
+        assert np.all(vectorized.schedule_outcomes >= 0)
+        standard_error = np.sqrt(
+            (np.var(iterative.schedule_outcomes) + np.var(vectorized.schedule_outcomes)) / 10000
+        )
+        assert abs(np.mean(iterative.schedule_outcomes) - np.mean(vectorized.schedule_outcomes)) <= 6 * standard_error
+        assert np.std(vectorized.schedule_outcomes) == pytest.approx(np.std(iterative.schedule_outcomes), rel=0.05)
@@ -82,6 +82,74 @@ def test_projects_list_cache_hit_with_mock(client: TestClient) -> None:
             del client.app.state.cache_manager
 
 
+class _FakeProjectsTable:
+    """Minimal projects query builder: eq/order/range and in_ over in-memory rows."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self._filters = []
+        self._ids = None
+        self._range = None
+
+    def select(self, *columns, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        self._filters.append((column, value))
+        return self
+
+    def in_(self, column, values):
+        self._ids = set(values)
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def execute(self):
+        rows = [r for r in self._rows if all(str(r.get(c)) == str(v) for c, v in self._filters)]
+        if self._ids is not None:
+            rows = [r for r in rows if r["id"] in self._ids]
+        if self._range is not None:
+            rows = rows[self._range[0]:self._range[1] + 1]
+        return MagicMock(data=[dict(r) for r in rows])
+
+
+def test_projects_list_paginates_permitted_projects_only(client: TestClient) -> None:
+    """Users without global read get full pages and a total counting only permitted projects."""
+    rows = [{"id": f"p{i}", "name": f"Project {i}", "portfolio_id": "pf-1"} for i in range(6)]
+    permitted = {"p0", "p2", "p4", "p5"}
+    db = MagicMock()
+    db.table.side_effect = lambda name: _FakeProjectsTable(rows)
+    checker = MagicMock()
+    checker.has_global_permission = AsyncMock(return_value=False)
+    checker.filter_projects_by_permission = AsyncMock(
+        side_effect=lambda user_id, permission, ids, parents: permitted & set(ids)
+    )
+
+    async def fake_user():
+        return {"user_id": "11111111-1111-1111-1111-111111111111", "organization_id": "org-1"}
+
+    with patch("routers.projects._db", return_value=db), \
+         patch("routers.projects.get_enhanced_permission_checker", return_value=checker), \
+         patch("auth.rbac.rbac") as mock_rbac:
+        mock_rbac.has_permission = AsyncMock(return_value=True)
+        try:
+            client.app.dependency_overrides[get_current_user] = fake_user
+            pages = [
+                client.get("/projects", params={"limit": 2, "offset": offset}).json()
+                for offset in (0, 2, 4)
+            ]
+        finally:
+            client.app.dependency_overrides.pop(get_current_user, None)
+
+    assert [[item["id"] for item in page["items"]] for page in pages] == [["p0", "p2"], ["p4", "p5"], []]
+    assert all(page["total"] == 4 for page in pages)
+
+
 # ---- POST /projects/sync (entity-hierarchy) ----
 @pytest.mark.regression
 def test_projects_sync_returns_422_when_body_invalid(client: TestClient) -> None:
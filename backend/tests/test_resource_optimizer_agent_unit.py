@@ -306,3 +306,106 @@ class TestResourceOptimizerEdgeCases:
         assert "error" in result or result["solver_status"] == "Infeasible"
         if "error" in result:
             assert "skill" in result["error"].lower() or "feasible" in result["error"].lower()
+
+
+class TestResourceOptimizerModelReuse:
+    """Unit tests for the sparse, cached optimization model"""
+    
+    def _data(self):
+        resources = [
+            {"id": "r-python", "name": "Py", "skills": ["python"], "hourly_rate": 100, "available_hours": 100},
+            {"id": "r-java", "name": "Java", "skills": ["java"], "hourly_rate": 80, "available_hours": 100},
+            {"id": "r-both", "name": "Both", "skills": ["python", "java"], "hourly_rate": 120, "available_hours": 100},
+        ]
+        projects = [
+            {"id": "p-python", "name": "P1", "required_skills": ["python"], "required_hours": 60},
+            {"id": "p-java", "name": "P2", "required_skills": ["java"], "required_hours": 60},
+        ]
+        return resources, projects
+    
+    def _agent(self, resources, projects):
+        agent = ResourceOptimizerAgent(Mock(), "test-api-key")
+        
+        async def mock_get_resources(org_id):
+            return resources
+        
+        async def mock_get_projects(org_id):
+            return projects
+        
+        async def mock_log_audit(*args, **kwargs):
+            pass
+        
+        agent._get_resources_by_organization = mock_get_resources
+        agent._get_projects_by_organization = mock_get_projects
+        agent._log_audit = mock_log_audit
+        return agent
+    
+    def test_skill_incompatible_pairs_have_no_variables(self):
+        """Only resources holding all required skills get an allocation variable"""
+        resources, projects = self._data()
+        agent = self._agent(resources, projects)
+        
+        _, allocation_vars = agent._build_optimization_model(resources, projects, {})
+        
+        assert set(allocation_vars) == {
+            ("r-python", "p-python"), ("r-both", "p-python"),
+            ("r-java", "p-java"), ("r-both", "p-java"),
+        }
+    
+    def test_capacity_change_reuses_compiled_model(self):
+        """Changed hours update the cached model instead of rebuilding it"""
+        resources, projects = self._data()
+        agent = self._agent(resources, projects)
+        
+        first = run_async(agent.optimize_resources("org-1", "user-1"))
+        model = agent._compiled_models["org-1"]["model"]
+        
+        # Cheapest java resource now covers only part of the requirement
+        resources[1]["available_hours"] = 20
+        projects[1]["required_hours"] = 90
+        second = run_async(agent.optimize_resources("org-1", "user-1"))
+        
+        assert agent._compiled_models["org-1"]["model"] is model
+        assert first["solver_status"] == second["solver_status"] == "Optimal"
+        hours = {(rec["resource_id"], rec["project_id"]): rec["allocated_hours"] for rec in second["recommendations"]}
+        assert hours[("r-java", "p-java")] == 20
+        assert hours[("r-both", "p-java")] == 70
+    
+    def test_skill_change_rebuilds_model(self):
+        """A structural change (skills) compiles a new model"""
+        resources, projects = self._data()
+        agent = self._agent(resources, projects)
+        
+        run_async(agent.optimize_resources("org-1", "user-1"))
+        model = agent._compiled_models["org-1"]["model"]
+        
+        resources[1]["skills"] = ["java", "python"]
+        result = run_async(agent.optimize_resources("org-1", "user-1"))
+        
+        assert agent._compiled_models["org-1"]["model"] is not model
+        assert ("r-java", "p-python") in agent._compiled_models["org-1"]["allocation_vars"]
+        assert result["solver_status"] == "Optimal"
+    
+    def test_organization_locks_are_pruned_after_solves(self):
+        """Per-organization locks do not outlive the solves that used them"""
+        resources, projects = self._data()
+        agent = self._agent(resources, projects)
+        held = []
+        calculate_confidence = agent._calculate_confidence
+        
+        def confidence_under_lock(model, recommendations):
+            held.append(agent._model_locks["org-1"].locked())
+            return calculate_confidence(model, recommendations)
+        
+        agent._calculate_confidence = confidence_under_lock
+        
+        async def solve_concurrently():
+            return await asyncio.gather(*(agent.optimize_resources("org-1", "user-1") for _ in range(3)))
+        
+        results = run_async(solve_concurrently())
+        
+        assert [result["solver_status"] for result in results] == ["Optimal"] * 3
+        assert held == [True] * 3
+        assert agent._model_locks == {}
+        assert not agent._model_lock_users
+
@@ -13,7 +13,7 @@ from uuid import uuid4, UUID
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 
-from services.po_breakdown_service import POBreakdownDatabaseService
+from services.po_breakdown_service import POBreakdownDatabaseService, POBreakdownTreeIndex
 from models.po_breakdown import (
     POBreakdownCreate,
     POBreakdownResponse,
@@ -562,54 +562,16 @@ class TestSAPRelationshipPreservation:
         root_id = uuid4()
         parent_id = uuid4()
         child_id = UUID(sample_breakdown_data['id'])
+        project_id = UUID(sample_breakdown_data['project_id'])
         
         # Mock hierarchy: root -> parent -> child
-        root = POBreakdownResponse(**{
-            **sample_breakdown_data,
-            'id': root_id,
-            'parent_breakdown_id': None,
-            'hierarchy_level': 0,
-            'planned_amount': Decimal('10000.00'),
-            'committed_amount': Decimal('8000.00'),
-            'actual_amount': Decimal('7500.00'),
-            'remaining_amount': Decimal('2500.00'),
-            'exchange_rate': Decimal('1.0'),
-            'breakdown_type': POBreakdownType.sap_standard,
-            'created_at': datetime.now(),
-            'updated_at': datetime.now(),
-        })
-        
-        parent = POBreakdownResponse(**{
-            **sample_breakdown_data,
-            'id': parent_id,
-            'parent_breakdown_id': root_id,
-            'hierarchy_level': 1,
-            'planned_amount': Decimal('10000.00'),
-            'committed_amount': Decimal('8000.00'),
-            'actual_amount': Decimal('7500.00'),
-            'remaining_amount': Decimal('2500.00'),
-            'exchange_rate': Decimal('1.0'),
-            'breakdown_type': POBreakdownType.sap_standard,
-            'created_at': datetime.now(),
-            'updated_at': datetime.now(),
-        })
-        
-        child = POBreakdownResponse(**{
-            **sample_breakdown_data,
-            'id': child_id,
-            'parent_breakdown_id': parent_id,
-            'hierarchy_level': 2,
-            'planned_amount': Decimal('10000.00'),
-            'committed_amount': Decimal('8000.00'),
-            'actual_amount': Decimal('7500.00'),
-            'remaining_amount': Decimal('2500.00'),
-            'exchange_rate': Decimal('1.0'),
-            'breakdown_type': POBreakdownType.sap_standard,
-            'created_at': datetime.now(),
-            'updated_at': datetime.now(),
-        })
+        rows = [
+            {**sample_breakdown_data, 'id': str(root_id), 'parent_breakdown_id': None, 'hierarchy_level': 0},
+            {**sample_breakdown_data, 'id': str(parent_id), 'parent_breakdown_id': str(root_id), 'hierarchy_level': 1},
+            {**sample_breakdown_data, 'id': str(child_id), 'parent_breakdown_id': str(parent_id), 'hierarchy_level': 2},
+        ]
         
-        service.get_breakdown_by_id = AsyncMock(side_effect=[child, parent, root])
+        service._get_tree_index_for_breakdown = AsyncMock(return_value=POBreakdownTreeIndex(project_id, rows))
         
         # Execute
         path = await service._calculate_hierarchy_path(child_id)
@@ -701,21 +663,10 @@ class TestSAPRelationshipEdgeCases:
         breakdown_id = UUID(sample_breakdown_data['id'])
         
         # Mock circular reference (should not happen, but test safety)
-        circular_breakdown = POBreakdownResponse(**{
-            **sample_breakdown_data,
-            'id': breakdown_id,
-            'parent_breakdown_id': breakdown_id,  # Points to itself
-            'planned_amount': Decimal('10000.00'),
-            'committed_amount': Decimal('8000.00'),
-            'actual_amount': Decimal('7500.00'),
-            'remaining_amount': Decimal('2500.00'),
-            'exchange_rate': Decimal('1.0'),
-            'breakdown_type': POBreakdownType.sap_standard,
-            'created_at': datetime.now(),
-            'updated_at': datetime.now(),
-        })
+        rows = [{**sample_breakdown_data, 'parent_breakdown_id': str(breakdown_id)}]  # Points to itself
+        index = POBreakdownTreeIndex(UUID(sample_breakdown_data['project_id']), rows)
         
-        service.get_breakdown_by_id = AsyncMock(return_value=circular_breakdown)
+        service._get_tree_index_for_breakdown = AsyncMock(return_value=index)
         
         # Execute - should not hang
         path = await service._calculate_hierarchy_path(breakdown_id)
@@ -785,4 +785,59 @@ class TestScenarioGeneratorProperties:
             assert tornado_data['ranges'][0] >= 0
             # Check that ranges are generally non-negative
             for range_val in tornado_data['ranges']:
-                assert range_val >= 0
\ No newline at end of file
+                assert range_val >= 0
+    
+    def test_batched_sensitivity_sweep_matches_individual_simulations(self):
+        """
+        A batched tornado sweep should use common random numbers: every variant must match a
+        full simulation of the modified scenario drawn from the same samples.
+        """
+        from monte_carlo.engine import MonteCarloEngine
+        
+        risks = [
+            Risk(
+                id=f"risk_{i}",
+                name=f"Risk {i}",
+                category=RiskCategory.COST,
+                impact_type=ImpactType.BOTH if i % 2 else ImpactType.COST,
+                probability_distribution=ProbabilityDistribution(
+                    DistributionType.TRIANGULAR, {'min': 0.5, 'mode': 1.0, 'max': 2.0}
+                ),
+                baseline_impact=1000.0 * (i + 1)
+            )
+            for i in range(4)
+        ]
+        engine = MonteCarloEngine()
+        generator = ScenarioGenerator()
+        baseline_scenario = generator.create_baseline_scenario(risks, "Baseline")
+        
+        sensitivity_results = generator.perform_sensitivity_analysis(
+            baseline_scenario, [r.id for r in risks], 0.2,
+            engine=engine, random_seed=13, baseline_costs={'base': 50000.0}
+        )
+        
+        for variable, results in sensitivity_results.items():
+            for side in ('low', 'high'):
+                expected = engine.run_simulation(
+                    results[f'{side}_scenario'].risks, 10000, random_seed=13,
+                    baseline_costs={'base': 50000.0}, vectorized=True
+                )
+                outcome = results[f'{side}_outcome']
+                assert outcome['cost']['mean'] == pytest.approx(np.mean(expected.cost_outcomes))
+                assert outcome['schedule']['percentiles'][90] == pytest.approx(
+                    np.percentile(expected.schedule_outcomes, 90)
+                )
+            assert results['cost_swing'] > 0
+        
+        # Risks with larger impacts swing the cost more and lead the tornado
+        tornado_data = generator.generate_tornado_diagram_data(sensitivity_results)
+        assert tornado_data['variables'] == ['risk_3', 'risk_2', 'risk_1', 'risk_0']
+        assert tornado_data['cost_swings'] == sorted(tornado_data['cost_swings'], reverse=True)
+        
+        multi_var_results = generator.perform_multi_variable_sensitivity(
+            baseline_scenario, [{'risk_0': 2.0, 'risk_3': 0.5}, {}],
+            engine=engine, random_seed=13
+        )
+        assert multi_var_results['MultiVar_0']['outcome']['cost']['mean'] < (
+            multi_var_results['MultiVar_1']['outcome']['cost']['mean']
+        )
@@ -0,0 +1,82 @@
+"""
+Unit Tests for the Async Database Access Layer
+
+Tests that execute_async runs blocking Supabase queries off the event loop
+and concurrently, enforces per-query timeouts and records metrics.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock
+
+from config.database import execute_async, run_db, query_metrics, get_query_metrics
+
+
+def slow_query(seconds, data=None):
+    query = Mock()
+
+    def execute():
+        time.sleep(seconds)
+        return Mock(data=data)
+
+    query.execute.side_effect = execute
+    return query
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    query_metrics.reset()
+    yield
+    query_metrics.reset()
+
+
+class TestExecuteAsync:
+
+    @pytest.mark.asyncio
+    async def test_queries_run_concurrently(self):
+        queries = [slow_query(0.2, data=[i]) for i in range(5)]
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(execute_async(q, label="tasks") for q in queries))
+        elapsed = time.perf_counter() - started
+
+        assert [r.data for r in results] == [[i] for i in range(5)]
+        assert elapsed < 0.6
+        metrics = get_query_metrics()
+        assert metrics["queries"]["tasks"]["count"] == 5
+        assert metrics["peak_in_flight"] == 5
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await execute_async(slow_query(0.2))
+        ticker_task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_raised_and_recorded(self):
+        with pytest.raises(asyncio.TimeoutError):
+            await execute_async(slow_query(0.5), timeout=0.05, label="audit_logs")
+
+        assert get_query_metrics()["queries"]["audit_logs"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_recorded(self):
+        def failing():
+            raise RuntimeError("connection reset")
+
+        with pytest.raises(RuntimeError):
+            await run_db(failing, label="rpc")
+
+        assert get_query_metrics()["queries"]["rpc"]["errors"] == 1
@@ -0,0 +1,178 @@
+"""
+Unit Tests for Keyset-Paginated Streaming Audit Exports
+
+Tests that the streaming export walks audit_logs with a (timestamp, id)
+cursor, neither skipping nor repeating events that share a timestamp or
+that arrive while the export runs, and that NDJSON and gzip output
+round-trip.
+
+**Validates: Requirements 5.2, 7.1, 7.6, 7.7**
+"""
+
+import csv
+import gzip
+import io
+import json
+import re
+import pytest
+
+from services.audit_export_service import AuditExportService, EXPORT_FIELDNAMES
+
+
+class FakeAuditQuery:
+    """Minimal stand-in for the Supabase query builder on audit_logs."""
+
+    KEYSET = re.compile(r'timestamp\.lt\."(.+)",and\(timestamp\.eq\."(.+)",id\.lt\."(.+)"\)')
+
+    def __init__(self, table):
+        self.table = table
+        self.predicates = []
+        self.ordering = []
+        self.page_size = None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, column, value):
+        self.predicates.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.predicates.append(lambda row: row.get(column) in values)
+        return self
+
+    def or_(self, expression):
+        last_timestamp, _, last_id = self.KEYSET.fullmatch(expression).groups()
+        self.table.keyset_filters.append(expression)
+        self.predicates.append(lambda row: (row["timestamp"], row["id"]) < (last_timestamp, last_id))
+        return self
+
+    def order(self, column, desc=False):
+        self.ordering.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self.page_size = count
+        return self
+
+    def execute(self):
+        assert self.ordering == [("timestamp", True), ("id", True)]
+        rows = [row for row in self.table.rows if all(p(row) for p in self.predicates)]
+        rows.sort(key=lambda row: (row["timestamp"], row["id"]), reverse=True)
+        page = rows[:self.page_size]
+        for callback in self.table.on_execute:
+            callback()
+        return type("Response", (), {"data": page})()
+
+
+class FakeAuditTable:
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.keyset_filters = []
+        self.on_execute = []
+
+    def __call__(self, name):
+        assert name == "audit_logs"
+        return FakeAuditQuery(self)
+
+
+def make_event(index, timestamp, **overrides):
+    event = {
+        "id": f"evt-{index:04d}",
+        "timestamp": timestamp,
+        "event_type": "budget_change",
+        "severity": "info",
+        "category": "Financial Impact",
+        "tenant_id": "tenant-1",
+        "tags": {"source": "test"},
+        "action_details": {"index": index},
+    }
+    event.update(overrides)
+    return event
+
+
+@pytest.fixture
+def events():
+    # Several events per timestamp so ties fall across page boundaries
+    return [
+        make_event(i, f"2024-01-{1 + i // 3:02d}T10:00:00+00:00", severity="critical" if i % 4 == 0 else "info")
+        for i in range(25)
+    ]
+
+
+@pytest.fixture
+def table(events):
+    return FakeAuditTable(events)
+
+
+@pytest.fixture
+def service(table):
+    supabase = type("Supabase", (), {})()
+    supabase.table = table
+    return AuditExportService(supabase_client=supabase)
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestKeysetStreaming:
+
+    @pytest.mark.asyncio
+    async def test_csv_stream_exports_every_event_once_in_order(self, service, table, events):
+        chunks = await collect(service.export_csv_streaming({}, tenant_id="tenant-1", batch_size=4))
+
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        expected = sorted(events, key=lambda e: (e["timestamp"], e["id"]), reverse=True)
+
+        assert [row["id"] for row in rows] == [e["id"] for e in expected]
+        assert list(rows[0].keys()) == EXPORT_FIELDNAMES
+        assert json.loads(rows[0]["action_details"]) == expected[0]["action_details"]
+        assert len(table.keyset_filters) == len(events) // 4
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_to_every_page(self, service, events):
+        chunks = await collect(service.export_events_streaming(
+            {"severity": "critical"}, tenant_id="tenant-1", batch_size=2, output_format="ndjson"
+        ))
+
+        exported = [json.loads(line) for line in "".join(chunks).splitlines()]
+
+        assert sorted(e["id"] for e in exported) == sorted(e["id"] for e in events if e["severity"] == "critical")
+
+    @pytest.mark.asyncio
+    async def test_events_arriving_mid_export_do_not_shift_pages(self, service, table, events):
+        newer = [make_event(100 + i, f"2024-02-01T00:00:0{i}+00:00") for i in range(5)]
+
+        def insert_newer_event():
+            if newer:
+                table.rows.append(newer.pop())
+
+        table.on_execute.append(insert_newer_event)
+
+        chunks = await collect(service.export_events_streaming({}, batch_size=3, output_format="ndjson"))
+        exported_ids = [json.loads(line)["id"] for line in "".join(chunks).splitlines()]
+
+        original_ids = {e["id"] for e in events}
+        assert len(exported_ids) == len(set(exported_ids))
+        assert original_ids <= set(exported_ids)
+
+    @pytest.mark.asyncio
+    async def test_gzip_ndjson_round_trip(self, service, events):
+        chunks = await collect(service.export_events_streaming(
+            {}, batch_size=10, output_format="ndjson", compress=True
+        ))
+
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        lines = gzip.decompress(b"".join(chunks)).decode("utf-8").splitlines()
+        first = json.loads(lines[0])
+
+        assert len(lines) == len(events)
+        assert set(first.keys()) == set(EXPORT_FIELDNAMES)
+        assert isinstance(first["tags"], dict)
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self, service):
+        with pytest.raises(ValueError):
+            await collect(service.export_events_streaming({}, output_format="xml"))
@@ -0,0 +1,187 @@
+"""
+Unit Tests for the Compiled Feature Flag Snapshot
+
+Tests that flag checks are served from one snapshot query, that bulk
+evaluation matches single checks, that local writes and the snapshot TTL
+trigger a reload, and that an unreachable Redis leaves TTL refresh in place.
+
+**Validates: Requirements 10.6**
+"""
+
+import hashlib
+from datetime import datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from models.feature_flags import FeatureFlagUpdate, FeatureFlagStatus
+from services import feature_flag_service as feature_flag_module
+from services.feature_flag_service import FeatureFlagService
+
+
+ALLOWED_USER = uuid4()
+OTHER_USER = uuid4()
+
+
+def flag_row(name, strategy, status="enabled", **fields):
+    now = datetime.now().isoformat()
+    return {
+        "id": str(uuid4()),
+        "name": name,
+        "description": name,
+        "status": status,
+        "rollout_strategy": strategy,
+        "rollout_percentage": fields.get("rollout_percentage"),
+        "allowed_user_ids": fields.get("allowed_user_ids"),
+        "allowed_roles": fields.get("allowed_roles"),
+        "metadata": {"owner": "test"},
+        "created_at": now,
+        "updated_at": now,
+        "created_by": str(uuid4()),
+    }
+
+
+class FakeSupabase:
+    """Serves feature_flags rows, counting unfiltered selects."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.snapshot_loads = 0
+
+    def table(self, name):
+        query = Mock()
+        state = {}
+        query.select.return_value = query
+
+        def update(data):
+            state["update"] = data
+            return query
+
+        def eq(column, value):
+            state["filter"] = (column, value)
+            return query
+
+        def execute():
+            if "filter" not in state:
+                self.snapshot_loads += 1
+                return Mock(data=list(self.rows))
+            column, value = state["filter"]
+            matched = [row for row in self.rows if row[column] == value]
+            for row in matched:
+                row.update(state.get("update", {}))
+            return Mock(data=matched)
+
+        query.update.side_effect = update
+        query.eq.side_effect = eq
+        query.execute.side_effect = execute
+        return query
+
+
+@pytest.fixture
+def supabase():
+    return FakeSupabase([
+        flag_row("everyone", "all_users"),
+        flag_row("off", "all_users", status="disabled"),
+        flag_row("beta_users", "user_list", allowed_user_ids=[str(ALLOWED_USER).upper()]),
+        flag_row("managers", "role_based", allowed_roles=["manager", "admin"]),
+        flag_row("no_roles", "role_based"),
+        flag_row("half", "percentage", rollout_percentage=50),
+    ])
+
+
+@pytest.fixture
+def service(supabase):
+    return FeatureFlagService(supabase)
+
+
+class TestSnapshotEvaluation:
+
+    def test_checks_share_one_snapshot_query(self, service, supabase):
+        for _ in range(50):
+            service.check_feature_enabled("everyone", ALLOWED_USER, ["viewer"])
+            service.check_feature_enabled("missing", ALLOWED_USER, ["viewer"])
+
+        assert supabase.snapshot_loads == 1
+
+    def test_rules_and_reasons(self, service):
+        check = service.check_feature_enabled
+
+        assert check("missing").reason == "Feature flag not found"
+        assert check("off").reason == "Feature is disabled"
+        assert check("beta_users", ALLOWED_USER).is_enabled
+        assert check("beta_users", OTHER_USER).reason == "User not in allowed list"
+        assert check("beta_users").reason == "User ID required for user list strategy"
+        assert check("managers", OTHER_USER, ["viewer", "admin"]).reason == "User has allowed role"
+        assert check("managers", OTHER_USER, ["viewer"]).reason == "User does not have allowed role"
+        assert check("no_roles", OTHER_USER, ["viewer"]).reason == "No allowed roles configured"
+
+    def test_user_list_matches_any_uuid_spelling(self, service):
+        spellings = [str(ALLOWED_USER), str(ALLOWED_USER).upper(), "{%s}" % ALLOWED_USER]
+
+        for user_id in spellings:
+            assert service.check_feature_enabled("beta_users", user_id).is_enabled
+            assert service.evaluate_all_flags(user_id)["beta_users"].is_enabled
+
+    def test_percentage_bucket_matches_hash(self, service):
+        user_id = str(OTHER_USER)
+        digest = hashlib.sha256(f"{user_id}:half".encode()).digest()
+        bucket = int.from_bytes(digest[:4], byteorder="big") % 100
+
+        result = service.check_feature_enabled("half", OTHER_USER)
+
+        assert service._hash_user_for_percentage(user_id, "half") == bucket
+        assert result.is_enabled == (bucket < 50)
+
+    def test_bulk_evaluation_matches_single_checks(self, service, supabase):
+        roles = ["manager"]
+
+        results = service.evaluate_all_flags(ALLOWED_USER, roles)
+
+        assert set(results) == {row["name"] for row in supabase.rows}
+        for name, result in results.items():
+            assert result == service.check_feature_enabled(name, ALLOWED_USER, roles)
+
+
+class TestSnapshotRefresh:
+
+    def test_update_invalidates_snapshot(self, service, supabase):
+        assert service.check_feature_enabled("everyone").is_enabled
+
+        flag_id = supabase.rows[0]["id"]
+        service.update_feature_flag(flag_id, FeatureFlagUpdate(status=FeatureFlagStatus.DISABLED))
+
+        assert not service.check_feature_enabled("everyone").is_enabled
+        assert supabase.snapshot_loads == 2
+
+    def test_stale_snapshot_reloads_after_ttl(self, supabase, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(feature_flag_module, "_monotonic", lambda: now[0])
+        service = FeatureFlagService(supabase, snapshot_ttl=30)
+
+        service.check_feature_enabled("everyone")
+        now[0] += 10
+        service.check_feature_enabled("everyone")
+        now[0] += 30
+        service.check_feature_enabled("everyone")
+
+        assert supabase.snapshot_loads == 2
+
+    def test_construction_does_not_connect_to_redis(self, supabase, monkeypatch):
+        connect = Mock()
+        monkeypatch.setattr(FeatureFlagService, "_start_invalidation_listener", connect)
+
+        service = FeatureFlagService(supabase, redis_url="redis://127.0.0.1:1/0")
+
+        connect.assert_not_called()
+        service.start_invalidation_listener()
+        connect.assert_called_once_with("redis://127.0.0.1:1/0")
+
+    def test_unreachable_redis_keeps_ttl_refresh(self, supabase):
+        service = FeatureFlagService(supabase, redis_url="redis://127.0.0.1:1/0")
+
+        service.start_invalidation_listener()
+        service.invalidate_snapshot()
+
+        assert service._listener is None
+        assert service.check_feature_enabled("everyone").is_enabled
@@ -0,0 +1,315 @@
+"""
+Unit Tests for Single-Pass Hierarchy Progress Rollup
+
+Tests that bulk task progress updates produce the same task and ancestor
+values as applying each update with its single-task parent rollup, while
+reading schedules past the PostgREST row cap page by page and writing only
+the changed fields, and that WBS rollups recalculate the whole ancestor
+chain from one load of the schedule.
+
+**Validates: Requirements 1.5, 2.3**
+"""
+
+import copy
+import random
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from models.schedule import TaskProgressUpdate, TaskStatus
+from services import hierarchy_rollup
+from services.hierarchy_rollup import roll_up, average_progress
+from services.schedule_manager import ScheduleManager
+from services.wbs_manager import WBSManager
+
+
+SCHEDULE_ID = str(uuid4())
+
+
+class FakeQuery:
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.filters = []
+        self.update_data = None
+        self.upsert_rows = None
+        self.order_column = None
+        self.offset = 0
+
+    def select(self, columns="*"):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) == str(value))
+        return self
+
+    def in_(self, column, values):
+        values = {str(v) for v in values}
+        self.filters.append(lambda row: str(row.get(column)) in values)
+        return self
+
+    def order(self, column):
+        self.order_column = column
+        return self
+
+    def range(self, start, end):
+        self.offset = start
+        return self
+
+    def update(self, data):
+        self.update_data = data
+        return self
+
+    def upsert(self, rows):
+        self.upsert_rows = rows
+        return self
+
+    def execute(self):
+        rows = self.db.tables[self.table]
+        self.db.calls.append((self.table, "upsert" if self.upsert_rows else "update" if self.update_data else "select"))
+        if self.upsert_rows is not None:
+            for row in self.upsert_rows:
+                rows[str(row["id"])] = dict(row)
+            return FakeResult([dict(row) for row in self.upsert_rows])
+        matched = [row for row in rows.values() if all(f(row) for f in self.filters)]
+        if self.update_data is not None:
+            self.db.updated_fields.append(set(self.update_data))
+            for row in matched:
+                row.update(self.update_data)
+            return FakeResult([dict(row) for row in matched])
+        if self.order_column:
+            matched.sort(key=lambda row: str(row[self.order_column]))
+        # PostgREST returns at most max_rows rows per request
+        return FakeResult([dict(row) for row in matched[self.offset:self.offset + self.db.max_rows]])
+
+
+class FakeResult:
+
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeDB:
+
+    def __init__(self, tables, max_rows=1000):
+        self.tables = tables
+        self.max_rows = max_rows
+        self.calls = []
+        self.updated_fields = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+def task_row(task_id, parent_id, effort):
+    now = datetime.utcnow().isoformat()
+    return {
+        "id": task_id,
+        "schedule_id": SCHEDULE_ID,
+        "parent_task_id": parent_id,
+        "wbs_code": "1",
+        "name": task_id,
+        "planned_start_date": "2024-01-01",
+        "planned_end_date": "2024-02-01",
+        "duration_days": 31,
+        "progress_percentage": 0,
+        "status": TaskStatus.NOT_STARTED.value,
+        "planned_effort_hours": effort,
+        "is_critical": False,
+        "total_float_days": 0,
+        "free_float_days": 0,
+        "deliverables": "[]",
+        "created_by": str(uuid4()),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+@pytest.fixture
+def hierarchy():
+    rng = random.Random(11)
+    ids = [str(uuid4()) for _ in range(120)]
+    tasks = {}
+    for i, task_id in enumerate(ids):
+        parent = ids[rng.randrange(i)] if i and rng.random() < 0.9 else None
+        tasks[task_id] = task_row(task_id, parent, rng.choice([None, 4, 8, 40]))
+    parents = {row["parent_task_id"] for row in tasks.values()}
+    leaves = [task_id for task_id in ids if task_id not in parents]
+    updates = [
+        {"task_id": task_id, "progress_percentage": rng.randint(0, 100), "status": TaskStatus.IN_PROGRESS.value}
+        for task_id in rng.sample(leaves, 40)
+    ]
+    return tasks, updates
+
+
+def manager_for(cls, tables, max_rows=1000):
+    manager = cls.__new__(cls)
+    manager.db = FakeDB(copy.deepcopy(tables), max_rows)
+    return manager
+
+
+class TestBulkTaskProgress:
+
+    @pytest.mark.asyncio
+    async def test_bulk_matches_sequential_updates(self, hierarchy):
+        tasks, updates = hierarchy
+        sequential = manager_for(ScheduleManager, {"tasks": tasks})
+        bulk = manager_for(ScheduleManager, {"tasks": tasks})
+
+        for update in updates:
+            await sequential.update_task_progress(
+                update["task_id"],
+                TaskProgressUpdate(progress_percentage=update["progress_percentage"], status=update["status"]),
+                uuid4(),
+            )
+        result = await bulk.bulk_update_task_progress(updates, uuid4())
+
+        assert result["successful_updates"] == len(updates)
+        for task_id, row in sequential.db.tables["tasks"].items():
+            written = bulk.db.tables["tasks"][task_id]
+            assert (written["progress_percentage"], written["status"]) == (row["progress_percentage"], row["status"])
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_only_progress_fields(self, hierarchy):
+        tasks, updates = hierarchy
+        bulk = manager_for(ScheduleManager, {"tasks": tasks})
+
+        await bulk.bulk_update_task_progress(updates, uuid4())
+
+        writes = [call for call in bulk.db.calls if call[1] != "select"]
+        assert writes and set(writes) == {("tasks", "update")}
+        for fields in bulk.db.updated_fields:
+            assert fields <= {"progress_percentage", "status", "updated_at"}
+
+    @pytest.mark.asyncio
+    async def test_reads_are_paged_past_the_row_cap(self, hierarchy, monkeypatch):
+        tasks, updates = hierarchy
+        monkeypatch.setattr(hierarchy_rollup, "READ_PAGE_SIZE", 7)
+        uncapped = manager_for(ScheduleManager, {"tasks": tasks})
+        capped = manager_for(ScheduleManager, {"tasks": tasks}, max_rows=7)
+
+        await uncapped.bulk_update_task_progress(updates, uuid4())
+        result = await capped.bulk_update_task_progress(updates, uuid4())
+        recalculated = await capped.recalculate_all_parent_progress(SCHEDULE_ID)
+
+        assert result["failed_updates"] == 0
+        assert recalculated["errors"] == []
+        for task_id, row in uncapped.db.tables["tasks"].items():
+            written = capped.db.tables["tasks"][task_id]
+            assert (written["progress_percentage"], written["status"]) == (row["progress_percentage"], row["status"])
+
+    @pytest.mark.asyncio
+    async def test_invalid_updates_are_reported_per_task(self, hierarchy):
+        tasks, updates = hierarchy
+        bulk = manager_for(ScheduleManager, {"tasks": tasks})
+        missing = str(uuid4())
+
+        result = await bulk.bulk_update_task_progress(
+            [
+                updates[0],
+                {"task_id": updates[1]["task_id"], "progress_percentage": 100, "status": TaskStatus.COMPLETED.value},
+                {"task_id": missing, "progress_percentage": 10, "status": TaskStatus.IN_PROGRESS.value},
+            ],
+            uuid4(),
+        )
+
+        errors = {entry["task_id"]: entry.get("error") for entry in result["results"] if not entry["success"]}
+        assert result["successful_updates"] == 1
+        assert "Invalid status transition" in errors[updates[1]["task_id"]]
+        assert "not found" in errors[missing]
+
+    @pytest.mark.asyncio
+    async def test_explicit_parent_progress_is_kept(self):
+        root, parent, child, sibling = (str(uuid4()) for _ in range(4))
+        tasks = {
+            root: task_row(root, None, 10),
+            parent: task_row(parent, root, 10),
+            child: task_row(child, parent, 10),
+            sibling: task_row(sibling, root, 10),
+        }
+        bulk = manager_for(ScheduleManager, {"tasks": tasks})
+
+        await bulk.bulk_update_task_progress(
+            [
+                {"task_id": child, "progress_percentage": 20, "status": TaskStatus.IN_PROGRESS.value},
+                {"task_id": parent, "progress_percentage": 80, "status": TaskStatus.IN_PROGRESS.value},
+            ],
+            uuid4(),
+        )
+
+        stored = bulk.db.tables["tasks"]
+        assert stored[child]["progress_percentage"] == 20
+        assert stored[parent]["progress_percentage"] == 80
+        assert stored[root]["progress_percentage"] == 40
+
+    @pytest.mark.asyncio
+    async def test_single_task_update_loads_only_the_ancestor_chain(self, hierarchy):
+        tasks, updates = hierarchy
+        manager = manager_for(ScheduleManager, {"tasks": tasks})
+        update = next(u for u in updates if tasks[u["task_id"]]["parent_task_id"])
+        manager.db.tables["tasks"]["unrelated"] = dict(task_row("unrelated", None, 8), schedule_id=None)
+        loaded = []
+        load_chain = manager._load_ancestor_chain
+        manager._load_ancestor_chain = lambda task_id: loaded.append(load_chain(task_id)) or loaded[-1]
+
+        await manager.update_task_progress(
+            update["task_id"],
+            TaskProgressUpdate(progress_percentage=update["progress_percentage"], status=update["status"]),
+            uuid4(),
+        )
+
+        chain = set()
+        node = tasks[update["task_id"]]["parent_task_id"]
+        while node:
+            chain.add(node)
+            node = tasks[node]["parent_task_id"]
+        expected = chain | {task_id for task_id, row in tasks.items() if row["parent_task_id"] in chain}
+        assert set(loaded[0]) == expected
+        writes = [call for call in manager.db.calls if call[1] != "select"]
+        assert set(writes) == {("tasks", "update")}
+        for fields in manager.db.updated_fields[1:]:
+            assert fields == {"progress_percentage", "status", "updated_at"}
+
+
+class TestRollUp:
+
+    def test_each_ancestor_is_recalculated_once(self):
+        rows = {
+            "root": {"id": "root", "parent": None, "progress_percentage": 0},
+            "a": {"id": "a", "parent": "root", "progress_percentage": 0},
+            "b": {"id": "b", "parent": "root", "progress_percentage": 0},
+            "a1": {"id": "a1", "parent": "a", "progress_percentage": 50},
+            "a2": {"id": "a2", "parent": "a", "progress_percentage": 100},
+            "b1": {"id": "b1", "parent": "b", "progress_percentage": 20},
+        }
+        calls = []
+
+        def fields(children):
+            calls.append(children)
+            return {"progress_percentage": int(round(average_progress(children)))}
+
+        order = roll_up(rows, ["a", "b", "a"], "parent", fields)
+
+        assert order[-1] == "root"
+        assert len(calls) == 3
+        assert rows["root"]["progress_percentage"] == round((75 + 20) / 2)
+
+    @pytest.mark.asyncio
+    async def test_wbs_rollup_updates_chain_in_one_write(self):
+        elements = {
+            "root": {"id": "root", "schedule_id": SCHEDULE_ID, "parent_element_id": None, "progress_percentage": 0},
+            "mid": {"id": "mid", "schedule_id": SCHEDULE_ID, "parent_element_id": "root", "progress_percentage": 0},
+            "leaf": {"id": "leaf", "schedule_id": SCHEDULE_ID, "parent_element_id": "mid", "progress_percentage": 60},
+            "other": {"id": "other", "schedule_id": SCHEDULE_ID, "parent_element_id": "root", "progress_percentage": 0},
+        }
+        manager = manager_for(WBSManager, {"wbs_elements": elements})
+
+        await manager._update_parent_wbs_progress_rollup("mid")
+
+        stored = manager.db.tables["wbs_elements"]
+        assert stored["mid"]["progress_percentage"] == 60
+        assert stored["root"]["progress_percentage"] == 30
+        assert [call for call in manager.db.calls if call[1] != "select"] == [("wbs_elements", "update")] * 2
+        assert manager.db.updated_fields == [{"progress_percentage", "updated_at"}] * 2
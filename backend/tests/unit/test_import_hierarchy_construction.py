@@ -39,7 +39,11 @@ def mock_supabase():
     mock.select = Mock(return_value=mock)
     mock.insert = Mock(return_value=mock)
     mock.update = Mock(return_value=mock)
+    mock.upsert = Mock(return_value=mock)
     mock.eq = Mock(return_value=mock)
+    mock.in_ = Mock(return_value=mock)
+    mock.order = Mock(return_value=mock)
+    mock.range = Mock(return_value=mock)
     mock.execute = Mock(return_value=Mock(data=[]))
     return mock
 
@@ -743,5 +747,190 @@ async def test_construct_hierarchy_with_missing_parents(import_service, basic_im
     assert any('Auto-created missing parent' in w.message for w in warnings)
 
 
+# =============================================================================
+# Bulk Hierarchy Construction Tests
+# =============================================================================
+
+def _upserted_rows(mock_supabase):
+    """Rows passed to every upsert call, in call order."""
+    return [row for call in mock_supabase.upsert.call_args_list for row in call.args[0]]
+
+
+@pytest.fixture
+def bulk_service(import_service):
+    """Import service with the post-write recalculation hooks mocked out."""
+    import_service.po_service._recalculate_parent_totals = AsyncMock()
+    import_service.po_service.schedule_automatic_variance_recalculation = AsyncMock(return_value=True)
+    return import_service
+
+
+@pytest.mark.asyncio
+async def test_construct_hierarchy_bulk_resolves_and_rolls_up(bulk_service, basic_import_config, mock_supabase):
+    """Test that the bulk path links parents, sets levels and rolls totals up in one write."""
+    errors = []
+    warnings = []
+    
+    parsed_rows = [
+        {'Structure Code': '1.1.1', 'name': 'Leaf A', 'code': 'LA', 'planned_amount': '100'},
+        {'Structure Code': '1', 'name': 'Root', 'code': 'R1', 'planned_amount': '9999'},
+        {'Structure Code': '1.1', 'name': 'Branch', 'code': 'B1', 'planned_amount': '0'},
+        {'Structure Code': '1.1.2', 'name': 'Leaf B', 'code': 'LB', 'planned_amount': '250'},
+        {'Structure Code': '1.2', 'name': 'Sibling', 'code': 'S1', 'planned_amount': '50'},
+    ]
+    
+    created_ids, hierarchy_count = await bulk_service.construct_hierarchy_bulk(
+        parsed_rows=parsed_rows,
+        project_id=uuid4(),
+        config=basic_import_config,
+        user_id=uuid4(),
+        batch_id=uuid4(),
+        errors=errors,
+        warnings=warnings
+    )
+    
+    assert errors == []
+    assert len(created_ids) == 5
+    assert hierarchy_count == 3
+    assert mock_supabase.upsert.call_count == 1
+    
+    rows = {row['code']: row for row in _upserted_rows(mock_supabase)}
+    assert rows['R1']['parent_breakdown_id'] is None
+    assert rows['B1']['parent_breakdown_id'] == rows['R1']['id']
+    assert rows['LA']['parent_breakdown_id'] == rows['B1']['id']
+    assert rows['LB']['hierarchy_level'] == 2
+    assert Decimal(rows['B1']['planned_amount']) == Decimal('350')
+    assert Decimal(rows['R1']['planned_amount']) == Decimal('400')
+    assert Decimal(rows['S1']['planned_amount']) == Decimal('50')
+    
+    # Parents are written before their children
+    order = [row['code'] for row in _upserted_rows(mock_supabase)]
+    assert order.index('R1') < order.index('B1') < order.index('LA')
+    bulk_service.po_service._recalculate_parent_totals.assert_not_called()
+    bulk_service.po_service.schedule_automatic_variance_recalculation.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_construct_hierarchy_bulk_plans_missing_parents(bulk_service, basic_import_config, mock_supabase):
+    """Test that missing parents are planned in memory and hang off existing database rows."""
+    existing_id = uuid4()
+    errors = []
+    warnings = []
+    
+    bulk_service._find_existing_breakdowns = Mock(return_value=(
+        {'1': {'id': str(existing_id), 'code': '1', 'hierarchy_level': 0}},
+        {}
+    ))
+    
+    parsed_rows = [
+        {'Structure Code': '1.1.1', 'name': 'Grandchild', 'code': 'GC1', 'planned_amount': '100'},
+    ]
+    
+    created_ids, _ = await bulk_service.construct_hierarchy_bulk(
+        parsed_rows=parsed_rows,
+        project_id=uuid4(),
+        config=basic_import_config,
+        user_id=uuid4(),
+        batch_id=uuid4(),
+        errors=errors,
+        warnings=warnings
+    )
+    
+    assert errors == []
+    assert len(created_ids) == 1
+    assert [w.warning_type for w in warnings] == ['parent_auto_created']
+    
+    rows = {row['code']: row for row in _upserted_rows(mock_supabase)}
+    assert rows['1.1']['parent_breakdown_id'] == str(existing_id)
+    assert rows['1.1']['custom_fields']['auto_created'] is True
+    assert Decimal(rows['1.1']['planned_amount']) == Decimal('100')
+    assert rows['GC1']['hierarchy_level'] == 2
+    bulk_service.po_service._recalculate_parent_totals.assert_awaited_once_with(existing_id)
+
+
+@pytest.mark.asyncio
+async def test_construct_hierarchy_bulk_detects_conflicts_in_one_lookup(bulk_service, basic_import_config, mock_supabase):
+    """Test that existing codes are found with one set-based query and skipped."""
+    existing = {'id': str(uuid4()), 'code': 'C1', 'name': 'Existing', 'hierarchy_level': 0}
+    mock_supabase.execute.return_value = Mock(data=[existing])
+    errors = []
+    warnings = []
+    conflicts = []
+    
+    parsed_rows = [
+        {'Structure Code': '1', 'name': 'Root', 'code': 'R1', 'planned_amount': '0'},
+        {'Structure Code': '1.1', 'name': 'Child 1', 'code': 'C1', 'planned_amount': '500'},
+        {'Structure Code': '1.2', 'name': 'Child 2', 'code': 'C2', 'planned_amount': '500'},
+    ]
+    
+    created_ids, _ = await bulk_service.construct_hierarchy_bulk(
+        parsed_rows=parsed_rows,
+        project_id=uuid4(),
+        config=basic_import_config,
+        user_id=uuid4(),
+        batch_id=uuid4(),
+        errors=errors,
+        warnings=warnings,
+        conflicts=conflicts
+    )
+    
+    assert len(created_ids) == 2
+    assert len(conflicts) == 1
+    assert conflicts[0].conflict_type == ConflictType.duplicate_code
+    assert any(w.warning_type == 'conflict_skipped' for w in warnings)
+    
+    in_filters = [call.args[0] for call in mock_supabase.in_.call_args_list]
+    assert in_filters == ['code']
+    assert set(mock_supabase.in_.call_args_list[0].args[1]) == {'R1', 'C1', 'C2', '1'}
+
+
+@pytest.mark.asyncio
+async def test_construct_hierarchy_bulk_chunks_and_fails_descendants(bulk_service, basic_import_config, mock_supabase):
+    """Test chunked upserts and that a failed chunk fails the children of its rows."""
+    from services.import_processing_service import BULK_INSERT_CHUNK
+    
+    errors = []
+    warnings = []
+    
+    leaf_count = BULK_INSERT_CHUNK + 10
+    parsed_rows = [{'Structure Code': '1', 'name': 'Root', 'code': 'R1', 'planned_amount': '0'}]
+    parsed_rows += [
+        {'Structure Code': f'1.{i}', 'name': f'Leaf {i}', 'code': f'L{i}', 'planned_amount': '1'}
+        for i in range(1, leaf_count + 1)
+    ]
+    
+    created_ids, _ = await bulk_service.construct_hierarchy_bulk(
+        parsed_rows=parsed_rows,
+        project_id=uuid4(),
+        config=basic_import_config,
+        user_id=uuid4(),
+        batch_id=uuid4(),
+        errors=errors,
+        warnings=warnings
+    )
+    
+    assert len(created_ids) == leaf_count + 1
+    assert mock_supabase.upsert.call_count == 2
+    assert Decimal(_upserted_rows(mock_supabase)[0]['planned_amount']) == Decimal(leaf_count)
+    
+    # Fail the first chunk: every row in it and every later child of the root fails
+    mock_supabase.upsert.reset_mock()
+    mock_supabase.upsert.side_effect = Exception("connection reset")
+    errors = []
+    
+    created_ids, _ = await bulk_service.construct_hierarchy_bulk(
+        parsed_rows=parsed_rows,
+        project_id=uuid4(),
+        config=basic_import_config,
+        user_id=uuid4(),
+        batch_id=uuid4(),
+        errors=errors,
+        warnings=[]
+    )
+    
+    assert created_ids == []
+    assert mock_supabase.upsert.call_count == 1
+    assert len(errors) == leaf_count + 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,261 @@
+"""
+Unit Tests for the Compiled Permission Index
+
+Tests that role assignments compile into scope bitsets, that the scope chain
+(organization -> portfolio -> project) is honoured by single and bulk checks,
+and that versioned invalidation rebuilds the index without scanning caches.
+
+**Validates: Requirements 1.2, 2.5, 7.1, 8.1**
+"""
+
+import pytest
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+from auth.rbac import Permission
+from auth.enhanced_rbac_models import ScopeType
+from auth import enhanced_permission_checker as checker_module
+from auth.enhanced_permission_checker import EnhancedPermissionChecker
+from auth.permission_index import (
+    PERMISSION_BITS,
+    IndexedRole,
+    compile_permission_index,
+    permission_mask,
+    permissions_from_mask,
+)
+
+
+ORG_ID = str(uuid4())
+PORTFOLIO_ID = str(uuid4())
+OTHER_PORTFOLIO_ID = str(uuid4())
+PROJECT_IN_PORTFOLIO = str(uuid4())
+PROJECT_IN_OTHER_PORTFOLIO = str(uuid4())
+ORPHAN_PROJECT = str(uuid4())
+GRANTED_PROJECT = str(uuid4())
+
+
+def role(*permissions):
+    return IndexedRole(role_id=str(uuid4()), role_name="test", permissions=[p.value for p in permissions])
+
+
+class FakeSupabase:
+    """Serves user_roles, projects and portfolios, counting queries per table."""
+
+    def __init__(self, assignments, projects, portfolios):
+        self.assignments = assignments
+        self.rows = {"projects": projects, "portfolios": portfolios}
+        self.queries = {"user_roles": 0, "projects": 0, "portfolios": 0}
+
+    def table(self, name):
+        query = Mock()
+        filters = {}
+        query.select.return_value = query
+        query.is_.return_value = query
+
+        def eq(column, value):
+            filters[column] = value
+            return query
+
+        def execute():
+            self.queries[name] += 1
+            if name == "user_roles":
+                return Mock(data=self.assignments)
+            return Mock(data=[row for row in self.rows[name] if row["id"] == filters.get("id")])
+
+        def in_(column, ids):
+            in_query = Mock()
+
+            def in_execute():
+                self.queries[name] += 1
+                return Mock(data=[row for row in self.rows[name] if row["id"] in ids])
+
+            in_query.execute.side_effect = in_execute
+            return in_query
+
+        query.eq.side_effect = eq
+        query.execute.side_effect = execute
+        query.in_.side_effect = in_
+        return query
+
+
+def assignment(scope_type, scope_id, *permissions):
+    return {
+        "id": str(uuid4()),
+        "role_id": str(uuid4()),
+        "scope_type": scope_type,
+        "scope_id": scope_id,
+        "expires_at": None,
+        "is_active": True,
+        "roles": {"name": "test", "permissions": [p.value for p in permissions], "is_active": True},
+    }
+
+
+@pytest.fixture
+def supabase():
+    return FakeSupabase(
+        assignments=[
+            assignment("portfolio", PORTFOLIO_ID, Permission.project_update),
+            assignment("organization", ORG_ID, Permission.portfolio_update),
+            assignment("project", GRANTED_PROJECT, Permission.project_update),
+        ],
+        projects=[
+            {"id": PROJECT_IN_PORTFOLIO, "portfolio_id": PORTFOLIO_ID},
+            {"id": PROJECT_IN_OTHER_PORTFOLIO, "portfolio_id": OTHER_PORTFOLIO_ID},
+            {"id": ORPHAN_PROJECT, "portfolio_id": None},
+            {"id": GRANTED_PROJECT, "portfolio_id": None},
+        ],
+        portfolios=[
+            {"id": PORTFOLIO_ID, "organization_id": None},
+            {"id": OTHER_PORTFOLIO_ID, "organization_id": ORG_ID},
+        ],
+    )
+
+
+@pytest.fixture
+def checker(supabase):
+    return EnhancedPermissionChecker(supabase_client=supabase, cache_ttl=300)
+
+
+class TestCompiledIndex:
+
+    def test_mask_round_trip_ignores_unknown_permissions(self):
+        mask = permission_mask([Permission.project_read, "project_update", "not_a_permission"])
+
+        assert set(permissions_from_mask(mask)) == {Permission.project_read, Permission.project_update}
+
+    def test_scope_chain_combines_parent_masks(self):
+        index = compile_permission_index(
+            "user",
+            (0, 0),
+            [
+                (ScopeType.ORGANIZATION, ORG_ID, role(Permission.portfolio_update)),
+                (ScopeType.PORTFOLIO, PORTFOLIO_ID, role(Permission.project_update)),
+            ],
+            default_global_permissions=[Permission.project_read],
+            ttl=300,
+        )
+
+        assert index.global_mask == PERMISSION_BITS[Permission.project_read]
+        assert index.project_mask(PROJECT_IN_PORTFOLIO, PORTFOLIO_ID) & PERMISSION_BITS[Permission.project_update]
+        assert not index.project_mask(PROJECT_IN_PORTFOLIO) & PERMISSION_BITS[Permission.project_update]
+        assert index.portfolio_mask(PORTFOLIO_ID, ORG_ID) & PERMISSION_BITS[Permission.portfolio_update]
+        assert index.has_scope_grants(ScopeType.ORGANIZATION)
+        assert not index.has_scope_grants(ScopeType.PROJECT)
+
+    def test_global_role_replaces_default_permissions(self):
+        index = compile_permission_index(
+            "user", (0, 0), [(ScopeType.GLOBAL, None, role(Permission.project_update))],
+            default_global_permissions=[Permission.project_read], ttl=300,
+        )
+
+        assert index.global_mask == PERMISSION_BITS[Permission.project_update]
+
+    @pytest.mark.asyncio
+    async def test_unknown_scope_type_row_is_skipped(self, checker, supabase):
+        supabase.assignments.append(assignment("team", str(uuid4()), Permission.project_delete))
+
+        index = await checker.get_permission_index(uuid4())
+
+        assert index.project_mask(PROJECT_IN_PORTFOLIO, PORTFOLIO_ID) & PERMISSION_BITS[Permission.project_update]
+        assert not index.global_mask & PERMISSION_BITS[Permission.project_delete]
+
+
+class TestBulkChecks:
+
+    @pytest.mark.asyncio
+    async def test_project_filter_matches_single_checks(self, checker, supabase):
+        user_id = uuid4()
+        project_ids = [PROJECT_IN_PORTFOLIO, PROJECT_IN_OTHER_PORTFOLIO, ORPHAN_PROJECT, GRANTED_PROJECT]
+
+        permitted = await checker.filter_projects_by_permission(user_id, Permission.project_update, project_ids)
+
+        assert permitted == {PROJECT_IN_PORTFOLIO, GRANTED_PROJECT}
+        assert supabase.queries == {"user_roles": 1, "projects": 1, "portfolios": 1}
+        for project_id in project_ids:
+            single = await checker.check_project_permission(user_id, Permission.project_update, project_id)
+            assert single == (project_id in permitted)
+        assert supabase.queries["user_roles"] == 1
+
+    @pytest.mark.asyncio
+    async def test_known_parents_skip_project_lookup(self, checker, supabase):
+        rows = [
+            {"id": PROJECT_IN_PORTFOLIO, "portfolio_id": PORTFOLIO_ID},
+            {"id": ORPHAN_PROJECT, "portfolio_id": None},
+        ]
+
+        permitted = await checker.filter_projects_by_permission(
+            uuid4(),
+            Permission.project_update,
+            [row["id"] for row in rows],
+            {row["id"]: row["portfolio_id"] for row in rows},
+        )
+
+        assert permitted == {PROJECT_IN_PORTFOLIO}
+        assert supabase.queries["projects"] == 0
+
+    @pytest.mark.asyncio
+    async def test_portfolio_filter_inherits_from_organization(self, checker):
+        permitted = await checker.filter_portfolios_by_permission(
+            uuid4(), Permission.portfolio_update, [PORTFOLIO_ID, OTHER_PORTFOLIO_ID]
+        )
+
+        assert permitted == {OTHER_PORTFOLIO_ID}
+
+
+class TestVersionedInvalidation:
+
+    @pytest.mark.asyncio
+    async def test_clear_user_cache_rebuilds_only_that_user(self, checker, supabase):
+        user_a, user_b = uuid4(), uuid4()
+        await checker.get_permission_index(user_a)
+        await checker.get_permission_index(user_b)
+
+        checker.clear_user_cache(user_a)
+        await checker.get_permission_index(user_a)
+        await checker.get_permission_index(user_b)
+
+        assert supabase.queries["user_roles"] == 3
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_every_index(self, checker, supabase):
+        user_id = uuid4()
+        before = await checker.check_portfolio_permission(user_id, Permission.portfolio_delete, OTHER_PORTFOLIO_ID)
+        supabase.assignments[1]["roles"]["permissions"].append(Permission.portfolio_delete.value)
+
+        checker.clear_role_cache(uuid4())
+        after = await checker.check_portfolio_permission(user_id, Permission.portfolio_delete, OTHER_PORTFOLIO_ID)
+
+        assert before is False
+        assert after is True
+
+    @pytest.mark.asyncio
+    async def test_index_cache_evicts_least_recently_used(self, checker, supabase, monkeypatch):
+        monkeypatch.setattr(checker_module, "PERMISSION_INDEX_CACHE_SIZE", 2)
+        user_a, user_b, user_c = uuid4(), uuid4(), uuid4()
+
+        await checker.get_permission_index(user_a)
+        await checker.get_permission_index(user_b)
+        await checker.get_permission_index(user_a)
+        await checker.get_permission_index(user_c)
+
+        assert list(checker._permission_indexes) == [str(user_a), str(user_c)]
+        await checker.get_permission_index(user_a)
+        assert supabase.queries["user_roles"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_revoking_a_role_invalidates_the_users_index(self, checker, supabase, monkeypatch):
+        from routers import rbac as rbac_router
+        
+        user_id = uuid4()
+        assert await checker.check_project_permission(user_id, Permission.project_update, GRANTED_PROJECT)
+        monkeypatch.setattr(rbac_router, "supabase", supabase)
+        monkeypatch.setattr(rbac_router, "audit_service", Mock())
+        monkeypatch.setattr(rbac_router, "get_enhanced_permission_checker", lambda: checker)
+        
+        revoked = supabase.assignments.pop()
+        await rbac_router.delete_role_assignment(
+            user_id, UUID(revoked["id"]), current_user={"user_id": str(uuid4())}
+        )
+        
+        assert not await checker.check_project_permission(user_id, Permission.project_update, GRANTED_PROJECT)
+
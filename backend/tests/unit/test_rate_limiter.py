@@ -0,0 +1,119 @@
+"""
+Unit Tests for the Sliding Window Counter Rate Limiter
+
+Tests that limits are enforced with constant state per user, that the
+previous window is weighted by its overlap with the sliding window, and that
+an unreachable Redis backend falls back to in-process counters.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from services import rate_limiter as rate_limiter_module
+from services.rate_limiter import RateLimiter, RateLimitExceeded
+
+
+class FakeClock:
+
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock(now=100 * 3600.0)
+    monkeypatch.setattr(rate_limiter_module.time, "time", fake.time)
+    return fake
+
+
+class TestSlidingWindowCounter:
+
+    @pytest.mark.asyncio
+    async def test_limit_enforced_within_window(self, clock):
+        limiter = RateLimiter(default_limit=5, window_seconds=60)
+
+        for _ in range(5):
+            assert await limiter.check_rate_limit("user-1", role="guest")
+        with pytest.raises(RateLimitExceeded):
+            await limiter.check_rate_limit("user-1", role="guest")
+
+        assert await limiter.get_remaining_requests("user-1", role="guest") == 0
+        assert await limiter.get_remaining_requests("user-2", role="guest") == 5
+        assert len(limiter.counters) == 1
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted_by_overlap(self, clock):
+        limiter = RateLimiter(default_limit=10, window_seconds=60)
+        for _ in range(10):
+            await limiter.check_rate_limit("user-1", role="guest")
+
+        # A quarter into the next window, 75% of the previous count still applies
+        clock.now += 75
+        decision = await limiter.acquire("user-1", role="guest")
+        assert decision.allowed
+        assert decision.remaining == 1
+        assert decision.reset_at == int(clock.now // 60 + 1) * 60
+
+        # Two windows later nothing carries over
+        clock.now += 120
+        assert await limiter.get_remaining_requests("user-1", role="guest") == 10
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_are_not_counted(self, clock):
+        limiter = RateLimiter(default_limit=2, window_seconds=60)
+        for _ in range(5):
+            await limiter.acquire("user-1", role="guest")
+
+        assert limiter.counters["user-1"].current == 2
+
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_idle_counters(self, clock):
+        limiter = RateLimiter(default_limit=2, window_seconds=60)
+        await limiter.acquire("idle", role="guest")
+        clock.now += 180
+        await limiter.acquire("active", role="guest")
+
+        await limiter._cleanup_old_requests()
+
+        assert set(limiter.counters) == {"active"}
+
+
+class TestRedisBackend:
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_falls_back_to_memory(self):
+        limiter = RateLimiter(default_limit=1, window_seconds=60, redis_url="redis://127.0.0.1:1/0")
+
+        assert (await limiter.acquire("user-1", role="guest")).allowed
+        assert not (await limiter.acquire("user-1", role="guest")).allowed
+        assert limiter.get_stats()["backend"] == "memory"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_share_one_client(self, monkeypatch):
+        created = []
+
+        class FakeRedis:
+
+            async def ping(self):
+                await asyncio.sleep(0)
+
+            def register_script(self, script):
+                return script
+
+        def from_url(url, **kwargs):
+            created.append(FakeRedis())
+            return created[-1]
+
+        monkeypatch.setattr(rate_limiter_module, "REDIS_AVAILABLE", True)
+        monkeypatch.setattr(rate_limiter_module, "aioredis", SimpleNamespace(from_url=from_url), raising=False)
+        limiter = RateLimiter(redis_url="redis://cache:6379/0")
+
+        clients = await asyncio.gather(*(limiter._get_redis() for _ in range(10)))
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
@@ -0,0 +1,113 @@
+"""
+Unit Tests for Time-Phased Resource Load Profiles
+
+Tests that daily load arrays built with difference arrays match a day-by-day
+sum, that over-allocation intervals and overlapping pairs are exact, and that
+weekly and windowed averages are consistent with the daily load.
+"""
+
+import random
+from datetime import date, timedelta
+from itertools import combinations
+
+import pytest
+
+from services.resource_load_profile import build_load_profiles
+
+
+BASE = date(2024, 1, 1)  # A Monday
+
+
+def assignment(resource_id, start, end, allocation, index=0):
+    return {
+        "id": f"a{index}",
+        "task_id": f"t{index}",
+        "resource_id": resource_id,
+        "allocation_percentage": allocation,
+        "assignment_start_date": (BASE + timedelta(days=start)).isoformat(),
+        "assignment_end_date": (BASE + timedelta(days=end)).isoformat(),
+    }
+
+
+@pytest.fixture
+def random_assignments():
+    rng = random.Random(7)
+    rows = []
+    for i in range(300):
+        start = rng.randint(0, 120)
+        rows.append(assignment(f"r{rng.randint(0, 9)}", start, start + rng.randint(0, 30), rng.randint(10, 80), i))
+    return rows
+
+
+def daily_load(rows, resource_id):
+    load = {}
+    for row in rows:
+        if row["resource_id"] != resource_id:
+            continue
+        day = date.fromisoformat(row["assignment_start_date"])
+        while day <= date.fromisoformat(row["assignment_end_date"]):
+            load[day] = load.get(day, 0) + row["allocation_percentage"]
+            day += timedelta(days=1)
+    return load
+
+
+class TestLoadProfiles:
+
+    def test_daily_load_matches_brute_force(self, random_assignments):
+        profiles = build_load_profiles(random_assignments)
+
+        assert set(profiles) == {row["resource_id"] for row in random_assignments}
+        for resource_id, profile in profiles.items():
+            expected = daily_load(random_assignments, resource_id)
+            for offset in range(len(profile.load)):
+                day = profile.origin + timedelta(days=offset)
+                assert profile.load_on(day) == pytest.approx(expected.get(day, 0))
+
+    def test_overallocation_intervals_are_exact(self, random_assignments):
+        for resource_id, profile in build_load_profiles(random_assignments).items():
+            expected = daily_load(random_assignments, resource_id)
+            reported = []
+            for interval in profile.overallocations():
+                days = [interval.start + timedelta(days=i) for i in range(interval.days)]
+                assert interval.peak_allocation == pytest.approx(max(expected[d] for d in days))
+                assert expected.get(interval.start - timedelta(days=1), 0) <= 100
+                assert expected.get(interval.end + timedelta(days=1), 0) <= 100
+                reported.extend(days)
+
+            assert reported == sorted(d for d, load in expected.items() if load > 100)
+
+    def test_overlapping_pairs_match_pairwise_scan(self, random_assignments):
+        for resource_id, profile in build_load_profiles(random_assignments).items():
+            rows = [i for i, row in enumerate(random_assignments) if row["resource_id"] == resource_id]
+            expected = {
+                (i, j) for i, j in combinations(rows, 2)
+                if random_assignments[i]["assignment_start_date"] <= random_assignments[j]["assignment_end_date"]
+                and random_assignments[j]["assignment_start_date"] <= random_assignments[i]["assignment_end_date"]
+            }
+
+            pairs = {(first, second) for first, second, _, _ in profile.overlapping_pairs()}
+
+            assert pairs == expected
+
+    def test_weekly_and_window_averages(self):
+        rows = [assignment("r1", 2, 8, 50), assignment("r1", 5, 5, 100, 1)]
+
+        profile = build_load_profiles(rows)["r1"]
+        weeks, load = profile.weekly_load()
+
+        assert weeks == [BASE, BASE + timedelta(weeks=1)]
+        assert load.tolist() == pytest.approx([(3 * 50 + 150 + 50) / 7, 2 * 50 / 7])
+        assert profile.average() == pytest.approx((7 * 50 + 100) / 7)
+        assert profile.average(BASE, BASE + timedelta(days=13)) == pytest.approx((7 * 50 + 100) / 14)
+
+    def test_rows_without_valid_dates_are_skipped(self):
+        rows = [
+            assignment("r1", 0, 3, 50),
+            {**assignment("r1", 0, 3, 50, 1), "assignment_end_date": None},
+            assignment("r1", 5, 2, 50, 2),
+        ]
+
+        profile = build_load_profiles(rows)["r1"]
+
+        assert profile.assignment_indices.tolist() == [0]
+        assert profile.peak() == 50
@@ -0,0 +1,89 @@
+"""
+Unit Tests for Reusing a Previous Monte Carlo Simulation
+
+Tests that a caller may only build on a stored run they own or whose project
+they can read simulations of.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from fastapi import HTTPException
+
+from auth.rbac import Permission
+from routers import simulations as simulations_router
+
+
+OWNER_ID = "owner-1"
+OTHER_USER_ID = "other-1"
+PROJECT_ID = "project-1"
+
+
+def stored_simulation(**overrides):
+    record = {
+        "id": "sim-1",
+        "user_id": OWNER_ID,
+        "project_id": PROJECT_ID,
+        "timestamp": "2026-01-01T00:00:00",
+        "iteration_count": 10000,
+        "execution_time": 1.5,
+        "status": "completed",
+        "results_summary": {},
+    }
+    record.update(overrides)
+    return record
+
+
+def fake_supabase(rows):
+    client = Mock()
+    query = client.table.return_value
+    query.select.return_value = query
+    query.eq.return_value = query
+    query.execute.return_value = Mock(data=rows)
+    return client
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    checker = Mock()
+    checker.check_project_permission = AsyncMock(return_value=False)
+    monkeypatch.setattr(simulations_router, "get_enhanced_permission_checker", lambda: checker)
+    return checker
+
+
+async def test_owner_may_reuse_their_simulation(monkeypatch, checker):
+    monkeypatch.setattr(simulations_router, "supabase", fake_supabase([stored_simulation()]))
+
+    record = await simulations_router._get_reusable_simulation("sim-1", {"user_id": OWNER_ID})
+
+    assert record["id"] == "sim-1"
+    checker.check_project_permission.assert_not_called()
+
+
+async def test_project_reader_may_reuse_simulation(monkeypatch, checker):
+    monkeypatch.setattr(simulations_router, "supabase", fake_supabase([stored_simulation()]))
+    checker.check_project_permission.return_value = True
+
+    record = await simulations_router._get_reusable_simulation("sim-1", {"user_id": OTHER_USER_ID})
+
+    assert record["id"] == "sim-1"
+    checker.check_project_permission.assert_awaited_once_with(
+        OTHER_USER_ID, Permission.simulation_read, PROJECT_ID
+    )
+
+
+async def test_other_users_simulation_is_rejected(monkeypatch, checker):
+    monkeypatch.setattr(simulations_router, "supabase", fake_supabase([stored_simulation()]))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await simulations_router._get_reusable_simulation("sim-1", {"user_id": OTHER_USER_ID})
+
+    assert exc_info.value.status_code == 403
+
+
+async def test_missing_simulation_is_not_found(monkeypatch, checker):
+    monkeypatch.setattr(simulations_router, "supabase", fake_supabase([]))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await simulations_router._get_reusable_simulation("sim-1", {"user_id": OWNER_ID})
+
+    assert exc_info.value.status_code == 404
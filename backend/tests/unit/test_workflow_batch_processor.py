@@ -0,0 +1,145 @@
+"""
+Unit Tests for Set-Based Workflow Batch Writes
+
+Tests that batch updates are grouped by payload into filtered multi-row
+UPDATEs and that the write buffer coalesces updates and flushes on size,
+age and close.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from models.workflow import ApprovalStatus, WorkflowStatus
+from services.workflow_batch_processor import WorkflowBatchProcessor, WorkflowWriteBuffer
+
+
+class RecordingTable:
+    """Records update(...).in_("id", ids) calls and echoes the ids back."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, name):
+        table = Mock()
+
+        def update(payload):
+            builder = Mock()
+
+            def in_(column, ids):
+                assert column == "id"
+                self.calls.append((name, payload, list(ids)))
+                query = Mock()
+                query.execute.return_value = Mock(data=[{"id": i} for i in ids])
+                return query
+
+            builder.in_.side_effect = in_
+            return builder
+
+        table.update.side_effect = update
+        return table
+
+
+@pytest.fixture
+def recorder():
+    return RecordingTable()
+
+
+@pytest.fixture
+def processor(recorder):
+    db = Mock()
+    db.table.side_effect = recorder
+    return WorkflowBatchProcessor(db, batch_size=50)
+
+
+class TestGroupedUpdates:
+
+    @pytest.mark.asyncio
+    async def test_expire_is_one_update_per_chunk(self, processor, recorder):
+        approval_ids = [uuid4() for _ in range(120)]
+
+        success_count, errors = await processor.expire_approvals_batch(approval_ids)
+
+        assert success_count == 120
+        assert errors == []
+        assert [len(ids) for _, _, ids in recorder.calls] == [50, 50, 20]
+        assert {payload["status"] for _, payload, _ in recorder.calls} == {ApprovalStatus.EXPIRED.value}
+
+    @pytest.mark.asyncio
+    async def test_updates_grouped_by_payload_and_merged_by_id(self, processor, recorder):
+        a, b, c = uuid4(), uuid4(), uuid4()
+
+        success_count, _ = await processor.update_workflow_instances_batch([
+            (a, {"current_step": 2}),
+            (b, {"current_step": 2}),
+            (c, {"current_step": 3}),
+            (a, {"status": WorkflowStatus.COMPLETED.value}),
+        ])
+
+        assert success_count == 3
+        written = {tuple(ids): payload for _, payload, ids in recorder.calls}
+        assert written[(str(b),)]["current_step"] == 2
+        assert written[(str(c),)]["current_step"] == 3
+        assert written[(str(a),)]["status"] == WorkflowStatus.COMPLETED.value
+        assert written[(str(a),)]["current_step"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_group_reports_each_row(self, processor):
+        processor.db.table.side_effect = RuntimeError("timeout")
+        ids = [uuid4(), uuid4()]
+
+        success_count, errors = await processor.cancel_workflow_instances_batch(ids, "obsolete")
+
+        assert success_count == 0
+        assert errors == [f"Instance {i}: timeout" for i in ids]
+
+
+class TestWorkflowWriteBuffer:
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_full_and_on_close(self, processor, recorder):
+        async with WorkflowWriteBuffer(processor, max_pending=3, flush_interval=60) as buffer:
+            for _ in range(4):
+                await buffer.update_approval(uuid4(), ApprovalStatus.APPROVED.value)
+            assert len(recorder.calls) == 1
+            assert buffer.pending_count == 1
+
+        assert buffer.pending_count == 0
+        assert buffer.success_count == 4
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self, processor, recorder):
+        buffer = WorkflowWriteBuffer(processor, max_pending=100, flush_interval=0.05)
+        instance_id = uuid4()
+
+        await buffer.update_instance(instance_id, {"current_step": 1})
+        await buffer.update_instance(instance_id, {"current_step": 2})
+        await asyncio.sleep(0.2)
+
+        assert len(recorder.calls) == 1
+        assert recorder.calls[0][1]["current_step"] == 2
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_running_timed_flush(self, processor, recorder):
+        buffer = WorkflowWriteBuffer(processor, max_pending=100, flush_interval=0.01)
+        write_started = asyncio.Event()
+        write_instances = processor.update_workflow_instances_batch
+
+        async def slow_write(updates):
+            write_started.set()
+            await asyncio.sleep(0.05)
+            return await write_instances(updates)
+
+        processor.update_workflow_instances_batch = slow_write
+
+        await buffer.update_instance(uuid4(), {"current_step": 1})
+        await buffer.update_approval(uuid4(), ApprovalStatus.APPROVED.value)
+        await write_started.wait()
+        await buffer.close()
+
+        assert len(recorder.calls) == 2
+        assert buffer.pending_count == 0
+        assert buffer.success_count == 2
+        assert buffer.errors == []